@@ -59,6 +59,7 @@ from .project_walker import (
     ProjectMap,
     ProjectWalker,
 )
+from .source_walker import SourceFiles, walk_source_files
 from .project_context import (
     CacheMetadata,
     DirectoryType,
@@ -91,6 +92,9 @@ __all__ = [
     "ProjectMap",
     "CacheMetadata",
     "DirectoryType",
+    # [20261018_PERF] Shared pruned scandir walker
+    "SourceFiles",
+    "walk_source_files",
     # Extensions and constants
     "DEFAULT_EXCLUDE_DIRS",
     "PYTHON_EXTENSIONS",
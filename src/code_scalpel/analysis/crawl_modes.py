@@ -0,0 +1,241 @@
+"""
+Tiered crawl modes for ProjectCrawler.
+
+[20261018_PERF] Most project summaries only need file counts, languages and
+line totals, yet a full crawl parses every Python file. Crawls now pick how
+much work to do per file:
+
+- ``summary``: stat and line count only; line breaks are counted on the
+  raw bytes (memory-mapped for large files), the file is never decoded or
+  parsed.
+- ``structure``: declaration-level scan - functions, classes, methods,
+  bases and imports from a line scan, no AST. Per-function complexity is
+  not measured (reported as 0); the file gets the keyword estimate the
+  crawler already uses for non-Python languages.
+- ``full``: today's behavior (AST analysis for Python).
+
+Cached results from a more detailed mode satisfy a less detailed crawl.
+"""
+
+from __future__ import annotations
+
+import mmap
+import os
+import re
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from code_scalpel.analysis.project_crawler import ClassInfo, FunctionInfo
+
+CRAWL_MODES: tuple[str, ...] = ("summary", "structure", "full")
+_MODE_RANK = {mode: rank for rank, mode in enumerate(CRAWL_MODES)}
+
+# Files up to this size are read in one call; mmap set-up costs more
+_MMAP_MIN_BYTES = 256 * 1024
+_COUNT_CHUNK_BYTES = 4 * 1024 * 1024
+# What str.splitlines() splits on ("\r\n" is one break), as UTF-8 bytes
+_LINE_BREAK_CHARS = "\n\r\x0b\x0c\x1c\x1d\x1e\x85\u2028\u2029"
+_ASCII_BREAKS = bytes(ord(c) for c in _LINE_BREAK_CHARS if c.isascii())
+_NON_BREAK_BYTES = bytes(b for b in range(256) if b not in _ASCII_BREAKS)
+_UNICODE_BREAKS: tuple[bytes, ...] = tuple(
+    c.encode("utf-8") for c in _LINE_BREAK_CHARS if not c.isascii()
+)
+# "\r" and "\n" separated only by non-ASCII bytes (one break if they are
+# invalid UTF-8, which decoding drops)
+_CR_JUNK_LF = re.compile(rb"\r([\x80-\xff]+)\n")
+# Breaks spanning several bytes, and how each changes _count_breaks
+_MULTIBYTE_BREAKS: tuple[tuple[bytes, int], ...] = (
+    (b"\r\n", -1),
+    *((b, 1) for b in _UNICODE_BREAKS),
+)
+
+_PY_DECL = re.compile(
+    r"^([ \t]*)(?:async[ \t]+)?(def|class)[ \t]+([A-Za-z_]\w*)[ \t]*(?:\(([^)]*)\))?",
+    re.M,
+)
+_PY_IMPORT = re.compile(
+    r"^[ \t]*(?:from[ \t]+\.*([\w.]*)[ \t]+import\b|import[ \t]+([^\n#;]+))",
+    re.M,
+)
+_DOTTED_NAME = re.compile(r"^[A-Za-z_][\w.]*$")
+
+
+def validate_mode(mode: str) -> str:
+    """Return ``mode`` if it is a known crawl mode, else raise ValueError."""
+    if mode not in _MODE_RANK:
+        raise ValueError(
+            f"Unknown crawl mode {mode!r}; expected one of {', '.join(CRAWL_MODES)}"
+        )
+    return mode
+
+
+def mode_covers(stored: str, requested: str) -> bool:
+    """Whether a result produced in ``stored`` mode serves ``requested``."""
+    return _MODE_RANK.get(stored, -1) >= _MODE_RANK.get(requested, len(CRAWL_MODES))
+
+
+def _count_breaks(data: bytes) -> int:
+    """Line breaks in UTF-8 ``data`` as ``str.splitlines`` sees them."""
+    # One pass keeps just the single-byte breaks; the rest is rarely needed
+    ascii_breaks = data.translate(None, _NON_BREAK_BYTES)
+    breaks = len(ascii_breaks)
+    if b"\r" in ascii_breaks:
+        breaks -= data.count(b"\r\n")
+    if not data.isascii():
+        breaks += sum(data.count(b) for b in _UNICODE_BREAKS)
+    return breaks
+
+
+def _split_breaks(mm: mmap.mmap, boundary: int) -> int:
+    """Correction to ``_count_breaks`` for chunks split at ``boundary``.
+
+    Chunks are longer than any break, so a break spans at most one boundary.
+    """
+    low = max(0, boundary - 2)
+    window = mm[low : boundary + 2]
+    cut = boundary - low
+    correction = 0
+    for pattern, weight in _MULTIBYTE_BREAKS:
+        for start in range(max(0, cut - len(pattern) + 1), cut):
+            if window[start : start + len(pattern)] == pattern:
+                correction += weight
+    return correction
+
+
+def _joined_crlf(data: bytes | mmap.mmap) -> int:
+    """``\\r`` ... ``\\n`` pairs that decode as one break (invalid UTF-8 between)."""
+    return sum(
+        1
+        for match in _CR_JUNK_LF.finditer(data)
+        if not match.group(1).decode("utf-8", "ignore")
+    )
+
+
+def _open_last_line(data: bytes | mmap.mmap, size: int) -> bool:
+    """Whether the decoded text ends in a line without a break.
+
+    Trailing bytes that are not valid UTF-8 are dropped by the decoder, so
+    the last character is decoded from a tail that grows until it is found.
+    """
+    tail = 64
+    while True:
+        text = data[max(0, size - tail) : size].decode("utf-8", "ignore")
+        if text or tail >= size:
+            return bool(text) and text[-1] not in _LINE_BREAK_CHARS
+        tail *= 4
+
+
+def count_lines(path: str | os.PathLike[str]) -> int:
+    """Line count of a file without decoding it.
+
+    Matches ``len(text.splitlines())`` of the UTF-8 text, as full mode
+    counts it: ``\\r``, ``\\r\\n``, form feeds and the other Unicode line
+    boundaries all end a line, and a final line without one still counts.
+    """
+    fd = os.open(path, os.O_RDONLY | getattr(os, "O_BINARY", 0))
+    try:
+        size = os.fstat(fd).st_size
+        if size == 0:
+            return 0
+        if size <= _MMAP_MIN_BYTES:
+            data = os.read(fd, size)
+            while len(data) < size:  # short read
+                more = os.read(fd, size - len(data))
+                if not more:
+                    break
+                data += more
+            lines = _count_breaks(data)
+            if not data.isascii() and b"\r" in data:
+                lines -= _joined_crlf(data)
+            return lines + _open_last_line(data, len(data))
+        with mmap.mmap(fd, 0, access=mmap.ACCESS_READ) as mm:
+            lines = 0
+            for offset in range(0, size, _COUNT_CHUNK_BYTES):
+                if offset:
+                    lines += _split_breaks(mm, offset)
+                lines += _count_breaks(mm[offset : offset + _COUNT_CHUNK_BYTES])
+            if mm.find(b"\r") != -1:
+                lines -= _joined_crlf(mm)
+            return lines + _open_last_line(mm, size)
+    finally:
+        os.close(fd)
+
+
+def _base_names(arguments: str | None) -> list[str]:
+    """Base class names from a class header, as the AST visitor reports them."""
+    if not arguments:
+        return []
+    names = []
+    for part in arguments.split(","):
+        part = part.strip()
+        if part and "=" not in part and _DOTTED_NAME.match(part):
+            names.append(part.rsplit(".", 1)[-1])
+    return names
+
+
+def scan_python_declarations(
+    code: str,
+) -> tuple[list[FunctionInfo], list[ClassInfo], list[str]]:
+    """Functions, classes (with methods) and imports from a line scan.
+
+    Nesting follows indentation the way ``CodeAnalyzerVisitor`` follows the
+    tree: any ``def`` inside a class body - however deep - is a method of the
+    innermost enclosing class. Declarations inside string literals are not
+    told apart from real ones.
+    """
+    from code_scalpel.analysis.project_crawler import ClassInfo, FunctionInfo
+
+    functions: list[FunctionInfo] = []
+    classes: list[ClassInfo] = []
+    # (indent width, class or None for a function)
+    stack: list[tuple[int, ClassInfo | None]] = []
+    line = 1
+    position = 0
+    for match in _PY_DECL.finditer(code):
+        line += code.count("\n", position, match.start())
+        position = match.start()
+        indent = len(match.group(1).expandtabs(8))
+        while stack and stack[-1][0] >= indent:
+            stack.pop()
+        current_class = next((c for _, c in reversed(stack) if c is not None), None)
+        name = match.group(3)
+        if match.group(2) == "class":
+            class_info = ClassInfo(
+                name=name, lineno=line, bases=_base_names(match.group(4))
+            )
+            classes.append(class_info)
+            stack.append((indent, class_info))
+        else:
+            func_info = FunctionInfo(
+                name=name,
+                lineno=line,
+                complexity=0,
+                is_method=current_class is not None,
+                class_name=current_class.name if current_class else None,
+            )
+            if current_class is not None:
+                current_class.methods.append(func_info)
+            else:
+                functions.append(func_info)
+            stack.append((indent, None))
+
+    imports: list[str] = []
+    for match in _PY_IMPORT.finditer(code):
+        if match.group(2) is None:
+            if match.group(1):
+                imports.append(match.group(1))
+            continue
+        for alias in match.group(2).split(","):
+            module = alias.strip().split(" as ")[0].strip().strip("()\\ ")
+            if _DOTTED_NAME.match(module):
+                imports.append(module)
+    return functions, classes, imports
+
+
+__all__ = [
+    "CRAWL_MODES",
+    "count_lines",
+    "mode_covers",
+    "scan_python_declarations",
+    "validate_mode",
+]
@@ -9,6 +9,8 @@ Features:
 - Custom metric registration
 - Aggregation and reporting
 - Export to JSON/CSV formats
+- [20261018_PERF] One parse per file shared by all collectors, values cached
+  per collector version and content hash, optional process pool
 
 Usage:
     from code_scalpel.analysis.custom_metrics import MetricsCollector
@@ -23,14 +25,20 @@ from __future__ import annotations
 
 import ast
 import csv
+import hashlib
 import json
+import multiprocessing as mp
+import os
+import pickle
 import re
 from abc import ABC, abstractmethod
-from dataclasses import dataclass, field
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import asdict, dataclass, field
 from datetime import datetime
 from io import StringIO
 from pathlib import Path
-from typing import Any, Callable, Dict, List, Optional, Set, Union
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple, Union
 
 
 @dataclass
@@ -120,9 +128,61 @@ class MetricsReport:
         return output.getvalue()
 
 
+class ParsedSource:
+    """
+    One file's content, shared by every collector that measures it.
+
+    [20261018_PERF] The Python AST, its node list and the split lines are built
+    on first use and reused by all collectors, so a file is parsed once however
+    many collectors read it.
+    """
+
+    __slots__ = ("path", "content", "_tree", "_parsed", "_nodes", "_lines")
+
+    def __init__(self, path: Path, content: str):
+        self.path = path
+        self.content = content
+        self._tree: Optional[ast.AST] = None
+        self._parsed = False
+        self._nodes: Optional[List[ast.AST]] = None
+        self._lines: Optional[List[str]] = None
+
+    @property
+    def tree(self) -> Optional[ast.AST]:
+        """AST of a ``.py`` file; None for other files or invalid syntax."""
+        if not self._parsed:
+            self._parsed = True
+            if self.path.suffix == ".py":
+                try:
+                    self._tree = ast.parse(self.content)
+                except (SyntaxError, ValueError):
+                    self._tree = None
+        return self._tree
+
+    @property
+    def nodes(self) -> List[ast.AST]:
+        """Every node of :attr:`tree` (empty without a tree)."""
+        if self._nodes is None:
+            tree = self.tree
+            self._nodes = list(ast.walk(tree)) if tree is not None else []
+        return self._nodes
+
+    @property
+    def lines(self) -> List[str]:
+        """``content.splitlines()``."""
+        if self._lines is None:
+            self._lines = self.content.splitlines()
+        return self._lines
+
+
 class MetricCollector(ABC):
     """Abstract base class for metric collectors."""
 
+    # [20261018_PERF] Cached values are keyed by collector name and version;
+    # bump it whenever the collector's results change. Values of collectors
+    # without a version are never cached.
+    version: Optional[str] = None
+
     @property
     @abstractmethod
     def name(self) -> str:
@@ -148,10 +208,20 @@ class MetricCollector(ABC):
         """
         pass
 
+    def collect_source(self, source: ParsedSource) -> Optional[MetricValue]:
+        """Collect metric from a shared :class:`ParsedSource`.
+
+        Defaults to :meth:`collect`; collectors that parse the content
+        override this to use the shared tree.
+        """
+        return self.collect(source.path, source.content)
+
 
 class LinesOfCodeCollector(MetricCollector):
     """Collects lines of code metrics."""
 
+    version = "1"
+
     @property
     def name(self) -> str:
         return "lines_of_code"
@@ -161,7 +231,11 @@ class LinesOfCodeCollector(MetricCollector):
         return "lines"
 
     def collect(self, file_path: Path, content: str) -> MetricValue:
-        lines = content.splitlines()
+        return self.collect_source(ParsedSource(file_path, content))
+
+    def collect_source(self, source: ParsedSource) -> MetricValue:
+        file_path = source.path
+        lines = source.lines
         total = len(lines)
         blank = sum(1 for line in lines if not line.strip())
         comment = sum(
@@ -186,6 +260,8 @@ class LinesOfCodeCollector(MetricCollector):
 class CyclomaticComplexityCollector(MetricCollector):
     """Collects cyclomatic complexity for Python files."""
 
+    version = "1"
+
     @property
     def name(self) -> str:
         return "cyclomatic_complexity"
@@ -195,17 +271,16 @@ class CyclomaticComplexityCollector(MetricCollector):
         return "score"
 
     def collect(self, file_path: Path, content: str) -> Optional[MetricValue]:
-        if file_path.suffix != ".py":
-            return None
+        return self.collect_source(ParsedSource(file_path, content))
 
-        try:
-            tree = ast.parse(content)
-        except SyntaxError:
+    def collect_source(self, source: ParsedSource) -> Optional[MetricValue]:
+        file_path = source.path
+        if file_path.suffix != ".py" or source.tree is None:
             return None
 
         complexity = 1  # Base complexity
 
-        for node in ast.walk(tree):
+        for node in source.nodes:
             # Each decision point adds 1
             if isinstance(node, (ast.If, ast.While, ast.For, ast.ExceptHandler)):
                 complexity += 1
@@ -228,6 +303,8 @@ class CyclomaticComplexityCollector(MetricCollector):
 class FunctionCountCollector(MetricCollector):
     """Counts functions/methods in files."""
 
+    version = "1"
+
     @property
     def name(self) -> str:
         return "function_count"
@@ -237,16 +314,16 @@ class FunctionCountCollector(MetricCollector):
         return "functions"
 
     def collect(self, file_path: Path, content: str) -> Optional[MetricValue]:
+        return self.collect_source(ParsedSource(file_path, content))
+
+    def collect_source(self, source: ParsedSource) -> Optional[MetricValue]:
+        file_path, content = source.path, source.content
         count = 0
 
         if file_path.suffix == ".py":
-            try:
-                tree = ast.parse(content)
-                for node in ast.walk(tree):
-                    if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
-                        count += 1
-            except SyntaxError:
-                pass
+            for node in source.nodes:
+                if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
+                    count += 1
         elif file_path.suffix in (".js", ".ts", ".jsx", ".tsx"):
             # Simple regex for JS/TS functions
             patterns = [
@@ -268,6 +345,8 @@ class FunctionCountCollector(MetricCollector):
 class ClassCountCollector(MetricCollector):
     """Counts classes in files."""
 
+    version = "1"
+
     @property
     def name(self) -> str:
         return "class_count"
@@ -277,16 +356,16 @@ class ClassCountCollector(MetricCollector):
         return "classes"
 
     def collect(self, file_path: Path, content: str) -> Optional[MetricValue]:
+        return self.collect_source(ParsedSource(file_path, content))
+
+    def collect_source(self, source: ParsedSource) -> Optional[MetricValue]:
+        file_path, content = source.path, source.content
         count = 0
 
         if file_path.suffix == ".py":
-            try:
-                tree = ast.parse(content)
-                for node in ast.walk(tree):
-                    if isinstance(node, ast.ClassDef):
-                        count += 1
-            except SyntaxError:
-                pass
+            for node in source.nodes:
+                if isinstance(node, ast.ClassDef):
+                    count += 1
         elif file_path.suffix in (".js", ".ts", ".jsx", ".tsx"):
             # Simple regex for JS/TS classes
             count = len(re.findall(r"class\s+\w+", content))
@@ -304,6 +383,8 @@ class ClassCountCollector(MetricCollector):
 class ImportCountCollector(MetricCollector):
     """Counts imports in files."""
 
+    version = "1"
+
     @property
     def name(self) -> str:
         return "import_count"
@@ -313,18 +394,18 @@ class ImportCountCollector(MetricCollector):
         return "imports"
 
     def collect(self, file_path: Path, content: str) -> Optional[MetricValue]:
+        return self.collect_source(ParsedSource(file_path, content))
+
+    def collect_source(self, source: ParsedSource) -> Optional[MetricValue]:
+        file_path, content = source.path, source.content
         count = 0
 
         if file_path.suffix == ".py":
-            try:
-                tree = ast.parse(content)
-                for node in ast.walk(tree):
-                    if isinstance(node, ast.Import):
-                        count += len(node.names)
-                    elif isinstance(node, ast.ImportFrom):
-                        count += len(node.names)
-            except SyntaxError:
-                pass
+            for node in source.nodes:
+                if isinstance(node, ast.Import):
+                    count += len(node.names)
+                elif isinstance(node, ast.ImportFrom):
+                    count += len(node.names)
         elif file_path.suffix in (".js", ".ts", ".jsx", ".tsx"):
             count = len(re.findall(r"(?:import|require)\s*\(?\s*['\"]", content))
 
@@ -338,6 +419,8 @@ class ImportCountCollector(MetricCollector):
 
 class TodoCountCollector(MetricCollector):
 
+    version = "1"
+
     @property
     def name(self) -> str:
         return "todo_count"
@@ -346,17 +429,25 @@ class TodoCountCollector(MetricCollector):
     def unit(self) -> str:
         return "items"
 
+    PATTERNS = [
+        (re.compile(r"#\s*(TODO|FIXME|XXX|HACK|BUG)[\s:]+(.+)", re.I), "python"),
+        (re.compile(r"//\s*(TODO|FIXME|XXX|HACK|BUG)[\s:]+(.+)", re.I), "js"),
+        (
+            re.compile(r"/\*\s*(TODO|FIXME|XXX|HACK|BUG)[\s:]+(.+?)\*/", re.I),
+            "block",
+        ),
+    ]
+
     def collect(self, file_path: Path, content: str) -> MetricValue:
+        return self.collect_source(ParsedSource(file_path, content))
+
+    def collect_source(self, source: ParsedSource) -> MetricValue:
+        file_path = source.path
         todos = []
-        patterns = [
-            (r"#\s*(TODO|FIXME|XXX|HACK|BUG)[\s:]+(.+)", "python"),
-            (r"//\s*(TODO|FIXME|XXX|HACK|BUG)[\s:]+(.+)", "js"),
-            (r"/\*\s*(TODO|FIXME|XXX|HACK|BUG)[\s:]+(.+?)\*/", "block"),
-        ]
 
-        for line_num, line in enumerate(content.splitlines(), 1):
-            for pattern, _ in patterns:
-                matches = re.findall(pattern, line, re.IGNORECASE)
+        for line_num, line in enumerate(source.lines, 1):
+            for pattern, _ in self.PATTERNS:
+                matches = pattern.findall(line)
                 for match in matches:
                     todos.append(
                         {
@@ -375,6 +466,76 @@ class TodoCountCollector(MetricCollector):
         )
 
 
+# Measured values of one file, by measure key (None: not applicable/failed)
+_FileValues = Dict[str, Optional[MetricValue]]
+
+# [20261018_PERF] Below this many files per worker a process pool costs more
+# than it saves
+_MIN_FILES_PER_WORKER = 64
+
+# Collector of a process-pool worker, set by _init_worker
+_WORKER_COLLECTOR: Optional["MetricsCollector"] = None
+
+
+def _init_worker(payload: bytes) -> None:
+    global _WORKER_COLLECTOR
+    _WORKER_COLLECTOR = pickle.loads(payload)
+
+
+def _measure_worker(
+    batch: List[Tuple[str, Optional[str], Optional[Set[str]]]],
+) -> List[Optional[Tuple[str, _FileValues]]]:
+    """ProcessPool worker entrypoint: measure a batch of files."""
+    assert _WORKER_COLLECTOR is not None
+    return [_WORKER_COLLECTOR._measure_file(*task) for task in batch]
+
+
+class _SummaryBuilder:
+    """Running total/min/max of one metric, updated value by value."""
+
+    __slots__ = ("name", "unit", "total", "count", "min_value", "max_value")
+
+    def __init__(self, name: str, unit: Optional[str]):
+        self.name = name
+        self.unit = unit
+        self.total: Union[int, float] = 0
+        self.count = 0
+        self.min_value: Union[int, float] = 0
+        self.max_value: Union[int, float] = 0
+
+    def add(self, value: Any) -> None:
+        if not isinstance(value, (int, float)):
+            return
+        if self.count == 0:
+            self.min_value = self.max_value = value
+        else:
+            self.min_value = min(self.min_value, value)
+            self.max_value = max(self.max_value, value)
+        self.total += value
+        self.count += 1
+
+    def summary(self) -> MetricSummary:
+        return MetricSummary(
+            name=self.name,
+            total=self.total,
+            average=self.total / self.count,
+            min_value=self.min_value,
+            max_value=self.max_value,
+            count=self.count,
+            unit=self.unit,
+        )
+
+
+def _add_to_summaries(
+    builders: Dict[str, _SummaryBuilder], metrics: List[MetricValue]
+) -> None:
+    for m in metrics:
+        builder = builders.get(m.name)
+        if builder is None:
+            builder = builders[m.name] = _SummaryBuilder(m.name, m.unit)
+        builder.add(m.value)
+
+
 class MetricsCollector:
     """Main metrics collection orchestrator."""
 
@@ -397,11 +558,34 @@ class MetricsCollector:
         ".cs",
     }
 
-    def __init__(self):
-        """Initialize with built-in collectors."""
+    def __init__(
+        self,
+        parallelism: str = "none",  # none|processes
+        enable_cache: bool = False,
+    ):
+        """
+        Initialize with built-in collectors.
+
+        Args:
+            parallelism: "processes" measures changed files in a process pool
+                (only when every collector can be pickled)
+            enable_cache: Keep values per file in
+                ``.code-scalpel/cache/metrics_cache_v1.json`` under the
+                project, keyed by collector version and content hash, so
+                re-runs only measure changed files
+        """
+        self.parallelism = parallelism
+        self.enable_cache = enable_cache
+        self._cache_hits = 0
+        self._cache_misses = 0
         self._collectors: Dict[str, MetricCollector] = {}
         self._custom_fns: Dict[
-            str, tuple[Callable[[Path, str], Union[int, float, None]], Optional[str]]
+            str,
+            tuple[
+                Callable[[Path, str], Union[int, float, None]],
+                Optional[str],
+                Optional[str],
+            ],
         ] = {}
 
         # Register built-in collectors
@@ -425,6 +609,7 @@ class MetricsCollector:
         name: str,
         fn: Callable[[Path, str], Union[int, float, None]],
         unit: Optional[str] = None,
+        version: Optional[str] = None,
     ) -> None:
         """
         Register a simple metric function.
@@ -433,8 +618,81 @@ class MetricsCollector:
             name: Metric name
             fn: Function taking (file_path, content) and returning value
             unit: Optional unit of measurement
+            version: Version of ``fn``'s results; values of unversioned
+                functions are never cached
+        """
+        self._custom_fns[name] = (fn, unit, version)
+
+    def _measure_keys(self) -> List[Tuple[str, bool]]:
+        """Key of every collector and metric function, and if it is cached."""
+        keys = [
+            (f"c:{c.name}@{c.version}", c.version is not None)
+            for c in self._collectors.values()
+        ]
+        for name, (_, _, version) in self._custom_fns.items():
+            keys.append((f"f:{name}@{version}", version is not None))
+        return keys
+
+    def _measure_source(
+        self, source: ParsedSource, wanted: Optional[Set[str]] = None
+    ) -> _FileValues:
+        """Run collectors (all, or those keyed in ``wanted``) over ``source``."""
+        values: _FileValues = {}
+        for collector in self._collectors.values():
+            key = f"c:{collector.name}@{collector.version}"
+            if wanted is not None and key not in wanted:
+                continue
+            try:
+                values[key] = collector.collect_source(source) or None
+            except Exception:
+                values[key] = None
+
+        for name, (fn, unit, version) in self._custom_fns.items():
+            key = f"f:{name}@{version}"
+            if wanted is not None and key not in wanted:
+                continue
+            values[key] = None
+            try:
+                value = fn(source.path, source.content)
+                if value is not None:
+                    values[key] = MetricValue(
+                        name=name,
+                        value=value,
+                        unit=unit,
+                        file_path=str(source.path),
+                    )
+            except Exception:
+                pass
+        return values
+
+    def _measure_file(
+        self,
+        file_path: str,
+        known_hash: Optional[str] = None,
+        missing: Optional[Set[str]] = None,
+    ) -> Optional[Tuple[str, _FileValues]]:
         """
-        self._custom_fns[name] = (fn, unit)
+        Read, hash and measure one file.
+
+        When its content still hashes to ``known_hash`` only the ``missing``
+        measures run; otherwise all do. Returns None if the file is unreadable.
+        """
+        try:
+            with open(file_path, "rb") as f:
+                data = f.read()
+        except OSError:
+            return None
+        digest = hashlib.sha256(data).hexdigest()
+        wanted = missing if digest == known_hash else None
+        # Match the text-mode read collectors were written against.
+        content = (
+            data.decode("utf-8", errors="replace")
+            .replace("\r\n", "\n")
+            .replace("\r", "\n")
+        )
+        return digest, self._measure_source(
+            ParsedSource(Path(file_path), content), wanted
+        )
 
     def collect(
         self,
@@ -453,6 +711,8 @@ class MetricsCollector:
         Returns:
             MetricsReport with all collected metrics
         """
+        from .source_walker import walk_source_files
+
         root = Path(project_path).resolve()
         target_extensions = extensions or self.SUPPORTED_EXTENSIONS
         exclude = exclude_dirs or {
@@ -463,102 +723,227 @@ class MetricsCollector:
             "venv",
         }
 
+        # [20261018_PERF] One pruned walk instead of rglob("*") filtered after
+        # listing excluded trees
+        walk = walk_source_files(
+            root, extensions=target_extensions, exclude_dirs=exclude, with_size=False
+        )
+        files = [(f.path, str(Path(f.rel_path))) for f in walk.all_files()]
+
+        keys = self._measure_keys()
+        cached_keys = {key for key, cached in keys if cached}
+        cache_file = root / ".code-scalpel" / "cache" / "metrics_cache_v1.json"
+        cache = self._load_cache(cache_file) if self.enable_cache else {}
+        self._cache_hits = self._cache_misses = 0
+
+        # Reuse cached values; queue files needing any measure
+        stored: Dict[str, Tuple[Optional[str], Dict[str, Any]]] = {}
+        pending: List[Tuple[str, Optional[str], Optional[Set[str]]]] = []
+        for file_path, rel_path in files:
+            fresh, digest, values = self._cached_values(
+                cache.get(rel_path), file_path, cached_keys
+            )
+            stored[rel_path] = (digest, values)
+            missing = {key for key, _ in keys if key not in values}
+            if fresh and not missing:
+                self._cache_hits += 1
+            else:
+                # Files only touched keep their values once the hash matches
+                self._cache_misses += 1
+                pending.append((file_path, digest, missing))
+
+        measured = self._measure_pending(pending)
+
+        new_cache: Dict[str, Any] = {}
         all_metrics: List[MetricValue] = []
         file_metrics: Dict[str, List[MetricValue]] = {}
+        builders: Dict[str, _SummaryBuilder] = {}
+        for file_path, rel_path in files:
+            digest, cached = stored[rel_path]
+            values: _FileValues = {
+                key: self._metric_from_cache(data, file_path)
+                for key, data in cached.items()
+            }
+            if file_path in measured:
+                result = measured[file_path]
+                if result is None:
+                    continue
+                if result[0] != digest:
+                    values = {}
+                digest = result[0]
+                values.update(result[1])
+            metrics: List[MetricValue] = []
+            for key, _ in keys:
+                metric = values.get(key)
+                if metric is not None:
+                    metrics.append(metric)
+            file_metrics[rel_path] = metrics
+            all_metrics.extend(metrics)
+            _add_to_summaries(builders, metrics)
+            if self.enable_cache:
+                new_cache[rel_path] = self._cache_entry(
+                    file_path, digest, values, cached_keys
+                )
 
-        for file_path in root.rglob("*"):
-            if not file_path.is_file():
-                continue
-            if file_path.suffix.lower() not in target_extensions:
-                continue
-            if any(ex in file_path.parts for ex in exclude):
-                continue
-
-            try:
-                content = file_path.read_text(encoding="utf-8", errors="replace")
-            except Exception:
-                continue
-
-            rel_path = str(file_path.relative_to(root))
-            file_metrics[rel_path] = []
-
-            # Collect from registered collectors
-            for collector in self._collectors.values():
-                try:
-                    metric = collector.collect(file_path, content)
-                    if metric:
-                        all_metrics.append(metric)
-                        file_metrics[rel_path].append(metric)
-                except Exception:
-                    pass
-
-            # Collect from custom functions
-            for name, (fn, unit) in self._custom_fns.items():
-                try:
-                    value = fn(file_path, content)
-                    if value is not None:
-                        metric = MetricValue(
-                            name=name,
-                            value=value,
-                            unit=unit,
-                            file_path=str(file_path),
-                        )
-                        all_metrics.append(metric)
-                        file_metrics[rel_path].append(metric)
-                except Exception:
-                    pass
-
-        # Calculate summaries
-        summaries = self._calculate_summaries(all_metrics)
+        if self.enable_cache:
+            self._save_cache(cache_file, new_cache)
 
         return MetricsReport(
             project_path=str(root),
             collected_at=datetime.now().isoformat(),
             metrics=all_metrics,
-            summaries=summaries,
+            summaries={name: b.summary() for name, b in builders.items() if b.count},
             file_metrics=file_metrics,
             metadata={
                 "collector_count": len(self._collectors) + len(self._custom_fns),
                 "file_count": len(file_metrics),
+                "files_measured": self._cache_misses,
             },
         )
 
+    def _measure_pending(
+        self, pending: List[Tuple[str, Optional[str], Optional[Set[str]]]]
+    ) -> Dict[str, Optional[Tuple[str, _FileValues]]]:
+        """Measure queued files, in a process pool when asked and worth it."""
+        workers = 1
+        payload = b""
+        if self.parallelism == "processes":
+            workers = min(os.cpu_count() or 1, len(pending) // _MIN_FILES_PER_WORKER)
+            if workers > 1:
+                try:
+                    payload = pickle.dumps(self)
+                except Exception:
+                    # Lambdas and local classes cannot cross processes
+                    workers = 1
+        if workers <= 1:
+            return {task[0]: self._measure_file(*task) for task in pending}
+
+        # Few large batches: each task round-trip pickles collectors' results
+        size = max(_MIN_FILES_PER_WORKER, len(pending) // (workers * 4))
+        batches = [pending[i : i + size] for i in range(0, len(pending), size)]
+        results: Dict[str, Optional[Tuple[str, _FileValues]]] = {}
+        try:
+            with ProcessPoolExecutor(
+                max_workers=workers,
+                mp_context=mp.get_context("spawn"),
+                initializer=_init_worker,
+                initargs=(payload,),
+            ) as ex:
+                for batch, measured in zip(batches, ex.map(_measure_worker, batches)):
+                    for task, result in zip(batch, measured):
+                        results[task[0]] = result
+        except BrokenProcessPool:
+            # A worker could not load the collectors (e.g. a class that only
+            # exists in the parent); measure the rest here
+            for task in pending:
+                if task[0] not in results:
+                    results[task[0]] = self._measure_file(*task)
+        return results
+
+    @staticmethod
+    def _cached_values(
+        entry: Any, file_path: str, cached_keys: Set[str]
+    ) -> Tuple[bool, Optional[str], Dict[str, Any]]:
+        """
+        Whether a file's cache entry still matches its stat, the content hash
+        it was measured at, and its values for measures still registered.
+        """
+        if not isinstance(entry, dict) or not isinstance(entry.get("values"), dict):
+            return False, None, {}
+        try:
+            st = os.stat(file_path)
+        except OSError:
+            return False, None, {}
+        fresh = (
+            entry.get("mtime_ns") == st.st_mtime_ns and entry.get("size") == st.st_size
+        )
+        values = {k: v for k, v in entry["values"].items() if k in cached_keys}
+        return fresh, entry.get("hash"), values
+
+    @staticmethod
+    def _metric_from_cache(
+        data: Optional[Dict[str, Any]], file_path: str
+    ) -> Optional[MetricValue]:
+        if data is None:
+            return None
+        return MetricValue(file_path=file_path, **data)
+
+    @staticmethod
+    def _cache_entry(
+        file_path: str,
+        digest: Optional[str],
+        values: _FileValues,
+        cached_keys: Set[str],
+    ) -> Dict[str, Any]:
+        try:
+            st = os.stat(file_path)
+        except OSError:
+            return {}
+        stored: Dict[str, Any] = {}
+        for key, metric in values.items():
+            if key not in cached_keys:
+                continue
+            if metric is None:
+                stored[key] = None
+            else:
+                data = asdict(metric)
+                del data["file_path"]
+                stored[key] = data
+        return {
+            "mtime_ns": st.st_mtime_ns,
+            "size": st.st_size,
+            "hash": digest,
+            "values": stored,
+        }
+
+    @staticmethod
+    def _load_cache(cache_file: Path) -> Dict[str, Any]:
+        try:
+            data = json.loads(cache_file.read_text(encoding="utf-8"))
+            if data.get("version") == 1 and isinstance(data.get("files"), dict):
+                return data["files"]
+        except Exception:
+            pass
+        return {}
+
+    @staticmethod
+    def _save_cache(cache_file: Path, files: Dict[str, Any]) -> None:
+        try:
+            text = json.dumps({"version": 1, "files": files})
+        except (TypeError, ValueError):
+            # Drop only the values (e.g. details) JSON cannot hold; those
+            # are measured again next time
+            for entry in files.values():
+                values = entry.get("values", {})
+                for key, data in list(values.items()):
+                    try:
+                        json.dumps(data)
+                    except (TypeError, ValueError):
+                        del values[key]
+            text = json.dumps({"version": 1, "files": files})
+        try:
+            cache_file.parent.mkdir(parents=True, exist_ok=True)
+            tmp = cache_file.with_suffix(".tmp")
+            tmp.write_text(text, encoding="utf-8")
+            os.replace(tmp, cache_file)
+        except OSError:
+            pass
+
     def _calculate_summaries(
         self,
         metrics: List[MetricValue],
     ) -> Dict[str, MetricSummary]:
         """Calculate summary statistics for each metric."""
-        summaries: Dict[str, MetricSummary] = {}
-
-        # Group by metric name
-        by_name: Dict[str, List[MetricValue]] = {}
-        for m in metrics:
-            if m.name not in by_name:
-                by_name[m.name] = []
-            by_name[m.name].append(m)
-
-        for name, values in by_name.items():
-            numeric_values = [
-                v.value for v in values if isinstance(v.value, (int, float))
-            ]
-
-            if numeric_values:
-                summaries[name] = MetricSummary(
-                    name=name,
-                    total=sum(numeric_values),
-                    average=sum(numeric_values) / len(numeric_values),
-                    min_value=min(numeric_values),
-                    max_value=max(numeric_values),
-                    count=len(numeric_values),
-                    unit=values[0].unit if values else None,
-                )
-
-        return summaries
+        builders: Dict[str, _SummaryBuilder] = {}
+        _add_to_summaries(builders, metrics)
+        return {name: b.summary() for name, b in builders.items() if b.count}
 
 
 def collect_metrics(
     project_path: str | Path,
     custom_metrics: Optional[Dict[str, Callable]] = None,
+    parallelism: str = "none",
+    enable_cache: bool = False,
 ) -> MetricsReport:
     """
     Convenience function to collect project metrics.
@@ -566,11 +951,13 @@ def collect_metrics(
     Args:
         project_path: Path to the project
         custom_metrics: Optional dict of {name: function} custom metrics
+        parallelism: "none" or "processes" (see MetricsCollector)
+        enable_cache: Reuse values of unchanged files (see MetricsCollector)
 
     Returns:
         MetricsReport with all collected metrics
     """
-    collector = MetricsCollector()
+    collector = MetricsCollector(parallelism=parallelism, enable_cache=enable_cache)
 
     if custom_metrics:
         for name, fn in custom_metrics.items():
@@ -23,9 +23,11 @@ Usage:
 from __future__ import annotations
 
 import ast
+import os
+import re
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Any, Dict, List, Set
+from typing import Any, Dict, List, Set, Tuple
 
 
 @dataclass
@@ -55,6 +57,32 @@ class FrameworkDetectionResult:
     metadata: Dict[str, Any] = field(default_factory=dict)
 
 
+_ARTIFACT_DIRS = frozenset({"dist", "build"})
+
+# [20261018_PERF] The generated-file globs, as regexes over the POSIX relative
+# path of each walked file:
+#   **/*.pb.py, **/migrations/*.py, **/*.graphql, **/generated/**/*.py,
+#   **/dist/**, **/build/**
+_GENERATED_PATTERNS: List[Tuple[re.Pattern[str], str]] = [
+    (re.compile(r"\.pb\.py$"), "protobuf"),
+    (re.compile(r"(?:^|/)migrations/[^/]*\.py$"), "django_migration"),
+    (re.compile(r"\.graphql$"), "graphql_schema"),
+    (re.compile(r"(?:^|/)generated/.*\.py$"), "build_generated"),
+    (re.compile(r"(?:^|/)dist/"), "build_artifact"),
+    (re.compile(r"(?:^|/)build/"), "build_artifact"),
+]
+
+_ROUTE_ORDER = {"next.js": 0, "django": 1, "flask": 3, "fastapi": 4}
+
+
+def _route_order(route: FrameworkRoute) -> int:
+    """Report order: Next.js, Django URLs, Django views, Flask, FastAPI."""
+    rank = _ROUTE_ORDER.get(route.framework, len(_ROUTE_ORDER) + 1)
+    if route.framework == "django" and route.handler_type != "view":
+        rank += 1
+    return rank
+
+
 class FrameworkDetector:
     """Detects web framework entry points and components."""
 
@@ -66,13 +94,15 @@ class FrameworkDetector:
         self.generated_files: List[Dict[str, str]] = []
 
     def detect(self) -> FrameworkDetectionResult:
-        """Run full framework detection across the project."""
+        """Run full framework detection across the project.
+
+        Dependency and tool directories (``DEFAULT_EXCLUDE_DIRS`` such as
+        ``venv`` and ``node_modules``, but not ``dist``/``build``) are not
+        walked, so routes and generated files inside them are not reported.
+        """
         # Detect each framework type
         self._detect_nextjs()
-        self._detect_django()
-        self._detect_flask()
-        self._detect_fastapi()
-        self._detect_generated_code()
+        self._scan_project()
 
         # Organize results by type
         nextjs_pages = [
@@ -147,89 +177,77 @@ class FrameworkDetector:
                         )
                     )
 
-    def _detect_django(self) -> None:
-        """Detect Django views and URL patterns."""
-        # Look for manage.py (Django project marker)
-        if not (self.root / "manage.py").exists():
-            return
-
-        self.detected_frameworks.add("django")
-
-        # Scan urls.py files for URL patterns
-        for urls_file in self.root.rglob("urls.py"):
-            try:
-                content = urls_file.read_text(encoding="utf-8", errors="ignore")
-                tree = ast.parse(content)
-                self._extract_django_urls(tree, urls_file)
-            except (SyntaxError, UnicodeDecodeError):
-                pass
-
-        # Scan views.py for view functions/classes
-        for views_file in self.root.rglob("views.py"):
-            try:
-                content = views_file.read_text(encoding="utf-8", errors="ignore")
-                tree = ast.parse(content)
-                self._extract_django_views(tree, views_file)
-            except (SyntaxError, UnicodeDecodeError):
-                pass
-
-    def _detect_flask(self) -> None:
-        """Detect Flask routes and blueprints."""
-        # Look for files importing flask
-        for py_file in self.root.rglob("*.py"):
-            try:
-                content = py_file.read_text(encoding="utf-8", errors="ignore")
-                if "from flask import" not in content and "import flask" not in content:
-                    continue
-
-                tree = ast.parse(content)
-                self._extract_flask_routes(tree, py_file)
-            except (SyntaxError, UnicodeDecodeError):
-                pass
-
-        if self.routes and any(r.framework == "flask" for r in self.routes):
-            self.detected_frameworks.add("flask")
-
-    def _detect_fastapi(self) -> None:
-        """Detect FastAPI routes and routers."""
-        # Look for files importing fastapi
-        for py_file in self.root.rglob("*.py"):
-            try:
-                content = py_file.read_text(encoding="utf-8", errors="ignore")
-                if (
-                    "from fastapi import" not in content
-                    and "import fastapi" not in content
-                ):
-                    continue
-
-                tree = ast.parse(content)
-                self._extract_fastapi_routes(tree, py_file)
-            except (SyntaxError, UnicodeDecodeError):
-                pass
-
-        if self.routes and any(r.framework == "fastapi" for r in self.routes):
-            self.detected_frameworks.add("fastapi")
-
-    def _detect_generated_code(self) -> None:
-        """Detect auto-generated files to skip or mark."""
-        patterns = [
-            ("**/*.pb.py", "protobuf"),
-            ("**/migrations/*.py", "django_migration"),
-            ("**/*.graphql", "graphql_schema"),
-            ("**/generated/**/*.py", "build_generated"),
-            ("**/dist/**", "build_artifact"),
-            ("**/build/**", "build_artifact"),
-        ]
-
-        for pattern, gen_type in patterns:
-            for file_path in self.root.glob(pattern):
-                if file_path.is_file():
-                    self.generated_files.append(
-                        {
-                            "path": str(file_path.relative_to(self.root)),
-                            "type": gen_type,
-                        }
+    def _scan_project(self) -> None:
+        """
+        Detect Django, Flask, FastAPI and generated files in one pass.
+
+        [20261018_PERF] One walk lists every file; each Python file is read
+        once as bytes and only parsed when a byte-level marker shows a
+        detector could find something in it. The single tree then feeds
+        every detector that wants the file. Unlike the former per-pattern
+        globs, the walk prunes ``DEFAULT_EXCLUDE_DIRS``: migrations or
+        ``*.pb.py`` files vendored under ``venv``/``node_modules`` are no
+        longer listed as generated, nor searched for routes. ``dist`` and
+        ``build`` stay walked, so their files are both tagged as build
+        artifacts and searched for routes as before.
+        """
+        from .project_walker import DEFAULT_EXCLUDE_DIRS
+        from .source_walker import walk_source_files
+
+        # dist/ and build/ are walked to report their contents as generated
+        walk = walk_source_files(
+            self.root,
+            exclude_dirs=DEFAULT_EXCLUDE_DIRS - _ARTIFACT_DIRS,
+            include_unknown=True,
+            with_size=False,
+        )
+        is_django = (self.root / "manage.py").exists()
+        if is_django:
+            self.detected_frameworks.add("django")
+
+        generated: List[List[Dict[str, str]]] = [[] for _ in _GENERATED_PATTERNS]
+        for file_info in walk.all_files():
+            rel_path = file_info.rel_path.replace(os.sep, "/")
+            for bucket, (pattern, gen_type) in zip(generated, _GENERATED_PATTERNS):
+                if pattern.search(rel_path):
+                    bucket.append(
+                        {"path": str(Path(file_info.rel_path)), "type": gen_type}
                     )
+            if file_info.extension == ".py":
+                self._scan_python_file(Path(file_info.path), is_django)
+
+        for bucket in generated:
+            self.generated_files.extend(bucket)
+        # Group routes the way the per-framework passes used to report them
+        self.routes.sort(key=_route_order)
+        for framework in ("flask", "fastapi"):
+            if any(r.framework == framework for r in self.routes):
+                self.detected_frameworks.add(framework)
+
+    def _scan_python_file(self, py_file: Path, is_django: bool) -> None:
+        """Parse ``py_file`` once if any detector is interested in it."""
+        extractors = []
+        if is_django and py_file.name == "urls.py":
+            extractors.append(self._extract_django_urls)
+        if is_django and py_file.name == "views.py":
+            extractors.append(self._extract_django_views)
+        try:
+            data = py_file.read_bytes()
+        except OSError:
+            return
+        if b"flask" in data or b"fastapi" in data:
+            if b"from flask import" in data or b"import flask" in data:
+                extractors.append(self._extract_flask_routes)
+            if b"from fastapi import" in data or b"import fastapi" in data:
+                extractors.append(self._extract_fastapi_routes)
+        if not extractors:
+            return
+        try:
+            tree = ast.parse(data.decode("utf-8", errors="ignore"))
+        except (SyntaxError, ValueError):
+            return
+        for extract in extractors:
+            extract(tree, py_file)
 
     def _extract_django_urls(self, tree: ast.AST, file_path: Path) -> None:
         """Extract Django URL patterns from a urls.py file."""
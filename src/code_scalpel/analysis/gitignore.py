@@ -1,25 +1,468 @@
-"""Simple .gitignore parser for file filtering.
+"""Compiled .gitignore matching for file filtering.
 
-Provides minimal but sufficient gitignore pattern matching for file crawling.
-Does not support advanced features like negation patterns (!pattern).
+[20261018_PERF] Patterns used to be tested one at a time with ``fnmatch``
+for every path, only the root ``.gitignore`` was read, and negation
+(``!pattern``) and anchored patterns were not supported. Each pattern
+source is now translated once into combined regular expressions that
+follow git's wildmatch rules:
+
+- one compiled level per ``.gitignore`` (per directory level), plus one
+  each for ``.git/info/exclude`` and the global ``core.excludesFile``;
+- within a level, basename patterns and path patterns each form a single
+  regex whose alternatives are ordered last-pattern-first, so the first
+  alternative that matches is the one git would apply and its group maps
+  back to the pattern (and whether it was a negation);
+- levels are consulted deepest first, then ``info/exclude``, then the
+  global excludes file, and a path inside an ignored directory is ignored
+  (git never re-includes it).
+
+Compiled levels are cached per ``.gitignore`` file and rebuilt when the
+file changes. ``GitignoreMatcher.entry_ignored`` is the walk-time check
+for walkers that already pruned ignored directories.
 """
 
 from __future__ import annotations
 
-from fnmatch import fnmatch
+import os
+import re
+import threading
+from dataclasses import dataclass
 from pathlib import Path
+from typing import Iterable, Optional
+
+from code_scalpel.cache.git_index import common_git_dir, find_git_dir
+
+# POSIX bracket classes accepted inside [...]
+_POSIX_CLASSES = {
+    "alnum": "a-zA-Z0-9",
+    "alpha": "a-zA-Z",
+    "blank": " \\t",
+    "cntrl": "\\x00-\\x1f\\x7f",
+    "digit": "0-9",
+    "graph": "!-~",
+    "lower": "a-z",
+    "print": " -~",
+    "punct": "!-/:-@\\[-`{-~",
+    "space": " \\t\\n\\r\\f\\v",
+    "upper": "A-Z",
+    "xdigit": "0-9A-Fa-f",
+}
+
+
+def _translate_bracket(pattern: str, start: int) -> tuple[Optional[str], int]:
+    """Translate the ``[...]`` class opening at ``start``.
+
+    Returns the regex and the index after the class, or ``(None, start)``
+    when the bracket is not closed (it is then matched literally).
+    """
+    i = start + 1
+    n = len(pattern)
+    negate = i < n and pattern[i] in "!^"
+    if negate:
+        i += 1
+    parts: list[str] = []
+    first = True
+    while i < n and (pattern[i] != "]" or first):
+        first = False
+        c = pattern[i]
+        if c == "[" and pattern.startswith("[:", i):
+            end = pattern.find(":]", i + 2)
+            if end != -1 and pattern[i + 2 : end] in _POSIX_CLASSES:
+                parts.append(_POSIX_CLASSES[pattern[i + 2 : end]])
+                i = end + 2
+                continue
+        if c == "\\" and i + 1 < n:
+            i += 1
+            c = pattern[i]
+        if i + 2 < n and pattern[i + 1] == "-" and pattern[i + 2] != "]":
+            hi = pattern[i + 2]
+            if hi == "\\" and i + 3 < n:
+                hi = pattern[i + 3]
+                i += 1
+            parts.append(f"{re.escape(c)}-{re.escape(hi)}")
+            i += 3
+            continue
+        parts.append(re.escape(c))
+        i += 1
+    if i >= n:
+        return None, start
+    body = "".join(parts)
+    # A class never matches "/" in a path
+    if negate:
+        return f"[^/{body}]", i + 1
+    return f"(?!/)[{body}]", i + 1
+
+
+def translate_pattern(pattern: str) -> str:
+    """Translate the glob part of a gitignore pattern into a regex.
+
+    ``*`` and ``?`` never match ``/``; ``**/``, ``/**/`` and a trailing
+    ``/**`` span directories; any other ``**`` behaves like ``*``.
+    """
+    out: list[str] = []
+    i = 0
+    n = len(pattern)
+    while i < n:
+        c = pattern[i]
+        if c == "*":
+            j = i
+            while j < n and pattern[j] == "*":
+                j += 1
+            at_start = i == 0 or pattern[i - 1] == "/"
+            if j - i >= 2 and at_start and (j == n or pattern[j] == "/"):
+                if j == n:
+                    out.append(".*")
+                    i = j
+                else:
+                    out.append("(?:.*/)?")
+                    i = j + 1
+                continue
+            out.append("[^/]*")
+            i = j
+        elif c == "?":
+            out.append("[^/]")
+            i += 1
+        elif c == "[":
+            regex, end = _translate_bracket(pattern, i)
+            if regex is None:
+                out.append(re.escape(c))
+                i += 1
+            else:
+                out.append(regex)
+                i = end
+        elif c == "\\" and i + 1 < n:
+            out.append(re.escape(pattern[i + 1]))
+            i += 2
+        else:
+            out.append(re.escape(c))
+            i += 1
+    return "".join(out)
+
+
+@dataclass(frozen=True)
+class GitignorePattern:
+    """One parsed gitignore line.
+
+    ``regex`` matches the basename for unanchored patterns (no ``/``) and
+    the whole relative path otherwise.
+    """
+
+    source: str
+    regex: str
+    negated: bool
+    dir_only: bool
+    anchored: bool
+
+
+def parse_pattern(line: str) -> Optional[GitignorePattern]:
+    """Parse one gitignore line; None for blank lines and comments."""
+    line = line.rstrip("\r\n")
+    # Trailing spaces are dropped unless escaped
+    stripped = line.rstrip(" ")
+    if stripped.endswith("\\") and len(stripped) < len(line):
+        stripped += " "
+    line = stripped
+    if not line or line.startswith("#"):
+        return None
+    negated = line.startswith("!")
+    if negated:
+        line = line[1:]
+    elif line.startswith(("\\!", "\\#")):
+        line = line[1:]
+    dir_only = line.endswith("/") and not line.endswith("\\/")
+    if dir_only:
+        line = line.rstrip("/")
+    if not line:
+        return None
+    anchored = "/" in line
+    return GitignorePattern(
+        source=line,
+        regex=translate_pattern(line.lstrip("/") if anchored else line),
+        negated=negated,
+        dir_only=dir_only,
+        anchored=anchored,
+    )
+
+
+class _Combined:
+    """Patterns merged into one regex per match target (basename, path)."""
+
+    __slots__ = ("name", "name_order", "path", "path_order", "negated")
+
+    def __init__(self, patterns: list[GitignorePattern]):
+        self.negated = tuple(p.negated for p in patterns)
+        self.name, self.name_order = self._compile(patterns, anchored=False)
+        self.path, self.path_order = self._compile(patterns, anchored=True)
+
+    @staticmethod
+    def _compile(
+        patterns: list[GitignorePattern], *, anchored: bool
+    ) -> tuple[Optional[re.Pattern[str]], tuple[int, ...]]:
+        # Last pattern first: the first alternative to match is the one
+        # git applies; group n maps back to its position in the file.
+        chosen = [(i, p) for i, p in enumerate(patterns) if p.anchored == anchored]
+        if not chosen:
+            return None, ()
+        chosen.reverse()
+        regex = "|".join(f"({p.regex})" for _, p in chosen)
+        return re.compile(regex, re.DOTALL), (-1,) + tuple(i for i, _ in chosen)
+
+    def match(self, rel_posix_path: str) -> Optional[bool]:
+        best = -1
+        if self.path is not None:
+            m = self.path.fullmatch(rel_posix_path)
+            if m is not None:
+                best = self.path_order[m.lastindex or 0]
+        if self.name is not None:
+            m = self.name.fullmatch(rel_posix_path.rpartition("/")[2])
+            if m is not None:
+                best = max(best, self.name_order[m.lastindex or 0])
+        if best < 0:
+            return None
+        return not self.negated[best]
+
+
+class CompiledPatterns:
+    """The patterns of one source, compiled into combined regexes.
+
+    Paths are matched relative to the directory the patterns apply to.
+    ``match`` returns True (ignored), False (re-included by a negation) or
+    None (no pattern matched).
+    """
+
+    __slots__ = ("patterns", "_files", "_dirs")
+
+    def __init__(self, patterns: Iterable[GitignorePattern]):
+        self.patterns = list(patterns)
+        self._files = _Combined([p for p in self.patterns if not p.dir_only])
+        self._dirs = _Combined(self.patterns)
+
+    def __bool__(self) -> bool:
+        return bool(self.patterns)
+
+    def match(self, rel_posix_path: str, is_dir: bool) -> Optional[bool]:
+        return (self._dirs if is_dir else self._files).match(rel_posix_path)
+
+    @classmethod
+    def from_lines(cls, lines: Iterable[str]) -> CompiledPatterns:
+        parsed = (parse_pattern(line) for line in lines)
+        return cls(p for p in parsed if p is not None)
+
+
+_EMPTY = CompiledPatterns(())
+
+# Compiled pattern files by absolute path: (mtime_ns, size, patterns)
+_FILE_CACHE: dict[str, tuple[int, int, CompiledPatterns]] = {}
+_FILE_CACHE_LOCK = threading.Lock()
+
+
+def load_patterns(path: str | os.PathLike[str]) -> CompiledPatterns:
+    """Compiled patterns of a gitignore-format file (empty if unreadable).
+
+    Results are cached per file and rebuilt when its mtime or size changes.
+    """
+    key = os.fspath(path)
+    try:
+        st = os.stat(key)
+    except OSError:
+        return _EMPTY
+    cached = _FILE_CACHE.get(key)
+    if cached is not None and cached[0] == st.st_mtime_ns and cached[1] == st.st_size:
+        return cached[2]
+    try:
+        with open(key, "rb") as f:
+            text = f.read().decode("utf-8", errors="ignore")
+    except OSError:
+        return _EMPTY
+    compiled = CompiledPatterns.from_lines(text.lstrip("\ufeff").split("\n"))
+    with _FILE_CACHE_LOCK:
+        _FILE_CACHE[key] = (st.st_mtime_ns, st.st_size, compiled)
+    return compiled
+
+
+def _config_excludes_file(config: Path) -> Optional[str]:
+    """``core.excludesFile`` from one git config file, if set there."""
+    try:
+        text = config.read_text(encoding="utf-8", errors="ignore")
+    except OSError:
+        return None
+    section = ""
+    value: Optional[str] = None
+    for raw in text.splitlines():
+        line = raw.strip()
+        if not line or line[0] in "#;":
+            continue
+        if line.startswith("["):
+            section = line[1 : line.find("]")].strip().lower()
+            continue
+        if section != "core" or "=" not in line:
+            continue
+        key, _, val = line.partition("=")
+        if key.strip().lower() == "excludesfile":
+            value = val.split(" #")[0].split(" ;")[0].strip().strip('"')
+    return value
+
+
+def global_excludes_file(git_dir: Optional[Path] = None) -> Optional[Path]:
+    """Path of the global excludes file git would use.
+
+    ``core.excludesFile`` from the repository, user and XDG configs (the
+    repository config wins); otherwise ``$XDG_CONFIG_HOME/git/ignore``.
+    """
+    home = os.environ.get("HOME") or os.path.expanduser("~")
+    xdg = os.environ.get("XDG_CONFIG_HOME") or os.path.join(home, ".config")
+    configs = [Path(xdg) / "git" / "config", Path(home) / ".gitconfig"]
+    if git_dir is not None:
+        configs.append(git_dir / "config")
+    value: Optional[str] = None
+    for config in configs:
+        found = _config_excludes_file(config)
+        if found is not None:
+            value = found
+    if value:
+        if value.startswith("~/"):
+            value = os.path.join(home, value[2:])
+        return Path(value)
+    return Path(xdg) / "git" / "ignore"
+
+
+def ignore_sources(root: str | os.PathLike[str]) -> list[Path]:
+    """Ignore files read by ``GitignoreMatcher(root)`` that lie outside ``root``.
+
+    The ``.gitignore`` files above ``root`` up to the repository top,
+    ``info/exclude`` and the global excludes file (existing or not).
+    """
+    root_path = Path(root).resolve()
+    top, git_dir = find_git_dir(root_path)
+    sources: list[Path] = []
+    if top is not None:
+        parent = root_path
+        while parent != top:
+            parent = parent.parent
+            sources.append(parent / ".gitignore")
+    if git_dir is not None:
+        git_dir = common_git_dir(git_dir)
+        sources.append(git_dir / "info" / "exclude")
+    excludes = global_excludes_file(git_dir)
+    if excludes is not None:
+        sources.append(excludes)
+    return sources
+
+
+class GitignoreMatcher:
+    """Full gitignore semantics for paths under ``root``.
+
+    Reads every ``.gitignore`` between the repository top and the path,
+    ``.git/info/exclude`` and the global excludes file. Paths are given
+    relative to ``root`` in POSIX form.
+
+    Example:
+        >>> matcher = GitignoreMatcher("/repo")
+        >>> matcher.is_ignored("build/out.js")
+        True
+    """
+
+    def __init__(
+        self,
+        root: str | os.PathLike[str],
+        *,
+        include_global: bool = True,
+    ):
+        self.root = Path(root).resolve()
+        top, git_dir = find_git_dir(self.root)
+        if git_dir is not None:
+            git_dir = common_git_dir(git_dir)  # info/exclude is shared by worktrees
+        self.top = top or self.root
+        self.git_dir = git_dir
+        prefix = self.root.relative_to(self.top).as_posix()
+        self._prefix = "" if prefix == "." else f"{prefix}/"
+        base: list[CompiledPatterns] = []
+        if git_dir is not None:
+            base.append(load_patterns(git_dir / "info" / "exclude"))
+        if include_global:
+            excludes = global_excludes_file(git_dir)
+            if excludes is not None:
+                base.append(load_patterns(excludes))
+        self._base = [levels for levels in base if levels]
+        self._levels: dict[str, CompiledPatterns] = {}
+        self._dirs: dict[str, bool] = {}
+
+    def _level(self, directory: str) -> CompiledPatterns:
+        """Patterns of ``<top>/<directory>/.gitignore`` (cached)."""
+        level = self._levels.get(directory)
+        if level is None:
+            level = load_patterns(self.top / directory / ".gitignore")
+            self._levels[directory] = level
+        return level
+
+    def _decide(self, path: str, is_dir: bool) -> bool:
+        """Whether ``path`` (relative to top) itself matches, parents aside."""
+        end = len(path)
+        while True:
+            end = path.rfind("/", 0, end)
+            directory = path[:end] if end > 0 else ""
+            level = self._level(directory)
+            if level:
+                result = level.match(path[end + 1 :] if end > 0 else path, is_dir)
+                if result is not None:
+                    return result
+            if end <= 0:
+                break
+        for level in self._base:
+            result = level.match(path, is_dir)
+            if result is not None:
+                return result
+        return False
+
+    def _dir_ignored(self, path: str) -> bool:
+        ignored = self._dirs.get(path)
+        if ignored is None:
+            parent = path.rfind("/")
+            ignored = (
+                parent > len(self._prefix) - 1 and self._dir_ignored(path[:parent])
+            ) or self._decide(path, True)
+            self._dirs[path] = ignored
+        return ignored
+
+    def is_ignored(self, rel_path: str | Path, *, is_dir: bool = False) -> bool:
+        """Whether git ignores ``rel_path``, including via an ignored parent."""
+        rel = Path(rel_path).as_posix() if isinstance(rel_path, Path) else rel_path
+        rel = rel.strip("/")
+        if not rel or rel == ".":
+            return False
+        path = self._prefix + rel
+        if is_dir:
+            return self._dir_ignored(path)
+        parent = path.rfind("/")
+        if parent > len(self._prefix) - 1 and self._dir_ignored(path[:parent]):
+            return True
+        return self._decide(path, False)
+
+    def entry_ignored(self, rel_path: str, is_dir: bool) -> bool:
+        """Walk-time check: ``rel_path``'s parent directories are not ignored.
+
+        Walkers prune ignored directories, so only the entry itself needs to
+        be matched.
+        """
+        return self._decide(self._prefix + rel_path, is_dir)
 
 
 class GitignoreParser:
-    """Simple gitignore pattern parser."""
+    """Patterns from a single gitignore-format file, compiled once.
+
+    Paths are matched relative to the file's directory. Use
+    ``GitignoreMatcher`` for nested ``.gitignore`` files and git's excludes.
+    """
 
     def __init__(self, patterns: list[str]):
         """Initialize with gitignore patterns.
 
         Args:
-            patterns: List of gitignore patterns (without comments or empty lines)
+            patterns: List of gitignore patterns (comments and empty lines
+                are skipped; ``!pattern`` re-includes a path)
         """
         self.patterns = patterns
+        self._compiled = CompiledPatterns.from_lines(patterns)
 
     @classmethod
     def from_file(cls, gitignore_path: str) -> GitignoreParser:
@@ -38,64 +481,48 @@ class GitignoreParser:
                 for raw in path.read_text(
                     encoding="utf-8", errors="ignore"
                 ).splitlines():
-                    line = raw.strip()
-                    # Skip empty lines and comments
-                    if not line or line.startswith("#"):
-                        continue
-                    # Skip negation patterns (not supported)
-                    if line.startswith("!"):
-                        continue
-                    patterns.append(line)
+                    if parse_pattern(raw) is not None:
+                        patterns.append(raw)
         except Exception:
             # If we can't read the file, just use no patterns
             pass
 
         return cls(patterns)
 
-    def _matches_pattern(
-        self, rel_posix_path: str, pattern: str, *, is_dir: bool
-    ) -> bool:
-        """Check if a path matches a gitignore pattern.
-
-        Args:
-            rel_posix_path: Path relative to repo root, in POSIX format
-            pattern: Gitignore pattern
-            is_dir: Whether the path is a directory
-
-        Returns:
-            True if pattern matches the path
-        """
-        # Directory-only patterns
-        if pattern.endswith("/"):
-            if not is_dir:
-                return False
-            pattern = pattern[:-1]
-
-        # Path patterns (contain /)
-        if "/" in pattern:
-            return fnmatch(rel_posix_path, pattern)
-
-        # Simple filename patterns (no /)
-        return fnmatch(Path(rel_posix_path).name, pattern)
-
     def is_ignored(self, rel_path: Path | str, *, is_dir: bool = False) -> bool:
         """Check if a path should be ignored.
 
         Args:
-            rel_path: Path relative to repo root
+            rel_path: Path relative to the .gitignore's directory
             is_dir: Whether this is a directory
 
         Returns:
-            True if path matches any gitignore pattern
+            True if the last matching pattern ignores the path (or one of
+            its parent directories)
         """
-        if not self.patterns:
+        if not self._compiled:
             return False
 
-        if isinstance(rel_path, str):
-            rel_path = Path(rel_path)
+        if isinstance(rel_path, Path):
+            rel_path = rel_path.as_posix()
+        rel_posix = rel_path.strip("/")
+        if rel_posix.startswith("./"):
+            rel_posix = rel_posix[2:]
+        parts = rel_posix.split("/")
+        for i in range(1, len(parts)):
+            if self._compiled.match("/".join(parts[:i]), True):
+                return True
+        return bool(self._compiled.match(rel_posix, is_dir))
+
 
-        rel_posix = rel_path.as_posix().lstrip("./")
-        return any(
-            self._matches_pattern(rel_posix, pat, is_dir=is_dir)
-            for pat in self.patterns
-        )
+__all__ = [
+    "CompiledPatterns",
+    "GitignoreMatcher",
+    "GitignoreParser",
+    "GitignorePattern",
+    "global_excludes_file",
+    "ignore_sources",
+    "load_patterns",
+    "parse_pattern",
+    "translate_pattern",
+]
@@ -8,6 +8,12 @@ Uses SQLite to track file hashes and cached analysis results:
 - Persists analysis between runs
 - Supports 100k+ file projects efficiently
 
+[20261018_PERF] Each thread keeps one WAL-mode connection for the life of
+the index; ``batch()`` groups many ``store_analysis`` calls into a single
+transaction written with ``executemany``; staleness is decided by joining
+the stored (size, mtime) against a temp table of current stat data so only
+files whose stat changed are re-hashed.
+
 Usage:
     from code_scalpel.analysis.incremental_index import IncrementalIndex
 
@@ -25,13 +31,35 @@ from __future__ import annotations
 
 import hashlib
 import json
+import os
 import sqlite3
+import threading
 import time
 from contextlib import contextmanager
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Any, Dict, Generator, List, Optional
 
+from code_scalpel.cache.change_feed import Changes, get_change_feed
+from code_scalpel.cache.git_index import git_detector_for
+
+# Rows buffered by batch() before they are written with one executemany
+_BATCH_SIZE = 1000
+# Stat data recorded less than this long before a file's mtime is not
+# trusted: a same-tick edit on a coarse-timestamp filesystem keeps the mtime
+_RACY_WINDOW_NS = 2_000_000_000
+
+_UPSERT_SQL = """
+    INSERT OR REPLACE INTO file_analysis
+    (path, content_hash, analysis_timestamp, lines_of_code,
+     functions_json, classes_json, imports_json,
+     complexity_warnings_json, error, size, mtime_ns, verified_ns)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+_REFRESH_SQL = (
+    "UPDATE file_analysis SET size = ?, mtime_ns = ?, verified_ns = ? WHERE path = ?"
+)
+
 
 @dataclass
 class CachedFileAnalysis:
@@ -60,10 +88,24 @@ class IndexStats:
     database_size_bytes: int
 
 
+def _stat_changed(
+    size: Optional[int],
+    mtime_ns: Optional[int],
+    verified_ns: Optional[int],
+    st: os.stat_result,
+) -> bool:
+    """True unless ``st`` matches the stored stat data and is not racy."""
+    return (
+        size != st.st_size
+        or mtime_ns != st.st_mtime_ns
+        or st.st_mtime_ns >= (verified_ns or 0) - _RACY_WINDOW_NS
+    )
+
+
 class IncrementalIndex:
     """SQLite-based incremental index for file analysis caching."""
 
-    SCHEMA_VERSION = 1
+    SCHEMA_VERSION = 2
 
     def __init__(
         self,
@@ -82,7 +124,12 @@ class IncrementalIndex:
         self.root = Path(project_root)
         self.cache_dir = Path(cache_dir) if cache_dir else self.root
         self.db_path = self.cache_dir / database_name
-        self._connection: Optional[sqlite3.Connection] = None
+        # [20261018_PERF] One persistent connection per thread
+        self._local = threading.local()
+        self._connections: List[sqlite3.Connection] = []
+        self._connections_lock = threading.Lock()
+        # [20261018_PERF] Change-feed token at which each path last hashed clean
+        self._verified: Dict[str, str] = {}
 
         # Initialize database
         self._init_database()
@@ -104,7 +151,10 @@ class IncrementalIndex:
                     classes_json TEXT,
                     imports_json TEXT,
                     complexity_warnings_json TEXT,
-                    error TEXT
+                    error TEXT,
+                    size INTEGER,
+                    mtime_ns INTEGER,
+                    verified_ns INTEGER
                 );
                 
                 CREATE TABLE IF NOT EXISTS crawl_metadata (
@@ -132,31 +182,119 @@ class IncrementalIndex:
         self, conn: sqlite3.Connection, from_ver: int, to_ver: int
     ) -> None:
         """Migrate database schema between versions."""
-        # For now, just update the version - add migrations as needed
+        if from_ver < 2:
+            # [20261018_PERF] Stat data for set-based staleness checks; old
+            # rows have none and are re-hashed (then refreshed) once.
+            columns = {
+                row[1] for row in conn.execute("PRAGMA table_info(file_analysis)")
+            }
+            for column in ("size", "mtime_ns", "verified_ns"):
+                if column not in columns:
+                    conn.execute(
+                        f"ALTER TABLE file_analysis ADD COLUMN {column} INTEGER"
+                    )
         conn.execute("UPDATE schema_version SET version = ?", (to_ver,))
 
+    def _connect(self) -> sqlite3.Connection:
+        """This thread's connection, opened (in WAL mode) on first use."""
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(
+                str(self.db_path),
+                timeout=30.0,
+                cached_statements=256,
+                check_same_thread=False,
+            )
+            conn.row_factory = sqlite3.Row
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute("PRAGMA temp_store=MEMORY")
+            self._local.conn = conn
+            self._local.depth = 0
+            self._local.pending = []
+            with self._connections_lock:
+                self._connections.append(conn)
+        return conn
+
     @contextmanager
     def _get_connection(self) -> Generator[sqlite3.Connection, None, None]:
-        """Get a database connection with proper lifecycle management."""
-        conn = sqlite3.connect(str(self.db_path))
-        conn.row_factory = sqlite3.Row
+        """Get this thread's connection; commits unless inside ``batch()``."""
+        conn = self._connect()
+        if self._local.depth:
+            self._flush(conn)  # reads inside a batch see its pending rows
+            yield conn
+            return
         try:
             yield conn
             conn.commit()
         except Exception:
             conn.rollback()
             raise
-        finally:
-            conn.close()
 
-    def compute_file_hash(self, file_path: str | Path) -> str:
-        """Compute content hash for a file."""
-        full_path = (
+    def _flush(self, conn: sqlite3.Connection) -> None:
+        pending = self._local.pending
+        if pending:
+            conn.executemany(_UPSERT_SQL, pending)
+            pending.clear()
+
+    @contextmanager
+    def batch(self) -> Generator["IncrementalIndex", None, None]:
+        """Group writes (e.g. one crawl's ``store_analysis`` calls) into one
+        transaction, written in ``executemany`` chunks.
+
+        Batches nest; the outermost one commits, or rolls back on error.
+        """
+        conn = self._connect()
+        local = self._local
+        local.depth += 1
+        try:
+            yield self
+            if local.depth == 1:
+                self._flush(conn)
+                conn.commit()
+        except BaseException:
+            if local.depth == 1:
+                local.pending.clear()
+                conn.rollback()
+            raise
+        finally:
+            local.depth -= 1
+
+    def close(self) -> None:
+        """Close every thread's connection (they reopen on next use)."""
+        with self._connections_lock:
+            connections, self._connections = self._connections, []
+            self._local = threading.local()
+        for conn in connections:
+            try:
+                conn.close()
+            except sqlite3.Error:
+                pass
+
+    def __enter__(self) -> "IncrementalIndex":
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        self.close()
+
+    def _full_path(self, file_path: str | Path) -> Path:
+        return (
             self.root / file_path
             if not Path(file_path).is_absolute()
             else Path(file_path)
         )
 
+    def compute_file_hash(self, file_path: str | Path) -> str:
+        """Compute content hash for a file.
+
+        [20261018_PERF] Inside a git work tree this is the file's blob id,
+        taken from ``.git/index`` without reading the file when it is clean.
+        """
+        full_path = self._full_path(file_path)
+        detector = git_detector_for(full_path)
+        if detector is not None:
+            return detector.blob_id(full_path)
+
         hasher = hashlib.sha256()
         try:
             with open(full_path, "rb") as f:
@@ -167,20 +305,46 @@ class IncrementalIndex:
             return ""
 
     def needs_reanalysis(self, file_path: str) -> bool:
-        """Check if a file needs re-analysis based on content hash."""
-        current_hash = self.compute_file_hash(file_path)
-        if not current_hash:
+        """Check if a file needs re-analysis based on content hash.
+
+        [20261018_PERF] A file the change feed vouches for since it was last
+        hashed is not hashed again.
+        """
+        full_path = os.path.abspath(self._full_path(file_path))
+        feed = get_change_feed(full_path)
+        verified = self._verified.get(file_path)
+        if feed is not None and feed.unchanged_since(verified, full_path):
+            return False
+        token = feed.token() if feed is not None else None
+
+        try:
+            st = os.stat(full_path)
+        except OSError:
             return True  # File doesn't exist or can't be read
 
         with self._get_connection() as conn:
-            cursor = conn.execute(
-                "SELECT content_hash FROM file_analysis WHERE path = ?", (file_path,)
-            )
-            row = cursor.fetchone()
-
+            row = conn.execute(
+                "SELECT content_hash, size, mtime_ns, verified_ns "
+                "FROM file_analysis WHERE path = ?",
+                (file_path,),
+            ).fetchone()
             if row is None:
                 return True  # Not in cache
-            return row["content_hash"] != current_hash
+            # [20261018_PERF] Unchanged stat data: no need to hash
+            if not _stat_changed(row["size"], row["mtime_ns"], row["verified_ns"], st):
+                if token is not None:
+                    self._verified[file_path] = token
+                return False
+
+            current_hash = self.compute_file_hash(file_path)
+            if not current_hash or row["content_hash"] != current_hash:
+                return True
+            conn.execute(
+                _REFRESH_SQL, (st.st_size, st.st_mtime_ns, time.time_ns(), file_path)
+            )
+        if token is not None:
+            self._verified[file_path] = token
+        return False
 
     def get_cached_analysis(self, file_path: str) -> Optional[CachedFileAnalysis]:
         """Get cached analysis for a file if available and valid."""
@@ -222,30 +386,48 @@ class IncrementalIndex:
         complexity_warnings: List[Dict[str, Any]],
         error: Optional[str] = None,
     ) -> None:
-        """Store analysis result for a file."""
+        """Store analysis result for a file.
+
+        [20261018_PERF] Inside ``batch()`` the row is buffered and written
+        with the rest of the batch.
+        """
+        full_path = os.path.abspath(self._full_path(file_path))
+        feed = get_change_feed(full_path)
+        token = feed.token() if feed is not None else None
+        # Stat before hashing: an edit during the hash then shows as a change
+        try:
+            st: Optional[os.stat_result] = os.stat(full_path)
+        except OSError:
+            st = None
         content_hash = self.compute_file_hash(file_path)
+        now = time.time_ns()
+        row = (
+            file_path,
+            content_hash,
+            now / 1e9,
+            lines_of_code,
+            json.dumps(functions),
+            json.dumps(classes),
+            json.dumps(imports),
+            json.dumps(complexity_warnings),
+            error,
+            st.st_size if st is not None else None,
+            st.st_mtime_ns if st is not None else None,
+            now,
+        )
 
-        with self._get_connection() as conn:
-            conn.execute(
-                """
-                INSERT OR REPLACE INTO file_analysis 
-                (path, content_hash, analysis_timestamp, lines_of_code,
-                 functions_json, classes_json, imports_json, 
-                 complexity_warnings_json, error)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """,
-                (
-                    file_path,
-                    content_hash,
-                    time.time(),
-                    lines_of_code,
-                    json.dumps(functions),
-                    json.dumps(classes),
-                    json.dumps(imports),
-                    json.dumps(complexity_warnings),
-                    error,
-                ),
-            )
+        conn = self._connect()
+        if self._local.depth:
+            self._local.pending.append(row)
+            if len(self._local.pending) >= _BATCH_SIZE:
+                self._flush(conn)
+        else:
+            with self._get_connection() as conn:
+                conn.execute(_UPSERT_SQL, row)
+        if token is not None and content_hash:
+            self._verified[file_path] = token
+        else:
+            self._verified.pop(file_path, None)
 
     def get_all_cached_paths(self) -> List[str]:
         """Get all file paths in the cache."""
@@ -254,17 +436,98 @@ class IncrementalIndex:
             return [row["path"] for row in cursor.fetchall()]
 
     def get_stale_files(self) -> List[str]:
-        """Get list of files that need re-analysis."""
+        """Get list of files that need re-analysis.
+
+        [20261018_PERF] With a change feed running, only files it cannot
+        vouch for are checked. The check is set-based: current stat data
+        goes into a temp table that is joined against the stored stat data,
+        and only the files whose stat changed are re-hashed.
+        """
         cached_paths = self.get_all_cached_paths()
-        return [p for p in cached_paths if self.needs_reanalysis(p)]
+        feed = get_change_feed(os.path.abspath(self.root))
+        if feed is None:
+            return self._stale_among(cached_paths)
+
+        changes: Dict[str, Optional[Changes]] = {}
+        candidates = []
+        for path in cached_paths:
+            token = self._verified.get(path)
+            if token is not None:
+                if token not in changes:
+                    changes[token] = feed.changes_since(token)
+                since = changes[token]
+                full_path = os.path.abspath(self._full_path(path))
+                if (
+                    since is not None
+                    and feed.watches(full_path)
+                    and not since.affects(full_path)
+                ):
+                    continue
+            candidates.append(path)
+        return self._stale_among(candidates)
+
+    def _stale_among(self, paths: List[str]) -> List[str]:
+        """Stale subset of cached ``paths``, in the given order."""
+        if not paths:
+            return []
+        feed = get_change_feed(os.path.abspath(self.root))
+        token = feed.token() if feed is not None else None
+        current = []
+        stale = set()
+        for path in paths:
+            try:
+                st = os.stat(self._full_path(path))
+            except OSError:
+                stale.add(path)
+                continue
+            current.append((path, st.st_size, st.st_mtime_ns))
+
+        with self._get_connection() as conn:
+            conn.execute(
+                "CREATE TEMP TABLE IF NOT EXISTS current_files "
+                "(path TEXT PRIMARY KEY, size INTEGER, mtime_ns INTEGER)"
+            )
+            conn.execute("DELETE FROM current_files")
+            conn.executemany("INSERT INTO current_files VALUES (?, ?, ?)", current)
+            changed = conn.execute(
+                """
+                SELECT c.path, c.size, c.mtime_ns, f.content_hash
+                FROM current_files c JOIN file_analysis f ON f.path = c.path
+                WHERE f.size IS NOT c.size
+                   OR f.mtime_ns IS NOT c.mtime_ns
+                   OR c.mtime_ns >= COALESCE(f.verified_ns, 0) - ?
+                """,
+                (_RACY_WINDOW_NS,),
+            ).fetchall()
+            conn.execute("DELETE FROM current_files")
+
+            refreshed = []
+            now = time.time_ns()
+            for row in changed:
+                path = row["path"]
+                current_hash = self.compute_file_hash(path)
+                if not current_hash or current_hash != row["content_hash"]:
+                    stale.add(path)
+                else:  # touched but not edited: remember the new stat data
+                    refreshed.append((row["size"], row["mtime_ns"], now, path))
+            if refreshed:
+                conn.executemany(_REFRESH_SQL, refreshed)
+
+        if token is not None:
+            for path in paths:
+                if path not in stale:
+                    self._verified[path] = token
+        return [p for p in paths if p in stale]
 
     def invalidate(self, file_path: str) -> None:
         """Invalidate cache for a specific file."""
+        self._verified.pop(file_path, None)
         with self._get_connection() as conn:
             conn.execute("DELETE FROM file_analysis WHERE path = ?", (file_path,))
 
     def invalidate_all(self) -> None:
         """Clear all cached analysis."""
+        self._verified.clear()
         with self._get_connection() as conn:
             conn.execute("DELETE FROM file_analysis")
 
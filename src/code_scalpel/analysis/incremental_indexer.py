@@ -12,6 +12,8 @@ Architecture:
 - Timestamp-based invalidation
 - Automatic cleanup of stale entries
 - Thread-safe access with optional Redis backing
+- [20261018_PERF] Optional content-addressed store shared across checkouts
+  and CI runners (see ``code_scalpel.cache.analysis_store``)
 
 Usage:
     from code_scalpel.analysis.incremental_indexer import IncrementalIndexer
@@ -37,11 +39,16 @@ from __future__ import annotations
 import hashlib
 import json
 import logging
+import os
 import sqlite3
 import time
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Mapping, Optional
+
+from code_scalpel import __version__
+from code_scalpel.cache.analysis_store import AnalysisStore
+from code_scalpel.cache.git_index import git_detector_for
 
 logger = logging.getLogger(__name__)
 
@@ -89,6 +96,8 @@ class IncrementalIndexer:
         cache_dir: Optional[str | Path] = None,
         ttl_seconds: int = 86400,
         use_redis: bool = False,
+        analysis_store: Optional[AnalysisStore | str | Path] = None,
+        analysis_config: Optional[Mapping[str, Any]] = None,
     ):
         """
         Initialize incremental indexer.
@@ -98,11 +107,24 @@ class IncrementalIndexer:
             cache_dir: Directory for SQLite cache (default: .code-scalpel/cache)
             ttl_seconds: Cache TTL in seconds (default: 24 hours)
             use_redis: Use Redis for distributed caching (Enterprise only)
+            analysis_store: Content-addressed store (or its directory) shared
+                between checkouts; defaults to ``SCALPEL_ANALYSIS_STORE``
+            analysis_config: Analysis options that change results; part of
+                every store key
         """
         self.root = Path(project_root)
         self.ttl_seconds = ttl_seconds
         self.use_redis = use_redis
 
+        # [20261018_PERF] Portable tier keyed by (version, content, config)
+        if analysis_store is None and os.environ.get("SCALPEL_ANALYSIS_STORE"):
+            analysis_store = os.environ["SCALPEL_ANALYSIS_STORE"]
+        if analysis_store is not None and not isinstance(analysis_store, AnalysisStore):
+            analysis_store = AnalysisStore(
+                analysis_store, analyzer_version=__version__, config=analysis_config
+            )
+        self.analysis_store: Optional[AnalysisStore] = analysis_store
+
         # Setup cache directory
         if cache_dir is None:
             cache_dir = self.root / ".code-scalpel" / "cache"
@@ -166,7 +188,14 @@ class IncrementalIndexer:
             self.redis_client = None
 
     def compute_file_hash(self, file_path: Path) -> str:
-        """Compute SHA256 hash of a file."""
+        """Compute SHA256 hash of a file.
+
+        [20261018_PERF] Inside a git work tree the git blob id is used
+        instead; clean files are answered from ``.git/index`` unread.
+        """
+        detector = git_detector_for(file_path)
+        if detector is not None:
+            return detector.blob_id(file_path)
         sha256 = hashlib.sha256()
         try:
             with open(file_path, "rb") as f:
@@ -252,6 +281,12 @@ class IncrementalIndexer:
 
             conn.commit()
 
+        if self.analysis_store is not None and file_hash:
+            try:
+                self.analysis_store.put(file_hash, analysis)
+            except OSError as e:
+                logger.warning(f"Analysis store write failed: {e}")
+
     def get_cached_analysis(self, file_path: Path) -> Optional[Dict[str, Any]]:
         """Get cached analysis for a file (if not expired)."""
         file_hash = self.compute_file_hash(file_path)
@@ -281,7 +316,7 @@ class IncrementalIndexer:
             ).fetchone()
 
         if row is None:
-            return None
+            return self._from_store(file_hash)
 
         analysis_json, cached_at, ttl = row
         now = time.time()
@@ -289,10 +324,20 @@ class IncrementalIndexer:
         # Check if expired
         if now - cached_at > ttl:
             self._invalidate_analysis(file_path)
-            return None
+            return self._from_store(file_hash)
 
         return json.loads(analysis_json)
 
+    def _from_store(self, file_hash: str) -> Optional[Dict[str, Any]]:
+        """[20261018_PERF] Result for this content from the shared store.
+
+        Entries are keyed by content, analyzer version and config, so they
+        never go stale and the TTL does not apply.
+        """
+        if self.analysis_store is None or not file_hash:
+            return None
+        return self.analysis_store.get(file_hash)
+
     def invalidate_cache(self, file_path: Optional[Path] = None) -> None:
         """Invalidate cache for a specific file or entire cache."""
         with sqlite3.connect(self.db_path) as conn:
@@ -28,7 +28,7 @@ from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any, Callable, Dict, Generator, List, Optional, Set
 
-from .gitignore import GitignoreParser
+from .gitignore import GitignoreMatcher
 
 
 @dataclass
@@ -141,12 +141,11 @@ class ParallelCrawler:
         self.respect_gitignore = respect_gitignore
         self.max_file_size = int(max_file_size_mb * 1024 * 1024)
 
-        # Initialize gitignore parser if needed
-        self.gitignore: Optional[GitignoreParser] = None
+        # [20261018_PERF] Compiled matcher for nested .gitignore files and
+        # git's excludes (see gitignore.GitignoreMatcher)
+        self.gitignore: Optional[GitignoreMatcher] = None
         if respect_gitignore:
-            gitignore_path = self.root / ".gitignore"
-            if gitignore_path.exists():
-                self.gitignore = GitignoreParser.from_file(str(gitignore_path))
+            self.gitignore = GitignoreMatcher(self.root)
 
         # Statistics
         self._files_discovered = 0
@@ -179,8 +178,8 @@ class ParallelCrawler:
 
             # Check gitignore
             if self.gitignore:
-                rel_path = str(dir_path.relative_to(self.root))
-                if self.gitignore.is_ignored(rel_path):
+                rel_path = dir_path.relative_to(self.root).as_posix()
+                if self.gitignore.entry_ignored(rel_path, True):
                     return True
 
             return False
@@ -197,6 +196,10 @@ class ParallelCrawler:
                         if entry.is_file(follow_symlinks=False):
                             path = Path(entry.path)
                             if path.suffix.lower() in target_extensions:
+                                if self.gitignore and self.gitignore.entry_ignored(
+                                    path.relative_to(self.root).as_posix(), False
+                                ):
+                                    continue
                                 stat = entry.stat()
                                 if stat.st_size <= self.max_file_size:
                                     files.append(
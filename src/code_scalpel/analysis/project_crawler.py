@@ -35,8 +35,17 @@ import re
 from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Any, TypedDict
-
+from typing import Any, Collection, TypedDict
+
+from ..cache.change_feed import Changes, ChangeFeed, get_change_feed
+from ..code_parsers.language_detection import detect_file_language, detect_languages
+from .crawl_modes import (
+    count_lines,
+    mode_covers,
+    scan_python_declarations,
+    validate_mode,
+)
+from .gitignore import ignore_sources
 from .project_walker import ProjectWalker
 
 
@@ -79,13 +88,24 @@ DEFAULT_EXCLUDE_DIRS: frozenset[str] = frozenset(
 # Default complexity threshold for warnings
 DEFAULT_COMPLEXITY_THRESHOLD: int = 10
 
+# Extensions the crawler maps to a language without reading the file
+_EXTENSION_LANGUAGES: dict[str, str] = {
+    ".py": "python",
+    ".js": "javascript",
+    ".jsx": "javascript",
+    ".ts": "typescript",
+    ".tsx": "typescript",
+    ".java": "java",
+}
 
-def _analyze_file_worker(file_path: str) -> "FileAnalysisResult":
+
+def _analyze_file_worker(file_path: str, mode: str = "full") -> "FileAnalysisResult":
     """ProcessPool worker entrypoint for analyzing a single file."""
     crawler = ProjectCrawler(
         root_path=Path(file_path).parent,
         # Worker only analyzes the given file; config is minimal and deterministic.
         respect_gitignore=False,
+        mode=mode,
     )
     return crawler._analyze_file(file_path)
 
@@ -343,6 +363,9 @@ class ProjectCrawler:
         include_extensions: tuple[str, ...] | None = None,
         parallelism: str = "none",  # none|threads|processes
         enable_cache: bool = False,
+        mode: str = "full",
+        exclude_paths: Collection[str] | None = None,
+        cache_dir: str | Path | None = None,
     ):
         """
         Initialize the project crawler.
@@ -351,6 +374,12 @@ class ProjectCrawler:
             root_path: Root directory to crawl
             exclude_dirs: Directory names to exclude (uses defaults if None)
             complexity_threshold: Complexity score that triggers a warning
+            mode: Per-file detail - "summary" (stat and line counts),
+                "structure" (declaration scan) or "full" (AST analysis)
+            exclude_paths: Directories (POSIX paths relative to the root) to
+                prune, e.g. nested packages crawled as their own shard
+            cache_dir: Where the crawl cache lives (default
+                ``<root>/.code-scalpel/cache``)
         """
         self.root_path = Path(root_path).resolve()
         self.exclude_dirs = exclude_dirs or DEFAULT_EXCLUDE_DIRS
@@ -368,12 +397,27 @@ class ProjectCrawler:
         )
         self.parallelism = parallelism
         self.enable_cache = enable_cache
-
-        self._cache_dir = self.root_path / ".code-scalpel" / "cache"
+        # [20261018_PERF] Tiered crawl modes (see crawl_modes)
+        self.mode = validate_mode(mode)
+
+        self.exclude_paths = frozenset(exclude_paths or ())
+        self._cache_dir = (
+            Path(cache_dir)
+            if cache_dir is not None
+            else self.root_path / ".code-scalpel" / "cache"
+        )
         self._cache_file = self._cache_dir / "crawl_cache_v1.json"
         self._cache_hits = 0
         self._cache_misses = 0
         self._cache: dict[str, Any] = {}
+        # [20261018_PERF] Content-detected languages for files whose
+        # extension does not identify the language, filled once per crawl
+        self._content_languages: dict[str, str] = {}
+        # [20261018_PERF] Change feed for the root (cache enabled only): the
+        # token of this crawl and the changes since each stored token
+        self._feed: ChangeFeed | None = None
+        self._feed_token: str | None = None
+        self._feed_changes: dict[str, Changes | None] = {}
 
         if not self.root_path.exists():
             raise ValueError(f"Path does not exist: {self.root_path}")
@@ -411,17 +455,14 @@ class ProjectCrawler:
             # Best-effort caching only
             return
 
-    def _detect_language(self, path: Path) -> str:
-        ext = path.suffix.lower()
-        if ext == ".py":
-            return "python"
-        if ext in (".js", ".jsx"):
-            return "javascript"
-        if ext in (".ts", ".tsx"):
-            return "typescript"
-        if ext == ".java":
-            return "java"
-        return "unknown"
+    def _detect_language(self, path: str | Path) -> str:
+        language = _EXTENSION_LANGUAGES.get(os.path.splitext(path)[1].lower())
+        if language is not None:
+            return language
+        detected = self._content_languages.get(str(path))
+        if detected is None:
+            detected = detect_file_language(Path(path)).value
+        return detected
 
     def _estimate_complexity_text(self, content: str, language: str) -> int:
         # Heuristic, deterministic, and cheap. Intended for "basic complexity metrics".
@@ -454,26 +495,138 @@ class ProjectCrawler:
         # Stable key regardless of OS path separators
         return rel_path.replace("\\", "/")
 
+    def _feed_unchanged(self, token: Any, file_path: str | Path) -> bool:
+        """Whether the change feed vouches ``file_path`` is unchanged since ``token``."""
+        if self._feed is None or not self._feed.watches(str(file_path)):
+            return False
+        changes = self._changes_since(token)
+        return changes is not None and not changes.affects(str(file_path))
+
+    def _feed_token_for(self, file_path: str | Path) -> str | None:
+        """The crawl's feed token, if the feed can later vouch for ``file_path``.
+
+        Files in unwatched directories and symlinks (whose target the feed
+        does not follow) get no token and are always checked by stat.
+        """
+        if self._feed is None or self._feed_token is None:
+            return None
+        path = str(file_path)
+        if not self._feed.watches(path) or os.path.islink(path):
+            return None
+        return self._feed_token
+
+    def _feed_covers_root(self, feed: ChangeFeed) -> bool:
+        """Whether ``feed`` watches the crawl root as a directory."""
+        rel = os.path.relpath(self.root_path, feed.root)
+        if rel == os.curdir:
+            return True
+        parts = rel.split(os.sep)
+        return parts[0] != os.pardir and not any(
+            part in feed.exclude_dirs for part in parts
+        )
+
+    def _changes_since(self, token: Any) -> Changes | None:
+        """Changes after ``token`` per the change feed (memoized per crawl)."""
+        if self._feed is None or not isinstance(token, str):
+            return None
+        if token not in self._feed_changes:
+            self._feed_changes[token] = self._feed.changes_since(token)
+        return self._feed_changes[token]
+
+    def _walk_key(self) -> list[Any]:
+        """Parameters that shape the discovered file list (JSON-comparable)."""
+        return [
+            sorted(self.exclude_dirs),
+            self.max_depth,
+            self.max_files,
+            self.respect_gitignore,
+            list(self.include_extensions),
+            sorted(self.exclude_paths),
+            self._ignore_stamps() if self.respect_gitignore else [],
+        ]
+
+    def _ignore_stamps(self) -> list[Any]:
+        """Stat of the ignore files the change feed does not see.
+
+        ``.git/info/exclude``, the global excludes file and ``.gitignore``
+        files above the root can change the file list without an event.
+        """
+        stamps: list[Any] = []
+        for source in ignore_sources(self.root_path):
+            try:
+                st = source.stat()
+            except OSError:
+                stamps.append([str(source), None])
+            else:
+                stamps.append([str(source), st.st_mtime_ns, st.st_size])
+        return stamps
+
+    def _reusable_listing(self) -> list[tuple[str, str]] | None:
+        """The previous crawl's file list, if the change feed shows it still holds.
+
+        It holds when no directory was created or removed and every changed
+        file is either already listed (and still present) or one the crawl
+        would not pick up anyway.
+        """
+        listed = self._cache.get("listing")
+        if not isinstance(listed, list) or self._cache.get("walk") != self._walk_key():
+            return None
+        # New files in a directory the feed skips but the crawl enters would
+        # go unnoticed (the tool's own .code-scalpel state directory aside)
+        if self._feed is None:
+            return None
+        unwatched = self._feed.exclude_dirs - {".code-scalpel"}
+        if not unwatched <= set(self.exclude_dirs):
+            return None
+        changes = self._changes_since(self._cache.get("listing_token"))
+        if changes is None or changes.directories:
+            return None
+        paths = {path for path, _ in listed}
+        for changed in changes.files:
+            if changed in paths:
+                if not os.path.isfile(changed):
+                    return None
+            elif (
+                os.path.basename(changed) == ".gitignore"
+                or os.path.splitext(changed)[1].lower() in self.include_extensions
+            ):
+                return None
+        return [(str(path), rel) for path, rel in listed]
+
     def _try_load_cached(
-        self, file_path: Path, rel_path: str
+        self, file_path: str | Path, rel_path: str
     ) -> FileAnalysisResult | None:
         if not self.enable_cache:
             return None
 
-        try:
-            st = file_path.stat()
-        except Exception:
-            return None
-
         cache_files = self._cache.get("files", {})
         key = self._cache_key_for(rel_path)
         entry = cache_files.get(key)
         if not isinstance(entry, dict):
             return None
+        # Entries written before crawl modes existed are full analyses
+        if not mode_covers(str(entry.get("mode", "full")), self.mode):
+            return None
+
+        # [20261018_PERF] An entry the change feed vouches for needs no stat
+        if self._feed_unchanged(entry.get("token"), file_path):
+            fresh = True
+            token = self._feed_token
+        else:
+            try:
+                st = Path(file_path).stat()
+            except Exception:
+                return None
+            fresh = (
+                entry.get("mtime") == st.st_mtime and entry.get("size") == st.st_size
+            )
+            token = self._feed_token_for(file_path)
 
-        if entry.get("mtime") == st.st_mtime and entry.get("size") == st.st_size:
+        if fresh:
             try:
                 self._cache_hits += 1
+                if self._feed_token is not None:
+                    entry["token"] = token
                 return FileAnalysisResult(
                     path=str(file_path),
                     language=str(entry.get("language") or "unknown"),
@@ -529,17 +682,23 @@ class ProjectCrawler:
         return None
 
     def _store_cache_entry(
-        self, file_path: Path, rel_path: str, result: FileAnalysisResult
+        self,
+        file_path: str | Path,
+        rel_path: str,
+        result: FileAnalysisResult,
+        token: str | None = None,
     ) -> None:
         if not self.enable_cache:
             return
         try:
-            st = file_path.stat()
+            st = Path(file_path).stat()
             key = self._cache_key_for(rel_path)
             files = self._cache.setdefault("files", {})
             files[key] = {
                 "mtime": st.st_mtime,
                 "size": st.st_size,
+                "token": token,
+                "mode": self.mode,
                 "language": result.language,
                 "status": result.status,
                 "lines_of_code": result.lines_of_code,
@@ -594,35 +753,68 @@ class ProjectCrawler:
             timestamp=datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
         )
 
-        # [20260126_FEATURE] Use ProjectWalker for file discovery
-        # This replaces the os.walk() logic and provides better filtering
-        walker = ProjectWalker(
-            self.root_path,
-            exclude_dirs=self.exclude_dirs,
-            max_depth=self.max_depth,
-            max_files=self.max_files,
-            respect_gitignore=self.respect_gitignore,
-        )
+        # [20261018_PERF] With a change feed running, take its token before
+        # any file is read; entries and the file list it vouches for are
+        # reused without walking or stat'ing the tree.
+        feed = get_change_feed(self.root_path) if self.enable_cache else None
+        self._feed = feed if feed is not None and self._feed_covers_root(feed) else None
+        self._feed_token = self._feed.token() if self._feed is not None else None
+        self._feed_changes = {}
+        reused = self._reusable_listing() if self._feed is not None else None
+
+        # [20261018_PERF] Plain (absolute path, relative path) strings: a
+        # Path per file costs more than summary-mode analysis of it
+        files_to_analyze: list[tuple[str, str]]
+        if reused is not None:
+            files_to_analyze = reused
+        else:
+            # [20260126_FEATURE] Use ProjectWalker for file discovery
+            # This replaces the os.walk() logic and provides better filtering
+            walker = ProjectWalker(
+                self.root_path,
+                exclude_dirs=self.exclude_dirs,
+                max_depth=self.max_depth,
+                max_files=self.max_files,
+                respect_gitignore=self.respect_gitignore,
+                exclude_paths=self.exclude_paths,
+            )
 
-        # Collect files to analyze
-        files_to_analyze: list[tuple[Path, str]] = []
-        for file_info in walker.get_files():
-            # Filter by supported extensions
-            if file_info.extension.lower() not in self.include_extensions:
-                continue
-            files_to_analyze.append((Path(file_info.path), file_info.rel_path))
+            # Collect files to analyze
+            files_to_analyze = []
+            for file_info in walker.get_files():
+                # Filter by supported extensions
+                if file_info.extension.lower() not in self.include_extensions:
+                    continue
+                files_to_analyze.append((file_info.path, file_info.rel_path))
+
+        if self._feed_token is not None:
+            self._cache["walk"] = self._walk_key()
+            self._cache["listing"] = [[fp, rel] for fp, rel in files_to_analyze]
+            self._cache["listing_token"] = self._feed_token
+
+        # [20261018_PERF] Classify extension-less / ambiguous files in one
+        # batch from bounded prefixes (verdicts cached per path and mtime)
+        unresolved = [
+            fp
+            for fp, _ in files_to_analyze
+            if os.path.splitext(fp)[1].lower() not in _EXTENSION_LANGUAGES
+        ]
+        if unresolved:
+            self._content_languages = {
+                path: lang.value for path, lang in detect_languages(unresolved).items()
+            }
 
         # Analyze discovered files (with optional caching/parallelism)
         analyzed_results: list[FileAnalysisResult] = []
 
-        def _analyze_one(path_and_rel: tuple[Path, str]) -> FileAnalysisResult:
+        def _analyze_one(path_and_rel: tuple[str, str]) -> FileAnalysisResult:
             fp, relp = path_and_rel
             cached = self._try_load_cached(fp, relp)
             if cached is not None:
                 return cached
             self._cache_misses += 1
-            res = self._analyze_file(str(fp))
-            self._store_cache_entry(fp, relp, res)
+            res = self._analyze_file(fp)
+            self._store_cache_entry(fp, relp, res, self._feed_token_for(fp))
             return res
 
         parallelism = self.parallelism
@@ -639,7 +831,7 @@ class ProjectCrawler:
             # Process-based parallelism for "distributed" worker mode (local machine).
             # Cache hits are resolved in the parent process; cache misses are analyzed in workers.
             hits: list[FileAnalysisResult] = []
-            misses: list[tuple[Path, str]] = []
+            misses: list[tuple[str, str]] = []
             for fp, relp in files_to_analyze:
                 cached = self._try_load_cached(fp, relp)
                 if cached is not None:
@@ -657,13 +849,16 @@ class ProjectCrawler:
                     mp_context=ctx,
                 ) as ex:
                     futs = {
-                        ex.submit(_analyze_file_worker, str(fp)): (fp, relp)
+                        ex.submit(_analyze_file_worker, fp, self.mode): (
+                            fp,
+                            relp,
+                        )
                         for fp, relp in misses
                     }
                     for fut in as_completed(futs):
                         fp, relp = futs[fut]
                         res = fut.result()
-                        self._store_cache_entry(fp, relp, res)
+                        self._store_cache_entry(fp, relp, res, self._feed_token_for(fp))
                         analyzed_results.append(res)
         else:
             for item in files_to_analyze:
@@ -677,7 +872,14 @@ class ProjectCrawler:
             else:
                 result.files_with_errors.append(file_result)
 
-        self._save_cache()
+        # [20261018_PERF] A crawl served entirely from the cache (without a
+        # change feed token to record) leaves the cache file untouched
+        if (
+            self._cache_misses
+            or self._feed_token is not None
+            or not self._cache_file.exists()
+        ):
+            self._save_cache()
         return result
 
     def _analyze_file(self, file_path: str) -> FileAnalysisResult:
@@ -691,16 +893,25 @@ class ProjectCrawler:
             FileAnalysisResult with metrics
         """
         try:
-            path_obj = Path(file_path)
-            language = self._detect_language(path_obj)
+            language = self._detect_language(file_path)
+
+            # [20261018_PERF] Summary mode: stat and line count only
+            if self.mode == "summary":
+                return FileAnalysisResult(
+                    path=file_path,
+                    language=language,
+                    status="success",
+                    lines_of_code=count_lines(file_path),
+                )
 
+            path_obj = Path(file_path)
             with open(file_path, "r", encoding="utf-8", errors="ignore") as f:
                 code = f.read()
 
             loc = len(code.splitlines())
 
             # Python: AST-based analysis
-            if language == "python":
+            if language == "python" and self.mode == "full":
                 tree = ast.parse(code, filename=file_path)
                 visitor = CodeAnalyzerVisitor(self.complexity_threshold)
                 visitor.visit(tree)
@@ -722,8 +933,13 @@ class ProjectCrawler:
                 )
 
             # JS/TS/Java: lightweight heuristics for v1.0 multi-language support
+            functions: list[FunctionInfo] = []
+            classes: list[ClassInfo] = []
             imports: list[str] = []
-            if language in ("javascript", "typescript"):
+            if language == "python":
+                # [20261018_PERF] Structure mode: declaration scan, no AST
+                functions, classes, imports = scan_python_declarations(code)
+            elif language in ("javascript", "typescript"):
                 # import x from 'y';  import {a} from "b";  require('x')
                 import_re = re.compile(
                     r"\bfrom\s+['\"]([^'\"]+)['\"]|\brequire\(\s*['\"]([^'\"]+)['\"]\s*\)"
@@ -751,8 +967,8 @@ class ProjectCrawler:
                 status="success",
                 lines_of_code=loc,
                 complexity_score=complexity,
-                functions=[],
-                classes=[],
+                functions=functions,
+                classes=classes,
                 imports=imports,
                 complexity_warnings=warnings,
             )
@@ -931,6 +1147,7 @@ def crawl_project(
     root_path: str,
     exclude_dirs: list[str] | None = None,
     complexity_threshold: int = DEFAULT_COMPLEXITY_THRESHOLD,
+    mode: str = "full",
 ) -> CrawlResultDict:
     """
     Convenience function to crawl a project and return results as a dictionary.
@@ -939,6 +1156,7 @@ def crawl_project(
         root_path: Path to the project root
         exclude_dirs: Optional list of directory names to exclude
         complexity_threshold: Complexity score that triggers a warning
+        mode: "summary", "structure" or "full" (see ProjectCrawler)
 
     Returns:
         Dictionary with crawl results
@@ -948,6 +1166,7 @@ def crawl_project(
         root_path,
         exclude_dirs=exclude_set,
         complexity_threshold=complexity_threshold,
+        mode=mode,
     )
     result = crawler.crawl()
     return crawler.to_dict(result)
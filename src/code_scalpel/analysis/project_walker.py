@@ -16,7 +16,9 @@ without the overhead of full AST analysis (which is handled by ProjectCrawler).
 import os
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Generator
+from typing import Collection, Generator, Optional
+
+from .gitignore import GitignoreMatcher
 
 # Default directories to exclude from walking
 DEFAULT_EXCLUDE_DIRS: frozenset[str] = frozenset(
@@ -76,6 +78,25 @@ ALL_SUPPORTED_EXTENSIONS = (
     | RUST_EXTENSIONS
 )
 
+# [20261018_PERF] Extension (lowercase) -> language, shared with source_walker
+LANGUAGE_BY_EXTENSION: dict[str, str] = {
+    **{ext: "python" for ext in PYTHON_EXTENSIONS},
+    **{ext: "javascript" for ext in JAVASCRIPT_EXTENSIONS | {".cjs"}},
+    **{ext: "typescript" for ext in TYPESCRIPT_EXTENSIONS | {".mts", ".cts"}},
+    **{ext: "java" for ext in JAVA_EXTENSIONS},
+    **{ext: "cpp" for ext in CPP_EXTENSIONS | {".hh", ".hxx"}},
+    **{ext: "csharp" for ext in CSHARP_EXTENSIONS},
+    **{ext: "ruby" for ext in RUBY_EXTENSIONS | {".rake", ".gemspec"}},
+    **{ext: "go" for ext in GO_EXTENSIONS},
+    **{ext: "rust" for ext in RUST_EXTENSIONS},
+    ".c": "c",
+    ".kt": "kotlin",
+    ".kts": "kotlin",
+    ".php": "php",
+    ".phtml": "php",
+    ".swift": "swift",
+}
+
 
 @dataclass
 class FileInfo:
@@ -166,6 +187,7 @@ class ProjectWalker:
         max_files: int | None = None,
         respect_gitignore: bool = False,
         follow_symlinks: bool = False,
+        exclude_paths: Collection[str] | None = None,
     ):
         """
         Initialize ProjectWalker.
@@ -177,6 +199,8 @@ class ProjectWalker:
             max_files: Maximum number of files to discover (None = unlimited)
             respect_gitignore: Whether to respect .gitignore patterns
             follow_symlinks: Whether to follow symlinks (with cycle detection)
+            exclude_paths: Directories (POSIX paths relative to the root) to
+                prune, e.g. nested packages crawled on their own
 
         Raises:
             ValueError: If root_path doesn't exist
@@ -192,91 +216,38 @@ class ProjectWalker:
         self.max_files = max_files
         self.respect_gitignore = respect_gitignore
         self.follow_symlinks = follow_symlinks
+        self.exclude_paths = frozenset(exclude_paths or ())
 
         # Track visited inodes to detect cycles (for symlinks)
         self._visited_inodes: set[int] = set()
         self._cycles_detected: list[str] = []
 
-        # Gitignore patterns cache (if enabled)
-        self._gitignore_patterns: dict[Path, list[str]] = {}
+        # Gitignore matcher (if enabled), built on first use
+        self._gitignore_matcher: Optional[GitignoreMatcher] = None
 
     def _get_language(self, extension: str) -> str:
         """Detect language from file extension."""
         ext_lower = extension.lower()
-        if ext_lower in PYTHON_EXTENSIONS:
-            return "python"
-        elif ext_lower in JAVASCRIPT_EXTENSIONS:
-            return "javascript"
-        elif ext_lower in TYPESCRIPT_EXTENSIONS:
-            return "typescript"
-        elif ext_lower in JAVA_EXTENSIONS:
-            return "java"
-        elif ext_lower in CPP_EXTENSIONS:
-            return "cpp"
-        elif ext_lower in CSHARP_EXTENSIONS:
-            return "csharp"
-        elif ext_lower in RUBY_EXTENSIONS:
-            return "ruby"
-        elif ext_lower in GO_EXTENSIONS:
-            return "go"
-        elif ext_lower in RUST_EXTENSIONS:
-            return "rust"
-        else:
+        if ext_lower not in ALL_SUPPORTED_EXTENSIONS:
             return "unknown"
+        return LANGUAGE_BY_EXTENSION[ext_lower]
 
-    def _load_gitignore(self, directory: Path) -> list[str]:
-        """Load .gitignore patterns from a directory."""
-        if directory in self._gitignore_patterns:
-            return self._gitignore_patterns[directory]
-
-        patterns = []
-        gitignore_path = directory / ".gitignore"
-        if gitignore_path.exists():
-            try:
-                with open(gitignore_path, "r", encoding="utf-8") as f:
-                    for line in f:
-                        line = line.rstrip("\n\r")
-                        # Skip empty lines and comments
-                        if not line or line.startswith("#"):
-                            continue
-                        patterns.append(line)
-            except (OSError, UnicodeDecodeError):
-                pass
-
-        self._gitignore_patterns[directory] = patterns
-        return patterns
+    def _gitignore(self) -> GitignoreMatcher:
+        """Compiled gitignore matcher for the root (built on first use)."""
+        if self._gitignore_matcher is None:
+            self._gitignore_matcher = GitignoreMatcher(self.root_path)
+        return self._gitignore_matcher
 
     def _is_gitignored(self, rel_path: Path, is_dir: bool = False) -> bool:
-        """Check if a path matches .gitignore patterns."""
+        """Check if a path is ignored by git's ignore rules.
+
+        [20261018_PERF] Nested ``.gitignore`` files, ``.git/info/exclude``
+        and the global excludes file are compiled once per directory level
+        (see ``gitignore.GitignoreMatcher``), with negation and anchoring.
+        """
         if not self.respect_gitignore:
             return False
-
-        # Simple pattern matching - not full gitignore semantics
-        path_str = str(rel_path).replace("\\", "/")
-        patterns = self._load_gitignore(self.root_path)
-
-        for pattern in patterns:
-            # Remove trailing slash for consistency
-            pattern = pattern.rstrip("/")
-
-            # Directory-only pattern (ended with / in .gitignore)
-            if is_dir and pattern.endswith("/"):
-                pattern = pattern[:-1]
-
-            # Simple fnmatch-like matching
-            if "*" in pattern:
-                import fnmatch
-
-                if fnmatch.fnmatch(path_str, pattern):
-                    return True
-                if fnmatch.fnmatch(Path(path_str).name, pattern):
-                    return True
-            else:
-                # Exact match
-                if path_str == pattern or Path(path_str).name == pattern:
-                    return True
-
-        return False
+        return self._gitignore().is_ignored(rel_path, is_dir=is_dir)
 
     def _check_cycle(self, dir_path: Path) -> bool:
         """Check for symlink cycles using inode tracking."""
@@ -344,51 +315,38 @@ class ProjectWalker:
         """
         Discover all files (respecting filters).
 
+        [20261018_PERF] Files come from one pruned ``os.scandir`` walk
+        (see ``source_walker``), in ``rel_path`` order.
+
         Yields:
             FileInfo for each discovered file
         """
-        count = 0
-        for root, dirs, files in self.walk():
-            root_path = Path(root).resolve()
-            try:
-                rel_dir = root_path.relative_to(self.root_path)
-                depth = len(rel_dir.parts)
-            except ValueError:
-                depth = 0
-
-            for filename in files:
-                if self.max_files is not None and count >= self.max_files:
-                    return
+        from .source_walker import walk_source_files
 
-                file_path = root_path / filename
-                try:
-                    rel_path = file_path.relative_to(self.root_path)
-                except ValueError:
-                    continue
+        gitignored = self._gitignore().entry_ignored if self.respect_gitignore else None
+        excluded = self.exclude_paths
 
-                if self._is_gitignored(rel_path, is_dir=False):
-                    continue
-
-                try:
-                    stat_info = file_path.stat()
-                    extension = file_path.suffix
-                    language = self._get_language(extension)
-                    is_symlink = file_path.is_symlink()
-
-                    file_info = FileInfo(
-                        path=str(file_path),
-                        rel_path=str(rel_path),
-                        size=stat_info.st_size,
-                        extension=extension,
-                        language=language,
-                        is_symlink=is_symlink,
-                        depth=depth,
-                    )
-                    yield file_info
-                    count += 1
-                except (OSError, ValueError):
-                    # Skip files we can't stat
-                    continue
+        def ignore(rel: str, is_dir: bool) -> bool:
+            if is_dir and rel in excluded:
+                return True
+            return gitignored is not None and gitignored(rel, is_dir)
+
+        files = walk_source_files(
+            self.root_path,
+            exclude_dirs=self.exclude_dirs,
+            ignore=ignore if excluded else gitignored,
+            max_depth=self.max_depth,
+            max_files=self.max_files,
+            follow_symlinks=self.follow_symlinks,
+            include_unknown=True,
+        )
+        self._cycles_detected.extend(files.cycles_detected)
+        for file_info in files.all_files():
+            # The shared walker knows more languages than ProjectWalker reports
+            file_info.language = self._get_language(file_info.extension)
+            if os.sep != "/":
+                file_info.rel_path = str(Path(file_info.rel_path))
+            yield file_info
 
     def get_code_files(self) -> Generator[FileInfo, None, None]:
         """
@@ -527,4 +485,5 @@ __all__ = [
     "GO_EXTENSIONS",
     "RUST_EXTENSIONS",
     "ALL_SUPPORTED_EXTENSIONS",
+    "LANGUAGE_BY_EXTENSION",
 ]
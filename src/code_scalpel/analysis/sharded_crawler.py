@@ -0,0 +1,291 @@
+"""
+Sharded Crawler - Crawl a monorepo one package at a time.
+
+[20261018_PERF] ProjectCrawler treats a repository as one flat job with one
+cache file, so editing any package rewrites (and on large repos, reloads) the
+cache of all of them. ShardedCrawler splits the repository by the packages
+MonorepoDetector finds:
+
+- each package is crawled by its own ProjectCrawler with its own cache
+  partition under ``.code-scalpel/cache/packages/``, so a change in one
+  package never touches the cached results of the others;
+- files outside every package form a root shard (``"."``), and packages
+  nested in other packages are pruned from their parent's shard;
+- shards can run in a thread or process pool;
+- results are merged into one CrawlResult with per-package summaries, and
+  a crawl scoped to some packages never walks or reads the others.
+
+Usage:
+    from code_scalpel.analysis.sharded_crawler import ShardedCrawler
+
+    crawler = ShardedCrawler("/path/to/monorepo", enable_cache=True)
+    result = crawler.crawl(packages=["@acme/web"])
+    for package in result.packages:
+        print(package.name, package.summary["total_files"])
+"""
+
+from __future__ import annotations
+
+import datetime
+import hashlib
+import multiprocessing as mp
+import os
+import re
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Iterable
+
+from .crawl_modes import validate_mode
+from .monorepo import MonorepoDetector
+from .project_crawler import (
+    DEFAULT_COMPLEXITY_THRESHOLD,
+    CrawlResult,
+    ProjectCrawler,
+)
+
+ROOT_SHARD = "."
+
+
+@dataclass
+class PackageShard:
+    """One independently crawled part of the repository."""
+
+    name: str
+    path: str  # POSIX path from the repo root; "." for the root shard
+    project_type: str
+    exclude_paths: list[str] = field(default_factory=list)  # relative to path
+
+
+@dataclass
+class PackageCrawl:
+    """Crawl result of one shard."""
+
+    name: str
+    path: str
+    project_type: str
+    result: CrawlResult
+    cache_hits: int = 0
+    cache_misses: int = 0
+
+    @property
+    def summary(self) -> dict[str, Any]:
+        """Package-level summary statistics."""
+        summary = dict(self.result.summary)
+        summary.update(
+            name=self.name,
+            path=self.path,
+            project_type=self.project_type,
+            cache_hits=self.cache_hits,
+            cache_misses=self.cache_misses,
+        )
+        return summary
+
+
+@dataclass
+class ShardedCrawlResult:
+    """Merged result of a sharded crawl."""
+
+    root_path: str
+    workspace_type: str | None
+    packages: list[PackageCrawl]
+    merged: CrawlResult
+
+    @property
+    def summary(self) -> dict[str, Any]:
+        """Repository totals plus one summary per crawled package."""
+        summary = dict(self.merged.summary)
+        summary["workspace_type"] = self.workspace_type
+        summary["packages"] = [package.summary for package in self.packages]
+        return summary
+
+
+def _crawl_shard(
+    root_path: str, options: dict[str, Any]
+) -> tuple[CrawlResult, int, int]:
+    """Crawl one shard (also the ProcessPool worker entrypoint)."""
+    crawler = ProjectCrawler(root_path, **options)
+    return crawler.crawl(), crawler._cache_hits, crawler._cache_misses
+
+
+def _partition_name(path: str) -> str:
+    """Cache partition directory name for a shard path."""
+    if path == ROOT_SHARD:
+        return "_root"
+    digest = hashlib.sha1(path.encode("utf-8")).hexdigest()[:10]
+    return f"{re.sub(r'[^A-Za-z0-9_.-]+', '_', path)[-60:]}-{digest}"
+
+
+class ShardedCrawler:
+    """Crawls a monorepo as one ProjectCrawler job per package."""
+
+    def __init__(
+        self,
+        root_path: str | Path,
+        exclude_dirs: frozenset[str] | None = None,
+        complexity_threshold: int = DEFAULT_COMPLEXITY_THRESHOLD,
+        respect_gitignore: bool = False,
+        include_extensions: tuple[str, ...] | None = None,
+        enable_cache: bool = False,
+        mode: str = "full",
+        parallelism: str = "none",  # none|threads|processes
+        max_workers: int | None = None,
+    ):
+        """
+        Initialize the sharded crawler.
+
+        Args:
+            root_path: Repository root
+            parallelism: How shards run side by side; each shard is crawled
+                sequentially by its own ProjectCrawler
+            max_workers: Shards crawled at once (default: CPU count)
+
+        The other arguments are passed to each shard's ProjectCrawler.
+        """
+        self.root_path = Path(root_path).resolve()
+        if not self.root_path.is_dir():
+            raise ValueError(f"Path is not a directory: {self.root_path}")
+        self.enable_cache = enable_cache
+        self.parallelism = parallelism
+        self.max_workers = max_workers
+        self._options: dict[str, Any] = {
+            "exclude_dirs": exclude_dirs,
+            "complexity_threshold": complexity_threshold,
+            "respect_gitignore": respect_gitignore,
+            "include_extensions": include_extensions,
+            "enable_cache": enable_cache,
+            "mode": validate_mode(mode),
+        }
+        self._cache_root = self.root_path / ".code-scalpel" / "cache" / "packages"
+        self._shards: list[PackageShard] | None = None
+        self.workspace_type: str | None = None
+
+    def shards(self) -> list[PackageShard]:
+        """Packages of the repository, plus the root shard (detected once)."""
+        if self._shards is not None:
+            return self._shards
+
+        detection = MonorepoDetector(self.root_path).detect()
+        self.workspace_type = detection.workspace_type
+        by_path: dict[str, PackageShard] = {}
+        for project in detection.projects:
+            path = Path(project.path).as_posix().strip("/")
+            if (
+                path in ("", ROOT_SHARD)
+                or path in by_path
+                or not (self.root_path / path).is_dir()
+            ):
+                continue
+            by_path[path] = PackageShard(
+                name=project.name, path=path, project_type=project.project_type
+            )
+        shards = [PackageShard(name=ROOT_SHARD, path=ROOT_SHARD, project_type="root")]
+        shards.extend(by_path[path] for path in sorted(by_path))
+
+        # Each file belongs to its innermost package: prune nested packages
+        for shard in shards:
+            prefix = "" if shard.path == ROOT_SHARD else shard.path + "/"
+            shard.exclude_paths = [
+                other.path[len(prefix) :]
+                for other in shards[1:]
+                if other is not shard and other.path.startswith(prefix)
+            ]
+        self._shards = shards
+        return shards
+
+    def _select(self, packages: Iterable[str] | None) -> list[PackageShard]:
+        shards = self.shards()
+        if packages is None:
+            return shards
+        selected: list[PackageShard] = []
+        for wanted in packages:
+            wanted_path = Path(wanted).as_posix().strip("/") or ROOT_SHARD
+            match = next(
+                (s for s in shards if s.name == wanted or s.path == wanted_path),
+                None,
+            )
+            if match is None:
+                raise ValueError(
+                    f"Unknown package {wanted!r}; expected a package name or path"
+                )
+            if match not in selected:
+                selected.append(match)
+        return selected
+
+    def _shard_options(self, shard: PackageShard) -> dict[str, Any]:
+        options = dict(self._options)
+        options["exclude_paths"] = shard.exclude_paths
+        options["cache_dir"] = str(self._cache_root / _partition_name(shard.path))
+        return options
+
+    def crawl(self, packages: Iterable[str] | None = None) -> ShardedCrawlResult:
+        """
+        Crawl every shard, or only ``packages`` (names or paths).
+
+        Returns:
+            ShardedCrawlResult with the merged result and one entry per shard
+        """
+        selected = self._select(packages)
+        jobs = [
+            (str(self.root_path / shard.path), self._shard_options(shard))
+            for shard in selected
+        ]
+        workers = min(len(jobs), self.max_workers or os.cpu_count() or 1)
+
+        if self.parallelism == "threads" and workers > 1:
+            with ThreadPoolExecutor(max_workers=workers) as ex:
+                outcomes = list(ex.map(lambda job: _crawl_shard(*job), jobs))
+        elif self.parallelism == "processes" and workers > 1:
+            with ProcessPoolExecutor(
+                max_workers=workers, mp_context=mp.get_context("spawn")
+            ) as ex:
+                outcomes = list(ex.map(_crawl_shard, *zip(*jobs)))
+        else:
+            outcomes = [_crawl_shard(*job) for job in jobs]
+
+        merged = CrawlResult(
+            root_path=str(self.root_path),
+            timestamp=datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+        )
+        package_crawls: list[PackageCrawl] = []
+        for shard, (result, hits, misses) in zip(selected, outcomes):
+            package_crawls.append(
+                PackageCrawl(
+                    name=shard.name,
+                    path=shard.path,
+                    project_type=shard.project_type,
+                    result=result,
+                    cache_hits=hits,
+                    cache_misses=misses,
+                )
+            )
+            merged.files_analyzed.extend(result.files_analyzed)
+            merged.files_with_errors.extend(result.files_with_errors)
+
+        # Deterministic ordering, as in ProjectCrawler.crawl
+        merged.files_analyzed.sort(key=lambda r: os.path.normpath(r.path))
+        merged.files_with_errors.sort(key=lambda r: os.path.normpath(r.path))
+        return ShardedCrawlResult(
+            root_path=str(self.root_path),
+            workspace_type=self.workspace_type,
+            packages=package_crawls,
+            merged=merged,
+        )
+
+
+def crawl_monorepo(
+    root_path: str | Path,
+    packages: Iterable[str] | None = None,
+    **options: Any,
+) -> ShardedCrawlResult:
+    """Convenience function: sharded crawl of ``root_path`` (see ShardedCrawler)."""
+    return ShardedCrawler(root_path, **options).crawl(packages)
+
+
+__all__ = [
+    "PackageCrawl",
+    "PackageShard",
+    "ShardedCrawlResult",
+    "ShardedCrawler",
+    "crawl_monorepo",
+]
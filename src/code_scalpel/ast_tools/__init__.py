@@ -1,6 +1,7 @@
 # Core imports
 from .analyzer import ASTAnalyzer, ClassMetrics, FunctionMetrics
 from .builder import ASTBuilder
+from .fused_visitor import FusedAnalysis, FusedWalker, run_analyses
 
 # These imports might fail due to incomplete implementations, handle gracefully
 try:
@@ -117,6 +118,10 @@ __all__ = [
     "build_ast",
     "build_ast_from_file",
     "visualize_ast",
+    # [20261018_PERF] Fused single-walk analyses
+    "FusedAnalysis",
+    "FusedWalker",
+    "run_analyses",
     # v1.5.1 - Import resolution
     "ImportResolver",
     "ImportInfo",
@@ -1,7 +1,6 @@
 from __future__ import annotations
 
 import ast
-import os
 import re
 from collections import deque
 from dataclasses import dataclass, field
@@ -98,6 +97,7 @@ class CallGraphBuilder:
         self._java_types_by_fqcn: Dict[str, str] = {}
         self._java_fqcn_to_local: Dict[str, str] = {}
         self._java_simple_type_index: Dict[str, Set[str]] = {}
+        self._source_walk = None
         self._java_superclass_refs: Dict[str, str] = {}
         self._java_field_types_by_class: Dict[str, Dict[str, str]] = {}
         self._java_member_selectors_by_class: Dict[str, Dict[str, List[str]]] = {}
@@ -205,52 +205,64 @@ class CallGraphBuilder:
 
         return graph
 
-    def _iter_source_files(self):
-        skip_dirs = {
-            ".git",
-            ".venv",
-            "venv",
-            "__pycache__",
-            "node_modules",
-            "dist",
-            "build",
+    # [20261018_PERF] Source files come from the shared pruned scandir walk
+    _SOURCE_EXTENSIONS = frozenset(
+        {
+            ".py",
+            ".js",
+            ".jsx",
+            ".java",
+            ".c",
+            ".h",
+            ".cpp",
+            ".cc",
+            ".cxx",
+            ".hpp",
+            ".hxx",
+            ".hh",
+            ".cs",
+            ".go",
+            ".kt",
+            ".kts",
+            ".php",
+            ".phtml",
+            ".rb",
+            ".rake",
+            ".gemspec",
+            ".swift",
+            ".rs",
+            ".ts",
+            ".tsx",
+            ".mjs",
+            ".cjs",
         }
-        for root, dirs, files in os.walk(self.root_path):
-            dirs[:] = [d for d in dirs if d not in skip_dirs and not d.startswith(".")]
-            for file in files:
-                lower = file.lower()
-                if lower.endswith(
-                    (
-                        ".py",
-                        ".js",
-                        ".jsx",
-                        ".java",
-                        ".c",
-                        ".h",
-                        ".cpp",
-                        ".cc",
-                        ".cxx",
-                        ".hpp",
-                        ".hxx",
-                        ".hh",
-                        ".cs",
-                        ".go",
-                        ".kt",
-                        ".kts",
-                        ".php",
-                        ".phtml",
-                        ".rb",
-                        ".rake",
-                        ".gemspec",
-                        ".swift",
-                        ".rs",
-                        ".ts",
-                        ".tsx",
-                        ".mjs",
-                        ".cjs",
-                    )
-                ):
-                    yield Path(root) / file
+    )
+
+    def _walk_sources(self):
+        """One pruned walk per builder, shared by every pass over the files."""
+        if self._source_walk is None:
+            from code_scalpel.analysis.source_walker import walk_source_files
+
+            self._source_walk = walk_source_files(
+                self.root_path,
+                extensions=self._SOURCE_EXTENSIONS,
+                exclude_dirs={
+                    ".git",
+                    ".venv",
+                    "venv",
+                    "__pycache__",
+                    "node_modules",
+                    "dist",
+                    "build",
+                },
+                skip_hidden_dirs=True,
+                with_size=False,
+            )
+        return self._source_walk
+
+    def _iter_source_files(self):
+        for file_info in self._walk_sources().all_files():
+            yield Path(file_info.path)
 
     # [20260307_FEATURE] Load a normalizer-backed IR module for languages that use
     # the shared polyglot IR but do not yet have dedicated call-graph resolvers.
@@ -766,8 +778,10 @@ class CallGraphBuilder:
                             advanced_resolution=advanced_resolution,
                         )
                     )
-            for child in self._iter_ir_child_nodes(getattr(node, "__dict__", {})):
-                collect_calls(child, current_class, calls)
+            # [20261018_PERF] IR nodes are slotted; walk dataclass fields
+            for name in getattr(node, "__dataclass_fields__", ()):
+                for child in self._iter_ir_child_nodes(getattr(node, name)):
+                    collect_calls(child, current_class, calls)
 
         def visit(nodes, current_class: str | None = None) -> None:
             for node in nodes or []:
@@ -2249,20 +2263,9 @@ class CallGraphBuilder:
         Yields:
             Path: Absolute path to each Python file
         """
-        skip_dirs = {
-            ".git",
-            ".venv",
-            "venv",
-            "__pycache__",
-            "node_modules",
-            "dist",
-            "build",
-        }
-        for root, dirs, files in os.walk(self.root_path):
-            dirs[:] = [d for d in dirs if d not in skip_dirs and not d.startswith(".")]
-            for file in files:
-                if file.endswith(".py"):
-                    yield Path(root) / file
+        for file_info in self._walk_sources().get("python"):
+            if file_info.extension == ".py":
+                yield Path(file_info.path)
 
     def _analyze_definitions(self, tree: ast.AST, rel_path: str):
         """
@@ -0,0 +1,145 @@
+"""
+Fused AST traversal: many analyses, one walk.
+
+[20261018_PERF] ``analyze_code`` used to run a dozen analyses over the same
+Python tree, each with its own ``ast.walk``. A FusedWalker walks the tree
+once and dispatches every node to the analyses interested in its type.
+
+An analysis subclasses FusedAnalysis and defines ``visit_<NodeType>``
+methods, named as for ``ast.NodeVisitor``. Each method receives the node
+and the analysis' *context* for it. State lives on the analysis instance,
+so analyses never see each other's data; ``finish()`` returns the result.
+
+Traversal order is breadth-first, exactly as ``ast.walk``, so ported
+analyses produce their lists in the same order as before.
+
+Context replaces the recursion analyses would otherwise need to know about
+a node's ancestors (nesting depth, enclosing functions). An analysis lists
+the node types that change it in ``context_types`` and implements
+``child_context(node, field, ctx)``, which returns the context inherited
+by the children stored in ``field`` of ``node``. All other nodes pass their
+context to their children unchanged, so context costs nothing on them.
+
+Example:
+    >>> class CountCalls(FusedAnalysis):
+    ...     def __init__(self):
+    ...         self.calls = 0
+    ...     def visit_Call(self, node, ctx):
+    ...         self.calls += 1
+    ...     def finish(self):
+    ...         return self.calls
+    >>> calls, = run_analyses(ast.parse("f(g())"), [CountCalls()])
+    >>> calls
+    2
+"""
+
+from __future__ import annotations
+
+import ast
+from collections import deque
+from typing import Any, Callable, Dict, List, Sequence, Tuple
+
+__all__ = ["FusedAnalysis", "FusedWalker", "run_analyses"]
+
+_Callback = Callable[[ast.AST, Any], None]
+
+
+class FusedAnalysis:
+    """
+    One analysis driven by a FusedWalker.
+
+    Attributes:
+        context_types: Node types whose children get a new context from
+            ``child_context``.
+        root_context: Context of the tree's root node.
+    """
+
+    context_types: Tuple[type, ...] = ()
+    root_context: Any = None
+
+    def child_context(self, node: ast.AST, field: str, ctx: Any) -> Any:
+        """Context inherited by the children in ``node.<field>``."""
+        return ctx
+
+    def finish(self) -> Any:
+        """Return the analysis result once the walk is complete."""
+        return None
+
+
+def _callbacks(analysis: FusedAnalysis) -> Dict[type, _Callback]:
+    found: Dict[type, _Callback] = {}
+    for name in dir(type(analysis)):
+        if name.startswith("visit_"):
+            node_type = getattr(ast, name[6:], None)
+            if isinstance(node_type, type) and issubclass(node_type, ast.AST):
+                found[node_type] = getattr(analysis, name)
+    return found
+
+
+class FusedWalker:
+    """
+    Walks a tree once, dispatching each node to every interested analysis.
+
+    The dispatch tables (node type -> callbacks, node type -> analyses
+    that derive context from it) are built once per walker.
+    """
+
+    def __init__(self, analyses: Sequence[FusedAnalysis]):
+        self.analyses = list(analyses)
+        self._dispatch: Dict[type, List[Tuple[int, _Callback]]] = {}
+        self._context: Dict[type, List[int]] = {}
+        for index, analysis in enumerate(self.analyses):
+            for node_type, callback in _callbacks(analysis).items():
+                self._dispatch.setdefault(node_type, []).append((index, callback))
+            for node_type in analysis.context_types:
+                self._context.setdefault(node_type, []).append(index)
+
+    def walk(self, tree: ast.AST) -> List[Any]:
+        """Run every analysis over ``tree``; return their ``finish()`` results."""
+        analyses = self.analyses
+        dispatch = self._dispatch
+        context_types = self._context
+        iter_children = ast.iter_child_nodes
+
+        root = tuple(a.root_context for a in analyses)
+        queue: deque[Tuple[ast.AST, Tuple[Any, ...]]] = deque([(tree, root)])
+        pop = queue.popleft
+        push = queue.append
+        while queue:
+            node, ctx = pop()
+            node_type = type(node)
+            for index, callback in dispatch.get(node_type, ()):
+                callback(node, ctx[index])
+
+            changers = context_types.get(node_type)
+            if changers is None:
+                for child in iter_children(node):
+                    push((child, ctx))
+                continue
+
+            # Same field order as ast.iter_child_nodes
+            for field in node._fields:
+                value = getattr(node, field, None)
+                if isinstance(value, ast.AST):
+                    children: List[Any] = [value]
+                elif isinstance(value, list):
+                    children = [v for v in value if isinstance(v, ast.AST)]
+                    if not children:
+                        continue
+                else:
+                    continue
+                field_ctx = list(ctx)
+                for index in changers:
+                    field_ctx[index] = analyses[index].child_context(
+                        node, field, ctx[index]
+                    )
+                child_ctx = tuple(field_ctx)
+                for child in children:
+                    push((child, child_ctx))
+
+        return [analysis.finish() for analysis in analyses]
+
+
+def run_analyses(tree: ast.AST, analyses: Sequence[FusedAnalysis]) -> List[Any]:
+    """Run ``analyses`` over ``tree`` in one walk and return their results."""
+    return FusedWalker(analyses).walk(tree)
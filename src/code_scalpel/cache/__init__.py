@@ -3,6 +3,25 @@
 [20251223_CONSOLIDATION] v3.0.5 - Unified cache merges analysis_cache.py + utilities/cache.py
 """
 
+# [20261018_PERF] Content-addressed analysis store (portable across machines)
+from .analysis_store import AnalysisStore, DirectoryRemote
+
+# [20261018_PERF] Filesystem change feed for long-running sessions
+from .change_feed import (
+    ChangeFeed,
+    Changes,
+    get_change_feed,
+    start_change_feed,
+    stop_change_feeds,
+)
+
+# [20261018_PERF] Content ids from .git/index
+from .git_index import (
+    GitChangeDetector,
+    git_detector_for,
+    hash_blob,
+    parse_git_index,
+)
 from .incremental_analyzer import IncrementalAnalyzer
 from .parallel_parser import ParallelParser
 
@@ -18,11 +37,22 @@ from .unified_cache import (
 
 __all__ = [
     "AnalysisCache",
+    "AnalysisStore",
     "CacheConfig",
     "CacheEntry",
     "CacheStats",
+    "ChangeFeed",
+    "Changes",
+    "DirectoryRemote",
+    "GitChangeDetector",
     "ParallelParser",
     "IncrementalAnalyzer",
     "get_cache",
+    "get_change_feed",
+    "git_detector_for",
+    "hash_blob",
+    "parse_git_index",
     "reset_cache",
+    "start_change_feed",
+    "stop_change_feeds",
 ]
@@ -0,0 +1,456 @@
+"""
+Content-addressed analysis store.
+
+[20261018_PERF] Analysis results keyed by *what was analyzed* rather than
+*where*: the key is derived from (analyzer version, file content hash,
+config hash), so two checkouts - or two CI runners - that see the same file
+content with the same analyzer share one entry.
+
+Layout (git-like, one compressed object per key)::
+
+    <store>/objects/ab/cdef0123...      # zlib(JSON), with a digest header
+
+Objects are written atomically; reading one refreshes its mtime, which is the
+"last used" time ``prune`` works from. A whole store can be exported as one
+pack (a tar file with a manifest) and imported elsewhere, which is how a CI
+job starts warm from an artifact. ``DirectoryRemote`` stands in for remote
+artifact storage with a plain directory.
+
+Example:
+    >>> store = AnalysisStore(".code-scalpel/store", analyzer_version="2.1.4")
+    >>> store.put(content_hash, {"functions": [...]})
+    >>> store.get(content_hash)
+    {'functions': [...]}
+    >>> store.export_pack("analysis.pack")
+"""
+
+from __future__ import annotations
+
+import hashlib
+import io
+import json
+import os
+import re
+import shutil
+import tarfile
+import tempfile
+import time
+import zlib
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Iterator, Mapping, Optional
+
+_MAGIC = b"SCAS1\n"
+_DIGEST_LEN = 64
+_KEY_RE = re.compile(r"^[0-9a-f]{64}$")
+_MEMBER_RE = re.compile(r"^objects/([0-9a-f]{2})/([0-9a-f]{62})$")
+_MANIFEST = "manifest.json"
+PACK_FORMAT = 1
+# Largest object (stored or decompressed) accepted from a pack
+MAX_PACK_OBJECT_BYTES = 64 * 1024 * 1024
+
+
+def config_hash(config: Optional[Mapping[str, Any]]) -> str:
+    """Stable hash of an analysis configuration (canonical JSON)."""
+    canonical = json.dumps(config or {}, sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+def _encode(data: Any) -> bytes:
+    body = zlib.compress(
+        json.dumps(data, separators=(",", ":")).encode("utf-8"), level=6
+    )
+    digest = hashlib.sha256(body).hexdigest().encode("ascii")
+    return _MAGIC + digest + b"\n" + body
+
+
+def _decode(raw: bytes, max_size: Optional[int] = None) -> Any:
+    """Payload of an object; raises ValueError if it is corrupt.
+
+    With ``max_size``, a payload that decompresses to more bytes is rejected
+    too.
+    """
+    header = len(_MAGIC) + _DIGEST_LEN + 1
+    if len(raw) < header or not raw.startswith(_MAGIC):
+        raise ValueError("not a store object")
+    digest = raw[len(_MAGIC) : header - 1].decode("ascii", "replace")
+    body = raw[header:]
+    if hashlib.sha256(body).hexdigest() != digest:
+        raise ValueError("digest mismatch")
+    try:
+        if max_size is None:
+            return json.loads(zlib.decompress(body))
+        inflater = zlib.decompressobj()
+        payload = inflater.decompress(body, max_size)
+        if inflater.unconsumed_tail:
+            raise ValueError(f"object expands beyond {max_size} bytes")
+        return json.loads(payload)
+    except (zlib.error, json.JSONDecodeError, UnicodeDecodeError) as e:
+        raise ValueError(f"undecodable object: {e}") from e
+
+
+@dataclass
+class PackResult:
+    """Outcome of importing a pack."""
+
+    imported: int = 0
+    skipped: int = 0  # already present
+    rejected: list[str] = field(default_factory=list)  # bad names or digests
+
+
+@dataclass
+class VerifyResult:
+    """Outcome of verifying a store."""
+
+    checked: int = 0
+    corrupt: list[str] = field(default_factory=list)
+    removed: int = 0
+
+
+class AnalysisStore:
+    """Directory of analysis results addressed by content and configuration."""
+
+    def __init__(
+        self,
+        root: str | os.PathLike[str],
+        analyzer_version: str = "",
+        config: Optional[Mapping[str, Any]] = None,
+    ):
+        self.root = Path(root)
+        self.objects = self.root / "objects"
+        self.analyzer_version = analyzer_version
+        self.config_hash = config_hash(config)
+        self.hits = 0
+        self.misses = 0
+
+    # ------------------------------------------------------------------
+    # Keys and objects
+    # ------------------------------------------------------------------
+
+    def key(self, content_hash: str) -> str:
+        """Store key for a file's content under this analyzer and config."""
+        material = f"{self.analyzer_version}\0{content_hash}\0{self.config_hash}"
+        return hashlib.sha256(material.encode("utf-8")).hexdigest()
+
+    def _object_path(self, key: str) -> Path:
+        return self.objects / key[:2] / key[2:]
+
+    def _write(self, key: str, raw: bytes) -> None:
+        path = self._object_path(key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=".tmp-")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(raw)
+            os.replace(tmp, path)
+        except BaseException:
+            try:
+                os.unlink(tmp)
+            except OSError:
+                pass
+            raise
+
+    def put(self, content_hash: str, data: Any) -> str:
+        """Store ``data`` for ``content_hash``; returns the key."""
+        key = self.key(content_hash)
+        self._write(key, _encode(data))
+        return key
+
+    def get(self, content_hash: str) -> Optional[Any]:
+        """Stored data for ``content_hash`` (None if absent or corrupt)."""
+        if not content_hash:
+            return None
+        path = self._object_path(self.key(content_hash))
+        try:
+            data = _decode(path.read_bytes())
+        except (OSError, ValueError):
+            self.misses += 1
+            return None
+        try:
+            os.utime(path)  # last-use time for prune()
+        except OSError:
+            pass
+        self.hits += 1
+        return data
+
+    def contains(self, content_hash: str) -> bool:
+        return self._object_path(self.key(content_hash)).is_file()
+
+    def keys(self) -> Iterator[str]:
+        """All object keys in the store."""
+        try:
+            fanout = sorted(os.scandir(self.objects), key=lambda e: e.name)
+        except OSError:
+            return
+        for bucket in fanout:
+            if len(bucket.name) != 2 or not bucket.is_dir():
+                continue
+            for entry in sorted(os.scandir(bucket.path), key=lambda e: e.name):
+                key = bucket.name + entry.name
+                if _KEY_RE.match(key) and entry.is_file():
+                    yield key
+
+    # ------------------------------------------------------------------
+    # Maintenance
+    # ------------------------------------------------------------------
+
+    def prune(
+        self,
+        max_age_seconds: Optional[float] = None,
+        max_bytes: Optional[int] = None,
+    ) -> int:
+        """Drop objects unused for ``max_age_seconds``, then the least
+        recently used ones until the store fits in ``max_bytes``.
+
+        Returns the number of objects removed.
+        """
+        entries = []
+        for key in self.keys():
+            path = self._object_path(key)
+            try:
+                st = path.stat()
+            except OSError:
+                continue
+            entries.append((st.st_mtime, st.st_size, path))
+        entries.sort()  # least recently used first
+
+        removed = 0
+        cutoff = time.time() - max_age_seconds if max_age_seconds is not None else None
+        total = sum(size for _, size, _ in entries)
+        for mtime, size, path in entries:
+            expired = cutoff is not None and mtime < cutoff
+            over = max_bytes is not None and total > max_bytes
+            if not (expired or over):
+                break  # everything after this is newer and the store fits
+            try:
+                path.unlink()
+            except OSError:
+                continue
+            removed += 1
+            total -= size
+        self._remove_empty_buckets()
+        return removed
+
+    def verify(self, remove_corrupt: bool = False) -> VerifyResult:
+        """Check every object's digest and encoding."""
+        result = VerifyResult()
+        for key in list(self.keys()):
+            result.checked += 1
+            path = self._object_path(key)
+            try:
+                _decode(path.read_bytes())
+            except (OSError, ValueError):
+                result.corrupt.append(key)
+                if remove_corrupt:
+                    try:
+                        path.unlink()
+                        result.removed += 1
+                    except OSError:
+                        pass
+        return result
+
+    def _remove_empty_buckets(self) -> None:
+        try:
+            buckets = list(os.scandir(self.objects))
+        except OSError:
+            return
+        for bucket in buckets:
+            if bucket.is_dir():
+                try:
+                    os.rmdir(bucket.path)
+                except OSError:
+                    pass  # not empty
+
+    # ------------------------------------------------------------------
+    # Packs
+    # ------------------------------------------------------------------
+
+    def export_pack(self, pack_path: str | os.PathLike[str]) -> int:
+        """Write every valid object into one pack file; returns the count."""
+        pack_path = Path(pack_path)
+        pack_path.parent.mkdir(parents=True, exist_ok=True)
+        manifest: dict[str, Any] = {"format": PACK_FORMAT, "objects": {}}
+        fd, tmp = tempfile.mkstemp(dir=pack_path.parent, prefix=".tmp-pack-")
+        os.close(fd)
+        try:
+            with tarfile.open(tmp, "w:") as tar:
+                for key in self.keys():
+                    path = self._object_path(key)
+                    try:
+                        raw = path.read_bytes()
+                        _decode(raw)
+                    except (OSError, ValueError):
+                        continue  # never ship corrupt objects
+                    name = f"objects/{key[:2]}/{key[2:]}"
+                    _add_member(tar, name, raw)
+                    manifest["objects"][key] = hashlib.sha256(raw).hexdigest()
+                _add_member(
+                    tar, _MANIFEST, json.dumps(manifest, sort_keys=True).encode()
+                )
+            os.replace(tmp, pack_path)
+        except BaseException:
+            try:
+                os.unlink(tmp)
+            except OSError:
+                pass
+            raise
+        return len(manifest["objects"])
+
+    def import_pack(
+        self,
+        pack_path: str | os.PathLike[str],
+        max_object_bytes: int = MAX_PACK_OBJECT_BYTES,
+    ) -> PackResult:
+        """Merge a pack into this store, checking every object.
+
+        Members with unexpected names (e.g. path traversal), objects whose
+        bytes do not match the manifest, corrupt objects, and objects larger
+        than ``max_object_bytes`` (stored or decompressed) are rejected
+        before they are read into memory. Raises ValueError if the file is
+        not a readable pack (e.g. truncated).
+        """
+        result = PackResult()
+        for key, raw in self._pack_objects(pack_path, result, max_object_bytes):
+            self._write(key, raw)
+            result.imported += 1
+        return result
+
+    def _pack_objects(
+        self,
+        pack_path: str | os.PathLike[str],
+        result: PackResult,
+        max_object_bytes: int,
+    ) -> Iterator[tuple[str, bytes]]:
+        """Checked objects of a pack not yet in this store.
+
+        Rejected and already present members are recorded in ``result``; a
+        file that cannot be read as a tar archive raises ValueError.
+        """
+        try:
+            with tarfile.open(pack_path, "r:*") as tar:
+                manifest = self._pack_manifest(tar, max_object_bytes)
+                for member in tar:
+                    if member.name == _MANIFEST:
+                        continue
+                    match = _MEMBER_RE.match(member.name)
+                    if (
+                        match is None
+                        or not member.isfile()
+                        or member.size > max_object_bytes
+                    ):
+                        result.rejected.append(member.name)
+                        continue
+                    key = match.group(1) + match.group(2)
+                    if self._object_path(key).is_file():
+                        result.skipped += 1
+                        continue
+                    stream = tar.extractfile(member)
+                    raw = stream.read() if stream is not None else b""
+                    expected = manifest.get(key)
+                    try:
+                        if (
+                            expected is not None
+                            and hashlib.sha256(raw).hexdigest() != expected
+                        ):
+                            raise ValueError("manifest mismatch")
+                        _decode(raw, max_object_bytes)
+                    except ValueError:
+                        result.rejected.append(member.name)
+                        continue
+                    yield key, raw
+        except (tarfile.TarError, EOFError, zlib.error, OSError) as e:
+            raise ValueError(f"Unreadable pack {os.fspath(pack_path)}: {e}") from e
+
+    @staticmethod
+    def _pack_manifest(tar: tarfile.TarFile, max_object_bytes: int) -> dict[str, Any]:
+        """Object digests listed in a pack's manifest ({} if absent or malformed)."""
+        try:
+            member = tar.getmember(_MANIFEST)
+        except KeyError:
+            return {}
+        stream = tar.extractfile(member)
+        if stream is None or member.size > max_object_bytes:
+            return {}
+        try:
+            data = json.loads(stream.read())
+        except ValueError:
+            return {}
+        objects = data.get("objects") if isinstance(data, dict) else None
+        return objects if isinstance(objects, dict) else {}
+
+    # ------------------------------------------------------------------
+    # Remote stand-in
+    # ------------------------------------------------------------------
+
+    def push(self, remote: "DirectoryRemote", name: str) -> int:
+        """Export this store and upload it to ``remote`` as ``name``."""
+        with tempfile.TemporaryDirectory() as tmp:
+            pack = Path(tmp) / "store.pack"
+            count = self.export_pack(pack)
+            remote.put(name, pack)
+        return count
+
+    def pull(self, remote: "DirectoryRemote", name: str) -> Optional[PackResult]:
+        """Download ``name`` from ``remote`` and import it (None if absent).
+
+        Raises ValueError if the downloaded pack cannot be read.
+        """
+        with tempfile.TemporaryDirectory() as tmp:
+            pack = Path(tmp) / "store.pack"
+            if not remote.get(name, pack):
+                return None
+            return self.import_pack(pack)
+
+
+def _add_member(tar: tarfile.TarFile, name: str, data: bytes) -> None:
+    info = tarfile.TarInfo(name)
+    info.size = len(data)
+    info.mode = 0o644
+    tar.addfile(info, io.BytesIO(data))
+
+
+class DirectoryRemote:
+    """Remote pack storage backed by a local (or mounted) directory.
+
+    Stands in for CI artifact or object storage: anything offering ``put``
+    and ``get`` of named files can replace it.
+    """
+
+    def __init__(self, root: str | os.PathLike[str]):
+        self.root = Path(root)
+
+    def _path(self, name: str) -> Path:
+        if not name or "/" in name or "\\" in name or name in (".", ".."):
+            raise ValueError(f"invalid pack name: {name!r}")
+        return self.root / name
+
+    def put(self, name: str, source: str | os.PathLike[str]) -> None:
+        target = self._path(name)
+        self.root.mkdir(parents=True, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=self.root, prefix=".tmp-")
+        os.close(fd)
+        try:
+            shutil.copyfile(source, tmp)
+            os.replace(tmp, target)
+        except BaseException:
+            try:
+                os.unlink(tmp)
+            except OSError:
+                pass
+            raise
+
+    def get(self, name: str, destination: str | os.PathLike[str]) -> bool:
+        source = self._path(name)
+        if not source.is_file():
+            return False
+        shutil.copyfile(source, destination)
+        return True
+
+
+__all__ = [
+    "AnalysisStore",
+    "DirectoryRemote",
+    "PackResult",
+    "VerifyResult",
+    "config_hash",
+]
@@ -0,0 +1,529 @@
+"""
+Filesystem change feed for long-running server sessions.
+
+[20261018_PERF] Cache freshness used to be decided by re-stat'ing (or
+re-hashing) every file on every tool call. A ``ChangeFeed`` watches a
+project root instead - inotify on Linux (through ``ctypes``, no extra
+dependency) and a background polling scanner elsewhere - and coalesces the
+events into a dirty-path set stamped with a monotonically increasing
+generation number. Caches record a ``token()`` before they read a file and
+later ask the feed whether the path changed since; only the paths the feed
+cannot vouch for are stat'ed again, so a warm pass over an unchanged tree
+costs O(changes) instead of O(files).
+
+The feed answers conservatively: a token from another feed or process,
+from before a queue overflow, or a path under an unwatched directory is
+never reported as unchanged.
+
+Example:
+    >>> feed = start_change_feed("/repo")
+    >>> token = feed.token()
+    >>> feed.unchanged_since(token, "/repo/src/app.py")
+    True
+"""
+
+from __future__ import annotations
+
+import ctypes
+import ctypes.util
+import errno
+import logging
+import os
+import select
+import struct
+import sys
+import threading
+import uuid
+from dataclasses import dataclass
+from typing import Optional
+
+logger = logging.getLogger(__name__)
+
+# Directories never watched (VCS metadata, dependencies, tool caches)
+DEFAULT_UNWATCHED_DIRS: frozenset[str] = frozenset(
+    {
+        ".git",
+        ".hg",
+        ".svn",
+        "node_modules",
+        "__pycache__",
+        ".venv",
+        "venv",
+        ".tox",
+        ".mypy_cache",
+        ".pytest_cache",
+        ".ruff_cache",
+        ".code-scalpel",
+    }
+)
+
+# inotify(7) constants
+_IN_MODIFY = 0x00000002
+_IN_ATTRIB = 0x00000004
+_IN_CLOSE_WRITE = 0x00000008
+_IN_MOVED_FROM = 0x00000040
+_IN_MOVED_TO = 0x00000080
+_IN_CREATE = 0x00000100
+_IN_DELETE = 0x00000200
+_IN_DELETE_SELF = 0x00000400
+_IN_MOVE_SELF = 0x00000800
+_IN_Q_OVERFLOW = 0x00004000
+_IN_IGNORED = 0x00008000
+_IN_ONLYDIR = 0x01000000
+_IN_DONT_FOLLOW = 0x02000000
+_IN_EXCL_UNLINK = 0x04000000
+_IN_ISDIR = 0x40000000
+_IN_NONBLOCK = 0o4000
+_IN_CLOEXEC = 0o2000000
+_WATCH_MASK = (
+    _IN_MODIFY
+    | _IN_ATTRIB
+    | _IN_CLOSE_WRITE
+    | _IN_MOVED_FROM
+    | _IN_MOVED_TO
+    | _IN_CREATE
+    | _IN_DELETE
+    | _IN_DELETE_SELF
+    | _IN_MOVE_SELF
+    | _IN_ONLYDIR
+    | _IN_DONT_FOLLOW
+    | _IN_EXCL_UNLINK
+)
+_EVENT_HEADER = struct.Struct("iIII")
+_DIR_REMOVED = _IN_DELETE | _IN_MOVED_FROM
+_DIR_ADDED = _IN_CREATE | _IN_MOVED_TO
+
+
+@dataclass(frozen=True)
+class Changes:
+    """Paths changed after a token (absolute, as reported by the feed)."""
+
+    files: frozenset[str]
+    directories: frozenset[str]
+    generation: int
+
+    def affects(self, path: str) -> bool:
+        """Whether ``path`` changed or lies under a changed directory."""
+        if path in self.files:
+            return True
+        for directory in self.directories:
+            if path == directory or path.startswith(directory + os.sep):
+                return True
+        return False
+
+    def __bool__(self) -> bool:
+        return bool(self.files or self.directories)
+
+
+class _InotifyBackend:
+    """Recursive inotify watches on a tree (one watch per directory)."""
+
+    def __init__(self, feed: ChangeFeed):
+        if not sys.platform.startswith("linux"):
+            raise OSError(errno.ENOSYS, "inotify is only available on Linux")
+        libc = ctypes.CDLL(ctypes.util.find_library("c") or "libc.so.6", use_errno=True)
+        self._add_watch = libc.inotify_add_watch
+        self._add_watch.argtypes = [ctypes.c_int, ctypes.c_char_p, ctypes.c_uint32]
+        self._rm_watch = libc.inotify_rm_watch
+        self._rm_watch.argtypes = [ctypes.c_int, ctypes.c_int]
+        fd = libc.inotify_init1(_IN_NONBLOCK | _IN_CLOEXEC)
+        if fd < 0:
+            err = ctypes.get_errno()
+            raise OSError(err, os.strerror(err))
+        self.fd = fd
+        self._feed = feed
+        self._paths: dict[int, str] = {}
+        self._wds: dict[str, int] = {}
+
+    def add_tree(self, top: str, files: set[str], dirs: set[str]) -> None:
+        """Watch ``top`` and its subdirectories; collect what they contain."""
+        stack = [top]
+        skip = self._feed.exclude_dirs
+        while stack:
+            path = stack.pop()
+            wd = self._add_watch(self.fd, os.fsencode(path), _WATCH_MASK)
+            if wd < 0:
+                err = ctypes.get_errno()
+                if err in (errno.ENOSPC, errno.ENOMEM):
+                    raise OSError(err, "inotify watch limit reached")
+                continue  # vanished or unreadable directory
+            self._paths[wd] = path
+            self._wds[path] = wd
+            try:
+                with os.scandir(path) as entries:
+                    for entry in entries:
+                        if entry.is_dir(follow_symlinks=False):
+                            if entry.name not in skip:
+                                dirs.add(entry.path)
+                                stack.append(entry.path)
+                        else:
+                            files.add(entry.path)
+            except OSError:
+                continue
+
+    def _forget(self, top: str) -> None:
+        """Drop watches for a directory moved away (their paths are stale)."""
+        prefix = top + os.sep
+        for path in [p for p in self._wds if p == top or p.startswith(prefix)]:
+            wd = self._wds.pop(path)
+            self._paths.pop(wd, None)
+            self._rm_watch(self.fd, wd)
+
+    def drain(self, files: set[str], dirs: set[str]) -> bool:
+        """Read queued events into ``files``/``dirs``; True on overflow."""
+        overflow = False
+        skip = self._feed.exclude_dirs
+        while True:
+            try:
+                data = os.read(self.fd, 65536)
+            except BlockingIOError:
+                return overflow
+            except OSError:
+                return True
+            offset = 0
+            while offset < len(data):
+                wd, mask, _cookie, length = _EVENT_HEADER.unpack_from(data, offset)
+                offset += _EVENT_HEADER.size
+                name = data[offset : offset + length].rstrip(b"\0")
+                offset += length
+                if mask & _IN_Q_OVERFLOW:
+                    overflow = True
+                    continue
+                base = self._paths.get(wd)
+                if base is None:
+                    continue
+                if mask & _IN_IGNORED:
+                    self._paths.pop(wd, None)
+                    self._wds.pop(base, None)
+                    continue
+                if mask & (_IN_DELETE_SELF | _IN_MOVE_SELF):
+                    dirs.add(base)
+                    continue
+                path = os.path.join(base, os.fsdecode(name)) if name else base
+                if not mask & _IN_ISDIR:
+                    files.add(path)
+                elif os.fsdecode(name) in skip:
+                    continue
+                elif mask & _DIR_REMOVED:
+                    dirs.add(path)
+                    self._forget(path)
+                elif mask & _DIR_ADDED:
+                    dirs.add(path)
+                    try:
+                        self.add_tree(path, files, dirs)
+                    except OSError:
+                        overflow = True
+
+    def close(self) -> None:
+        try:
+            os.close(self.fd)
+        except OSError:
+            pass
+
+
+class _PollBackend:
+    """Periodic ``os.scandir`` snapshots diffed against the previous one."""
+
+    def __init__(self, feed: ChangeFeed):
+        self._feed = feed
+        self._files: dict[str, tuple[int, int]] = {}
+        self._dirs: set[str] = set()
+
+    def _scan(self) -> tuple[dict[str, tuple[int, int]], set[str]]:
+        files: dict[str, tuple[int, int]] = {}
+        dirs: set[str] = set()
+        skip = self._feed.exclude_dirs
+        stack = [self._feed.root]
+        while stack:
+            try:
+                with os.scandir(stack.pop()) as entries:
+                    for entry in entries:
+                        try:
+                            if entry.is_dir(follow_symlinks=False):
+                                if entry.name not in skip:
+                                    dirs.add(entry.path)
+                                    stack.append(entry.path)
+                            else:
+                                st = entry.stat(follow_symlinks=False)
+                                files[entry.path] = (st.st_mtime_ns, st.st_size)
+                        except OSError:
+                            continue
+            except OSError:
+                continue
+        return files, dirs
+
+    def prime(self) -> None:
+        self._files, self._dirs = self._scan()
+
+    def poll(self, files: set[str], dirs: set[str]) -> None:
+        current_files, current_dirs = self._scan()
+        previous = self._files
+        files.update(p for p, sig in current_files.items() if previous.get(p) != sig)
+        files.update(p for p in previous if p not in current_files)
+        dirs.update(current_dirs ^ self._dirs)
+        self._files, self._dirs = current_files, current_dirs
+
+
+class ChangeFeed:
+    """Coalesced dirty-path set for one project root.
+
+    Args:
+        root: Directory to watch.
+        backend: ``"auto"`` (inotify when available, else polling),
+            ``"inotify"`` or ``"poll"``.
+        poll_interval: Seconds between polling scans (and the maximum lag
+            of the polling backend).
+        exclude_dirs: Directory names that are not watched.
+    """
+
+    def __init__(
+        self,
+        root: str | os.PathLike[str],
+        *,
+        backend: str = "auto",
+        poll_interval: float = 1.0,
+        exclude_dirs: frozenset[str] = DEFAULT_UNWATCHED_DIRS,
+    ):
+        self.root = os.path.realpath(os.fspath(root))
+        self.requested_backend = backend
+        self.poll_interval = poll_interval
+        self.exclude_dirs = exclude_dirs
+        self.session = uuid.uuid4().hex[:12]
+        self.backend: Optional[str] = None
+        self._lock = threading.RLock()
+        self._generation = 0
+        self._valid_from = 0
+        self._files: dict[str, int] = {}
+        self._dirs: dict[str, int] = {}
+        self._inotify: Optional[_InotifyBackend] = None
+        self._poller: Optional[_PollBackend] = None
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    # -- lifecycle -----------------------------------------------------
+
+    @property
+    def running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self) -> ChangeFeed:
+        """Register watches (or take the first snapshot) and start watching."""
+        if self.running:
+            return self
+        if self.requested_backend in ("auto", "inotify"):
+            try:
+                self._inotify = _InotifyBackend(self)
+                self._inotify.add_tree(self.root, set(), set())
+                self.backend = "inotify"
+            except (OSError, AttributeError) as e:
+                if self._inotify is not None:
+                    self._inotify.close()
+                    self._inotify = None
+                if self.requested_backend == "inotify":
+                    raise
+                logger.info("inotify unavailable for %s (%s); polling", self.root, e)
+        if self._inotify is None:
+            self._poller = _PollBackend(self)
+            self._poller.prime()
+            self.backend = "poll"
+        self._stop.clear()
+        self._thread = threading.Thread(
+            target=self._run, name="scalpel-change-feed", daemon=True
+        )
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout=5)
+            self._thread = None
+        if self._inotify is not None:
+            self._inotify.close()
+            self._inotify = None
+
+    def __enter__(self) -> ChangeFeed:
+        return self.start()
+
+    def __exit__(self, *exc: object) -> None:
+        self.stop()
+
+    def _run(self) -> None:
+        while not self._stop.is_set():
+            if self._inotify is not None:
+                try:
+                    select.select([self._inotify.fd], [], [], 0.5)
+                except (OSError, ValueError):
+                    return
+                self.sync()
+            else:
+                self._stop.wait(self.poll_interval)
+                if self._stop.is_set() or self._poller is None:
+                    return
+                files: set[str] = set()
+                dirs: set[str] = set()
+                self._poller.poll(files, dirs)
+                self._commit(files, dirs, overflow=False)
+
+    # -- change log ----------------------------------------------------
+
+    def _commit(self, files: set[str], dirs: set[str], *, overflow: bool) -> None:
+        """Record one coalesced batch under a new generation."""
+        if not (files or dirs or overflow):
+            return
+        with self._lock:
+            self._generation += 1
+            generation = self._generation
+            if overflow:
+                # Events were lost: nothing before this point can be vouched for
+                self._valid_from = generation
+            for path in files:
+                self._files[path] = generation
+            for path in dirs:
+                self._dirs[path] = generation
+
+    def sync(self) -> None:
+        """Fold queued kernel events into the change log (inotify only)."""
+        backend = self._inotify
+        if backend is None:
+            return
+        with self._lock:
+            files: set[str] = set()
+            dirs: set[str] = set()
+            overflow = backend.drain(files, dirs)
+            self._commit(files, dirs, overflow=overflow)
+
+    @property
+    def generation(self) -> int:
+        self.sync()
+        return self._generation
+
+    def token(self) -> str:
+        """Opaque marker of "now"; take it before reading a file."""
+        return f"{self.session}:{self.generation}"
+
+    def _since(self, token: Optional[str]) -> Optional[int]:
+        """Generation encoded in ``token`` if this feed can answer for it."""
+        if not token or not self.running:
+            return None
+        session, _, generation = token.partition(":")
+        if session != self.session or not generation.isdigit():
+            return None
+        since = int(generation)
+        self.sync()
+        if since < self._valid_from or since > self._generation:
+            return None
+        return since
+
+    def watches(self, path: str) -> bool:
+        """Whether ``path`` lies in the watched part of the tree."""
+        if path == self.root:
+            return True
+        if not path.startswith(self.root + os.sep):
+            return False
+        parts = path[len(self.root) + 1 :].split(os.sep)
+        return not any(part in self.exclude_dirs for part in parts[:-1])
+
+    def changes_since(self, token: Optional[str]) -> Optional[Changes]:
+        """Paths changed after ``token``, or None if the feed cannot tell."""
+        with self._lock:
+            since = self._since(token)
+            if since is None:
+                return None
+            return Changes(
+                files=frozenset(p for p, g in self._files.items() if g > since),
+                directories=frozenset(p for p, g in self._dirs.items() if g > since),
+                generation=self._generation,
+            )
+
+    def unchanged_since(
+        self, token: Optional[str], path: str | os.PathLike[str]
+    ) -> bool:
+        """True only if the feed vouches that ``path`` did not change."""
+        path = os.path.abspath(os.fspath(path))
+        if not self.watches(path):
+            return False
+        with self._lock:
+            since = self._since(token)
+            if since is None or self._files.get(path, 0) > since:
+                return False
+            if self._dirs:
+                parent = path
+                while len(parent) > len(self.root):
+                    if self._dirs.get(parent, 0) > since:
+                        return False
+                    parent = os.path.dirname(parent)
+            return True
+
+
+_FEEDS: dict[str, ChangeFeed] = {}
+_FEEDS_LOCK = threading.Lock()
+
+
+def start_change_feed(
+    root: str | os.PathLike[str],
+    *,
+    backend: str = "auto",
+    poll_interval: float = 1.0,
+) -> ChangeFeed:
+    """Start (or return the running) change feed for ``root``."""
+    key = os.path.realpath(os.fspath(root))
+    with _FEEDS_LOCK:
+        feed = _FEEDS.get(key)
+        if feed is None or not feed.running:
+            feed = ChangeFeed(key, backend=backend, poll_interval=poll_interval)
+            feed.start()
+            _FEEDS[key] = feed
+        return feed
+
+
+def get_change_feed(path: str | os.PathLike[str]) -> Optional[ChangeFeed]:
+    """The running feed that watches ``path``, if any."""
+    if not _FEEDS:
+        return None
+    target = os.path.abspath(os.fspath(path))
+    for feed in list(_FEEDS.values()):
+        if feed.running and feed.watches(target):
+            return feed
+    return None
+
+
+def stop_change_feeds() -> None:
+    """Stop every running feed."""
+    with _FEEDS_LOCK:
+        feeds = list(_FEEDS.values())
+        _FEEDS.clear()
+    for feed in feeds:
+        feed.stop()
+
+
+def start_change_feed_from_env(root: str | os.PathLike[str]) -> Optional[ChangeFeed]:
+    """Start a feed for ``root`` when ``SCALPEL_CHANGE_FEED`` asks for one.
+
+    ``1``/``on``/``auto`` picks the best backend; ``inotify`` and ``poll``
+    force one. ``SCALPEL_CHANGE_FEED_POLL_INTERVAL`` sets the polling period.
+    """
+    mode = os.environ.get("SCALPEL_CHANGE_FEED", "").strip().lower()
+    if mode in ("", "0", "off", "false", "no"):
+        return None
+    backend = mode if mode in ("inotify", "poll") else "auto"
+    try:
+        interval = float(os.environ.get("SCALPEL_CHANGE_FEED_POLL_INTERVAL", "1.0"))
+    except ValueError:
+        interval = 1.0
+    try:
+        return start_change_feed(root, backend=backend, poll_interval=interval)
+    except OSError as e:
+        logger.warning("Change feed not started for %s: %s", root, e)
+        return None
+
+
+__all__ = [
+    "DEFAULT_UNWATCHED_DIRS",
+    "ChangeFeed",
+    "Changes",
+    "get_change_feed",
+    "start_change_feed",
+    "start_change_feed_from_env",
+    "stop_change_feeds",
+]
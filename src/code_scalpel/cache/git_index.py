@@ -0,0 +1,419 @@
+"""
+Git-index-aware change detection.
+
+[20261018_PERF] In a git checkout every tracked file already has a content
+address: ``.git/index`` records each file's blob object id next to the stat
+data it had when it was staged. ``GitChangeDetector`` reads the index
+directly (pure Python, no ``git`` subprocess) and answers "what is this
+file's content id" from it:
+
+- a file whose stat data still matches its index entry is clean, and its
+  blob id comes straight from the index - no read, no hash;
+- a dirty, untracked or racily-clean file is hashed the way git would hash
+  it (``blob <size>\\0`` + content), so keys stay in one namespace.
+
+Because blob ids only depend on content, cache keys built from them are
+shared by every clone and CI machine that checks out the same commit.
+
+Set ``SCALPEL_GIT_INDEX=0`` to fall back to plain content hashing.
+
+Example:
+    >>> detector = git_detector_for("/repo/src/app.py")
+    >>> detector.blob_id("/repo/src/app.py")
+    'e69de29bb2d1d6434b8b29ae775ad8c2e48c5391'
+"""
+
+from __future__ import annotations
+
+import hashlib
+import os
+import struct
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Optional
+
+# Entry header: ctime s/ns, mtime s/ns, dev, ino, mode, uid, gid, size
+_STAT = struct.Struct(">10I")
+_FLAG_EXTENDED = 0x4000
+_FLAG_STAGE = 0x3000
+_FLAG_NAME_MASK = 0x0FFF
+_EXT_SKIP_WORKTREE = 0x4000
+_EXT_INTENT_TO_ADD = 0x2000
+_S_IFMT = 0o170000
+_S_IFREG = 0o100000
+_S_IFLNK = 0o120000
+_S_IFGITLINK = 0o160000
+_STREAM_CHUNK = 1 << 20
+
+
+@dataclass(frozen=True)
+class GitIndexEntry:
+    """Stat data and blob id of one stage-0 path in the index."""
+
+    path: str
+    oid: str
+    mode: int
+    size: int
+    mtime_s: int
+    mtime_ns: int
+    ctime_s: int
+    ctime_ns: int
+    ino: int
+    uid: int
+    gid: int
+    assume_dirty: bool = False
+
+
+@dataclass
+class GitIndex:
+    """Parsed ``.git/index``: entries by POSIX path relative to the top."""
+
+    version: int
+    entries: dict[str, GitIndexEntry]
+    mtime_ns: int
+    hash_name: str = "sha1"
+
+
+def _read_varint(data: memoryview, pos: int) -> tuple[int, int]:
+    """Git's offset varint (index v4 path prefix lengths)."""
+    c = data[pos]
+    pos += 1
+    value = c & 0x7F
+    while c & 0x80:
+        c = data[pos]
+        pos += 1
+        value = ((value + 1) << 7) | (c & 0x7F)
+    return value, pos
+
+
+def parse_git_index(
+    data: bytes, *, mtime_ns: int = 0, hash_name: str = "sha1"
+) -> GitIndex:
+    """Parse the bytes of an index file (versions 2, 3 and 4).
+
+    Conflicted (non-zero stage), skip-worktree and sparse-directory entries
+    are left out; intent-to-add entries are kept but never clean.
+
+    Raises:
+        ValueError: If the data is not a supported index.
+    """
+    if len(data) < 12 or data[:4] != b"DIRC":
+        raise ValueError("not a git index")
+    version, count = struct.unpack_from(">II", data, 4)
+    if version not in (2, 3, 4):
+        raise ValueError(f"unsupported index version {version}")
+    oid_size = 32 if hash_name == "sha256" else 20
+    view = memoryview(data)
+    pos = 12
+    previous = b""
+    entries: dict[str, GitIndexEntry] = {}
+    fixed = _STAT.size + oid_size + 2
+    for _ in range(count):
+        start = pos
+        ctime_s, ctime_ns, mtime_s, mtime_ns_, _dev, ino, mode, uid, gid, size = (
+            _STAT.unpack_from(data, pos)
+        )
+        pos += _STAT.size
+        oid = data[pos : pos + oid_size].hex()
+        pos += oid_size
+        (flags,) = struct.unpack_from(">H", data, pos)
+        pos += 2
+        extended = 0
+        if flags & _FLAG_EXTENDED and version >= 3:
+            (extended,) = struct.unpack_from(">H", data, pos)
+            pos += 2
+        if version == 4:
+            strip, pos = _read_varint(view, pos)
+            end = data.index(b"\0", pos)
+            name = previous[: len(previous) - strip] + data[pos:end]
+            pos = end + 1
+            previous = name
+        else:
+            length = flags & _FLAG_NAME_MASK
+            if length == _FLAG_NAME_MASK:
+                length = data.index(b"\0", pos) - pos
+            name = data[pos : pos + length]
+            # Entries are NUL-padded to a multiple of 8 bytes
+            header = fixed + (2 if flags & _FLAG_EXTENDED and version >= 3 else 0)
+            pos = start + ((header + length + 8) & ~7)
+        if flags & _FLAG_STAGE or extended & _EXT_SKIP_WORKTREE:
+            continue
+        if mode & _S_IFMT not in (_S_IFREG, _S_IFLNK):
+            continue  # submodules (gitlinks) and sparse directories
+        path = name.decode("utf-8", "surrogateescape")
+        entries[path] = GitIndexEntry(
+            path=path,
+            oid=oid,
+            mode=mode,
+            size=size,
+            mtime_s=mtime_s,
+            mtime_ns=mtime_ns_,
+            ctime_s=ctime_s,
+            ctime_ns=ctime_ns,
+            ino=ino,
+            uid=uid,
+            gid=gid,
+            assume_dirty=bool(extended & _EXT_INTENT_TO_ADD),
+        )
+    return GitIndex(
+        version=version, entries=entries, mtime_ns=mtime_ns, hash_name=hash_name
+    )
+
+
+def find_git_dir(start: Path) -> tuple[Optional[Path], Optional[Path]]:
+    """(work tree top, git dir) of the repository containing ``start``.
+
+    Follows ``.git`` files (worktrees, submodules) and ``commondir``.
+    """
+    for candidate in (start, *start.parents):
+        dot_git = candidate / ".git"
+        if dot_git.is_dir():
+            return candidate, dot_git
+        if dot_git.is_file():
+            try:
+                text = dot_git.read_text(encoding="utf-8", errors="ignore")
+            except OSError:
+                return candidate, None
+            if not text.startswith("gitdir:"):
+                return candidate, None
+            git_dir = Path(text[len("gitdir:") :].strip())
+            if not git_dir.is_absolute():
+                git_dir = candidate / git_dir
+            return candidate, git_dir
+    return None, None
+
+
+def common_git_dir(git_dir: Path) -> Path:
+    """Directory holding the shared config (differs for linked worktrees)."""
+    common = git_dir / "commondir"
+    if common.is_file():
+        try:
+            return (git_dir / common.read_text().strip()).resolve()
+        except OSError:
+            pass
+    return git_dir
+
+
+def _object_format(git_dir: Path) -> str:
+    """``extensions.objectFormat`` of the repository (sha1 by default)."""
+    try:
+        text = (common_git_dir(git_dir) / "config").read_text(
+            encoding="utf-8", errors="ignore"
+        )
+    except OSError:
+        return "sha1"
+    section = ""
+    for raw in text.splitlines():
+        line = raw.strip()
+        if line.startswith("["):
+            section = line[1 : line.find("]")].strip().lower()
+        elif section == "extensions" and "=" in line:
+            key, _, value = line.partition("=")
+            if key.strip().lower() == "objectformat":
+                return value.strip().lower()
+    return "sha1"
+
+
+def hash_blob(path: str | os.PathLike[str], hash_name: str = "sha1") -> str:
+    """Git blob id of a file's content ("" if it cannot be read)."""
+    try:
+        if os.path.islink(path):
+            data = os.fsencode(os.readlink(path))
+            hasher = hashlib.new(hash_name, b"blob %d\0" % len(data))
+            hasher.update(data)
+            return hasher.hexdigest()
+        with open(path, "rb") as f:
+            size = os.fstat(f.fileno()).st_size
+            hasher = hashlib.new(hash_name, b"blob %d\0" % size)
+            read = 0
+            for chunk in iter(lambda: f.read(_STREAM_CHUNK), b""):
+                hasher.update(chunk)
+                read += len(chunk)
+        if read != size:
+            return ""  # changed while reading
+        return hasher.hexdigest()
+    except OSError:
+        return ""
+
+
+class GitChangeDetector:
+    """Content ids for files of one git work tree, from its index."""
+
+    def __init__(self, top: str | os.PathLike[str], git_dir: str | os.PathLike[str]):
+        self.top = os.fspath(top)
+        self.git_dir = Path(git_dir)
+        self.hash_name = _object_format(self.git_dir)
+        self._index: Optional[GitIndex] = None
+        self._signature: Optional[tuple[int, int]] = None
+        self._lock = threading.Lock()
+        self.files_hashed = 0
+
+    @property
+    def index(self) -> Optional[GitIndex]:
+        """The current index, re-read when the index file changes."""
+        index_path = self.git_dir / "index"
+        try:
+            st = index_path.stat()
+        except OSError:
+            return None
+        signature = (st.st_mtime_ns, st.st_size)
+        if signature != self._signature:
+            with self._lock:
+                if signature != self._signature:
+                    try:
+                        data = index_path.read_bytes()
+                        self._index = parse_git_index(
+                            data, mtime_ns=st.st_mtime_ns, hash_name=self.hash_name
+                        )
+                    except (OSError, ValueError, struct.error):
+                        self._index = None
+                    self._signature = signature
+        return self._index
+
+    def _relative(self, path: str | os.PathLike[str]) -> Optional[str]:
+        full = os.path.abspath(os.fspath(path))
+        if not full.startswith(self.top + os.sep):
+            return None
+        rel = full[len(self.top) + 1 :]
+        return rel.replace(os.sep, "/") if os.sep != "/" else rel
+
+    def entry(self, path: str | os.PathLike[str]) -> Optional[GitIndexEntry]:
+        index = self.index
+        rel = self._relative(path)
+        if index is None or rel is None:
+            return None
+        return index.entries.get(rel)
+
+    def index_oid(
+        self, path: str | os.PathLike[str], st: Optional[os.stat_result] = None
+    ) -> Optional[str]:
+        """Blob id from the index if ``path`` is clean against it, else None.
+
+        Clean follows git's stat check: same mtime, ctime, size, inode,
+        owner and file type, and not modified within the index file's own
+        timestamp granularity ("racily clean" entries are not trusted).
+        """
+        index = self.index
+        rel = self._relative(path)
+        if index is None or rel is None:
+            return None
+        entry = index.entries.get(rel)
+        if entry is None or entry.assume_dirty:
+            return None
+        if st is None:
+            try:
+                st = os.lstat(path)
+            except OSError:
+                return None
+        if (st.st_mode & _S_IFMT) != (entry.mode & _S_IFMT):
+            return None
+        if entry.mode & _S_IFMT == _S_IFREG and (st.st_mode & 0o100) != (
+            entry.mode & 0o100
+        ):
+            return None
+        if (
+            st.st_size & 0xFFFFFFFF != entry.size
+            or st.st_ino & 0xFFFFFFFF != entry.ino
+            or st.st_uid != entry.uid
+            or st.st_gid != entry.gid
+        ):
+            return None
+        mtime_s, mtime_ns = divmod(st.st_mtime_ns, 1_000_000_000)
+        ctime_s, ctime_ns = divmod(st.st_ctime_ns, 1_000_000_000)
+        if (
+            mtime_s & 0xFFFFFFFF != entry.mtime_s
+            or ctime_s & 0xFFFFFFFF != entry.ctime_s
+        ):
+            return None
+        # Nanoseconds are only recorded by git builds that support them
+        if entry.mtime_ns and mtime_ns != entry.mtime_ns:
+            return None
+        if entry.ctime_ns and ctime_ns != entry.ctime_ns:
+            return None
+        entry_mtime = entry.mtime_s * 1_000_000_000 + entry.mtime_ns
+        if entry_mtime >= index.mtime_ns:
+            return None  # racily clean: content may have changed in the same tick
+        return entry.oid
+
+    def blob_id(self, path: str | os.PathLike[str]) -> str:
+        """Content id of ``path``: from the index when clean, else hashed."""
+        oid = self.index_oid(path)
+        if oid is not None:
+            return oid
+        self.files_hashed += 1
+        return hash_blob(path, self.hash_name)
+
+    def dirty_paths(self) -> list[str]:
+        """Tracked paths (relative, POSIX) that are not clean against the index."""
+        index = self.index
+        if index is None:
+            return []
+        return sorted(
+            rel
+            for rel in index.entries
+            if self.index_oid(os.path.join(self.top, rel)) is None
+        )
+
+
+# Detectors by work tree top; directories are memoized to their top (or
+# None outside git) in a bounded LRU
+_DETECTORS: dict[str, GitChangeDetector] = {}
+_DIRECTORY_TOPS: OrderedDict[str, Optional[str]] = OrderedDict()
+_DIRECTORY_TOPS_MAX = 4096
+_DETECTORS_LOCK = threading.Lock()
+
+
+def git_detector_for(path: str | os.PathLike[str]) -> Optional[GitChangeDetector]:
+    """The detector for the work tree containing ``path`` (None outside git).
+
+    Detectors are shared per work tree; ``SCALPEL_GIT_INDEX=0`` disables
+    them.
+    """
+    flag = os.environ.get("SCALPEL_GIT_INDEX", "1").strip().lower()
+    if flag in ("0", "off", "false"):
+        return None
+    full = os.path.abspath(os.fspath(path))
+    directory = full if os.path.isdir(full) else os.path.dirname(full)
+    with _DETECTORS_LOCK:
+        if directory in _DIRECTORY_TOPS:
+            _DIRECTORY_TOPS.move_to_end(directory)
+            key = _DIRECTORY_TOPS[directory]
+            return _DETECTORS.get(key) if key is not None else None
+    top, git_dir = find_git_dir(Path(directory))
+    if git_dir is not None and not (git_dir / "index").is_file():
+        git_dir = None
+    key: Optional[str] = None
+    detector: Optional[GitChangeDetector] = None
+    with _DETECTORS_LOCK:
+        if top is not None and git_dir is not None:
+            key = os.fspath(top)
+            detector = _DETECTORS.get(key)
+            if detector is None:
+                detector = GitChangeDetector(top, git_dir)
+                _DETECTORS[key] = detector
+        _DIRECTORY_TOPS[directory] = key
+        if len(_DIRECTORY_TOPS) > _DIRECTORY_TOPS_MAX:
+            _DIRECTORY_TOPS.popitem(last=False)
+    return detector
+
+
+def reset_git_detectors() -> None:
+    """Forget cached detectors (e.g. after ``git init`` in a known directory)."""
+    with _DETECTORS_LOCK:
+        _DETECTORS.clear()
+        _DIRECTORY_TOPS.clear()
+
+
+__all__ = [
+    "GitChangeDetector",
+    "GitIndex",
+    "GitIndexEntry",
+    "common_git_dir",
+    "find_git_dir",
+    "git_detector_for",
+    "hash_blob",
+    "parse_git_index",
+    "reset_git_detectors",
+]
@@ -42,6 +42,8 @@ from dataclasses import dataclass
 from pathlib import Path
 from typing import Any, Callable, Dict, Generic, Optional, TypedDict, TypeVar
 
+from .git_index import git_detector_for
+
 
 class CacheStatsDict(TypedDict):
     """Cache statistics dictionary for JSON serialization."""
@@ -443,7 +445,16 @@ class AnalysisCache(Generic[T]):
             cache_path.unlink(missing_ok=True)
 
     def _hash_file(self, path: Path) -> str:
-        """Hash file contents, using memory-mapped I/O for large files."""
+        """Hash file contents, using memory-mapped I/O for large files.
+
+        [20261018_PERF] Files in a git work tree are keyed by their blob id,
+        read from ``.git/index`` when the file is clean.
+        """
+        detector = git_detector_for(path)
+        if detector is not None:
+            blob = detector.blob_id(path)
+            if blob:
+                return blob
         try:
             file_size = path.stat().st_size
             if file_size > MMAP_THRESHOLD_BYTES:
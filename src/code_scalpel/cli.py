@@ -8,7 +8,6 @@ from pathlib import Path
 
 from code_scalpel.mcp.protocol import format_tier_for_display
 
-
 # [20260311_FEATURE] Keep CLI analyze choices aligned with the local analyzer
 # and MCP language surface instead of a stale Python/JS/Java-only subset.
 ANALYZE_LANGUAGE_CHOICES = [
@@ -1751,6 +1750,56 @@ def handle_license(args: argparse.Namespace, parser: argparse.ArgumentParser) ->
     return 1
 
 
+def handle_analysis_store(
+    args: argparse.Namespace, parser: argparse.ArgumentParser
+) -> int:
+    """Handle 'codescalpel analysis-store' command family.
+
+    [20261018_PERF] Lets CI jobs restore a warm store from an artifact pack
+    and publish it again after the run.
+    """
+    from .cache.analysis_store import AnalysisStore
+
+    store_dir = (
+        args.store
+        or os.environ.get("SCALPEL_ANALYSIS_STORE")
+        or os.path.join(".code-scalpel", "store")
+    )
+    store = AnalysisStore(store_dir)
+    command = args.store_command
+    if command == "export":
+        count = store.export_pack(args.pack)
+        print(f"Exported {count} objects to {args.pack}")
+        return 0
+    if command == "import":
+        if not os.path.isfile(args.pack):
+            print(f"Pack not found: {args.pack}", file=sys.stderr)
+            return 1
+        try:
+            result = store.import_pack(args.pack)
+        except ValueError as e:
+            print(f"Error: {e}", file=sys.stderr)
+            return 1
+        print(
+            f"Imported {result.imported} objects "
+            f"({result.skipped} present, {len(result.rejected)} rejected)"
+        )
+        return 0
+    if command == "prune":
+        max_age = args.max_age_days * 86400 if args.max_age_days is not None else None
+        max_bytes = int(args.max_mb * 1024 * 1024) if args.max_mb is not None else None
+        removed = store.prune(max_age_seconds=max_age, max_bytes=max_bytes)
+        print(f"Removed {removed} objects")
+        return 0
+    if command == "verify":
+        result = store.verify(remove_corrupt=args.remove_corrupt)
+        print(f"Checked {result.checked} objects, {len(result.corrupt)} corrupt")
+        return 1 if result.corrupt and not args.remove_corrupt else 0
+
+    parser.print_help()
+    return 1
+
+
 def handle_mcp(args: argparse.Namespace) -> int:
     """Handle 'codescalpel mcp' command."""
     transport = args.transport
@@ -2782,6 +2831,48 @@ For more information, visit: https://github.com/3D-Tech-Solutions/code-scalpel
         help="Overwrite destination if it already exists",
     )
 
+    # [20261018_PERF] Content-addressed analysis store maintenance
+    store_parser = subparsers.add_parser(
+        "analysis-store", help="Export, import, prune or verify the analysis store"
+    )
+    store_parser.add_argument(
+        "--store",
+        default=None,
+        help="Store directory (default: $SCALPEL_ANALYSIS_STORE or .code-scalpel/store)",
+    )
+    store_subparsers = store_parser.add_subparsers(dest="store_command")
+    store_export_parser = store_subparsers.add_parser(
+        "export", help="Write the store to a single pack file"
+    )
+    store_export_parser.add_argument("pack", help="Pack file to write")
+    store_import_parser = store_subparsers.add_parser(
+        "import", help="Merge a pack file into the store"
+    )
+    store_import_parser.add_argument("pack", help="Pack file to read")
+    store_prune_parser = store_subparsers.add_parser(
+        "prune", help="Drop objects by last use"
+    )
+    store_prune_parser.add_argument(
+        "--max-age-days",
+        type=float,
+        default=None,
+        help="Remove objects not used for this many days",
+    )
+    store_prune_parser.add_argument(
+        "--max-mb",
+        type=float,
+        default=None,
+        help="Then remove least recently used objects until the store fits",
+    )
+    store_verify_parser = store_subparsers.add_parser(
+        "verify", help="Check every object's integrity"
+    )
+    store_verify_parser.add_argument(
+        "--remove-corrupt",
+        action="store_true",
+        help="Delete objects that fail verification",
+    )
+
     # Version command
     subparsers.add_parser("version", help="Show version information")
 
@@ -2949,6 +3040,7 @@ For more information, visit: https://github.com/3D-Tech-Solutions/code-scalpel
         "regenerate-manifest": lambda: handle_regenerate_manifest(args),
         "server": lambda: handle_server(args),
         "license": lambda: handle_license(args, license_parser),
+        "analysis-store": lambda: handle_analysis_store(args, store_parser),
         "mcp": lambda: handle_mcp(args),
         "capabilities": lambda: handle_capabilities(args),
         "version": lambda: handle_version(args),
@@ -6,6 +6,8 @@ Replaces the NotImplementedError stub with a real implementation.
 
 from typing import Any, List
 
+from code_scalpel.parsing.artifact_store import normalize_ir
+
 from ..interface import IParser, Language, ParseResult
 
 
@@ -25,7 +27,7 @@ class CppParserAdapter(IParser):
 
     def parse(self, code: str) -> ParseResult:
         """Parse C++ source code and return a ParseResult with the IR module."""
-        ir_module = self._normalizer.normalize(code)
+        ir_module = normalize_ir(self._normalizer, code)
         return ParseResult(
             ast=ir_module,
             errors=[],
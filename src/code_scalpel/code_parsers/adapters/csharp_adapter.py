@@ -8,6 +8,8 @@ interface can be used by the rest of the code_parsers infrastructure.
 
 from typing import Any, List
 
+from code_scalpel.parsing.artifact_store import normalize_ir
+
 from ..interface import IParser, ParseResult
 
 
@@ -39,7 +41,7 @@ class CSharpParserAdapter(IParser):
         """Parse C# source code and return a ParseResult wrapping the IR module."""
         from code_scalpel.code_parsers.interface import Language as IFaceLanguage
 
-        ir_module = self._normalizer.normalize(code)
+        ir_module = normalize_ir(self._normalizer, code)
         self._cached_module = ir_module
         self._cached_code = code
         return ParseResult(
@@ -5,6 +5,8 @@
 
 from typing import Any, List
 
+from code_scalpel.parsing.artifact_store import normalize_ir
+
 from ..interface import IParser, ParseResult
 
 
@@ -26,7 +28,7 @@ class GoParserAdapter(IParser):
         """Parse Go source code and return a ParseResult with the IR module."""
         from ..interface import Language as IParserLanguage
 
-        ir_module = self._normalizer.normalize(code)
+        ir_module = normalize_ir(self._normalizer, code)
         return ParseResult(
             ast=ir_module,
             errors=[],
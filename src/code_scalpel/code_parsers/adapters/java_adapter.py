@@ -1,5 +1,7 @@
 from typing import Any, Dict, List, Optional
 
+from code_scalpel.parsing.artifact_store import PARSED_ARTIFACTS
+
 from ..interface import IParser, Language, ParseResult
 
 # Try to import the Java parser
@@ -47,7 +49,12 @@ class JavaParserAdapter(IParser):
         """
         try:
             # Use the underlying parser's parse method
-            java_result = self._parser.parse(code)
+            # [20261018_PERF] Shared with other tools parsing the same text
+            java_result = PARSED_ARTIFACTS.get(
+                PARSED_ARTIFACTS.key(None, code, "java", "java-treesitter"),
+                lambda: self._parser.parse(code),
+                size=len(code),
+            )
             self._last_result = java_result
 
             # Convert to IParser ParseResult format
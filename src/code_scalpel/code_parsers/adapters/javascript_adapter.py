@@ -1,5 +1,7 @@
 from typing import Any, Dict, List, Optional
 
+from code_scalpel.parsing.artifact_store import PARSED_ARTIFACTS
+
 from ..interface import IParser, Language, ParseResult
 
 # Try to import the JavaScript parser
@@ -54,7 +56,12 @@ class JavaScriptParserAdapter(IParser):
         """
         try:
             # Use the underlying parser's internal parse method
-            internal_result = self._parser._parse_javascript(code)
+            # [20261018_PERF] Shared with other tools parsing the same text
+            internal_result = PARSED_ARTIFACTS.get(
+                PARSED_ARTIFACTS.key(None, code, "javascript", "esprima"),
+                lambda: self._parser._parse_javascript(code),
+                size=len(code),
+            )
 
             # Cache the AST
             self._last_ast = internal_result.ast
@@ -9,6 +9,8 @@ from __future__ import annotations
 
 from typing import Any, List
 
+from code_scalpel.parsing.artifact_store import normalize_ir
+
 from ..interface import IParser, Language, ParseResult
 
 
@@ -39,7 +41,7 @@ class RubyParserAdapter(IParser):
 
         [20260304_FEATURE] ast_tree is the IRModule produced by RubyNormalizer.
         """
-        ir_module = self._normalizer.normalize(code)
+        ir_module = normalize_ir(self._normalizer, code)
         return ParseResult(
             ast=ir_module,
             errors=[],
@@ -6,6 +6,8 @@
 
 from typing import Any, List
 
+from code_scalpel.parsing.artifact_store import normalize_ir
+
 from ..interface import IParser, Language as IParserLanguage, ParseResult
 
 
@@ -24,7 +26,7 @@ class SwiftParserAdapter(IParser):
 
     def parse(self, code: str) -> ParseResult:
         """Parse Swift source code and return a ParseResult wrapping an IRModule."""
-        ir_module = self._normalizer.normalize(code)
+        ir_module = normalize_ir(self._normalizer, code)
         return ParseResult(
             ast=ir_module,
             errors=[],
@@ -27,6 +27,8 @@ from dataclasses import dataclass, field
 from enum import Enum
 from pathlib import Path
 
+from code_scalpel.parsing.artifact_store import normalize_ir
+
 # [20251215_REFACTOR] Remove unused typing import for lint compliance.
 
 
@@ -392,6 +394,27 @@ class PolyglotExtractor:
 
         self._python_extractor = SurgicalExtractor(self.code, self.file_path)
 
+    def _uses_tsx_parser(self) -> bool:
+        """Whether JS/TS code must go through the TSX parser (JSX syntax)."""
+        if self.language == Language.JAVASCRIPT:
+            # JSX files use the TSX parser, which handles JSX syntax
+            return bool(self.file_path and self.file_path.endswith(".jsx"))
+
+        # Check if this is a TSX file by extension
+        if self.file_path and self.file_path.endswith(".tsx"):
+            return True
+
+        # [20251215_BUGFIX] Also detect JSX syntax in code content
+        # This handles cases where code is passed directly without file_path
+        if "</" in self.code:
+            # Check for JSX patterns: <Component>, <tag>, </tag>, </>
+            import re
+
+            jsx_pattern = r"<[A-Za-z][A-Za-z0-9]*[\s/>]|</[A-Za-z]|<>"
+            if re.search(jsx_pattern, self.code):
+                return True
+        return False
+
     def _parse_javascript(self) -> None:
         """
         Parse JavaScript code using tree-sitter.
@@ -399,10 +422,7 @@ class PolyglotExtractor:
         [20251215_FEATURE] v2.0.0 P1 - JSX support via TSX parser.
         For .jsx files, use TSX parser which handles JSX syntax.
         """
-        # Check if this is a JSX file
-        is_jsx = self.file_path and self.file_path.endswith(".jsx")
-
-        if is_jsx:
+        if self._uses_tsx_parser():
             # Use TSX normalizer for JSX files (TSX parser handles JSX syntax)
             from code_scalpel.ir.normalizers.typescript_normalizer import (
                 TypeScriptTSXNormalizer,
@@ -416,7 +436,7 @@ class PolyglotExtractor:
 
             normalizer = JavaScriptNormalizer()
 
-        self._ir_module = normalizer.normalize(self.code)
+        self._ir_module = normalize_ir(normalizer, self.code, self.file_path)
 
     def _parse_typescript(self) -> None:
         """
@@ -427,20 +447,7 @@ class PolyglotExtractor:
 
         [20251215_BUGFIX] v2.0.1 - Auto-detect JSX in code content when no file path.
         """
-        # Check if this is a TSX file by extension
-        is_tsx = self.file_path and self.file_path.endswith(".tsx")
-
-        # [20251215_BUGFIX] Also detect JSX syntax in code content
-        # This handles cases where code is passed directly without file_path
-        if not is_tsx and "</" in self.code:
-            # Check for JSX patterns: <Component>, <tag>, </tag>, </>
-            import re
-
-            jsx_pattern = r"<[A-Za-z][A-Za-z0-9]*[\s/>]|</[A-Za-z]|<>"
-            if re.search(jsx_pattern, self.code):
-                is_tsx = True
-
-        if is_tsx:
+        if self._uses_tsx_parser():
             from code_scalpel.ir.normalizers.typescript_normalizer import (
                 TypeScriptTSXNormalizer,
             )
@@ -453,14 +460,14 @@ class PolyglotExtractor:
 
             normalizer = TypeScriptNormalizer()
 
-        self._ir_module = normalizer.normalize(self.code)
+        self._ir_module = normalize_ir(normalizer, self.code, self.file_path)
 
     def _parse_java(self) -> None:
         """Parse Java code using tree-sitter."""
         from code_scalpel.ir.normalizers.java_normalizer import JavaNormalizer
 
         normalizer = JavaNormalizer()
-        self._ir_module = normalizer.normalize(self.code)
+        self._ir_module = normalize_ir(normalizer, self.code, self.file_path)
 
     def _parse_c(self) -> None:
         """
@@ -471,7 +478,7 @@ class PolyglotExtractor:
         from code_scalpel.ir.normalizers.c_normalizer import CNormalizer
 
         normalizer = CNormalizer()
-        self._ir_module = normalizer.normalize(self.code)
+        self._ir_module = normalize_ir(normalizer, self.code, self.file_path)
 
     def _parse_cpp(self) -> None:
         """
@@ -482,7 +489,7 @@ class PolyglotExtractor:
         from code_scalpel.ir.normalizers.cpp_normalizer import CppNormalizer
 
         normalizer = CppNormalizer()
-        self._ir_module = normalizer.normalize(self.code)
+        self._ir_module = normalize_ir(normalizer, self.code, self.file_path)
 
     def _parse_csharp(self) -> None:
         """
@@ -493,7 +500,7 @@ class PolyglotExtractor:
         from code_scalpel.ir.normalizers.csharp_normalizer import CSharpNormalizer
 
         normalizer = CSharpNormalizer()
-        self._ir_module = normalizer.normalize(self.code)
+        self._ir_module = normalize_ir(normalizer, self.code, self.file_path)
 
     def _parse_go(self) -> None:
         """
@@ -504,7 +511,7 @@ class PolyglotExtractor:
         from code_scalpel.ir.normalizers.go_normalizer import GoNormalizer
 
         normalizer = GoNormalizer()
-        self._ir_module = normalizer.normalize(self.code)
+        self._ir_module = normalize_ir(normalizer, self.code, self.file_path)
 
     def _parse_php(self) -> None:
         """
@@ -515,7 +522,7 @@ class PolyglotExtractor:
         from code_scalpel.ir.normalizers.php_normalizer import PHPNormalizer
 
         normalizer = PHPNormalizer()
-        self._ir_module = normalizer.normalize(self.code)
+        self._ir_module = normalize_ir(normalizer, self.code, self.file_path)
 
     def _parse_ruby(self) -> None:
         """
@@ -526,7 +533,7 @@ class PolyglotExtractor:
         from code_scalpel.ir.normalizers.ruby_normalizer import RubyNormalizer
 
         normalizer = RubyNormalizer()
-        self._ir_module = normalizer.normalize(self.code)
+        self._ir_module = normalize_ir(normalizer, self.code, self.file_path)
 
     def _parse_swift(self) -> None:
         """
@@ -537,7 +544,7 @@ class PolyglotExtractor:
         from code_scalpel.ir.normalizers.swift_normalizer import SwiftNormalizer
 
         normalizer = SwiftNormalizer()
-        self._ir_module = normalizer.normalize(self.code)
+        self._ir_module = normalize_ir(normalizer, self.code, self.file_path)
 
     def _parse_rust(self) -> None:
         """
@@ -548,7 +555,7 @@ class PolyglotExtractor:
         from code_scalpel.ir.normalizers.rust_normalizer import RustNormalizer
 
         normalizer = RustNormalizer()
-        self._ir_module = normalizer.normalize(self.code)
+        self._ir_module = normalize_ir(normalizer, self.code, self.file_path)
 
     def extract(
         self, target_type: str, target_name: str, include_dependencies: bool = False
@@ -566,6 +573,13 @@ class PolyglotExtractor:
         Returns:
             PolyglotExtractionResult with extracted code
         """
+        # [20261018_PERF] Normalize only the requested declaration when the
+        # language supports it; fall back to the whole module otherwise
+        if self.language != Language.PYTHON and not self._parsed:
+            target_node = self._find_lazily(target_type, target_name)
+            if target_node is not None:
+                return self._ir_result(target_node, target_type, target_name)
+
         self._parse()
 
         # Python uses existing extractor
@@ -639,8 +653,6 @@ class PolyglotExtractor:
         [20251214_FEATURE] IR-based extraction for non-Python languages.
         [20251216_BUGFIX] Handle IRExport nodes wrapping functions/classes.
         """
-        from code_scalpel.ir.nodes import IRClassDef, IRExport, IRFunctionDef
-
         if not self._ir_module:
             return PolyglotExtractionResult(
                 success=False,
@@ -651,9 +663,34 @@ class PolyglotExtractor:
             )
 
         # Search for target in IR
+        target_node = self._find_ir_target(
+            self._ir_module.body, target_type, target_name
+        )
+
+        if not target_node:
+            return PolyglotExtractionResult(
+                success=False,
+                error=f"{target_type} '{target_name}' not found",
+                language=self.language.value,
+                target_type=target_type,
+                target_name=target_name,
+            )
+
+        return self._ir_result(target_node, target_type, target_name)
+
+    @staticmethod
+    def _find_ir_target(nodes, target_type: str, target_name: str):
+        """
+        Find the IR node of ``target_name`` among top-level IR ``nodes``.
+
+        Functions and classes return the first match; methods the last
+        matching ``ClassName.methodName``.
+        """
+        from code_scalpel.ir.nodes import IRClassDef, IRExport, IRFunctionDef
+
         target_node = None
 
-        for node in self._ir_module.body:
+        for node in nodes:
             # [20251216_BUGFIX] Unwrap IRExport nodes
             actual_node = node.declaration if isinstance(node, IRExport) else node
 
@@ -678,15 +715,109 @@ class PolyglotExtractor:
                                 target_node = member
                                 break
 
-        if not target_node:
-            return PolyglotExtractionResult(
-                success=False,
-                error=f"{target_type} '{target_name}' not found",
-                language=self.language.value,
-                target_type=target_type,
-                target_name=target_name,
+        return target_node
+
+    def _lazy_normalizer(self):
+        """
+        Return ``(cache key, normalizer class)`` for on-demand normalization.
+
+        None for languages whose normalizer cannot normalize single nodes.
+        """
+        from code_scalpel.ir.normalizers import (
+            CNormalizer,
+            CppNormalizer,
+            CSharpNormalizer,
+            GoNormalizer,
+            JavaNormalizer,
+            PHPNormalizer,
+        )
+
+        if self.language in (Language.JAVASCRIPT, Language.TYPESCRIPT):
+            from code_scalpel.ir.normalizers.typescript_normalizer import (
+                TypeScriptNormalizer,
+                TypeScriptTSXNormalizer,
             )
 
+            if self._uses_tsx_parser():
+                normalizer_cls = TypeScriptTSXNormalizer
+            elif self.language == Language.TYPESCRIPT:
+                normalizer_cls = TypeScriptNormalizer
+            else:
+                from code_scalpel.ir.normalizers.javascript_normalizer import (
+                    JavaScriptNormalizer,
+                )
+
+                normalizer_cls = JavaScriptNormalizer
+        else:
+            normalizer_cls = {
+                Language.JAVA: JavaNormalizer,
+                Language.C: CNormalizer,
+                Language.CPP: CppNormalizer,
+                Language.CSHARP: CSharpNormalizer,
+                Language.GO: GoNormalizer,
+                Language.PHP: PHPNormalizer,
+            }.get(self.language)
+        if normalizer_cls is None:
+            return None
+        return normalizer_cls.__name__, normalizer_cls
+
+    def _find_lazily(self, target_type: str, target_name: str):
+        """
+        Find the IR node of a target by normalizing only its declaration.
+
+        [20261018_PERF] A byte-range declaration index of the raw tree picks
+        the candidate top-level declarations by name; only those are
+        normalized. Results are cached per (content hash, symbol). Returns
+        None when the target is not indexed under its name, the source has
+        syntax errors or the language has no on-demand normalizer, so the
+        caller falls back to full normalization.
+        """
+        from code_scalpel.ir.normalizers.lazy import LAZY_MODULES, content_hash
+
+        try:
+            spec = self._lazy_normalizer()
+        except ImportError:
+            return None
+        if spec is None:
+            return None
+        key, normalizer_cls = spec
+        digest = content_hash(self.code)
+        cached = LAZY_MODULES.get_symbol(key, digest, target_type, target_name)
+        if cached is not None:
+            return cached
+
+        lookup_name = target_name
+        if target_type == "method" and "." in target_name:
+            lookup_name = target_name.split(".", 1)[0]
+
+        target_node = None
+        try:
+            module = LAZY_MODULES.get(key, normalizer_cls, self.code, digest)
+            if module.has_error:
+                return None
+            for decl in module.index.lookup(lookup_name):
+                if decl.parent is not None:
+                    continue
+                found = self._find_ir_target(
+                    module.normalize(decl), target_type, target_name
+                )
+                if found is not None:
+                    target_node = found
+                    if target_type != "method":
+                        break
+        except (NotImplementedError, SyntaxError, ValueError):
+            # Unsupported or malformed constructs; full normalization reports them
+            return None
+
+        if target_node is not None:
+            LAZY_MODULES.put_symbol(key, digest, target_type, target_name, target_node)
+        return target_node
+
+    def _ir_result(
+        self, target_node, target_type: str, target_name: str
+    ) -> PolyglotExtractionResult:
+        """Build the extraction result for an IR node found by name."""
+
         # Extract source lines using location info from IR
         if target_node.loc:
             start_line = target_node.loc.line
@@ -357,6 +357,48 @@ class ESLintParser:
         except subprocess.SubprocessError as e:
             raise RuntimeError(f"ESLint execution failed: {e}")
 
+    def analyze_command(self, config_path: Optional[str] = None) -> list[str]:
+        """Return the argv ``analyze_files`` runs, without the files."""
+        cmd = (self._eslint_path or "eslint").split() + ["--format=json"]
+        if config_path:
+            cmd.extend(["--config", config_path])
+        return cmd
+
+    def analyze_files(
+        self, file_paths: list[str], config_path: Optional[str] = None
+    ) -> list[ESLintFileResult]:
+        """
+        Run ESLint once over several files.
+
+        [20261018_PERF] One process (one config resolution) for the whole
+        batch; used by the lint orchestrator, which sizes batches to the
+        argv limit.
+
+        :param file_paths: Paths to JavaScript/TypeScript files.
+        :param config_path: Optional path to ESLint config.
+        :return: One ESLintFileResult per file ESLint reported on.
+        """
+        if not self._eslint_path:
+            raise RuntimeError("ESLint not found. Install with: npm install eslint")
+        if not file_paths:
+            return []
+
+        cmd = self.analyze_command(config_path)
+        cmd.extend(file_paths)
+
+        try:
+            result = subprocess.run(
+                cmd,
+                capture_output=True,
+                text=True,
+                timeout=60 + 2 * len(file_paths),
+            )
+            return self.parse_output(result.stdout or result.stderr)
+        except subprocess.TimeoutExpired:
+            raise TimeoutError(f"ESLint timed out analyzing {len(file_paths)} files")
+        except subprocess.SubprocessError as e:
+            raise RuntimeError(f"ESLint execution failed: {e}")
+
     def analyze_code(
         self,
         code: str,
@@ -10,12 +10,20 @@ Unified Language Detection - Central language detection for code-scalpel.
 This module should be the single source of truth for language detection
 across all code-scalpel modules.
 
+[20261018_PERF] ``LanguageDetector`` classifies files from a bounded prefix
+(shebang, modeline, then one combined scan over all content heuristics that
+stops once a language can no longer be caught up) and caches verdicts per
+(path, mtime, size). ``detect_languages`` is the batch form for crawlers.
 """
 
+import os
 import re
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from enum import Enum
 from pathlib import Path
-from typing import List, Optional, Tuple
+from typing import Dict, Iterable, List, Optional, Tuple, Union
 
 
 class Language(Enum):
@@ -414,3 +422,322 @@ def detect_language_confidence(
                 confidence = content_confidence * 0.7  # Reduce for conflict
 
     return detected, confidence
+
+
+# ---------------------------------------------------------------------------
+# [20261018_PERF] Bounded-prefix detector for files
+# ---------------------------------------------------------------------------
+
+# Bytes of a file examined by LanguageDetector
+DEFAULT_PREFIX_BYTES = 16 * 1024
+
+# Matches of one heuristic that still add to a language's score
+_MAX_MATCHES = 3
+_MIN_SCORE = 2
+
+# The scan stops once the leader has this score and this multiple of the
+# runner-up's score
+_DECISIVE_SCORE = 24
+_DECISIVE_RATIO = 2
+
+# Lines at the head and tail of the prefix searched for an editor modeline
+_MODELINE_LINES = 5
+
+# Extensions shared by several languages: extension -> default language
+_AMBIGUOUS_EXTENSIONS: dict[str, Language] = {".h": Language.C}
+_CPP_HEADER_MARKERS = re.compile(
+    r"\b(?:class|namespace|template|virtual)\b|\b(?:public|private|protected)\s*:"
+    r"|std::|nullptr"
+)
+
+# Template wrappers: "settings.py.j2" is detected as "settings.py"
+_TEMPLATE_SUFFIXES = frozenset(
+    {".in", ".tmpl", ".tpl", ".template", ".j2", ".jinja", ".jinja2"}
+)
+
+# vim: set ft=python:   /   -*- mode: ruby -*-   /   -*- c++ -*-
+_MODELINE_PATTERNS = (
+    re.compile(r"(?:^|\s)(?:vi|vim|ex):.*?\b(?:ft|filetype|syntax|syn)=([\w+#.-]+)"),
+    re.compile(r"-\*-(?:.*?;)?\s*mode:\s*([\w+#.-]+)"),
+    re.compile(r"-\*-\s*([\w+#.-]+)\s*-\*-"),
+)
+_MODELINE_ALIASES: dict[str, Language] = {
+    "python": Language.PYTHON,
+    "py": Language.PYTHON,
+    "javascript": Language.JAVASCRIPT,
+    "js": Language.JAVASCRIPT,
+    "typescript": Language.TYPESCRIPT,
+    "ts": Language.TYPESCRIPT,
+    "java": Language.JAVA,
+    "c": Language.C,
+    "cpp": Language.CPP,
+    "c++": Language.CPP,
+    "cs": Language.CSHARP,
+    "csharp": Language.CSHARP,
+    "go": Language.GO,
+    "rust": Language.RUST,
+    "ruby": Language.RUBY,
+    "php": Language.PHP,
+    "swift": Language.SWIFT,
+    "kotlin": Language.KOTLIN,
+    "scala": Language.SCALA,
+    "html": Language.HTML,
+    "css": Language.CSS,
+    "sql": Language.SQL,
+    "sh": Language.SHELL,
+    "bash": Language.SHELL,
+    "zsh": Language.SHELL,
+    "shell-script": Language.SHELL,
+    "yaml": Language.YAML,
+    "json": Language.JSON,
+    "xml": Language.XML,
+    "markdown": Language.MARKDOWN,
+}
+
+
+def _combine_heuristics(
+    heuristics: List[Tuple[re.Pattern, Language, int]],
+) -> Tuple[re.Pattern, List[int]]:
+    """
+    Join all heuristics into one alternation with a named group per entry.
+
+    Matches may only start at a word boundary or a non-word character, so the
+    scan does not retry every alternative at each position inside a word.
+
+    Returns the combined pattern and, per group index, the heuristic index
+    (-1 for groups nested inside a heuristic's own pattern).
+    """
+    parts = []
+    for i, (pattern, _, _) in enumerate(heuristics):
+        body = pattern.pattern
+        if pattern.flags & re.MULTILINE:
+            body = f"(?m:{body})"
+        parts.append(f"(?P<h{i}>{body})")
+    combined = re.compile(r"(?:(?<!\w)|(?!\w))(?:" + "|".join(parts) + ")")
+    owner = [-1] * (combined.groups + 1)
+    for name, index in combined.groupindex.items():
+        owner[index] = int(name[1:])
+    return combined, owner
+
+
+def _modeline_language(text: str) -> Language:
+    """Detect language from a vim/emacs modeline near the start or end."""
+    head = text[:2048].split("\n", _MODELINE_LINES)[:_MODELINE_LINES]
+    tail = text[-2048:].rsplit("\n", _MODELINE_LINES)[-_MODELINE_LINES:]
+    for line in head + tail:
+        if "-*-" not in line and ":" not in line:
+            continue
+        for pattern in _MODELINE_PATTERNS:
+            match = pattern.search(line)
+            if match:
+                lang = _MODELINE_ALIASES.get(match.group(1).lower())
+                if lang is not None:
+                    return lang
+    return Language.UNKNOWN
+
+
+class LanguageDetector:
+    """
+    Language detector that reads a bounded prefix of each file.
+
+    Detection order: unambiguous extension (no I/O), shebang, modeline,
+    then one combined pass over ``CONTENT_HEURISTICS``. Scores follow
+    :func:`_detect_from_content` (weight times at most three matches per
+    heuristic, minimum score 2); the scan stops as soon as the leader is
+    clearly ahead (see ``_DECISIVE_SCORE``). File verdicts are cached per
+    path and invalidated when the file's mtime or size changes.
+
+    Example:
+        >>> detector = LanguageDetector()
+        >>> detector.detect_file("scripts/deploy")
+        Language.SHELL
+        >>> detector.detect_many(["a.h", "tool"])
+        {'a.h': Language.CPP, 'tool': Language.PYTHON}
+    """
+
+    def __init__(
+        self,
+        prefix_bytes: int = DEFAULT_PREFIX_BYTES,
+        max_entries: int = 4096,
+        heuristics: Optional[List[Tuple[re.Pattern, Language, int]]] = None,
+    ):
+        self.prefix_bytes = prefix_bytes
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self._heuristics = list(heuristics or CONTENT_HEURISTICS)
+        self._combined, self._group_owner = _combine_heuristics(self._heuristics)
+        # Tie-break like _detect_from_content: order of first heuristic
+        self._rank: dict[Language, int] = {}
+        for _, lang, _ in self._heuristics:
+            self._rank.setdefault(lang, len(self._rank))
+        # abspath -> (mtime_ns, size, verdict)
+        self._cache: OrderedDict[str, Tuple[int, int, Language]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def detect_code(self, code: str) -> Language:
+        """Detect the language of a source string from its bounded prefix."""
+        return self._classify(code[: self.prefix_bytes])
+
+    def detect_file(self, path: Union[str, "os.PathLike[str]"]) -> Language:
+        """Detect the language of the file at ``path`` (UNKNOWN if unreadable)."""
+        path = os.fspath(path)
+        ext_lang, ambiguous = _extension_verdict(path)
+        if ext_lang != Language.UNKNOWN and not ambiguous:
+            return ext_lang
+
+        key = os.path.abspath(path)
+        try:
+            st = os.stat(key)
+        except OSError:
+            return ext_lang
+        with self._lock:
+            entry = self._cache.get(key)
+            if entry is not None and entry[:2] == (st.st_mtime_ns, st.st_size):
+                self._cache.move_to_end(key)
+                self.hits += 1
+                return entry[2]
+            self.misses += 1
+
+        try:
+            with open(key, "rb") as f:
+                text = f.read(self.prefix_bytes).decode("utf-8", errors="replace")
+        except OSError:
+            return ext_lang
+
+        if ambiguous:
+            verdict = self._refine_ambiguous(path, ext_lang, text)
+        else:
+            verdict = self._classify(text)
+
+        with self._lock:
+            self._cache[key] = (st.st_mtime_ns, st.st_size, verdict)
+            self._cache.move_to_end(key)
+            while len(self._cache) > self.max_entries:
+                self._cache.popitem(last=False)
+        return verdict
+
+    def detect_many(
+        self,
+        paths: Iterable[Union[str, "os.PathLike[str]"]],
+        *,
+        max_workers: Optional[int] = None,
+    ) -> Dict[str, Language]:
+        """
+        Detect the languages of a batch of files.
+
+        Args:
+            paths: Files to classify.
+            max_workers: Read prefixes on a thread pool of this size.
+                Sequential when None or 1.
+
+        Returns:
+            Mapping of each path (as given, via ``os.fspath``) to its language.
+        """
+        keys = [os.fspath(p) for p in paths]
+        if not max_workers or max_workers <= 1 or len(keys) <= 1:
+            return {key: self.detect_file(key) for key in keys}
+        with ThreadPoolExecutor(max_workers=max_workers) as pool:
+            return dict(zip(keys, pool.map(self.detect_file, keys)))
+
+    def invalidate(self, path: Optional[Union[str, "os.PathLike[str]"]] = None) -> None:
+        """Forget the cached verdict for ``path`` (all verdicts if None)."""
+        with self._lock:
+            if path is None:
+                self._cache.clear()
+            else:
+                self._cache.pop(os.path.abspath(os.fspath(path)), None)
+
+    def get_stats(self) -> dict[str, int]:
+        """Return cache size and hit/miss counters."""
+        return {
+            "entries": len(self._cache),
+            "hits": self.hits,
+            "misses": self.misses,
+        }
+
+    def _refine_ambiguous(self, path: str, default: Language, text: str) -> Language:
+        """Pick between the languages sharing an extension (e.g. C vs C++ ``.h``)."""
+        lang = _modeline_language(text)
+        if lang != Language.UNKNOWN:
+            return lang
+        if default == Language.C and _CPP_HEADER_MARKERS.search(text):
+            return Language.CPP
+        return default
+
+    def _classify(self, text: str) -> Language:
+        if not text:
+            return Language.UNKNOWN
+        lang = _detect_from_shebang(text)
+        if lang != Language.UNKNOWN:
+            return lang
+        lang = _modeline_language(text)
+        if lang != Language.UNKNOWN:
+            return lang
+        return self._score(text)
+
+    def _score(self, text: str) -> Language:
+        """Single combined scan, stopping once one language is clearly ahead."""
+        heuristics = self._heuristics
+        owner = self._group_owner
+        counts = [0] * len(heuristics)
+        scores = dict.fromkeys(self._rank, 0)
+        leader: Optional[Language] = None
+
+        for match in self._combined.finditer(text):
+            i = owner[match.lastindex or 0]
+            if i < 0 or counts[i] == _MAX_MATCHES:
+                continue
+            counts[i] += 1
+            _, lang, weight = heuristics[i]
+            scores[lang] += weight
+            if leader is None or scores[lang] > scores[leader]:
+                leader = lang
+            best = scores[leader]
+            if best >= _DECISIVE_SCORE and best >= _DECISIVE_RATIO * max(
+                score for other, score in scores.items() if other is not leader
+            ):
+                break
+
+        if leader is None:
+            return Language.UNKNOWN
+        rank = self._rank
+        best_lang = min(
+            (lang for lang, score in scores.items() if score == scores[leader]),
+            key=lambda lang: rank[lang],
+        )
+        return best_lang if scores[best_lang] >= _MIN_SCORE else Language.UNKNOWN
+
+
+def _extension_verdict(path: str) -> Tuple[Language, bool]:
+    """Return ``(language, ambiguous)`` from the extension, unwrapping templates."""
+    base = path
+    suffix = os.path.splitext(base)[1].lower()
+    while suffix in _TEMPLATE_SUFFIXES:
+        base = base[: -len(suffix)]
+        suffix = os.path.splitext(base)[1].lower()
+    if suffix in _AMBIGUOUS_EXTENSIONS:
+        return _AMBIGUOUS_EXTENSIONS[suffix], True
+    return _detect_from_extension(base), False
+
+
+_DEFAULT_DETECTOR = LanguageDetector()
+
+
+def get_language_detector() -> LanguageDetector:
+    """Return the process-wide file language detector."""
+    return _DEFAULT_DETECTOR
+
+
+def detect_file_language(path: Union[str, "os.PathLike[str]"]) -> Language:
+    """Detect a file's language with the process-wide detector."""
+    return _DEFAULT_DETECTOR.detect_file(path)
+
+
+def detect_languages(
+    paths: Iterable[Union[str, "os.PathLike[str]"]],
+    *,
+    max_workers: Optional[int] = None,
+) -> Dict[str, Language]:
+    """Detect the languages of a batch of files with the process-wide detector."""
+    return _DEFAULT_DETECTOR.detect_many(paths, max_workers=max_workers)
@@ -0,0 +1,529 @@
+"""
+Batched linter orchestration for the external tool wrappers.
+
+[20261018_PERF] The wrappers in ``python_parsers`` and ``javascript_parsers``
+run one subprocess per analyzed file and probe ``--version`` on every
+``is_available()`` call, so linting a 2k-file project launched thousands of
+processes. The orchestrator instead:
+
+- probes each executable once per process (``probe_tool``; the wrappers'
+  ``version`` and ``is_available`` go through it too);
+- runs each tool once per chunk of files, with chunks sized to the
+  platform's argv limit (``argv_chunks``), optionally on a thread pool;
+- uses the tool's long-running mode when it has one: ``dmypy`` (the mypy
+  daemon, kept alive for the life of the process) and ``eslint_d``;
+- caches diagnostics per (tool, config, path, content hash, on-disk tool
+  config), so unchanged files are not linted again. The on-disk part hashes
+  the tool's config files (pyproject.toml, ruff.toml, .eslintrc...) in the
+  file's directory, its ancestors and the working directory, so editing
+  them invalidates the affected entries.
+
+mypy checks a program, not a file: its diagnostics for one file depend on
+the modules it imports. When any requested file misses the cache, every
+requested file is re-checked (incrementally, when the daemon is used) and
+all their entries are refreshed.
+
+Example:
+    >>> run = get_lint_orchestrator().run("ruff", paths)
+    >>> for path, violations in run.diagnostics.items():
+    ...     print(path, len(violations))
+"""
+
+from __future__ import annotations
+
+import atexit
+import hashlib
+import os
+import shutil
+import subprocess
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+
+# Markers the wrappers put in their error lists when a run produced nothing
+# trustworthy (tool missing, crashed, or unparsable output).
+_FATAL_MARKERS = ("not found", "execution failed", "Failed to parse")
+
+_PROBES: Dict[Tuple[str, ...], Optional[str]] = {}
+_PROBE_LOCK = threading.Lock()
+
+
+def probe_tool(executable: str | List[str]) -> Optional[str]:
+    """
+    Return the ``--version`` output of ``executable`` (None if unusable).
+
+    The probe runs once per executable per process. ``executable`` may be a
+    command with arguments (``"npx eslint"``).
+    """
+    argv = tuple(executable.split() if isinstance(executable, str) else executable)
+    with _PROBE_LOCK:
+        if argv in _PROBES:
+            return _PROBES[argv]
+    try:
+        result = subprocess.run(
+            [*argv, "--version"], capture_output=True, text=True, check=True
+        )
+        version: Optional[str] = result.stdout.strip()
+    except (subprocess.CalledProcessError, OSError):
+        version = None
+    with _PROBE_LOCK:
+        return _PROBES.setdefault(argv, version)
+
+
+def clear_probe_cache() -> None:
+    """Forget probe results (e.g. after installing a tool)."""
+    with _PROBE_LOCK:
+        _PROBES.clear()
+
+
+def argv_limit() -> int:
+    """Bytes of command-line arguments one invocation may safely use."""
+    if os.name == "nt":
+        return 30_000  # CreateProcess caps the command line at 32,767 chars
+    try:
+        limit = os.sysconf("SC_ARG_MAX")
+    except (AttributeError, ValueError, OSError):
+        limit = 128 * 1024
+    environment = sum(len(k) + len(v) + 2 for k, v in os.environ.items())
+    return max(4096, min(limit - environment - 4096, 512 * 1024))
+
+
+def argv_chunks(
+    prefix: List[str], files: List[str], limit: Optional[int] = None
+) -> Iterator[List[str]]:
+    """
+    Split ``files`` into chunks whose ``prefix + chunk`` argv fits ``limit``.
+
+    Each argument costs its encoded length plus a terminator and a pointer.
+    A single file longer than the limit still gets a chunk of its own.
+    """
+    limit = argv_limit() if limit is None else limit
+    base = sum(len(os.fsencode(arg)) + 9 for arg in prefix)
+    chunk: List[str] = []
+    used = base
+    for path in files:
+        cost = len(os.fsencode(path)) + 9
+        if chunk and used + cost > limit:
+            yield chunk
+            chunk, used = [], base
+        chunk.append(path)
+        used += cost
+    if chunk:
+        yield chunk
+
+
+def _file_key(path: str) -> str:
+    return os.path.normcase(os.path.abspath(path))
+
+
+def _digest(path: str) -> Optional[str]:
+    try:
+        with open(path, "rb") as f:
+            return hashlib.blake2b(f.read(), digest_size=16).hexdigest()
+    except OSError:
+        return None
+
+
+class _ConfigFingerprints:
+    """
+    Per-run digests of a tool's config files, memoized per directory.
+
+    A directory's fingerprint covers the config files in it and in all of
+    its ancestors, since tools resolve their config by walking upwards.
+    """
+
+    def __init__(self, names: Tuple[str, ...]):
+        self._names = names
+        self._memo: Dict[str, str] = {}
+
+    def __call__(self, directory: str) -> str:
+        chain: List[str] = []
+        while directory not in self._memo:
+            chain.append(directory)
+            parent = os.path.dirname(directory)
+            if parent == directory:
+                self._memo[parent] = ""
+                break
+            directory = parent
+        inherited = self._memo[directory]
+        for current in reversed(chain):
+            h = hashlib.blake2b(inherited.encode(), digest_size=16)
+            for name in self._names:
+                digest = _digest(os.path.join(current, name))
+                if digest:
+                    h.update(f"{name}:{digest};".encode())
+            inherited = self._memo[current] = h.hexdigest()
+        return inherited
+
+
+def _explicit_config_digest(config: Any) -> str:
+    """Digest of ``config`` when it names a config file (ESLint), else ''."""
+    if isinstance(config, (str, os.PathLike)):
+        return _digest(os.fspath(config)) or ""
+    return ""
+
+
+def _fatal(errors: List[str]) -> bool:
+    return any(marker in error for error in errors for marker in _FATAL_MARKERS)
+
+
+# ---------------------------------------------------------------------------
+# Tool runners: (parser, files, config) -> ([(path, diagnostic)], errors)
+# ---------------------------------------------------------------------------
+
+
+def _analyze_command(parser: Any, config: Any) -> List[str]:
+    return parser.analyze_command(config)
+
+
+def _mypy_command(parser: Any, config: Any) -> List[str]:
+    return parser.analyze_command(config, daemon=parser.daemon_available())
+
+
+Pairs = List[Tuple[str, Any]]
+
+
+def _run_ruff(parser: Any, files: List[str], config: Any) -> Tuple[Pairs, List[str]]:
+    report = parser.analyze(files, config=config)
+    return [(v.filename, v) for v in report.violations], report.errors
+
+
+def _run_flake8(parser: Any, files: List[str], config: Any) -> Tuple[Pairs, List[str]]:
+    report = parser.analyze(files, config=config)
+    return [(v.filename, v) for v in report.violations], report.errors
+
+
+def _run_pylint(parser: Any, files: List[str], config: Any) -> Tuple[Pairs, List[str]]:
+    report = parser.analyze(files, config=config)
+    return [(m.path, m) for m in report.messages], report.errors
+
+
+def _run_bandit(parser: Any, files: List[str], config: Any) -> Tuple[Pairs, List[str]]:
+    report = parser.analyze(files, config=config)
+    errors = [e if isinstance(e, str) else str(e) for e in report.errors]
+    return [(i.filename, i) for i in report.issues], errors
+
+
+def _run_mypy(parser: Any, files: List[str], config: Any) -> Tuple[Pairs, List[str]]:
+    if parser.daemon_available():
+        report = parser.analyze_daemon(files, config=config)
+    else:
+        report = parser.analyze(files, config=config)
+    return [(e.file, e) for e in report.errors], report.parse_errors
+
+
+def _run_eslint(parser: Any, files: List[str], config: Any) -> Tuple[Pairs, List[str]]:
+    try:
+        results = parser.analyze_files(files, config_path=config)
+    except (RuntimeError, TimeoutError, ValueError) as e:
+        return [], [f"ESLint execution failed: {e}"]
+    return [(r.file_path, v) for r in results for v in r.violations], []
+
+
+def _ruff_parser() -> Any:
+    from .python_parsers.python_parsers_ruff import RuffParser
+
+    return RuffParser()
+
+
+def _flake8_parser() -> Any:
+    from .python_parsers.python_parsers_flake8 import Flake8Parser
+
+    return Flake8Parser()
+
+
+def _pylint_parser() -> Any:
+    from .python_parsers.python_parsers_pylint import PylintParser
+
+    return PylintParser()
+
+
+def _bandit_parser() -> Any:
+    from .python_parsers.python_parsers_bandit import BanditParser
+
+    return BanditParser()
+
+
+def _mypy_parser() -> Any:
+    from .python_parsers.python_parsers_mypy import MypyParser
+
+    return MypyParser()
+
+
+def _eslint_parser() -> Any:
+    from .javascript_parsers.javascript_parsers_eslint import ESLintParser
+
+    # eslint_d keeps a warm ESLint server and accepts the same arguments
+    return ESLintParser(eslint_path=shutil.which("eslint_d"))
+
+
+@dataclass(frozen=True)
+class LintTool:
+    """
+    How the orchestrator drives one linter.
+
+    Attributes:
+        command: (parser, config) -> the argv every invocation carries
+            besides the files; used to size argv chunks.
+        config_files: File names the tool reads its configuration from.
+    """
+
+    name: str
+    make_parser: Callable[[], Any]
+    run_chunk: Callable[[Any, List[str], Any], Tuple[Pairs, List[str]]]
+    config_files: Tuple[str, ...] = ()
+    whole_program: bool = False
+    command: Callable[[Any, Any], List[str]] = _analyze_command
+
+
+_ESLINT_CONFIG_FILES = (
+    "eslint.config.js",
+    "eslint.config.mjs",
+    "eslint.config.cjs",
+    "eslint.config.ts",
+    ".eslintrc",
+    ".eslintrc.js",
+    ".eslintrc.cjs",
+    ".eslintrc.json",
+    ".eslintrc.yaml",
+    ".eslintrc.yml",
+    ".eslintignore",
+    "package.json",
+)
+
+LINT_TOOLS: Dict[str, LintTool] = {
+    tool.name: tool
+    for tool in (
+        LintTool(
+            "ruff",
+            _ruff_parser,
+            _run_ruff,
+            ("pyproject.toml", "ruff.toml", ".ruff.toml"),
+        ),
+        LintTool(
+            "flake8", _flake8_parser, _run_flake8, (".flake8", "setup.cfg", "tox.ini")
+        ),
+        LintTool(
+            "pylint",
+            _pylint_parser,
+            _run_pylint,
+            ("pylintrc", ".pylintrc", "pyproject.toml", "setup.cfg"),
+        ),
+        LintTool("bandit", _bandit_parser, _run_bandit, (".bandit", "pyproject.toml")),
+        LintTool(
+            "mypy",
+            _mypy_parser,
+            _run_mypy,
+            ("mypy.ini", ".mypy.ini", "pyproject.toml", "setup.cfg"),
+            whole_program=True,
+            command=_mypy_command,
+        ),
+        LintTool("eslint", _eslint_parser, _run_eslint, _ESLINT_CONFIG_FILES),
+    )
+}
+
+_CacheKey = Tuple[str, str, str, str, str]
+
+
+@dataclass
+class LintRun:
+    """
+    Result of linting a set of files with one tool.
+
+    Attributes:
+        diagnostics: Requested path (as given) -> the tool's native
+            diagnostics for it (RuffViolation, MypyError, ESLintViolation...).
+        errors: Tool errors reported by the invocations.
+        invocations: Number of tool processes launched.
+        cached: Number of files answered from the diagnostics cache.
+    """
+
+    tool: str
+    diagnostics: Dict[str, List[Any]] = field(default_factory=dict)
+    errors: List[str] = field(default_factory=list)
+    invocations: int = 0
+    cached: int = 0
+
+
+class LintOrchestrator:
+    """
+    Runs linters over many files with as few processes as possible.
+
+    Thread-safe. One orchestrator per process (``get_lint_orchestrator``)
+    shares parsers, probes and the diagnostics cache across callers.
+    """
+
+    def __init__(self, *, max_entries: int = 50_000, argv_limit: Optional[int] = None):
+        self.max_entries = max_entries
+        self.argv_limit = argv_limit
+        self._cache: OrderedDict[_CacheKey, List[Any]] = OrderedDict()
+        self._parsers: Dict[str, Any] = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.invocations = 0
+
+    def parser(self, tool: str) -> Any:
+        """Return the shared wrapper instance for ``tool``."""
+        with self._lock:
+            parser = self._parsers.get(tool)
+            if parser is None:
+                parser = self._parsers[tool] = LINT_TOOLS[tool].make_parser()
+            return parser
+
+    def run(
+        self,
+        tool: str,
+        files: Iterable[str | Path],
+        *,
+        config: Any = None,
+        max_workers: Optional[int] = None,
+    ) -> LintRun:
+        """
+        Lint ``files`` with ``tool`` ("ruff", "flake8", "pylint", "bandit",
+        "mypy" or "eslint").
+
+        Args:
+            files: Paths to lint; unreadable paths are linted but not cached.
+            config: The wrapper's config object (``RuffConfig``...; a config
+                file path for ESLint). Part of the cache key via ``repr``
+                (plus the file's content for a config path).
+            max_workers: Run chunks on a thread pool of this size.
+
+        Returns:
+            LintRun with an entry for every requested path.
+        """
+        spec = LINT_TOOLS.get(tool)
+        if spec is None:
+            raise ValueError(f"Unknown lint tool: {tool}")
+        config_key = f"{config!r}:{_explicit_config_digest(config)}"
+        paths = [os.fspath(f) for f in files]
+        run = LintRun(tool=tool, diagnostics={p: [] for p in paths})
+
+        # File I/O happens before taking the lock
+        fingerprints = _ConfigFingerprints(spec.config_files)
+        cwd_fingerprint = fingerprints(os.getcwd())
+        keys: Dict[str, Optional[_CacheKey]] = {}
+        for path in paths:
+            digest = _digest(path)
+            if not digest:
+                keys[path] = None
+                continue
+            file_key = _file_key(path)
+            on_disk = fingerprints(os.path.dirname(file_key)) + cwd_fingerprint
+            keys[path] = (tool, config_key, file_key, digest, on_disk)
+
+        pending: List[str] = []
+        with self._lock:
+            for path in paths:
+                key = keys[path]
+                cached = self._cache.get(key) if key else None
+                if cached is None:
+                    self.misses += 1
+                    pending.append(path)
+                else:
+                    self._cache.move_to_end(key)
+                    self.hits += 1
+                    run.diagnostics[path] = list(cached)
+                    run.cached += 1
+        if not pending:
+            return run
+        if spec.whole_program:
+            pending = paths
+            run.cached = 0
+
+        parser = self.parser(tool)
+        absolute = [os.path.abspath(p) for p in pending]
+        chunks = list(
+            argv_chunks(spec.command(parser, config), absolute, self.argv_limit)
+        )
+        if max_workers and max_workers > 1 and len(chunks) > 1:
+            with ThreadPoolExecutor(max_workers=max_workers) as pool:
+                outcomes = list(
+                    pool.map(lambda c: spec.run_chunk(parser, c, config), chunks)
+                )
+        else:
+            outcomes = [spec.run_chunk(parser, chunk, config) for chunk in chunks]
+        run.invocations = len(chunks)
+
+        by_key = {_file_key(p): p for p in pending}
+        failed: set[str] = set()
+        fresh: Dict[str, List[Any]] = {p: [] for p in pending}
+        for chunk, (pairs, errors) in zip(chunks, outcomes):
+            run.errors.extend(errors)
+            if _fatal(errors):
+                failed.update(_file_key(p) for p in chunk)
+            for reported, diagnostic in pairs:
+                path = by_key.get(_file_key(reported))
+                if path is not None:
+                    fresh[path].append(diagnostic)
+
+        with self._lock:
+            self.invocations += len(chunks)
+            for path, diagnostics in fresh.items():
+                run.diagnostics[path] = diagnostics
+                key = keys[path]
+                if key is None or _file_key(path) in failed:
+                    continue
+                self._cache[key] = list(diagnostics)
+                self._cache.move_to_end(key)
+            while len(self._cache) > self.max_entries:
+                self._cache.popitem(last=False)
+        return run
+
+    def clear(self) -> None:
+        with self._lock:
+            self._cache.clear()
+            self.hits = 0
+            self.misses = 0
+            self.invocations = 0
+
+    def get_stats(self) -> Dict[str, int]:
+        """Return cache size, hit/miss counters and processes launched."""
+        return {
+            "entries": len(self._cache),
+            "hits": self.hits,
+            "misses": self.misses,
+            "invocations": self.invocations,
+        }
+
+
+_ORCHESTRATOR = LintOrchestrator()
+
+
+def get_lint_orchestrator() -> LintOrchestrator:
+    """Return the process-wide lint orchestrator."""
+    return _ORCHESTRATOR
+
+
+def lint_files(
+    tool: str,
+    files: Iterable[str | Path],
+    *,
+    config: Any = None,
+    max_workers: Optional[int] = None,
+) -> LintRun:
+    """Lint ``files`` with the process-wide orchestrator."""
+    return _ORCHESTRATOR.run(tool, files, config=config, max_workers=max_workers)
+
+
+_DAEMONS: Dict[str, List[str]] = {}
+
+
+def _stop_daemons() -> None:
+    for argv in _DAEMONS.values():
+        try:
+            subprocess.run(argv, capture_output=True, timeout=30)
+        except (OSError, subprocess.SubprocessError):
+            pass
+
+
+def register_daemon(name: str, stop_argv: List[str]) -> None:
+    """Stop a daemon started by a wrapper when the process exits."""
+    with _PROBE_LOCK:
+        if not _DAEMONS:
+            atexit.register(_stop_daemons)
+        _DAEMONS.setdefault(name, stop_argv)
@@ -3,6 +3,8 @@
 import ast
 from typing import Any, List
 
+from code_scalpel.parsing.artifact_store import parse_python_ast
+
 from .interface import IParser, Language, ParseResult
 
 
@@ -13,7 +15,7 @@ class PythonParser(IParser):
         errors = []
         metrics = {}
         try:
-            tree = ast.parse(code)
+            tree = parse_python_ast(code)
             metrics["complexity"] = self._calculate_complexity(tree)
             return ParseResult(
                 ast=tree,
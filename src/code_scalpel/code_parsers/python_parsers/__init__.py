@@ -110,6 +110,7 @@ def __getattr__(name: str):
         "PythonScope",
         "CallGraph",
         "ControlFlowGraph",
+        "DominatorInfo",
         "DataFlowInfo",
         # Optimization analysis exports
         "Expression",
@@ -301,8 +301,11 @@ Implemented Features:
     - [✓] Handle control flow jumps (return, raise, break, continue)
     - [✓] Handle match/case (Python 3.10+)
     - [—] Support assert with AssertionError path (out of scope - assert is sequential)
-    - [✓] Path enumeration from entry to exit
+    - [✓] Path enumeration from entry to exit (lazy, bounded)
+    - [✓] Linear-time path counting and McCabe basis path generation
     - [✓] Dominator and immediate dominator computation
+    - [✓] Post-dominators, dominance frontiers and control dependences
+          (Cooper-Harvey-Kennedy over reverse postorder ids, cached per CFG)
     - [✓] Back edge detection for loops
 
 Data Structures:
@@ -418,10 +421,11 @@ Test Cases:
 from __future__ import annotations
 
 import ast
+from collections import deque
 from dataclasses import dataclass, field
 from enum import Enum, auto
 from pathlib import Path
-from typing import TYPE_CHECKING, Any, Iterator, Literal
+from typing import TYPE_CHECKING, Any, Callable, Iterator, Literal
 
 if TYPE_CHECKING:
     pass
@@ -936,6 +940,170 @@ class BasicBlock:
         return False
 
 
+# [20261018_PERF] Cooper-Harvey-Kennedy dominance over postorder integer ids.
+@dataclass
+class DominatorInfo:
+    """
+    Dominance information for a CFG, computed once and cached.
+
+    Produced by the Cooper-Harvey-Kennedy iterative algorithm over reverse
+    postorder integer ids. The same structure describes post-dominance when
+    computed on the reversed CFG rooted at the exit block.
+
+    Attributes:
+        root: Block id the analysis is rooted at (entry, or exit for post-dominance).
+        order: Reachable block ids in reverse postorder.
+        idom: Block id -> immediate (post-)dominator id (None for root/unreachable).
+        tree: Block id -> child block ids in the (post-)dominator tree.
+        frontiers: Block id -> (post-)dominance frontier block ids.
+    """
+
+    root: int | None
+    order: list[int] = field(default_factory=list)
+    idom: dict[int, int | None] = field(default_factory=dict)
+    tree: dict[int, list[int]] = field(default_factory=dict)
+    frontiers: dict[int, set[int]] = field(default_factory=dict)
+    _pre: dict[int, int] = field(default_factory=dict, repr=False)
+    _post: dict[int, int] = field(default_factory=dict, repr=False)
+
+    @classmethod
+    def compute(
+        cls, blocks: list[BasicBlock], root: BasicBlock | None, reverse: bool = False
+    ) -> DominatorInfo:
+        """
+        Compute dominance (or post-dominance when ``reverse``) for ``blocks``.
+
+        Args:
+            blocks: All blocks of the CFG.
+            root: Entry block (or exit block when ``reverse`` is True).
+            reverse: Walk predecessor edges instead of successor edges.
+
+        Returns:
+            Populated DominatorInfo. Blocks unreachable from ``root`` have no
+            immediate dominator and an empty frontier.
+        """
+        info = cls(root=root.id if root else None)
+        for block in blocks:
+            info.idom[block.id] = None
+            info.tree[block.id] = []
+            info.frontiers[block.id] = set()
+        if root is None:
+            return info
+
+        def forward(b: BasicBlock) -> list[BasicBlock]:
+            return b.predecessors if reverse else b.successors
+
+        def backward(b: BasicBlock) -> list[BasicBlock]:
+            return b.successors if reverse else b.predecessors
+
+        # Iterative DFS postorder numbering (no recursion limit on big CFGs)
+        postorder: list[BasicBlock] = []
+        number: dict[int, int] = {}
+        seen = {root.id}
+        stack: list[tuple[BasicBlock, Iterator[BasicBlock]]] = [
+            (root, iter(forward(root)))
+        ]
+        while stack:
+            block, children = stack[-1]
+            for child in children:
+                if child.id not in seen:
+                    seen.add(child.id)
+                    stack.append((child, iter(forward(child))))
+                    break
+            else:
+                stack.pop()
+                number[block.id] = len(postorder)
+                postorder.append(block)
+
+        count = len(postorder)
+        preds = [
+            [number[p.id] for p in backward(b) if p.id in number] for b in postorder
+        ]
+        doms = [-1] * count
+        doms[count - 1] = count - 1
+
+        def intersect(a: int, b: int) -> int:
+            while a != b:
+                while a < b:
+                    a = doms[a]
+                while b < a:
+                    b = doms[b]
+            return a
+
+        changed = True
+        while changed:
+            changed = False
+            for b in range(count - 2, -1, -1):
+                new_idom = -1
+                for p in preds[b]:
+                    if doms[p] != -1:
+                        new_idom = p if new_idom == -1 else intersect(p, new_idom)
+                if doms[b] != new_idom:
+                    doms[b] = new_idom
+                    changed = True
+
+        info.order = [postorder[i].id for i in range(count - 1, -1, -1)]
+        for b in range(count - 1):
+            block_id = postorder[b].id
+            parent_id = postorder[doms[b]].id
+            info.idom[block_id] = parent_id
+            info.tree[parent_id].append(block_id)
+
+        # Dominance frontiers: walk up from each join-point predecessor
+        for b in range(count):
+            if len(preds[b]) < 2:
+                continue
+            for p in preds[b]:
+                runner = p
+                while runner != doms[b]:
+                    info.frontiers[postorder[runner].id].add(postorder[b].id)
+                    runner = doms[runner]
+
+        # Pre/post numbering of the tree gives O(1) dominance queries
+        clock = 0
+        walk: list[tuple[int, bool]] = [(root.id, False)]
+        while walk:
+            block_id, done = walk.pop()
+            if done:
+                info._post[block_id] = clock
+            else:
+                info._pre[block_id] = clock
+                walk.append((block_id, True))
+                walk.extend((c, False) for c in reversed(info.tree[block_id]))
+            clock += 1
+        return info
+
+    def dominates(self, a: int, b: int) -> bool:
+        """Return True if block ``a`` (post-)dominates block ``b`` (reflexive)."""
+        if a == b:
+            return True
+        if a not in self._pre or b not in self._pre:
+            return False
+        return self._pre[a] < self._pre[b] and self._post[b] < self._post[a]
+
+    def dominator_sets(self) -> dict[int, set[int]]:
+        """Expand the tree into full dominator sets (block id -> dominator ids)."""
+        sets: dict[int, set[int]] = {}
+        for block_id in self.order:
+            parent = self.idom[block_id]
+            sets[block_id] = (sets[parent] if parent is not None else set()) | {
+                block_id
+            }
+        for block_id in self.idom:
+            sets.setdefault(block_id, {block_id})
+        return sets
+
+
+@dataclass
+class _LoopCollapsedCFG:
+    """Acyclic views of a CFG used for path counting and basis paths."""
+
+    order: list[BasicBlock]  # Reachable blocks in topological order
+    acyclic: dict[int, list[BasicBlock]]  # Real edges minus retreating edges
+    collapsed: dict[int, list[BasicBlock]]  # acyclic + loop tail -> loop exits
+    back_edges: list[tuple[int, int]]  # Retreating edges removed by the DFS
+
+
 @dataclass
 class ControlFlowGraph:
     """Control flow graph for a function."""
@@ -944,116 +1112,384 @@ class ControlFlowGraph:
     entry_block: BasicBlock | None = None
     exit_block: BasicBlock | None = None
     blocks: list[BasicBlock] = field(default_factory=list)
+    _analysis_cache: dict[str, Any] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
 
-    def get_all_paths(self, max_paths: int = 1000) -> Iterator[list[BasicBlock]]:
+    def get_all_paths(self, max_paths: int | None = 1000) -> Iterator[list[BasicBlock]]:
         """
         Yield all paths from entry to exit.
 
-        Uses depth-first search with cycle detection.
-        Limited to max_paths to avoid infinite loops in pathological cases.
+        Paths are produced lazily by a backtracking depth-first search that
+        shares a single path buffer, never revisits a block on the current
+        path, and skips successors that cannot reach the exit at all.
+        Use count_paths() when only the number of paths is needed.
 
         Args:
-            max_paths: Maximum number of paths to yield.
+            max_paths: Maximum number of paths to yield (None for no limit).
 
         Yields:
             Lists of BasicBlocks representing paths from entry to exit.
         """
         if not self.entry_block or not self.exit_block:
             return
+        if max_paths is not None and max_paths <= 0:
+            return
+
+        entry, exit_id = self.entry_block, self.exit_block.id
+        if entry.id == exit_id:
+            yield [entry]
+            return
 
+        live = self._blocks_reaching_exit()
+        if entry.id not in live:
+            return
+
+        path = [entry]
+        on_path = {entry.id}
+        stack: list[Iterator[BasicBlock]] = [iter(entry.successors)]
         path_count = 0
-        stack: list[tuple[BasicBlock, list[BasicBlock], set[int]]] = [
-            (self.entry_block, [self.entry_block], {self.entry_block.id})
-        ]
 
-        while stack and path_count < max_paths:
-            current, path, visited = stack.pop()
+        while stack:
+            for succ in stack[-1]:
+                if succ.id in on_path or succ.id not in live:
+                    continue
+                if succ.id == exit_id:
+                    yield path + [succ]
+                    path_count += 1
+                    if max_paths is not None and path_count >= max_paths:
+                        return
+                    continue
+                path.append(succ)
+                on_path.add(succ.id)
+                stack.append(iter(succ.successors))
+                break
+            else:
+                stack.pop()
+                on_path.discard(path.pop().id)
+
+    def count_paths(self) -> int:
+        """
+        Count entry-to-exit paths in the loop-collapsed CFG.
+
+        Each loop is collapsed so it is either skipped or run once, which
+        leaves a DAG whose paths are counted by dynamic programming in
+        reverse topological order. This runs in O(blocks + edges) regardless
+        of how many paths exist (NPATH-style: each loop body counts once).
+
+        Returns:
+            Number of acyclic paths from entry to exit (0 if exit is unreachable).
+        """
+        if not self.entry_block or not self.exit_block:
+            return 0
+        view = self._loop_collapsed()
+        exit_id = self.exit_block.id
+        counts: dict[int, int] = {}
+        for block in reversed(view.order):
+            if block.id == exit_id:
+                counts[block.id] = 1
+            else:
+                counts[block.id] = sum(
+                    counts[succ.id] for succ in view.collapsed[block.id]
+                )
+        return counts.get(self.entry_block.id, 0)
+
+    def get_cyclomatic_complexity(self) -> int:
+        """
+        Return McCabe cyclomatic complexity (E - N + 2) of the reachable CFG.
+
+        This is also the size of a basis path set; see get_basis_paths().
+        """
+        if not self.entry_block:
+            return 0
+        view = self._loop_collapsed()
+        edges = sum(len(succs) for succs in view.acyclic.values())
+        return max(edges + len(view.back_edges) - len(view.order) + 2, 1)
+
+    def get_basis_paths(self) -> list[list[BasicBlock]]:
+        """
+        Generate a McCabe basis path set.
 
-            if current.id == self.exit_block.id:
-                yield path.copy()
-                path_count += 1
+        Each path takes the shortest route from entry to an edge not yet
+        covered, crosses it, and then the shortest route to exit. Every path
+        therefore adds at least one new edge, so the set is linearly
+        independent and has at most get_cyclomatic_complexity() members.
+        Loop back edges yield paths that run the loop body exactly once more.
+
+        Returns:
+            List of paths (lists of BasicBlocks) from entry to exit.
+        """
+        if not self.entry_block or not self.exit_block:
+            return []
+        view = self._loop_collapsed()
+        dag = view.acyclic
+        by_id = {block.id: block for block in view.order}
+        entry_id, exit_id = self.entry_block.id, self.exit_block.id
+        if exit_id not in by_id:
+            return []
+
+        # Shortest DAG routes: entry -> block (parent links) and block -> exit
+        parent: dict[int, int | None] = {entry_id: None}
+        queue = deque([entry_id])
+        while queue:
+            block_id = queue.popleft()
+            for succ in dag[block_id]:
+                if succ.id not in parent:
+                    parent[succ.id] = block_id
+                    queue.append(succ.id)
+
+        reverse_dag: dict[int, list[int]] = {block_id: [] for block_id in by_id}
+        for block_id, succs in dag.items():
+            for succ in succs:
+                reverse_dag[succ.id].append(block_id)
+        toward_exit: dict[int, int | None] = {exit_id: None}
+        queue = deque([exit_id])
+        while queue:
+            block_id = queue.popleft()
+            for pred_id in reverse_dag[block_id]:
+                if pred_id not in toward_exit:
+                    toward_exit[pred_id] = block_id
+                    queue.append(pred_id)
+
+        def route(src: int, dst: int) -> list[int]:
+            head: list[int] = []
+            cursor: int | None = src
+            while cursor is not None:
+                head.append(cursor)
+                cursor = parent[cursor]
+            head.reverse()
+            cursor = dst
+            while cursor is not None:
+                head.append(cursor)
+                cursor = toward_exit[cursor]
+            return head
+
+        candidates = [(b.id, s.id) for b in view.order for s in dag[b.id]]
+        candidates.extend(view.back_edges)
+
+        covered: set[tuple[int, int]] = set()
+        paths: list[list[BasicBlock]] = []
+        for src, dst in candidates:
+            if (src, dst) in covered or src not in parent or dst not in toward_exit:
                 continue
+            ids = route(src, dst)
+            covered.update(zip(ids, ids[1:]))
+            paths.append([by_id[block_id] for block_id in ids])
+        return paths
+
+    def _loop_collapsed(self) -> _LoopCollapsedCFG:
+        """Return the loop-collapsed view of the reachable CFG (cached)."""
+        return self._cached("loop_collapsed", self._compute_loop_collapsed)
+
+    def _compute_loop_collapsed(self) -> _LoopCollapsedCFG:
+        """
+        Break cycles and collapse natural loops into single-pass regions.
+
+        A DFS from entry drops retreating edges to obtain an acyclic
+        successor map. For each retreating edge u -> h where h dominates u
+        (a natural loop), the collapsed map additionally lets u continue to
+        h's successors outside the loop body, so a loop is counted as
+        "skipped or run once" instead of losing every path through its body.
+        """
+        if not self.entry_block:
+            return _LoopCollapsedCFG([], {}, {}, [])
+        acyclic: dict[int, list[BasicBlock]] = {self.entry_block.id: []}
+        retreating: list[tuple[int, int]] = []
+        by_id = {self.entry_block.id: self.entry_block}
+        on_stack = {self.entry_block.id}
+        stack: list[tuple[BasicBlock, Iterator[BasicBlock]]] = [
+            (self.entry_block, iter(self.entry_block.successors))
+        ]
+        while stack:
+            block, children = stack[-1]
+            for child in children:
+                if child.id in on_stack:
+                    retreating.append((block.id, child.id))
+                    continue
+                acyclic[block.id].append(child)
+                if child.id not in acyclic:
+                    acyclic[child.id] = []
+                    by_id[child.id] = child
+                    on_stack.add(child.id)
+                    stack.append((child, iter(child.successors)))
+                    break
+            else:
+                stack.pop()
+                on_stack.discard(block.id)
+
+        collapsed = {block_id: list(succs) for block_id, succs in acyclic.items()}
+        dom_info = self.get_dominator_info()
+        for tail, header in retreating:
+            if not dom_info.dominates(header, tail):
+                continue  # Irreducible region: the edge is simply dropped
+            body = {header, tail}
+            work = [tail]
+            while work:
+                for pred in by_id[work.pop()].predecessors:
+                    if pred.id in acyclic and pred.id not in body:
+                        body.add(pred.id)
+                        work.append(pred.id)
+            targets = collapsed[tail]
+            for succ in acyclic[header]:
+                if succ.id not in body and succ not in targets:
+                    targets.append(succ)
+
+        # Kahn topological order over the collapsed map (it is still acyclic)
+        indegree = dict.fromkeys(collapsed, 0)
+        for succs in collapsed.values():
+            for succ in succs:
+                indegree[succ.id] += 1
+        ready = deque(block_id for block_id, deg in indegree.items() if deg == 0)
+        order: list[BasicBlock] = []
+        while ready:
+            block_id = ready.popleft()
+            order.append(by_id[block_id])
+            for succ in collapsed[block_id]:
+                indegree[succ.id] -= 1
+                if indegree[succ.id] == 0:
+                    ready.append(succ.id)
+        return _LoopCollapsedCFG(order, acyclic, collapsed, retreating)
+
+    def _blocks_reaching_exit(self) -> set[int]:
+        """Return ids of blocks from which the exit block is reachable (cached)."""
+
+        def compute() -> set[int]:
+            if not self.exit_block:
+                return set()
+            seen = {self.exit_block.id}
+            stack = [self.exit_block]
+            while stack:
+                for pred in stack.pop().predecessors:
+                    if pred.id not in seen:
+                        seen.add(pred.id)
+                        stack.append(pred)
+            return seen
+
+        return self._cached("reaching_exit", compute)
+
+    def _cached(self, key: str, compute: Callable[[], Any]) -> Any:
+        """
+        Return a cached analysis result, recomputing if the graph shape changed.
+
+        The cache is keyed on the block/edge counts and entry/exit ids so that
+        blocks or edges added after a query transparently invalidate it.
+        """
+        signature = (
+            len(self.blocks),
+            sum(len(b.successors) for b in self.blocks),
+            self.entry_block.id if self.entry_block else None,
+            self.exit_block.id if self.exit_block else None,
+        )
+        if self._analysis_cache.get("__signature__") != signature:
+            self._analysis_cache.clear()
+            self._analysis_cache["__signature__"] = signature
+        if key not in self._analysis_cache:
+            self._analysis_cache[key] = compute()
+        return self._analysis_cache[key]
+
+    def invalidate_analysis_cache(self) -> None:
+        """Drop cached dominance results after in-place edits to blocks."""
+        self._analysis_cache.clear()
+
+    def get_dominator_info(self) -> DominatorInfo:
+        """Return cached dominance information rooted at the entry block."""
+        return self._cached(
+            "dominators", lambda: DominatorInfo.compute(self.blocks, self.entry_block)
+        )
 
-            for succ in current.successors:
-                if succ.id not in visited:
-                    new_path = path + [succ]
-                    new_visited = visited | {succ.id}
-                    stack.append((succ, new_path, new_visited))
+    def get_post_dominator_info(self) -> DominatorInfo:
+        """Return cached post-dominance information rooted at the exit block."""
+        return self._cached(
+            "post_dominators",
+            lambda: DominatorInfo.compute(self.blocks, self.exit_block, reverse=True),
+        )
 
     def get_dominators(self) -> dict[int, set[int]]:
         """
         Compute dominator sets for each block.
 
         Block A dominates block B if every path from entry to B
-        goes through A.
+        goes through A. Blocks unreachable from entry map to themselves.
 
         Returns:
             Dictionary mapping block id to set of dominating block ids.
         """
         if not self.entry_block:
             return {}
+        return self.get_dominator_info().dominator_sets()
 
-        # Initialize: entry dominated only by itself, others by all blocks
-        all_block_ids = {b.id for b in self.blocks}
-        dominators: dict[int, set[int]] = {}
-
-        for block in self.blocks:
-            if block.id == self.entry_block.id:
-                dominators[block.id] = {block.id}
-            else:
-                dominators[block.id] = all_block_ids.copy()
+    def get_immediate_dominators(self) -> dict[int, int | None]:
+        """
+        Compute immediate dominators for each block.
 
-        # Build id -> block mapping
-        {b.id: b for b in self.blocks}
+        The immediate dominator of B is the closest strict dominator of B.
 
-        # Iterate until no changes
-        changed = True
-        while changed:
-            changed = False
-            for block in self.blocks:
-                if block.id == self.entry_block.id:
-                    continue
+        Returns:
+            Dictionary mapping block id to immediate dominator block id (None for entry).
+        """
+        if not self.entry_block:
+            return {}
+        return dict(self.get_dominator_info().idom)
 
-                # Dom(b) = {b} ∪ ⋂ Dom(p) for all predecessors p
-                if block.predecessors:
-                    pred_doms = [dominators[p.id] for p in block.predecessors]
-                    new_dom = {block.id} | set.intersection(*pred_doms)
-                else:
-                    new_dom = {block.id}
+    def get_dominator_tree(self) -> dict[int, list[int]]:
+        """Return the dominator tree as block id -> child block ids."""
+        return self.get_dominator_info().tree
 
-                if new_dom != dominators[block.id]:
-                    dominators[block.id] = new_dom
-                    changed = True
+    def get_dominance_frontiers(self) -> dict[int, set[int]]:
+        """Return the dominance frontier of each block."""
+        return self.get_dominator_info().frontiers
 
-        return dominators
+    def dominates(self, a: int, b: int) -> bool:
+        """Return True if block ``a`` dominates block ``b``."""
+        return self.get_dominator_info().dominates(a, b)
 
-    def get_immediate_dominators(self) -> dict[int, int | None]:
+    def get_post_dominators(self) -> dict[int, set[int]]:
         """
-        Compute immediate dominators for each block.
+        Compute post-dominator sets for each block.
 
-        The immediate dominator of B is the closest strict dominator of B.
+        Block A post-dominates block B if every path from B to exit
+        goes through A. Blocks that cannot reach exit map to themselves.
 
         Returns:
-            Dictionary mapping block id to immediate dominator block id (None for entry).
+            Dictionary mapping block id to set of post-dominating block ids.
         """
-        dominators = self.get_dominators()
-        idom: dict[int, int | None] = {}
+        if not self.exit_block:
+            return {}
+        return self.get_post_dominator_info().dominator_sets()
 
-        for block_id, doms in dominators.items():
-            strict_doms = doms - {block_id}
-            if not strict_doms:
-                idom[block_id] = None  # Entry block
-            else:
-                # Find the dominator closest to block (dominated by all others)
-                for dom_id in strict_doms:
-                    if all(
-                        dom_id in dominators[other] or other == dom_id
-                        for other in strict_doms
-                    ):
-                        idom[block_id] = dom_id
-                        break
+    def get_immediate_post_dominators(self) -> dict[int, int | None]:
+        """Return block id -> immediate post-dominator id (None for exit)."""
+        if not self.exit_block:
+            return {}
+        return dict(self.get_post_dominator_info().idom)
+
+    def get_post_dominator_tree(self) -> dict[int, list[int]]:
+        """Return the post-dominator tree as block id -> child block ids."""
+        return self.get_post_dominator_info().tree
+
+    def get_post_dominance_frontiers(self) -> dict[int, set[int]]:
+        """Return the post-dominance frontier of each block."""
+        return self.get_post_dominator_info().frontiers
+
+    def post_dominates(self, a: int, b: int) -> bool:
+        """Return True if block ``a`` post-dominates block ``b``."""
+        return self.get_post_dominator_info().dominates(a, b)
+
+    def get_control_dependences(self) -> dict[int, set[int]]:
+        """
+        Compute control dependences between blocks.
 
-        return idom
+        Block B is control dependent on block A when A decides whether B
+        executes, i.e. A is in the post-dominance frontier of B
+        (Ferrante-Ottenstein-Warren).
+
+        Returns:
+            Dictionary mapping block id to the ids of blocks it depends on.
+        """
+        return {
+            block_id: set(frontier)
+            for block_id, frontier in self.get_post_dominance_frontiers().items()
+        }
 
     def get_back_edges(self) -> list[tuple[int, int]]:
         """
@@ -1064,12 +1500,14 @@ class ControlFlowGraph:
         Returns:
             List of (from_block_id, to_block_id) tuples representing back edges.
         """
-        dominators = self.get_dominators()
+        if not self.entry_block:
+            return []
+        info = self.get_dominator_info()
         back_edges = []
 
         for block in self.blocks:
             for succ in block.successors:
-                if succ.id in dominators.get(block.id, set()):
+                if info.dominates(succ.id, block.id):
                     back_edges.append((block.id, succ.id))
 
         return back_edges
@@ -2987,6 +3425,7 @@ class CFGBuilder(ast.NodeVisitor):
         # Add condition test to current block
         if self.current_block is not None:
             self.current_block.statements.append(stmt)
+        test_block = self.current_block
 
         # Create blocks for branches
         then_block = self._new_block("if_then")
@@ -3009,9 +3448,9 @@ class CFGBuilder(ast.NodeVisitor):
         # Process else/elif
         if stmt.orelse:
             else_block = self._new_block("if_else")
-            self._add_edge(
-                self.blocks[self.block_counter - 3], else_block
-            )  # From test block
+            # [20261018_BUGFIX] Link from the recorded test block; indexing
+            # self.blocks picked the wrong block once the then-branch nested.
+            self._add_edge(test_block, else_block)
 
             self._set_current_block(else_block)
             for s in stmt.orelse:
@@ -3021,9 +3460,7 @@ class CFGBuilder(ast.NodeVisitor):
                 self._add_edge(self.current_block, after_block)
         else:
             # No else: connect test directly to after
-            self._add_edge(
-                self.blocks[self.block_counter - 2], after_block
-            )  # From test block
+            self._add_edge(test_block, after_block)
 
         self._set_current_block(after_block)
 
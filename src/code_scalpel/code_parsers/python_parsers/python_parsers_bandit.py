@@ -29,6 +29,8 @@ from enum import Enum
 from pathlib import Path
 from typing import TYPE_CHECKING, Any
 
+from ..lint_orchestrator import probe_tool
+
 if TYPE_CHECKING:
     pass
 
@@ -1032,29 +1034,25 @@ class BanditParser:
     def version(self) -> str | None:
         """Get the Bandit version."""
         if self._version is None:
-            try:
-                result = subprocess.run(
-                    [self.bandit_path, "--version"],
-                    capture_output=True,
-                    text=True,
-                    check=True,
-                )
-                self._version = result.stdout.strip()
-            except (subprocess.CalledProcessError, FileNotFoundError):
-                pass
+            self._version = probe_tool(self.bandit_path)
         return self._version
 
     def is_available(self) -> bool:
-        """Check if Bandit is available."""
-        try:
-            subprocess.run(
-                [self.bandit_path, "--version"],
-                capture_output=True,
-                check=True,
-            )
-            return True
-        except (subprocess.CalledProcessError, FileNotFoundError):
-            return False
+        """Check if Bandit is available (probed once per process)."""
+        return probe_tool(self.bandit_path) is not None
+
+    def analyze_command(self, config: BanditConfig | None = None) -> list[str]:
+        """Return the argv ``analyze`` runs, without the targets."""
+        # Use JSON format for structured output
+        cmd = [
+            self.bandit_path,
+            "-f",
+            "json",
+            "--exit-zero",  # Don't exit with error on findings
+        ]
+        if config:
+            cmd.extend(config.to_cli_args())
+        return cmd
 
     def analyze(
         self,
@@ -1082,17 +1080,7 @@ class BanditParser:
         else:
             targets = [str(t) for t in target]
 
-        # Build command - use JSON format for structured output
-        cmd = [
-            self.bandit_path,
-            "-f",
-            "json",
-            "--exit-zero",  # Don't exit with error on findings
-        ]
-
-        if config:
-            cmd.extend(config.to_cli_args())
-
+        cmd = self.analyze_command(config)
         cmd.extend(targets)
 
         try:
@@ -142,6 +142,8 @@ from dataclasses import dataclass, field
 from pathlib import Path
 from typing import TYPE_CHECKING, Any
 
+from ..lint_orchestrator import probe_tool
+
 if TYPE_CHECKING:
     pass
 
@@ -885,33 +887,26 @@ class Flake8Parser:
 
     def _get_version_info(self) -> None:
         """Get version and plugin information."""
-        try:
-            result = subprocess.run(
-                [self.flake8_path, "--version"],
-                capture_output=True,
-                text=True,
-                check=True,
-            )
-            output = result.stdout.strip()
+        output = probe_tool(self.flake8_path)
 
-            # Parse version (first part before parenthesis)
-            if output:
-                self._version = output.split()[0]
-                self._plugins = Flake8PluginInfo.from_version_line(output)
-        except (subprocess.CalledProcessError, FileNotFoundError):
-            pass
+        # Parse version (first part before parenthesis)
+        if output:
+            self._version = output.split()[0]
+            self._plugins = Flake8PluginInfo.from_version_line(output)
 
     def is_available(self) -> bool:
-        """Check if Flake8 is available."""
-        try:
-            subprocess.run(
-                [self.flake8_path, "--version"],
-                capture_output=True,
-                check=True,
-            )
-            return True
-        except (subprocess.CalledProcessError, FileNotFoundError):
-            return False
+        """Check if Flake8 is available (probed once per process)."""
+        return probe_tool(self.flake8_path) is not None
+
+    def analyze_command(self, config: Flake8Config | None = None) -> list[str]:
+        """Return the argv ``analyze`` runs, without the targets."""
+        cmd = [
+            self.flake8_path,
+            "--exit-zero",  # Don't exit with error on violations
+        ]
+        if config:
+            cmd.extend(config.to_cli_args())
+        return cmd
 
     def analyze(
         self,
@@ -943,15 +938,7 @@ class Flake8Parser:
         else:
             targets = [str(t) for t in target]
 
-        # Build command
-        cmd = [
-            self.flake8_path,
-            "--exit-zero",  # Don't exit with error on violations
-        ]
-
-        if config:
-            cmd.extend(config.to_cli_args())
-
+        cmd = self.analyze_command(config)
         cmd.extend(targets)
 
         try:
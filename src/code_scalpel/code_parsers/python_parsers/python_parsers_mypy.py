@@ -40,6 +40,8 @@ from enum import Enum, auto
 from pathlib import Path
 from typing import TYPE_CHECKING, Any, Literal
 
+from ..lint_orchestrator import probe_tool, register_daemon
+
 # Try to import tomllib (Python 3.11+) or tomli as fallback
 try:
     import tomllib
@@ -840,43 +842,43 @@ class MypyParser:
         >>> config = MypyConfig.find_config(Path("."))
     """
 
-    def __init__(self, *, mypy_path: str = "mypy"):
+    def __init__(self, *, mypy_path: str = "mypy", dmypy_path: str = "dmypy"):
         """
         Initialize the mypy parser.
 
         Args:
             mypy_path: Path to the mypy executable.
+            dmypy_path: Path to the mypy daemon client.
         """
         self.mypy_path = mypy_path
+        self.dmypy_path = dmypy_path
         self._version: str | None = None
 
     @property
     def version(self) -> str | None:
         """Get the mypy version."""
         if self._version is None:
-            try:
-                result = subprocess.run(
-                    [self.mypy_path, "--version"],
-                    capture_output=True,
-                    text=True,
-                    check=True,
-                )
-                self._version = result.stdout.strip()
-            except (subprocess.CalledProcessError, FileNotFoundError):
-                pass
+            self._version = probe_tool(self.mypy_path)
         return self._version
 
     def is_available(self) -> bool:
-        """Check if mypy is available."""
-        try:
-            subprocess.run(
-                [self.mypy_path, "--version"],
-                capture_output=True,
-                check=True,
-            )
-            return True
-        except (subprocess.CalledProcessError, FileNotFoundError):
-            return False
+        """Check if mypy is available (probed once per process)."""
+        return probe_tool(self.mypy_path) is not None
+
+    def analyze_command(
+        self, config: MypyConfig | None = None, *, daemon: bool = False
+    ) -> list[str]:
+        """
+        Return the argv ``analyze`` (or ``analyze_daemon`` when ``daemon``)
+        runs, without the targets.
+        """
+        cmd = [self.dmypy_path, "run", "--"] if daemon else [self.mypy_path]
+        if config:
+            cmd.extend(config.to_cli_args())
+        else:
+            # Default options
+            cmd.extend(["--show-error-codes", "--show-column-numbers"])
+        return cmd
 
     def analyze(
         self,
@@ -904,20 +906,7 @@ class MypyParser:
         else:
             targets = [str(t) for t in target]
 
-        # Build command
-        cmd = [self.mypy_path]
-
-        if config:
-            cmd.extend(config.to_cli_args())
-        else:
-            # Default options
-            cmd.extend(
-                [
-                    "--show-error-codes",
-                    "--show-column-numbers",
-                ]
-            )
-
+        cmd = self.analyze_command(config)
         cmd.extend(targets)
 
         try:
@@ -927,42 +916,95 @@ class MypyParser:
                 text=True,
             )
 
-            # Parse output
-            current_error: MypyError | None = None
+            self._parse_text_output(report, result.stdout)
 
-            for line in result.stdout.splitlines():
-                if not line.strip():
-                    continue
+            if result.stderr:
+                report.parse_errors.append(result.stderr.strip())
 
-                error = MypyError.from_line(line)
-                if error:
-                    if error.severity == MypySeverity.NOTE and current_error:
-                        # Check if it's a revealed type
-                        revealed = RevealedType.from_note(error)
-                        if revealed:
-                            report.revealed_types.append(revealed)
-                        else:
-                            current_error.related_notes.append(error)
+        except FileNotFoundError:
+            report.parse_errors.append(f"mypy not found at: {self.mypy_path}")
+            report.success = False
+        except subprocess.SubprocessError as e:
+            report.parse_errors.append(f"mypy execution failed: {e}")
+            report.success = False
+
+        return report
+
+    def _parse_text_output(self, report: MypyReport, stdout: str) -> None:
+        """Fill ``report`` from mypy's text output."""
+        current_error: MypyError | None = None
+
+        for line in stdout.splitlines():
+            if not line.strip():
+                continue
+
+            error = MypyError.from_line(line)
+            if error:
+                if error.severity == MypySeverity.NOTE and current_error:
+                    # Check if it's a revealed type
+                    revealed = RevealedType.from_note(error)
+                    if revealed:
+                        report.revealed_types.append(revealed)
                     else:
-                        if current_error:
-                            report.errors.append(current_error)
-                        current_error = error
+                        current_error.related_notes.append(error)
+                else:
+                    if current_error:
+                        report.errors.append(current_error)
+                    current_error = error
 
-            # Don't forget the last error
-            if current_error:
-                report.errors.append(current_error)
+        # Don't forget the last error
+        if current_error:
+            report.errors.append(current_error)
 
-            # Success if no errors (notes are OK)
-            report.success = all(
-                e.severity != MypySeverity.ERROR for e in report.errors
-            )
-            report.files_analyzed = len(set(e.file for e in report.errors)) or 1
+        # Success if no errors (notes are OK)
+        report.success = all(e.severity != MypySeverity.ERROR for e in report.errors)
+        report.files_analyzed = len(set(e.file for e in report.errors)) or 1
 
-            if result.stderr:
-                report.parse_errors.append(result.stderr.strip())
+    def daemon_available(self) -> bool:
+        """Check if the mypy daemon (dmypy) is available."""
+        return probe_tool(self.dmypy_path) is not None
 
+    def analyze_daemon(
+        self,
+        target: str | Path | list[str | Path],
+        *,
+        config: MypyConfig | None = None,
+    ) -> MypyReport:
+        """
+        Analyze Python files through the mypy daemon.
+
+        [20261018_PERF] ``dmypy run`` starts the daemon on first use and
+        re-checks incrementally afterwards, so repeated runs only pay for
+        what changed. The daemon is stopped when the process exits.
+
+        Args:
+            target: File, directory, or list of targets to analyze.
+            config: Optional configuration override.
+
+        Returns:
+            MypyReport with errors and metadata.
+        """
+        report = MypyReport(config=config, mypy_version=self.version)
+
+        if isinstance(target, (str, Path)):
+            targets = [str(target)]
+        else:
+            targets = [str(t) for t in target]
+
+        cmd = self.analyze_command(config, daemon=True)
+        cmd.extend(targets)
+
+        register_daemon("dmypy", [self.dmypy_path, "stop"])
+        try:
+            result = subprocess.run(cmd, capture_output=True, text=True)
+            self._parse_text_output(report, result.stdout)
+            if result.returncode not in (0, 1):
+                report.parse_errors.append(
+                    f"mypy execution failed: {result.stderr.strip()}"
+                )
+                report.success = False
         except FileNotFoundError:
-            report.parse_errors.append(f"mypy not found at: {self.mypy_path}")
+            report.parse_errors.append(f"dmypy not found at: {self.dmypy_path}")
             report.success = False
         except subprocess.SubprocessError as e:
             report.parse_errors.append(f"mypy execution failed: {e}")
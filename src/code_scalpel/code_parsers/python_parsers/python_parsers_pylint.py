@@ -200,6 +200,8 @@ from enum import Enum
 from pathlib import Path
 from typing import TYPE_CHECKING, Any
 
+from ..lint_orchestrator import probe_tool
+
 # Try to import tomllib (Python 3.11+) or tomli as fallback
 try:
     import tomllib
@@ -1294,29 +1296,26 @@ class PylintParser:
     def version(self) -> str | None:
         """Get the Pylint version."""
         if self._version is None:
-            try:
-                result = subprocess.run(
-                    [self.pylint_path, "--version"],
-                    capture_output=True,
-                    text=True,
-                    check=True,
-                )
-                self._version = result.stdout.strip().split("\n")[0]
-            except (subprocess.CalledProcessError, FileNotFoundError):
-                pass
+            output = probe_tool(self.pylint_path)
+            if output:
+                self._version = output.split("\n")[0]
         return self._version
 
     def is_available(self) -> bool:
-        """Check if Pylint is available."""
-        try:
-            subprocess.run(
-                [self.pylint_path, "--version"],
-                capture_output=True,
-                check=True,
-            )
-            return True
-        except (subprocess.CalledProcessError, FileNotFoundError):
-            return False
+        """Check if Pylint is available (probed once per process)."""
+        return probe_tool(self.pylint_path) is not None
+
+    def analyze_command(self, config: PylintConfig | None = None) -> list[str]:
+        """Return the argv ``analyze`` runs, without the targets."""
+        # Use JSON2 format for structured output
+        cmd = [
+            self.pylint_path,
+            "--output-format=json2",
+            "--exit-zero",  # Don't exit with error on violations
+        ]
+        if config:
+            cmd.extend(config.to_cli_args())
+        return cmd
 
     def analyze(
         self,
@@ -1342,16 +1341,7 @@ class PylintParser:
         else:
             targets = [str(t) for t in target]
 
-        # Build command - use JSON2 format for structured output
-        cmd = [
-            self.pylint_path,
-            "--output-format=json2",
-            "--exit-zero",  # Don't exit with error on violations
-        ]
-
-        if config:
-            cmd.extend(config.to_cli_args())
-
+        cmd = self.analyze_command(config)
         cmd.extend(targets)
 
         try:
@@ -200,6 +200,8 @@ from enum import Enum, auto
 from pathlib import Path
 from typing import TYPE_CHECKING, Any, Literal
 
+from ..lint_orchestrator import probe_tool
+
 # Try to import tomllib (Python 3.11+) or tomli as fallback
 try:
     import tomllib
@@ -746,29 +748,24 @@ class RuffParser:
     def version(self) -> str | None:
         """Get the Ruff version."""
         if self._version is None:
-            try:
-                result = subprocess.run(
-                    [self.ruff_path, "--version"],
-                    capture_output=True,
-                    text=True,
-                    check=True,
-                )
-                self._version = result.stdout.strip()
-            except (subprocess.CalledProcessError, FileNotFoundError):
-                pass
+            self._version = probe_tool(self.ruff_path)
         return self._version
 
     def is_available(self) -> bool:
-        """Check if Ruff is available."""
-        try:
-            subprocess.run(
-                [self.ruff_path, "--version"],
-                capture_output=True,
-                check=True,
-            )
-            return True
-        except (subprocess.CalledProcessError, FileNotFoundError):
-            return False
+        """Check if Ruff is available (probed once per process)."""
+        return probe_tool(self.ruff_path) is not None
+
+    def analyze_command(self, config: RuffConfig | None = None) -> list[str]:
+        """Return the argv ``analyze`` runs, without the targets."""
+        cmd = [
+            self.ruff_path,
+            "check",
+            "--output-format=json",
+            "--exit-zero",  # Don't exit with error on violations
+        ]
+        if config:
+            cmd.extend(config.to_cli_args())
+        return cmd
 
     def analyze(
         self,
@@ -796,16 +793,7 @@ class RuffParser:
         else:
             targets = [str(t) for t in target]
 
-        # Build command
-        cmd = [
-            self.ruff_path,
-            "check",
-            "--output-format=json",
-            "--exit-zero",  # Don't exit with error on violations
-        ]
-
-        if config:
-            cmd.extend(config.to_cli_args())
+        cmd = self.analyze_command(config)
 
         if stdin_source:
             cmd.append("--stdin-filename")
@@ -9,6 +9,8 @@ Design Principles:
     2. Semantic - Represent meaning, not syntax (no commas, parentheses, etc.)
     3. Typed - All fields have type annotations
     4. Immutable-ish - Use dataclasses with default_factory for lists
+    5. Compact - Slotted dataclasses, lazily allocated metadata and interned
+       identifiers, since project-wide IR holds millions of small nodes
 
 Node Categories:
     - Statements: IRModule, IRFunctionDef, IRIf, IRFor, IRWhile, IRAssign, etc.
@@ -18,8 +20,9 @@ Node Categories:
 
 from __future__ import annotations
 
+import sys
 from dataclasses import dataclass, field
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Dict, List, Optional, Union, cast, overload
 
 from .operators import (
     AugAssignOperator,
@@ -30,7 +33,7 @@ from .operators import (
 )
 
 
-@dataclass
+@dataclass(slots=True)
 class SourceLocation:
     """
     Source code location for error reporting and debugging.
@@ -49,6 +52,14 @@ class SourceLocation:
     end_column: Optional[int] = None
     filename: Optional[str] = None
 
+    def __post_init__(self) -> None:
+        # [20261018_PERF] Every node of a file repeats its path, and most
+        # nodes end on their start line; share those objects.
+        if type(self.filename) is str:
+            self.filename = sys.intern(self.filename)
+        if self.end_line == self.line:
+            self.end_line = self.line
+
     def __str__(self) -> str:
         if self.filename:
             return f"{self.filename}:{self.line}:{self.column}"
@@ -60,7 +71,99 @@ class SourceLocation:
 # =============================================================================
 
 
-@dataclass
+class _LazyMetadata(dict):
+    """
+    Empty ``_metadata`` stand-in for nodes that never had metadata written.
+
+    [20261018_PERF] Most nodes never carry metadata, so IRNode stores None
+    instead of an empty dict and hands out one of these on access. The first
+    write attaches it to the node, after which it is the node's metadata dict.
+    """
+
+    __slots__ = ("_owner", "_field")
+
+    def __init__(self, owner: "IRNode", field_: "_LazyMetadataField"):
+        super().__init__()
+        self._owner: Optional[IRNode] = owner
+        self._field = field_
+
+    def _attach(self) -> None:
+        owner = self._owner
+        if owner is not None:
+            self._owner = None
+            if self._field.stored(owner) is None:
+                self._field.store(owner, self)
+
+    def __setitem__(self, key: str, value: Any) -> None:
+        self._attach()
+        super().__setitem__(key, value)
+
+    def setdefault(self, key: str, default: Any = None) -> Any:
+        self._attach()
+        return super().setdefault(key, default)
+
+    def update(self, *args: Any, **kwargs: Any) -> None:
+        self._attach()
+        super().update(*args, **kwargs)
+
+    def __ior__(self, other: Any) -> "_LazyMetadata":
+        self.update(other)
+        return self
+
+    def __reduce__(self) -> Any:
+        return dict, (dict(self),)
+
+
+class _LazyMetadataField:
+    """
+    Data descriptor for ``IRNode._metadata`` wrapping the dataclass slot.
+
+    Reads always return a dict (a _LazyMetadata view while the slot holds
+    None); writes store the dict, or None for an untouched view.
+    """
+
+    __slots__ = ("_slot",)
+
+    def __init__(self, slot: Any):
+        self._slot = slot
+
+    @classmethod
+    def install(cls, owner: type) -> None:
+        """Wrap the ``_metadata`` slot member that ``owner`` itself declares."""
+        slot = owner.__dict__.get("_metadata")
+        if slot is not None and not isinstance(slot, cls):
+            setattr(owner, "_metadata", cls(slot))
+
+    def stored(self, node: "IRNode") -> Optional[Dict[str, Any]]:
+        try:
+            return self._slot.__get__(node, type(node))
+        except AttributeError:  # created without __init__ (e.g. copy/unpickle)
+            return None
+
+    def store(self, node: "IRNode", value: Optional[Dict[str, Any]]) -> None:
+        self._slot.__set__(node, value)
+
+    @overload
+    def __get__(self, node: None, owner: Any = None) -> "_LazyMetadataField": ...
+
+    @overload
+    def __get__(self, node: "IRNode", owner: Any = None) -> Dict[str, Any]: ...
+
+    def __get__(
+        self, node: Optional["IRNode"], owner: Any = None
+    ) -> Union["_LazyMetadataField", Dict[str, Any]]:
+        if node is None:
+            return self
+        metadata = self.stored(node)
+        return _LazyMetadata(node, self) if metadata is None else metadata
+
+    def __set__(self, node: "IRNode", value: Optional[Dict[str, Any]]) -> None:
+        if type(value) is _LazyMetadata and value._owner is not None:
+            value = None  # an untouched view of another node's empty metadata
+        self.store(node, value)
+
+
+@dataclass(slots=True)
 class IRNode:
     """
     Base class for all Unified IR nodes.
@@ -90,7 +193,15 @@ class IRNode:
 
     loc: Optional[SourceLocation] = None
     source_language: str = "unknown"
-    _metadata: Dict[str, Any] = field(default_factory=dict)
+    # [20261018_PERF] The slot holds None until first written; reads go
+    # through _LazyMetadataField and always see a dict.
+    _metadata: Dict[str, Any] = field(default=cast(Dict[str, Any], None))
+
+    def __init_subclass__(cls) -> None:
+        # Python 3.10's dataclass(slots=True) re-declares inherited slots in
+        # each subclass; give those the same lazy wrapper. (No zero-argument
+        # super() here: slotted dataclasses are rebuilt as new classes.)
+        _LazyMetadataField.install(cls)
 
     def with_metadata(self, key: str, value: Any) -> "IRNode":
         """Add metadata and return self for chaining."""
@@ -103,7 +214,7 @@ class IRNode:
 # =============================================================================
 
 
-@dataclass
+@dataclass(slots=True)
 class IRModule(IRNode):
     """
     Root node representing a source file/module.
@@ -117,7 +228,7 @@ class IRModule(IRNode):
     docstring: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class IRFunctionDef(IRNode):
     """
     Function definition.
@@ -145,8 +256,12 @@ class IRFunctionDef(IRNode):
     decorators: List["IRExpr"] = field(default_factory=list)
     docstring: Optional[str] = None
 
+    def __post_init__(self) -> None:
+        if type(self.name) is str:
+            self.name = sys.intern(self.name)
+
 
-@dataclass
+@dataclass(slots=True)
 class IRClassDef(IRNode):
     """
     Class definition.
@@ -168,8 +283,12 @@ class IRClassDef(IRNode):
     decorators: List["IRExpr"] = field(default_factory=list)
     docstring: Optional[str] = None
 
+    def __post_init__(self) -> None:
+        if type(self.name) is str:
+            self.name = sys.intern(self.name)
 
-@dataclass
+
+@dataclass(slots=True)
 class IRIf(IRNode):
     """
     If statement with optional elif/else chain.
@@ -191,7 +310,7 @@ class IRIf(IRNode):
     orelse: List[IRNode] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True)
 class IRFor(IRNode):
     """
     For loop (iteration over collection).
@@ -216,7 +335,7 @@ class IRFor(IRNode):
     is_for_in: bool = False  # JS for-in vs for-of
 
 
-@dataclass
+@dataclass(slots=True)
 class IRWhile(IRNode):
     """
     While loop.
@@ -233,7 +352,7 @@ class IRWhile(IRNode):
     orelse: List[IRNode] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True)
 class IRReturn(IRNode):
     """
     Return statement.
@@ -246,7 +365,7 @@ class IRReturn(IRNode):
     value: Optional["IRExpr"] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class IRAssign(IRNode):
     """
     Assignment statement.
@@ -267,7 +386,7 @@ class IRAssign(IRNode):
     declaration_kind: Optional[str] = None  # "let", "const", "var" for JS
 
 
-@dataclass
+@dataclass(slots=True)
 class IRAugAssign(IRNode):
     """
     Augmented assignment (+=, -=, etc.).
@@ -284,7 +403,7 @@ class IRAugAssign(IRNode):
     value: Optional["IRExpr"] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class IRExprStmt(IRNode):
     """
     Expression statement (expression used as statement).
@@ -299,7 +418,7 @@ class IRExprStmt(IRNode):
     value: Optional["IRExpr"] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class IRPass(IRNode):
     """
     Pass/no-op statement.
@@ -311,14 +430,14 @@ class IRPass(IRNode):
     pass
 
 
-@dataclass
+@dataclass(slots=True)
 class IRBreak(IRNode):
     """Break statement - exit loop."""
 
     pass
 
 
-@dataclass
+@dataclass(slots=True)
 class IRContinue(IRNode):
     """Continue statement - skip to next iteration."""
 
@@ -326,7 +445,7 @@ class IRContinue(IRNode):
 
 
 # [20251215_FEATURE] v2.0.0 - Import/Export support for polyglot extraction
-@dataclass
+@dataclass(slots=True)
 class IRImport(IRNode):
     """
     Import statement (ES6 modules, Python imports, Java imports).
@@ -351,7 +470,7 @@ class IRImport(IRNode):
     is_star: bool = False
 
 
-@dataclass
+@dataclass(slots=True)
 class IRExport(IRNode):
     """
     Export statement (ES6 modules).
@@ -374,7 +493,7 @@ class IRExport(IRNode):
     source: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class IRSwitch(IRNode):
     """
     Switch statement.
@@ -389,7 +508,7 @@ class IRSwitch(IRNode):
     cases: List[tuple] = field(default_factory=list)  # [(test, [body]), ...]
 
 
-@dataclass
+@dataclass(slots=True)
 class IRTry(IRNode):
     """
     Try/catch/finally statement.
@@ -407,7 +526,7 @@ class IRTry(IRNode):
     finalbody: List["IRNode"] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True)
 class IRRaise(IRNode):
     """
     Raise/throw statement.
@@ -426,7 +545,7 @@ class IRRaise(IRNode):
 # =============================================================================
 
 
-@dataclass
+@dataclass(slots=True)
 class IRExpr(IRNode):
     """
     Base class for expression nodes.
@@ -437,7 +556,7 @@ class IRExpr(IRNode):
     pass
 
 
-@dataclass
+@dataclass(slots=True)
 class IRBinaryOp(IRExpr):
     """
     Binary operation (a + b, a * b, etc.).
@@ -466,7 +585,7 @@ class IRBinaryOp(IRExpr):
     right: Optional[IRExpr] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class IRUnaryOp(IRExpr):
     """
     Unary operation (-x, not x, ~x, etc.).
@@ -481,7 +600,7 @@ class IRUnaryOp(IRExpr):
     operand: Optional[IRExpr] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class IRCompare(IRExpr):
     """
     Comparison operation.
@@ -505,7 +624,7 @@ class IRCompare(IRExpr):
     comparators: List[IRExpr] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True)
 class IRBoolOp(IRExpr):
     """
     Boolean/logical operation (and, or).
@@ -523,7 +642,7 @@ class IRBoolOp(IRExpr):
 
 
 # [20251215_FEATURE] v2.0.0 - Ternary/conditional expression for polyglot support
-@dataclass
+@dataclass(slots=True)
 class IRTernary(IRExpr):
     """
     Ternary/conditional expression.
@@ -543,7 +662,7 @@ class IRTernary(IRExpr):
     orelse: Optional[IRExpr] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class IRCall(IRExpr):
     """
     Function/method call.
@@ -571,7 +690,7 @@ class IRCall(IRExpr):
     kwargs: Dict[str, IRExpr] = field(default_factory=dict)
 
 
-@dataclass
+@dataclass(slots=True)
 class IRAttribute(IRExpr):
     """
     Attribute access (obj.attr).
@@ -585,8 +704,12 @@ class IRAttribute(IRExpr):
     value: Optional[IRExpr] = None
     attr: str = ""
 
+    def __post_init__(self) -> None:
+        if type(self.attr) is str:
+            self.attr = sys.intern(self.attr)
+
 
-@dataclass
+@dataclass(slots=True)
 class IRSubscript(IRExpr):
     """
     Subscript/index access (obj[key]).
@@ -601,7 +724,7 @@ class IRSubscript(IRExpr):
     slice: Optional[IRExpr] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class IRName(IRExpr):
     """
     Variable/identifier reference.
@@ -612,8 +735,12 @@ class IRName(IRExpr):
 
     id: str = ""
 
+    def __post_init__(self) -> None:
+        if type(self.id) is str:
+            self.id = sys.intern(self.id)
 
-@dataclass
+
+@dataclass(slots=True)
 class IRConstant(IRExpr):
     """
     Literal constant value.
@@ -633,7 +760,7 @@ class IRConstant(IRExpr):
     raw: Optional[str] = None  # Preserves "undefined" vs "null" distinction
 
 
-@dataclass
+@dataclass(slots=True)
 class IRList(IRExpr):
     """
     List/Array literal.
@@ -645,7 +772,7 @@ class IRList(IRExpr):
     elements: List[IRExpr] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True)
 class IRDict(IRExpr):
     """
     Dictionary/Object literal.
@@ -659,7 +786,7 @@ class IRDict(IRExpr):
     values: List[IRExpr] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True)
 class IRParameter(IRNode):
     """
     Function parameter.
@@ -678,6 +805,13 @@ class IRParameter(IRNode):
     is_rest: bool = False
     is_keyword_only: bool = False
 
+    def __post_init__(self) -> None:
+        if type(self.name) is str:
+            self.name = sys.intern(self.name)
+
+
+_LazyMetadataField.install(IRNode)
+
 
 # =============================================================================
 # Type Aliases for Convenience
@@ -12,10 +12,11 @@ Available Normalizers:
 
 Base Classes:
     - BaseNormalizer: Abstract interface for all normalizers
+    - OnDemandNormalizer: Normalizers that can normalize single nodes lazily
     - TreeSitterVisitor: Base class for tree-sitter based normalizers
 """
 
-from .base import BaseNormalizer
+from .base import BaseNormalizer, OnDemandNormalizer
 from .java_normalizer import JavaNormalizer  # [20251215_FEATURE] Export Java normalizer
 from .python_normalizer import PythonNormalizer
 from .tree_sitter_visitor import TreeSitterVisitor, VisitorContext
@@ -79,6 +80,7 @@ except ImportError:
 
 __all__ = [
     "BaseNormalizer",
+    "OnDemandNormalizer",
     "PythonNormalizer",
     "JavaNormalizer",
     "TreeSitterVisitor",
@@ -88,3 +88,31 @@ class BaseNormalizer(ABC):
         """
         node.source_language = self.language
         return node
+
+
+class OnDemandNormalizer(BaseNormalizer):
+    """
+    Normalizer that can normalize selected nodes of a tree on demand.
+
+    [20261018_PERF] The tree-sitter normalizers derive from this so callers
+    (see ``lazy.LazyModule``) can parse once and normalize only the
+    declarations they need. Test ``issubclass(cls, OnDemandNormalizer)``
+    to find out whether a normalizer supports it.
+    """
+
+    @abstractmethod
+    def parse_tree(self, source: str, filename: str = "<string>") -> Any:
+        """
+        Parse source without normalizing it.
+
+        After this call, ``normalize_node`` accepts nodes of the returned
+        tree.
+
+        Args:
+            source: Source code string
+            filename: Optional filename for locations
+
+        Returns:
+            The tree-sitter Tree of ``source``
+        """
+        pass
@@ -64,7 +64,8 @@ from ..nodes import (
     SourceLocation,
 )
 from ..operators import BinaryOperator
-from .base import BaseNormalizer
+from .base import OnDemandNormalizer
+from .incremental import INCREMENTAL_TREES
 from .tree_sitter_visitor import TreeSitterVisitor
 
 # ---------------------------------------------------------------------------
@@ -860,7 +861,7 @@ class CVisitor(TreeSitterVisitor):
 # ---------------------------------------------------------------------------
 
 
-class CNormalizer(BaseNormalizer):
+class CNormalizer(OnDemandNormalizer):
     """
     Normalizes C source code to Unified IR using tree-sitter-c.
 
@@ -890,9 +891,13 @@ class CNormalizer(BaseNormalizer):
 
     def normalize(self, source: str, filename: str = "<string>") -> IRModule:
         """Parse C source and return a Unified IRModule."""
-        tree = self._parse_cached(source)
+        session = INCREMENTAL_TREES.parse(
+            self._parser, self.language, source, filename, self._parse_cached
+        )
         self._visitor = CVisitor(source)
-        result = self._visitor.visit(tree.root_node)
+        self._visitor.session = session
+        result = self._visitor.visit(session.tree.root_node)
+        session.commit()
         return cast(IRModule, result)
 
     def _parse_cached(self, source: str) -> Any:
@@ -906,6 +911,11 @@ class CNormalizer(BaseNormalizer):
         self._tree_cache[key] = tree
         return tree
 
+    def parse_tree(self, source: str, filename: str = "<string>") -> Any:
+        """[20261018_PERF] Parse without normalizing; primes normalize_node."""
+        self._visitor = CVisitor(source)
+        return self._parse_cached(source)
+
     def normalize_node(self, node: Any) -> Any:
         if self._visitor is None:
             raise RuntimeError("normalize() must be called before normalize_node()")
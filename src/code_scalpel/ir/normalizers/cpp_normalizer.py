@@ -47,7 +47,8 @@ from ..nodes import (
     IRNode,
     IRParameter,
 )
-from .base import BaseNormalizer
+from .base import OnDemandNormalizer
+from .incremental import INCREMENTAL_TREES
 from .c_normalizer import CVisitor
 
 # ---------------------------------------------------------------------------
@@ -523,7 +524,7 @@ class CppVisitor(CVisitor):
 # ---------------------------------------------------------------------------
 
 
-class CppNormalizer(BaseNormalizer):
+class CppNormalizer(OnDemandNormalizer):
     """
     Normalizes C++ source code to Unified IR using tree-sitter-cpp.
 
@@ -560,9 +561,13 @@ class CppNormalizer(BaseNormalizer):
 
     def normalize(self, source: str, filename: str = "<string>") -> IRModule:
         """Parse C++ source and return a Unified IRModule."""
-        tree = self._parse_cached(source)
+        session = INCREMENTAL_TREES.parse(
+            self._parser, self.language, source, filename, self._parse_cached
+        )
         self._visitor = CppVisitor(source)
-        result = self._visitor.visit(tree.root_node)
+        self._visitor.session = session
+        result = self._visitor.visit(session.tree.root_node)
+        session.commit()
         return cast(IRModule, result)
 
     def _parse_cached(self, source: str) -> Any:
@@ -576,6 +581,11 @@ class CppNormalizer(BaseNormalizer):
         self._tree_cache[key] = tree
         return tree
 
+    def parse_tree(self, source: str, filename: str = "<string>") -> Any:
+        """[20261018_PERF] Parse without normalizing; primes normalize_node."""
+        self._visitor = CppVisitor(source)
+        return self._parse_cached(source)
+
     def normalize_node(self, node: Any) -> Any:
         if self._visitor is None:
             raise RuntimeError("normalize() must be called before normalize_node()")
@@ -0,0 +1,308 @@
+"""
+Incremental tree-sitter reparsing for the IR normalizers.
+
+[20261018_PERF] Editor and agent loops call ``normalize`` again and again on
+a file that changed by a few lines. Instead of parsing from scratch and
+re-normalizing every declaration, the normalizers keep the previous tree
+per file, describe the text diff to tree-sitter with ``Tree.edit``, reparse
+incrementally and only re-normalize the top-level declarations whose byte
+ranges changed. The IR of untouched declarations is spliced back in (with
+line numbers shifted when the edit moved them).
+
+A declaration's IR is reused only when all of these hold:
+    - it lies entirely before the edit, or starts on a line after it
+      (so columns are unchanged);
+    - the new tree has a node of the same type at the shifted byte range;
+    - that range does not overlap any range reported by
+      ``Tree.changed_ranges``.
+
+Incremental state is only kept for real filenames; ``"<string>"`` sources
+always take the full-parse path.
+
+Example:
+    >>> session = INCREMENTAL_TREES.parse(parser, "go", source, "main.go")
+    >>> visitor.session = session
+    >>> module = visitor.visit(session.tree.root_node)
+    >>> session.commit()
+"""
+
+from __future__ import annotations
+
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass, fields
+from enum import Enum
+from typing import Any, Callable, Dict, Optional, Tuple
+
+from ..nodes import IRNode, SourceLocation
+
+# (start_byte, end_byte, node type)
+FragmentKey = Tuple[int, int, str]
+
+ANONYMOUS_FILENAME = "<string>"
+
+_CHUNK = 4096
+
+# Field values that never contain locations
+_SCALARS = (str, int, float, bool, bytes, Enum)
+_FIELD_NAMES: Dict[type, Tuple[str, ...]] = {}
+
+
+@dataclass
+class _FileState:
+    """Tree and top-level IR fragments from the last normalization of a file."""
+
+    source: bytes
+    tree: Any
+    # key -> (IR result, start row)
+    fragments: Dict[FragmentKey, Tuple[Any, int]]
+
+
+def _point(data: bytes, offset: int) -> Tuple[int, int]:
+    """Return the (row, byte column) tree-sitter point of ``offset``."""
+    row = data.count(b"\n", 0, offset)
+    return row, offset - (data.rfind(b"\n", 0, offset) + 1)
+
+
+def _common_prefix(a: bytes, b: bytes) -> int:
+    """Length of the common prefix, comparing in chunks to stay in C."""
+    limit = min(len(a), len(b))
+    pos = 0
+    while pos < limit and a[pos : pos + _CHUNK] == b[pos : pos + _CHUNK]:
+        pos += _CHUNK
+    while pos < limit and a[pos] == b[pos]:
+        pos += 1
+    return min(pos, limit)
+
+
+def _common_suffix(a: bytes, b: bytes, limit: int) -> int:
+    """Length of the common suffix, capped at ``limit`` bytes."""
+    la, lb = len(a), len(b)
+    n = 0
+    while (
+        n + _CHUNK <= limit
+        and a[la - n - _CHUNK : la - n] == b[lb - n - _CHUNK : lb - n]
+    ):
+        n += _CHUNK
+    while n < limit and a[la - n - 1] == b[lb - n - 1]:
+        n += 1
+    return n
+
+
+def _field_names(cls: type) -> Tuple[str, ...]:
+    names = _FIELD_NAMES.get(cls)
+    if names is None:
+        names = _FIELD_NAMES[cls] = tuple(f.name for f in fields(cls))
+    return names
+
+
+def shift_lines(value: Any, delta: int) -> Any:
+    """
+    Return a copy of an IR result with every source line moved by ``delta``.
+
+    Handles IR nodes, lists/tuples/dicts of them and bare SourceLocations;
+    other values are shared, not copied.
+    """
+    if isinstance(value, IRNode):
+        cls = type(value)
+        clone = cls.__new__(cls)
+        for name in _field_names(cls):
+            attr = getattr(value, name)
+            if name == "_metadata" and not attr:
+                continue  # keep the clone's metadata lazily unallocated
+            if attr is not None and not isinstance(attr, _SCALARS):
+                attr = shift_lines(attr, delta)
+            object.__setattr__(clone, name, attr)
+        return clone
+    if isinstance(value, list):
+        return [shift_lines(item, delta) for item in value]
+    if isinstance(value, SourceLocation):
+        return SourceLocation(
+            line=value.line + delta,
+            column=value.column,
+            end_line=value.end_line + delta if value.end_line is not None else None,
+            end_column=value.end_column,
+            filename=value.filename,
+        )
+    if isinstance(value, dict):
+        return {key: shift_lines(item, delta) for key, item in value.items()}
+    if isinstance(value, tuple):
+        return tuple(shift_lines(item, delta) for item in value)
+    return value
+
+
+class IncrementalSession:
+    """
+    One normalization pass over a (possibly incrementally reparsed) tree.
+
+    Visitors call :meth:`reuse` before normalizing a top-level node and
+    :meth:`record` afterwards; the normalizer calls :meth:`commit` once the
+    module is built so the next pass can reuse this one's fragments.
+
+    Attributes:
+        tree: The tree-sitter tree for the current source.
+        reused: Number of top-level fragments spliced in from the last pass.
+        normalized: Number of top-level fragments normalized in this pass.
+    """
+
+    def __init__(
+        self,
+        store: Optional[IncrementalTreeStore],
+        key: Optional[Tuple[str, str]],
+        source: bytes,
+        tree: Any,
+        reusable: Dict[FragmentKey, Tuple[Any, int]],
+    ):
+        self.tree = tree
+        self.reused = 0
+        self.normalized = 0
+        self._store = store
+        self._key = key
+        self._source = source
+        self._reusable = reusable
+        self._recorded: Dict[FragmentKey, Tuple[Any, int]] = {}
+
+    def reuse(self, node: Any) -> Tuple[bool, Any]:
+        """Return ``(True, ir)`` when ``node``'s IR can be spliced in."""
+        key = (node.start_byte, node.end_byte, node.type)
+        entry = self._reusable.get(key)
+        if entry is None:
+            return False, None
+        result, delta = entry
+        if delta:
+            result = shift_lines(result, delta)
+        self._recorded[key] = (result, node.start_point[0])
+        self.reused += 1
+        return True, result
+
+    def record(self, node: Any, result: Any) -> None:
+        """Remember the IR produced for top-level ``node``."""
+        self._recorded[(node.start_byte, node.end_byte, node.type)] = (
+            result,
+            node.start_point[0],
+        )
+        self.normalized += 1
+
+    def splice(self, node: Any, normalize: Callable[[Any], Any]) -> Any:
+        """Reuse ``node``'s IR if possible, otherwise normalize and record it."""
+        found, result = self.reuse(node)
+        if found:
+            return result
+        result = normalize(node)
+        self.record(node, result)
+        return result
+
+    def commit(self) -> None:
+        """Keep this pass's tree and fragments for the next edit of the file."""
+        if self._store is not None and self._key is not None:
+            self._store._put(
+                self._key, _FileState(self._source, self.tree, self._recorded)
+            )
+
+
+class IncrementalTreeStore:
+    """
+    Process-wide LRU of the last tree and IR fragments per (language, file).
+
+    Entries are checked out while a file is being normalized, so concurrent
+    normalizations of the same file never edit a shared tree.
+    """
+
+    def __init__(self, max_files: int = 64):
+        self.max_files = max_files
+        self._files: OrderedDict[Tuple[str, str], _FileState] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def parse(
+        self,
+        parser: Any,
+        language: str,
+        source: str,
+        filename: str,
+        parse_full: Optional[Callable[[str], Any]] = None,
+    ) -> IncrementalSession:
+        """
+        Parse ``source`` with ``parser``, incrementally when possible.
+
+        Args:
+            parser: A tree-sitter Parser configured for ``language``.
+            language: Language key separating files parsed by different grammars.
+            source: The new source text.
+            filename: File identity; ``"<string>"`` disables incremental state.
+            parse_full: Parser used for anonymous sources (e.g. a normalizer's
+                content-hash tree cache). Its trees are never edited.
+        """
+        data = source.encode("utf-8")
+        if filename == ANONYMOUS_FILENAME:
+            tree = parse_full(source) if parse_full is not None else parser.parse(data)
+            return IncrementalSession(None, None, data, tree, {})
+
+        key = (language, filename)
+        with self._lock:
+            previous = self._files.pop(key, None)
+
+        if previous is None:
+            return IncrementalSession(self, key, data, parser.parse(data), {})
+
+        if previous.source == data:
+            reusable = {k: (ir, 0) for k, (ir, _) in previous.fragments.items()}
+            return IncrementalSession(self, key, data, previous.tree, reusable)
+
+        old = previous.source
+        start = _common_prefix(old, data)
+        suffix = _common_suffix(old, data, min(len(old), len(data)) - start)
+        old_end = len(old) - suffix
+        new_end = len(data) - suffix
+
+        old_tree = previous.tree
+        old_end_point = _point(old, old_end)
+        new_end_point = _point(data, new_end)
+        old_tree.edit(
+            start_byte=start,
+            old_end_byte=old_end,
+            new_end_byte=new_end,
+            start_point=_point(old, start),
+            old_end_point=old_end_point,
+            new_end_point=new_end_point,
+        )
+        tree = parser.parse(data, old_tree)
+        changed = [(r.start_byte, r.end_byte) for r in old_tree.changed_ranges(tree)]
+
+        byte_delta = new_end - old_end
+        row_delta = new_end_point[0] - old_end_point[0]
+        reusable: Dict[FragmentKey, Tuple[Any, int]] = {}
+        for (s, e, node_type), (ir, row) in previous.fragments.items():
+            if e <= start:
+                new_key, delta = (s, e, node_type), 0
+            elif s >= old_end and row > old_end_point[0]:
+                new_key = (s + byte_delta, e + byte_delta, node_type)
+                delta = row_delta
+            else:
+                continue
+            ns, ne = new_key[0], new_key[1]
+            if any(ns < ce and cs < ne for cs, ce in changed):
+                continue
+            reusable[new_key] = (ir, delta)
+        return IncrementalSession(self, key, data, tree, reusable)
+
+    def _put(self, key: Tuple[str, str], state: _FileState) -> None:
+        with self._lock:
+            self._files[key] = state
+            self._files.move_to_end(key)
+            while len(self._files) > self.max_files:
+                self._files.popitem(last=False)
+
+    def forget(self, language: str, filename: str) -> None:
+        """Drop the incremental state of one file."""
+        with self._lock:
+            self._files.pop((language, filename), None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._files.clear()
+
+    def __len__(self) -> int:
+        return len(self._files)
+
+
+INCREMENTAL_TREES = IncrementalTreeStore()
@@ -40,7 +40,8 @@ from ..nodes import (  # [20251214_FEATURE] Add location tracking for polyglot e
     SourceLocation,
 )
 from ..operators import BinaryOperator
-from .base import BaseNormalizer
+from .base import OnDemandNormalizer
+from .incremental import INCREMENTAL_TREES
 from .tree_sitter_visitor import TreeSitterVisitor
 
 
@@ -981,7 +982,7 @@ class JavaVisitor(TreeSitterVisitor):
         return names
 
 
-class JavaNormalizer(BaseNormalizer):
+class JavaNormalizer(OnDemandNormalizer):
     """[20251224_FEATURE] Java CST normalization with comprehensive features.
 
 
@@ -1008,9 +1009,13 @@ class JavaNormalizer(BaseNormalizer):
         self._visitor: Optional[JavaVisitor] = None
 
     def normalize(self, source: str, filename: str = "<string>") -> IRModule:
-        tree = self._parse_cached(source)
+        session = INCREMENTAL_TREES.parse(
+            self.parser, self.language, source, filename, self._parse_cached
+        )
         self._visitor = JavaVisitor(source)
-        result = self._visitor.visit(tree.root_node)
+        self._visitor.session = session
+        result = self._visitor.visit(session.tree.root_node)
+        session.commit()
         return cast(IRModule, result)  # [20251220_BUGFIX] Cast result to IRModule
 
     def _parse_cached(self, source: str):
@@ -1026,6 +1031,11 @@ class JavaNormalizer(BaseNormalizer):
         self._tree_cache[key] = tree
         return tree
 
+    def parse_tree(self, source: str, filename: str = "<string>") -> Any:
+        """[20261018_PERF] Parse without normalizing; primes normalize_node."""
+        self._visitor = JavaVisitor(source)
+        return self._parse_cached(source)
+
     def normalize_node(self, node: Any) -> Any:
         """Normalize a single tree-sitter node to IR."""
         if self._visitor is None:
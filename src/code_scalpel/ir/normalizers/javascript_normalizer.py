@@ -69,7 +69,8 @@ from ..operators import (
     CompareOperator,
     UnaryOperator,
 )
-from .base import BaseNormalizer
+from .base import OnDemandNormalizer
+from .incremental import INCREMENTAL_TREES, IncrementalSession
 
 # =============================================================================
 # Operator Mappings
@@ -135,7 +136,7 @@ AUG_ASSIGN_OP_MAP = {
 }
 
 
-class JavaScriptNormalizer(BaseNormalizer):
+class JavaScriptNormalizer(OnDemandNormalizer):
     """
     Normalizes JavaScript CST (from tree-sitter) to Unified IR.
 
@@ -169,6 +170,7 @@ class JavaScriptNormalizer(BaseNormalizer):
         self._source: str = ""
         self._parser: Optional[Any] = None
         self._language: Optional[Any] = None
+        self._session: Optional[IncrementalSession] = None
         self._ensure_parser()
 
     # [20251220_BUGFIX] Helper methods for proper type casting
@@ -229,8 +231,9 @@ class JavaScriptNormalizer(BaseNormalizer):
         self._source = source
 
         # Parse with tree-sitter
-        tree = self._parser.parse(source.encode("utf-8"))
-        root = tree.root_node
+        # [20261018_PERF] Reparse incrementally against the file's last tree
+        session = INCREMENTAL_TREES.parse(self._parser, self.language, source, filename)
+        root = session.tree.root_node
 
         # Check for parse errors
         if root.has_error:
@@ -242,7 +245,22 @@ class JavaScriptNormalizer(BaseNormalizer):
             raise SyntaxError("Parse error in JavaScript source")
 
         # Normalize the program
-        return self._normalize_program(root)
+        self._session = session
+        try:
+            module = self._normalize_program(root)
+        finally:
+            self._session = None
+        session.commit()
+        return module
+
+    def parse_tree(self, source: str, filename: str = "<string>") -> Any:
+        """[20261018_PERF] Parse without normalizing; primes normalize_node."""
+        self._ensure_parser()
+        assert self._parser is not None
+        self._filename = filename
+        self._source = source
+        self._session = None
+        return self._parser.parse(source.encode("utf-8"))
 
     def normalize_node(self, node: Any) -> Union[IRNode, List[IRNode], None]:
         """Dispatch to appropriate normalizer based on node type."""
@@ -333,7 +351,19 @@ class JavaScriptNormalizer(BaseNormalizer):
 
     def _normalize_program(self, node) -> IRModule:
         """Normalize the root program node."""
-        body = self._norm_body(self._get_named_children(node))
+        children = self._get_named_children(node)
+        session = self._session
+        if session is None:
+            body = self._norm_body(children)
+        else:
+            # Reuse IR of top-level statements outside the edited ranges
+            body = []
+            for child in children:
+                result = session.splice(child, self.normalize_node)
+                if isinstance(result, list):
+                    body.extend(result)
+                elif result is not None:
+                    body.append(result)
 
         # [20251220_BUGFIX] Cast _set_language return to IRModule
         return cast(
@@ -71,7 +71,8 @@ from ..nodes import (
     SourceLocation,
 )
 from ..operators import BinaryOperator
-from .base import BaseNormalizer
+from .base import OnDemandNormalizer
+from .incremental import INCREMENTAL_TREES
 from .tree_sitter_visitor import TreeSitterVisitor
 
 # ---------------------------------------------------------------------------
@@ -1096,7 +1097,7 @@ class KotlinVisitor(TreeSitterVisitor):
 # ---------------------------------------------------------------------------
 
 
-class KotlinNormalizer(BaseNormalizer):
+class KotlinNormalizer(OnDemandNormalizer):
     """
     Normalizes Kotlin source code to Unified IR using tree-sitter-kotlin.
 
@@ -1129,11 +1130,15 @@ class KotlinNormalizer(BaseNormalizer):
 
     def normalize(self, source: str, filename: str = "<string>") -> IRModule:
         """Parse Kotlin source and return a Unified IRModule."""
-        tree = self._parse_cached(source)
+        session = INCREMENTAL_TREES.parse(
+            self._parser, self.language, source, filename, self._parse_cached
+        )
         self._visitor = KotlinVisitor(source)
-        result = self._visitor.visit(tree.root_node)
+        self._visitor.session = session
+        result = self._visitor.visit(session.tree.root_node)
         module = cast(IRModule, result)
         module._metadata["source_file"] = filename
+        session.commit()
         return module
 
     def _parse_cached(self, source: str) -> Any:
@@ -1147,6 +1152,11 @@ class KotlinNormalizer(BaseNormalizer):
         self._tree_cache[key] = tree
         return tree
 
+    def parse_tree(self, source: str, filename: str = "<string>") -> Any:
+        """[20261018_PERF] Parse without normalizing; primes normalize_node."""
+        self._visitor = KotlinVisitor(source)
+        return self._parse_cached(source)
+
     def normalize_node(self, node: Any) -> Any:
         if self._visitor is None:
             raise RuntimeError("normalize() must be called before normalize_node()")
@@ -0,0 +1,329 @@
+"""
+On-demand, per-declaration IR normalization for tree-sitter normalizers.
+
+[20261018_PERF] Extraction tools need one declaration out of a file, but
+``normalize`` turns the whole module into IR first, so extracting from a
+20k-line file costs a hundred times more than from a 200-line one.
+A LazyModule instead:
+
+- parses the file (tree-sitter, in C) without normalizing anything;
+- builds a DeclarationIndex: a byte-range index of the top-level
+  declarations and their class-level members, read straight off the tree;
+- normalizes a top-level declaration only when it is asked for, through the
+  normalizer's ``normalize_node`` (top-level nodes normalize independently,
+  the same unit ``incremental.py`` splices).
+
+Modules are kept per (language, content hash) and normalized symbols per
+(language, content hash, symbol) in process-wide LRUs, so repeated lookups
+in an unchanged file cost a dictionary hit.
+
+Example:
+    >>> module = LAZY_MODULES.get("javascript", JavaScriptNormalizer, source)
+    >>> decl = module.index.lookup("Calculator.add")[0]
+    >>> ir_nodes = module.normalize(module.index.top_level(decl))
+"""
+
+from __future__ import annotations
+
+import bisect
+import hashlib
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from ..nodes import IRNode
+from .base import OnDemandNormalizer
+
+# Types whose text is a declared name when reached through a declarator chain
+_IDENTIFIER_TYPES = frozenset(
+    {"identifier", "field_identifier", "type_identifier", "simple_identifier"}
+)
+
+
+@dataclass
+class Declaration:
+    """
+    A declaration found in the raw tree.
+
+    Attributes:
+        name: Declared name ("" when it could not be read off the tree).
+        qualified_name: ``Outer.name`` for class-level members.
+        node_type: tree-sitter node type of the declaration.
+        start_byte/end_byte: Byte range in the UTF-8 source.
+        start_line/end_line: 1-based line range.
+        parent: Enclosing top-level declaration (None at top level).
+    """
+
+    name: str
+    qualified_name: str
+    node_type: str
+    start_byte: int
+    end_byte: int
+    start_line: int
+    end_line: int
+    parent: Optional[Declaration] = field(default=None, repr=False, compare=False)
+    node: Any = field(default=None, repr=False, compare=False)
+
+
+def _text(data: bytes, node: Any) -> str:
+    return data[node.start_byte : node.end_byte].decode("utf-8", errors="replace")
+
+
+def declared_name(node: Any, data: bytes) -> str:
+    """
+    Read the declared name of ``node`` without normalizing it.
+
+    Follows ``declaration`` (export wrappers), ``name``, C-style
+    ``declarator`` chains and Go-style ``*_spec`` children.
+    """
+    inner = node.child_by_field_name("declaration")
+    if inner is not None:
+        node = inner
+    name = node.child_by_field_name("name")
+    if name is not None:
+        return _text(data, name)
+    declarator = node.child_by_field_name("declarator")
+    while declarator is not None:
+        if declarator.type in _IDENTIFIER_TYPES:
+            return _text(data, declarator)
+        nested = declarator.child_by_field_name("declarator")
+        if nested is None:
+            nested = declarator.child_by_field_name("name")
+        declarator = nested
+    for child in node.named_children:
+        if child.type.endswith("_spec"):
+            spec_name = child.child_by_field_name("name")
+            if spec_name is not None:
+                return _text(data, spec_name)
+    return ""
+
+
+def _member_body(node: Any) -> Optional[Any]:
+    """The body holding class-level declarations (None for functions)."""
+    inner = node.child_by_field_name("declaration")
+    if inner is not None:
+        node = inner
+    if "function" in node.type or "method" in node.type:
+        return None
+    return node.child_by_field_name("body")
+
+
+def _declaration(
+    node: Any, data: bytes, parent: Optional[Declaration] = None
+) -> Declaration:
+    name = declared_name(node, data)
+    outer = parent.name if parent is not None else ""
+    return Declaration(
+        name=name,
+        qualified_name=f"{outer}.{name}" if outer and name else name,
+        node_type=node.type,
+        start_byte=node.start_byte,
+        end_byte=node.end_byte,
+        start_line=node.start_point[0] + 1,
+        end_line=node.end_point[0] + 1,
+        parent=parent,
+        node=node,
+    )
+
+
+class DeclarationIndex:
+    """
+    Byte-range index of top-level and class-level declarations of a tree.
+
+    Construction only records the byte ranges of the root's children. A
+    lookup searches the raw bytes for the name and reads declarations (and
+    the members of class-like ones) only off the top-level nodes whose
+    range contains a hit, so its cost does not grow with the number or the
+    size of the other declarations.
+    """
+
+    def __init__(self, root: Any, data: bytes):
+        self._data = data
+        self._nodes: List[Any] = root.named_children
+        self._starts = [node.start_byte for node in self._nodes]
+        self._ends = [node.end_byte for node in self._nodes]
+        # top-level position -> [declaration, *class-level members]
+        self._entries: Dict[int, List[Declaration]] = {}
+
+    def __len__(self) -> int:
+        return len(self._nodes)
+
+    def _entry(self, pos: int) -> List[Declaration]:
+        entry = self._entries.get(pos)
+        if entry is None:
+            node = self._nodes[pos]
+            top = _declaration(node, self._data)
+            entry = [top]
+            body = _member_body(node)
+            if body is not None:
+                entry.extend(
+                    _declaration(member, self._data, top)
+                    for member in body.named_children
+                )
+            self._entries[pos] = entry
+        return entry
+
+    @property
+    def declarations(self) -> List[Declaration]:
+        """Every indexed declaration, in source order (reads the whole tree)."""
+        return [decl for pos in range(len(self._nodes)) for decl in self._entry(pos)]
+
+    def lookup(self, qualified_name: str) -> List[Declaration]:
+        """Declarations named ``qualified_name`` (``Class.member`` for members)."""
+        needle = qualified_name.split(".", 1)[0].encode("utf-8")
+        if not needle:
+            return []
+        found: List[Declaration] = []
+        data, starts, ends = self._data, self._starts, self._ends
+        offset = data.find(needle)
+        while offset >= 0:
+            pos = bisect.bisect_right(starts, offset) - 1
+            if pos >= 0 and offset < ends[pos]:
+                found.extend(
+                    decl
+                    for decl in self._entry(pos)
+                    if decl.qualified_name == qualified_name
+                )
+                offset = data.find(needle, ends[pos])
+            else:
+                offset = data.find(needle, offset + 1)
+        return found
+
+    def top_level(self, decl: Declaration) -> Declaration:
+        """The top-level declaration containing ``decl`` (itself at top level)."""
+        return decl.parent if decl.parent is not None else decl
+
+    def enclosing(self, byte_offset: int) -> Optional[Declaration]:
+        """The top-level declaration whose byte range contains ``byte_offset``."""
+        pos = bisect.bisect_right(self._starts, byte_offset) - 1
+        if pos < 0 or byte_offset >= self._ends[pos]:
+            return None
+        return self._entry(pos)[0]
+
+
+class LazyModule:
+    """
+    A parsed source file whose top-level declarations are normalized on demand.
+
+    Attributes:
+        index: DeclarationIndex of the file.
+        has_error: Whether the tree contains syntax errors (callers usually
+            fall back to full normalization for its error reporting).
+        normalized: Number of declarations normalized so far.
+    """
+
+    def __init__(
+        self, normalizer: OnDemandNormalizer, source: str, filename: str = "<string>"
+    ):
+        self._normalizer = normalizer
+        self._lock = threading.Lock()
+        self._results: Dict[int, List[IRNode]] = {}
+        self.normalized = 0
+        data = source.encode("utf-8")
+        root = normalizer.parse_tree(source, filename).root_node
+        self.has_error = bool(root.has_error)
+        self.index = DeclarationIndex(root, data)
+
+    def normalize(self, decl: Declaration) -> List[IRNode]:
+        """Return the IR nodes of top-level declaration ``decl``."""
+        with self._lock:
+            cached = self._results.get(decl.start_byte)
+            if cached is not None:
+                return cached
+            result = self._normalizer.normalize_node(decl.node)
+            if result is None:
+                nodes: List[IRNode] = []
+            elif isinstance(result, list):
+                nodes = result
+            else:
+                nodes = [result]
+            self._results[decl.start_byte] = nodes
+            self.normalized += 1
+            return nodes
+
+
+def content_hash(source: str) -> str:
+    """Digest identifying a source text in the lazy caches."""
+    return hashlib.blake2b(source.encode("utf-8"), digest_size=16).hexdigest()
+
+
+class LazyModuleStore:
+    """
+    Process-wide LRU of LazyModules and normalized symbols.
+
+    Modules are keyed by (language, content hash); symbols by (language,
+    content hash, kind, name). Both are content-addressed, so an edited file
+    simply misses and its old entries age out.
+    """
+
+    def __init__(self, max_modules: int = 32, max_symbols: int = 1024):
+        self.max_modules = max_modules
+        self.max_symbols = max_symbols
+        self._modules: OrderedDict[Tuple[str, str], LazyModule] = OrderedDict()
+        self._symbols: OrderedDict[Tuple[str, str, str, str], Any] = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(
+        self,
+        language: str,
+        normalizer_factory: Callable[[], OnDemandNormalizer],
+        source: str,
+        digest: Optional[str] = None,
+    ) -> LazyModule:
+        """Return the LazyModule of ``source``, parsing it on first use."""
+        key = (language, digest or content_hash(source))
+        with self._lock:
+            module = self._modules.get(key)
+            if module is not None:
+                self._modules.move_to_end(key)
+                return module
+        module = LazyModule(normalizer_factory(), source)
+        with self._lock:
+            self._modules[key] = module
+            while len(self._modules) > self.max_modules:
+                self._modules.popitem(last=False)
+        return module
+
+    def get_symbol(self, language: str, digest: str, kind: str, name: str) -> Any:
+        """Return a cached normalized symbol (None on a miss)."""
+        key = (language, digest, kind, name)
+        with self._lock:
+            found = self._symbols.get(key)
+            if found is None:
+                self.misses += 1
+                return None
+            self._symbols.move_to_end(key)
+            self.hits += 1
+            return found
+
+    def put_symbol(
+        self, language: str, digest: str, kind: str, name: str, node: Any
+    ) -> None:
+        """Cache the normalized IR node of a symbol."""
+        with self._lock:
+            self._symbols[(language, digest, kind, name)] = node
+            self._symbols.move_to_end((language, digest, kind, name))
+            while len(self._symbols) > self.max_symbols:
+                self._symbols.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._modules.clear()
+            self._symbols.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def get_stats(self) -> Dict[str, int]:
+        """Return cache sizes and symbol hit/miss counters."""
+        return {
+            "modules": len(self._modules),
+            "symbols": len(self._symbols),
+            "hits": self.hits,
+            "misses": self.misses,
+        }
+
+
+LAZY_MODULES = LazyModuleStore()
@@ -93,7 +93,8 @@ from ..nodes import (
     SourceLocation,
 )
 from ..operators import AugAssignOperator, BinaryOperator, BoolOperator, CompareOperator
-from .base import BaseNormalizer
+from .base import OnDemandNormalizer
+from .incremental import INCREMENTAL_TREES
 from .tree_sitter_visitor import TreeSitterVisitor
 
 # ---------------------------------------------------------------------------
@@ -926,7 +927,7 @@ class PHPVisitor(TreeSitterVisitor):
 # ---------------------------------------------------------------------------
 
 
-class PHPNormalizer(BaseNormalizer):
+class PHPNormalizer(OnDemandNormalizer):
     """
     Normalize PHP source code to Unified IR.
 
@@ -955,11 +956,15 @@ class PHPNormalizer(BaseNormalizer):
 
     def normalize(self, source: str, filename: str = "<string>") -> IRModule:
         """Parse PHP source and return a Unified IRModule."""
-        tree = self._parse_cached(source)
+        session = INCREMENTAL_TREES.parse(
+            self._parser, self.language, source, filename, self._parse_cached
+        )
         self._visitor = PHPVisitor(source)
-        result = self._visitor.visit(tree.root_node)
+        self._visitor.session = session
+        result = self._visitor.visit(session.tree.root_node)
         module = cast(IRModule, result)
         module._metadata["source_file"] = filename
+        session.commit()
         return module
 
     def _parse_cached(self, source: str) -> Any:
@@ -973,6 +978,11 @@ class PHPNormalizer(BaseNormalizer):
         self._tree_cache[key] = tree
         return tree
 
+    def parse_tree(self, source: str, filename: str = "<string>") -> Any:
+        """[20261018_PERF] Parse without normalizing; primes normalize_node."""
+        self._visitor = PHPVisitor(source)
+        return self._parse_cached(source)
+
     def normalize_node(self, node: Any) -> Any:
         if self._visitor is None:
             raise RuntimeError("normalize() must be called before normalize_node()")
@@ -78,6 +78,7 @@ from ..nodes import (
 )
 from ..operators import AugAssignOperator, BinaryOperator, BoolOperator, CompareOperator
 from .base import BaseNormalizer
+from .incremental import INCREMENTAL_TREES
 from .tree_sitter_visitor import TreeSitterVisitor
 
 # ---------------------------------------------------------------------------
@@ -836,13 +837,15 @@ class RubyNormalizer(BaseNormalizer):
         """Parse Ruby source and return an IRModule."""
         language = Language(tree_sitter_ruby.language())
         parser = Parser(language)
-        tree = parser.parse(bytes(source, "utf-8"))
+        session = INCREMENTAL_TREES.parse(parser, self.language, source, filename)
         visitor = RubyVisitor(source=source)
-        module = visitor.visit(tree.root_node)
+        visitor.session = session
+        module = visitor.visit(session.tree.root_node)
         if module is None:
             return IRModule(body=[], source_language="ruby")
         cast_module: IRModule = module  # type: ignore[assignment]
         cast_module._metadata["source_file"] = filename
+        session.commit()
         return cast_module
 
     def normalize_node(self, node: Any) -> None:
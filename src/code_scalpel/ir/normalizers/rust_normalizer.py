@@ -75,6 +75,7 @@ from ..nodes import (
 )
 from ..operators import AugAssignOperator, BinaryOperator, BoolOperator, CompareOperator
 from .base import BaseNormalizer
+from .incremental import INCREMENTAL_TREES
 from .tree_sitter_visitor import TreeSitterVisitor
 
 # ---------------------------------------------------------------------------
@@ -944,11 +945,13 @@ class RustNormalizer(BaseNormalizer):
         if not source or not source.strip():
             return IRModule(body=[], source_language="rust")
 
-        tree = self._parser.parse(source.encode("utf-8"))
+        session = INCREMENTAL_TREES.parse(self._parser, self.language, source, filename)
         visitor = RustVisitor(source=source)
-        module = visitor.visit(tree.root_node)
+        visitor.session = session
+        module = visitor.visit(session.tree.root_node)
         if hasattr(module, "_metadata"):
             module._metadata["source_file"] = filename
+        session.commit()
         return module
 
     def normalize_node(self, node: Any) -> None:
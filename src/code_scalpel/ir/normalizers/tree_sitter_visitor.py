@@ -15,9 +15,22 @@ and filtering out syntactic noise to produce IR nodes.
 Design Philosophy:
     1. Type-safe: Map CST node types to visitor methods
     2. Flexible: Allow subclasses to override any node handler
-    3. Debuggable: Track parent chain for error messages
+    3. Debuggable: Track parent chain for error messages (opt-in)
     4. Noise-aware: Default handlers for common noise nodes
 
+Dispatch and Traversal:
+    [20261018_PERF] For tree-sitter nodes, handlers are looked up in a table
+    indexed by the integer ``kind_id`` (one table per visitor class and
+    language, shared by all instances) instead of by type string, and noise
+    kinds are a per-language bitset. ``generic_visit``/``visit_children``
+    descend through nodes without a handler with a ``TreeCursor`` and an
+    explicit depth counter rather than recursing, so long chains of wrapper
+    nodes in generated code cost neither Python frames nor per-node dispatch.
+    Handlers still recurse into ``visit`` for the children they convert.
+
+    Set ``visitor.track_parents = True`` to record ``ctx.parent_chain``
+    while debugging; it is not maintained otherwise.
+
 Usage:
     class JavaScriptVisitor(TreeSitterVisitor):
         language = "javascript"
@@ -39,15 +52,38 @@ Node Field Access:
 
 from __future__ import annotations
 
+import threading
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
-from typing import Any, Callable, Dict, Generic, List, Optional, TypeVar, Union
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Generic,
+    List,
+    Optional,
+    Tuple,
+    TypeVar,
+    Union,
+)
 
 from ..nodes import IRNode, SourceLocation
+from .incremental import IncrementalSession
 
 # Type variable for the tree-sitter Node type
 TSNode = TypeVar("TSNode")
 
+# Dispatch table entry for a kind_id not seen yet
+_UNSEEN: Any = object()
+
+# node type -> visit_* method name, per visitor class
+_HANDLER_NAMES: Dict[type, Dict[str, str]] = {}
+# kind_id -> visit_* method name (None: no handler), per (visitor class, language)
+_KIND_TABLES: Dict[Tuple[type, str], List[Any]] = {}
+# kind_id -> 1 noise, 0 not noise, 2 unseen, per (visitor class, language)
+_NOISE_TABLES: Dict[Tuple[type, str], bytearray] = {}
+_TABLES_LOCK = threading.Lock()
+
 
 @dataclass
 class VisitorContext:
@@ -57,7 +93,8 @@ class VisitorContext:
     Attributes:
         filename: Source filename for error messages
         source: Original source code (for extracting text)
-        parent_chain: Stack of parent nodes for debugging
+        parent_chain: Stack of parent nodes for debugging (only filled when
+            the visitor's ``track_parents`` is set)
         scope_stack: Current scope hierarchy (for name resolution)
     """
 
@@ -107,6 +144,20 @@ class TreeSitterVisitor(ABC, Generic[TSNode]):
     def __init__(self):
         self.ctx: VisitorContext = VisitorContext()
         self._handlers: Dict[str, Callable] = {}
+        # [20261018_PERF] Set by normalizers that parse incrementally; top-level
+        # nodes outside the edited ranges reuse IR from the previous pass.
+        self.session: Optional[IncrementalSession] = None
+        # Debug mode: maintain ctx.parent_chain during traversal
+        self.track_parents: bool = False
+        # Number of nodes currently being visited (root handler runs at 1)
+        self._depth = 0
+        # kind_id -> bound handler for this instance (None: string dispatch)
+        self._dispatch: Optional[List[Any]] = []
+        self._kind_table: List[Any] = []
+        self._noise_table = bytearray()
+        self._inline_generic = (
+            type(self).generic_visit is TreeSitterVisitor.generic_visit
+        )
         self._register_handlers()
 
     @property
@@ -158,14 +209,24 @@ class TreeSitterVisitor(ABC, Generic[TSNode]):
         """
         Auto-register visit_* methods as handlers.
 
-        Scans for methods named visit_<node_type> and registers them.
+        Scans for methods named visit_<node_type> and registers them. The
+        scan runs once per class; instances only bind the cached names.
         """
-        for name in dir(self):
-            if name.startswith("visit_"):
-                node_type = name[6:]  # Remove 'visit_' prefix
-                method = getattr(self, name)
-                if callable(method):
-                    self._handlers[node_type] = method
+        cls = type(self)
+        names = _HANDLER_NAMES.get(cls)
+        if names is None:
+            names = {
+                name[6:]: name  # Remove 'visit_' prefix
+                for name in dir(cls)
+                if name.startswith("visit_") and callable(getattr(cls, name))
+            }
+            _HANDLER_NAMES[cls] = names
+        for node_type, name in names.items():
+            self._handlers[node_type] = getattr(self, name)
+        key = (cls, self.language)
+        with _TABLES_LOCK:
+            self._kind_table = _KIND_TABLES.setdefault(key, [])
+            self._noise_table = _NOISE_TABLES.setdefault(key, bytearray())
 
     def register_handler(self, node_type: str, handler: Callable) -> None:
         """
@@ -176,6 +237,53 @@ class TreeSitterVisitor(ABC, Generic[TSNode]):
             handler: Callable that takes a node and returns IR
         """
         self._handlers[node_type] = handler
+        # The shared kind_id tables only know the class's visit_* methods.
+        self._dispatch = None
+
+    def _handler_for(self, node: TSNode) -> Optional[Callable]:
+        """Return the handler for ``node`` (None if unhandled)."""
+        try:
+            handler = self._dispatch[node.kind_id]  # type: ignore[attr-defined,index]
+        except (AttributeError, IndexError, TypeError):
+            return self._lookup_handler(node)
+        if handler is _UNSEEN:
+            return self._lookup_handler(node)
+        return handler
+
+    def _lookup_handler(self, node: TSNode) -> Optional[Callable]:
+        """Slow path of _handler_for: resolve by type and fill the tables."""
+        dispatch = self._dispatch
+        kind = getattr(node, "kind_id", None)
+        if dispatch is None or kind is None:
+            return self._handlers.get(self._get_node_type(node))
+        table = self._kind_table
+        name = table[kind] if kind < len(table) else _UNSEEN
+        if name is _UNSEEN:
+            name = _HANDLER_NAMES[type(self)].get(self._get_node_type(node))
+            with _TABLES_LOCK:
+                if kind >= len(table):
+                    table.extend([_UNSEEN] * (kind + 1 - len(table)))
+                table[kind] = name
+        handler = getattr(self, name) if name is not None else None
+        if kind >= len(dispatch):
+            dispatch.extend([_UNSEEN] * (kind + 1 - len(dispatch)))
+        dispatch[kind] = handler
+        return handler
+
+    def _is_noise_kind(self, node: TSNode) -> bool:
+        """NOISE_TYPES membership, memoized per kind_id in a shared bitset."""
+        kind = getattr(node, "kind_id", None)
+        if kind is None:
+            return self._get_node_type(node) in self.NOISE_TYPES
+        table = self._noise_table
+        flag = table[kind] if kind < len(table) else 2
+        if flag == 2:
+            flag = int(self._get_node_type(node) in self.NOISE_TYPES)
+            with _TABLES_LOCK:
+                if kind >= len(table):
+                    table.extend(b"\x02" * (kind + 1 - len(table)))
+                table[kind] = flag
+        return flag == 1
 
     # =========================================================================
     # Core Visitor Logic
@@ -186,7 +294,7 @@ class TreeSitterVisitor(ABC, Generic[TSNode]):
         Visit a node and return its IR representation.
 
         Dispatch order:
-        1. Look up registered handler by node type
+        1. Look up registered handler by node kind
         2. Fall back to generic_visit if no handler
 
         Args:
@@ -195,27 +303,40 @@ class TreeSitterVisitor(ABC, Generic[TSNode]):
         Returns:
             IRNode, list of IRNodes, or None (for noise nodes)
         """
-        node_type = self._get_node_type(node)
-
-        # Push to parent chain for debugging
-        # [20251220_BUGFIX] Check if parent_chain is not None before appending
-        if self.ctx.parent_chain is not None:
-            self.ctx.parent_chain.append(node)
-
+        # [20261018_PERF] Handlers recurse through here, so the kind_id
+        # lookup is inlined to keep it to one frame per level.
+        try:
+            handler = self._dispatch[node.kind_id]  # type: ignore[attr-defined,index]
+        except (AttributeError, IndexError, TypeError):
+            handler = _UNSEEN
+        if handler is _UNSEEN:
+            handler = self._lookup_handler(node)
+        depth = self._depth
+
+        # [20261018_PERF] Direct children of the root are the unit of
+        # incremental reuse.
+        session = self.session if depth == 1 else None
+        if session is not None:
+            found, reused = session.reuse(node)
+            if found:
+                return reused
+
+        chain = self.ctx.parent_chain if self.track_parents else None
+        if chain is not None:
+            chain.append(node)
+        self._depth = depth + 1
         try:
-            # Look up handler
-            handler = self._handlers.get(node_type)
-
             if handler is not None:
-                return handler(node)
+                result = handler(node)
             else:
-                return self.generic_visit(node)
-
+                result = self.generic_visit(node)
+            if session is not None:
+                session.record(node, result)
+            return result
         finally:
-            # Pop from parent chain
-            # [20251220_BUGFIX] Check if parent_chain is not None before popping
-            if self.ctx.parent_chain is not None:
-                self.ctx.parent_chain.pop()
+            self._depth = depth
+            if chain is not None:
+                chain.pop()
 
     def generic_visit(self, node: TSNode) -> Union[IRNode, List[IRNode], None]:
         """
@@ -227,15 +348,7 @@ class TreeSitterVisitor(ABC, Generic[TSNode]):
         Returns:
             List of IR nodes from children, or None if all children return None
         """
-        results = []
-        for child in self._get_named_children(node):
-            result = self.visit(child)
-            if result is not None:
-                if isinstance(result, list):
-                    results.extend(result)
-                else:
-                    results.append(result)
-
+        results = self._collect(node)
         return results if results else None
 
     def visit_children(self, node: TSNode) -> List[IRNode]:
@@ -244,15 +357,52 @@ class TreeSitterVisitor(ABC, Generic[TSNode]):
 
         Convenience method for compound nodes.
         """
-        results = []
-        for child in self._get_named_children(node):
-            result = self.visit(child)
-            if result is not None:
-                if isinstance(result, list):
-                    results.extend(result)
-                else:
-                    results.append(result)
-        return results
+        return self._collect(node)
+
+    def _collect(self, node: TSNode) -> List[IRNode]:
+        """
+        Visit the named children of ``node`` and flatten their results.
+
+        Children without a handler would only flatten their own children
+        (generic_visit), so the tree-sitter path walks into them with a
+        TreeCursor instead of calling visit recursively. Noise nodes without
+        a handler produce nothing and are skipped.
+        """
+        results: List[IRNode] = []
+        base = self._depth
+        walk = getattr(node, "walk", None)
+        if (
+            walk is None
+            or not self._inline_generic
+            or self.track_parents
+            or self._dispatch is None
+        ):
+            for child in self._get_named_children(node):
+                _extend(results, self.visit(child))
+            return results
+
+        cursor = walk()
+        if not cursor.goto_first_child():
+            return results
+        session_depth = 1 if self.session is not None else -1
+        depth = base
+        try:
+            while True:
+                child = cursor.node
+                if child.is_named:
+                    if depth == session_depth or self._handler_for(child) is not None:
+                        self._depth = depth
+                        _extend(results, self.visit(child))
+                    elif not self._is_noise_kind(child) and cursor.goto_first_child():
+                        depth += 1
+                        continue
+                while not cursor.goto_next_sibling():
+                    if depth == base:
+                        return results
+                    cursor.goto_parent()
+                    depth -= 1
+        finally:
+            self._depth = base
 
     # =========================================================================
     # Noise Filtering
@@ -330,8 +480,7 @@ class TreeSitterVisitor(ABC, Generic[TSNode]):
 
         Override in subclass to customize noise filtering.
         """
-        node_type = self._get_node_type(node)
-        return node_type in self.NOISE_TYPES
+        return self._is_noise_kind(node)
 
     # =========================================================================
     # Helper Methods
@@ -413,3 +562,11 @@ class TreeSitterVisitor(ABC, Generic[TSNode]):
             lines.append(self.debug_node(child, indent + 1))
 
         return "\n".join(lines)
+
+
+def _extend(results: List[Any], result: Any) -> None:
+    if result is not None:
+        if isinstance(result, list):
+            results.extend(result)
+        else:
+            results.append(result)
@@ -10,6 +10,7 @@ import re
 import time
 from typing import Any
 
+from code_scalpel.ast_tools.fused_visitor import FusedAnalysis, run_analyses
 from code_scalpel.code_parsers.factory import ParserFactory
 from code_scalpel.code_parsers.interface import Language as ParserLanguage
 from code_scalpel.licensing.features import get_tool_capabilities, has_capability
@@ -22,7 +23,13 @@ from code_scalpel.mcp.helpers.language_helpers import (
 # (jwt_validator.get_current_tier bypasses env-var downgrade logic)
 from code_scalpel.mcp.protocol import _get_current_tier as get_current_tier_from_license
 from code_scalpel.mcp.models.core import AnalysisResult, ClassInfo, FunctionInfo
-from code_scalpel.parsing import ParsingError, parse_python_code
+from code_scalpel.parsing import (
+    PARSED_ARTIFACTS,
+    ParsingError,
+    get_parser_service,
+    parse_python_code,
+)
+from code_scalpel.parsing.large_files import LargeFileInfo, index_large_file
 
 logger = logging.getLogger(__name__)
 
@@ -86,15 +93,145 @@ def _validate_code(code: str) -> tuple[bool, str | None]:
     return True, None
 
 
+# [20261018_PERF] Python analyses are FusedAnalysis subclasses so that
+# _analyze_code_sync runs all of them in a single walk of the tree. The
+# module-level functions run one analysis each and keep their old behavior.
+
+_NESTING_TYPES = (
+    ast.If,
+    ast.For,
+    ast.While,
+    ast.Try,
+    ast.With,
+    ast.AsyncWith,
+    ast.FunctionDef,
+    ast.AsyncFunctionDef,
+)
+
+
+class _SymbolCollector(FusedAnalysis):
+    """Functions, classes, imports and naming issues for AnalysisResult."""
+
+    def __init__(self) -> None:
+        self.functions: list[str] = []
+        self.function_details: list[FunctionInfo] = []
+        self.classes: list[str] = []
+        self.class_details: list[ClassInfo] = []
+        self.imports: list[str] = []
+        self.issues: list[str] = []
+
+    def visit_FunctionDef(self, node: ast.FunctionDef, ctx: Any) -> None:
+        self.functions.append(node.name)
+        self.function_details.append(
+            FunctionInfo(
+                name=node.name,
+                lineno=node.lineno,
+                end_lineno=getattr(node, "end_lineno", None),
+                is_async=False,
+            )
+        )
+        # Flag potential issues
+        if len(node.name) < 2:
+            self.issues.append(f"Function '{node.name}' has very short name")
+
+    def visit_AsyncFunctionDef(self, node: ast.AsyncFunctionDef, ctx: Any) -> None:
+        self.functions.append(f"async {node.name}")
+        self.function_details.append(
+            FunctionInfo(
+                name=node.name,
+                lineno=node.lineno,
+                end_lineno=getattr(node, "end_lineno", None),
+                is_async=True,
+            )
+        )
+
+    def visit_ClassDef(self, node: ast.ClassDef, ctx: Any) -> None:
+        self.classes.append(node.name)
+        # Extract method names
+        methods = [
+            n.name
+            for n in node.body
+            if isinstance(n, (ast.FunctionDef, ast.AsyncFunctionDef))
+        ]
+        self.class_details.append(
+            ClassInfo(
+                name=node.name,
+                lineno=node.lineno,
+                end_lineno=getattr(node, "end_lineno", None),
+                methods=methods,
+            )
+        )
+
+    def visit_Import(self, node: ast.Import, ctx: Any) -> None:
+        for alias in node.names:
+            self.imports.append(alias.name)
+
+    def visit_ImportFrom(self, node: ast.ImportFrom, ctx: Any) -> None:
+        module = node.module or ""
+        for alias in node.names:
+            self.imports.append(f"{module}.{alias.name}")
+
+    def finish(self) -> _SymbolCollector:
+        return self
+
+
+class _CyclomaticComplexity(FusedAnalysis):
+    """Decision points + 1."""
+
+    def __init__(self) -> None:
+        self.complexity = 1
+
+    def _branch(self, node: ast.AST, ctx: Any) -> None:
+        self.complexity += 1
+
+    visit_If = visit_While = visit_For = visit_ExceptHandler = _branch
+
+    def visit_BoolOp(self, node: ast.BoolOp, ctx: Any) -> None:
+        if isinstance(node.op, (ast.And, ast.Or)):
+            self.complexity += len(node.values) - 1
+
+    def finish(self) -> int:
+        return self.complexity
+
+
 def _count_complexity(tree: ast.AST) -> int:
     """Estimate cyclomatic complexity."""
-    complexity = 1
-    for node in ast.walk(tree):
-        if isinstance(node, (ast.If, ast.While, ast.For, ast.ExceptHandler)):
-            complexity += 1
-        elif isinstance(node, ast.BoolOp) and isinstance(node.op, (ast.And, ast.Or)):
-            complexity += len(node.values) - 1
-    return complexity
+    return run_analyses(tree, [_CyclomaticComplexity()])[0]
+
+
+class _CognitiveComplexity(FusedAnalysis):
+    """
+    Sonar cognitive complexity; the context is the nesting level.
+
+    [20251229_FEATURE] v3.3.0 - Implements Sonar cognitive complexity metric.
+    """
+
+    context_types = (ast.If, ast.While, ast.For, ast.ExceptHandler, ast.Lambda)
+    root_context = 0
+
+    def __init__(self) -> None:
+        self.complexity = 0
+
+    def child_context(self, node: ast.AST, field: str, ctx: int) -> int:
+        return ctx + 1
+
+    def _control(self, node: ast.AST, nesting: int) -> None:
+        self.complexity += 1 + nesting
+
+    visit_If = visit_While = visit_For = visit_ExceptHandler = _control
+
+    def visit_BoolOp(self, node: ast.BoolOp, nesting: int) -> None:
+        # Logical operators add complexity
+        self.complexity += len(node.values) - 1
+
+    def _jump(self, node: ast.AST, nesting: int) -> None:
+        # Control flow breaks
+        self.complexity += 1
+
+    visit_Break = visit_Continue = visit_Return = _jump
+
+    def finish(self) -> int:
+        return self.complexity
 
 
 def _calculate_cognitive_complexity_python(tree: ast.AST) -> int:
@@ -111,79 +248,99 @@ def _calculate_cognitive_complexity_python(tree: ast.AST) -> int:
     Returns:
         int: Cognitive complexity score
     """
-    complexity = 0
+    return run_analyses(tree, [_CognitiveComplexity()])[0]
 
-    def visit_node(node: ast.AST, parent_nesting: int) -> None:
-        nonlocal complexity
-        local_complexity = 0
-        current_nesting = parent_nesting
 
-        # Increment for control structures
-        if isinstance(node, (ast.If, ast.While, ast.For, ast.ExceptHandler)):
-            local_complexity = 1 + current_nesting
-            current_nesting += 1
-        elif isinstance(node, ast.BoolOp):
-            # Logical operators add complexity
-            local_complexity = len(node.values) - 1
-        elif isinstance(node, (ast.Break, ast.Continue, ast.Return)):
-            # Control flow breaks
-            local_complexity = 1
-        elif isinstance(node, ast.Lambda):
-            # Lambdas increase nesting
-            current_nesting += 1
+class _FunctionFrame:
+    """Per-function counters filled in while the walk is inside it."""
 
-        complexity += local_complexity
+    __slots__ = ("node", "max_depth", "complexity")
 
-        # Recursively visit children
-        for child in ast.iter_child_nodes(node):
-            visit_node(child, current_nesting)
+    def __init__(self, node: ast.AST) -> None:
+        self.node = node
+        self.max_depth = 0
+        self.complexity = 1
 
-    visit_node(tree, 0)
-    return complexity
 
+class _CodeSmells(FusedAnalysis):
+    """
+    Long methods, god classes, long parameter lists, deep nesting.
 
-def _detect_code_smells_python(tree: ast.AST, code: str) -> list[str]:
+    The context holds (frame, depth, in_body) for every enclosing function:
+    nesting depth counts from the function itself, cyclomatic complexity
+    only covers its body.
     """
-    Detect code smells in Python code.
 
-    [20251229_FEATURE] v3.3.0 - Code smell detection for PRO tier.
+    context_types = _NESTING_TYPES
+    root_context: tuple = ()
 
-    Detects:
-    - Long methods (>50 lines)
-    - God classes (>10 methods)
-    - Too many parameters (>5 parameters)
-    - Deep nesting (>4 levels)
+    def __init__(self) -> None:
+        self._entries: list[_FunctionFrame | str] = []
+        self._frames: dict[int, _FunctionFrame] = {}
 
-    Returns:
-        list[str]: List of code smell descriptions
-    """
-    smells = []
-    code.splitlines()
-
-    def _max_nesting(n: ast.AST, depth: int = 0) -> int:
-        depths = [depth]
-        for child in ast.iter_child_nodes(n):
-            if isinstance(
-                child,
-                (
-                    ast.If,
-                    ast.For,
-                    ast.While,
-                    ast.Try,
-                    ast.With,
-                    ast.AsyncWith,
-                    ast.FunctionDef,
-                    ast.AsyncFunctionDef,
-                ),
-            ):
-                depths.append(_max_nesting(child, depth + 1))
-            else:
-                depths.append(_max_nesting(child, depth))
-        return max(depths) if depths else depth
+    def child_context(self, node: ast.AST, field: str, ctx: tuple) -> tuple:
+        inner = tuple((frame, depth + 1, body) for frame, depth, body in ctx)
+        frame = self._frames.get(id(node))
+        if frame is not None:
+            inner += ((frame, 0, field == "body"),)
+        return inner
+
+    def _nest(self, ctx: tuple) -> None:
+        for frame, depth, _ in ctx:
+            if depth + 1 > frame.max_depth:
+                frame.max_depth = depth + 1
+
+    def _branch(self, node: ast.AST, ctx: tuple, increment: int = 1) -> None:
+        for frame, _, body in ctx:
+            if body:
+                frame.complexity += increment
+
+    def visit_If(self, node: ast.AST, ctx: tuple) -> None:
+        self._nest(ctx)
+        self._branch(node, ctx)
+
+    visit_For = visit_While = visit_If
+
+    def visit_ExceptHandler(self, node: ast.AST, ctx: tuple) -> None:
+        self._branch(node, ctx)
+
+    def visit_BoolOp(self, node: ast.BoolOp, ctx: tuple) -> None:
+        if isinstance(node.op, (ast.And, ast.Or)):
+            self._branch(node, ctx, len(node.values) - 1)
+
+    def visit_Try(self, node: ast.AST, ctx: tuple) -> None:
+        self._nest(ctx)
 
-    for node in ast.walk(tree):
-        # Long method detection
-        if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
+    visit_With = visit_AsyncWith = visit_Try
+
+    def visit_FunctionDef(self, node: ast.AST, ctx: tuple) -> None:
+        self._nest(ctx)
+        frame = self._frames[id(node)] = _FunctionFrame(node)
+        self._entries.append(frame)
+
+    visit_AsyncFunctionDef = visit_FunctionDef
+
+    def visit_ClassDef(self, node: ast.ClassDef, ctx: tuple) -> None:
+        # God class detection
+        methods = [
+            n
+            for n in node.body
+            if isinstance(n, (ast.FunctionDef, ast.AsyncFunctionDef))
+        ]
+        if len(methods) > 10:
+            self._entries.append(
+                f"God class '{node.name}' with {len(methods)} methods "
+                f"at line {node.lineno}. Consider splitting responsibilities."
+            )
+
+    def finish(self) -> list[str]:
+        smells: list[str] = []
+        for entry in self._entries:
+            if isinstance(entry, str):
+                smells.append(entry)
+                continue
+            node: Any = entry.node
+            # Long method detection
             if hasattr(node, "end_lineno") and node.end_lineno and node.lineno:
                 method_length = node.end_lineno - node.lineno
                 if method_length > 50:
@@ -200,87 +357,89 @@ def _detect_code_smells_python(tree: ast.AST, code: str) -> list[str]:
                 )
 
             # Deep nesting and high complexity hints
-            depth = _max_nesting(node, 0)
-            if depth > 4:
+            if entry.max_depth > 4:
                 smells.append(
-                    f"Method '{node.name}' has deep nesting (>{depth} levels) at line {node.lineno}."
+                    f"Method '{node.name}' has deep nesting (>{entry.max_depth} levels) at line {node.lineno}."
                 )
-            try:
-                func_tree = ast.Module(body=node.body, type_ignores=[])
-                func_complexity = _count_complexity(func_tree)
-                if func_complexity > 10:
-                    smells.append(
-                        f"Method '{node.name}' has high cyclomatic complexity ({func_complexity}) at line {node.lineno}."
-                    )
-            except Exception:
-                pass
-
-        # God class detection
-        elif isinstance(node, ast.ClassDef):
-            methods = [
-                n
-                for n in node.body
-                if isinstance(n, (ast.FunctionDef, ast.AsyncFunctionDef))
-            ]
-            if len(methods) > 10:
+            if entry.complexity > 10:
                 smells.append(
-                    f"God class '{node.name}' with {len(methods)} methods "
-                    f"at line {node.lineno}. Consider splitting responsibilities."
+                    f"Method '{node.name}' has high cyclomatic complexity ({entry.complexity}) at line {node.lineno}."
                 )
+        return smells
 
-    return smells
+
+def _detect_code_smells_python(tree: ast.AST, code: str) -> list[str]:
+    """
+    Detect code smells in Python code.
+
+    [20251229_FEATURE] v3.3.0 - Code smell detection for PRO tier.
+
+    Detects:
+    - Long methods (>50 lines)
+    - God classes (>10 methods)
+    - Too many parameters (>5 parameters)
+    - Deep nesting (>4 levels)
+
+    Returns:
+        list[str]: List of code smell descriptions
+    """
+    return run_analyses(tree, [_CodeSmells()])[0]
 
 
 # [20251225_FEATURE] Tier-gated advanced metrics and detections for analyze_code
+class _HalsteadMetrics(FusedAnalysis):
+    """Operators and operands for Halstead metrics."""
+
+    def __init__(self) -> None:
+        self.operators: list[str] = []
+        self.operands: list[str] = []
+
+    def _operator(self, node: ast.AST, ctx: Any) -> None:
+        self.operators.append(type(node).__name__)
+
+    visit_BinOp = visit_BoolOp = visit_UnaryOp = visit_Compare = _operator
+    visit_Assign = visit_AugAssign = visit_AnnAssign = _operator
+    visit_Call = visit_IfExp = _operator
+
+    def visit_Name(self, node: ast.Name, ctx: Any) -> None:
+        self.operands.append(node.id)
+
+    def visit_Constant(self, node: ast.Constant, ctx: Any) -> None:
+        self.operands.append(repr(node.value))
+
+    def finish(self) -> dict[str, float]:
+        operators, operands = self.operators, self.operands
+        distinct_operators = len(set(operators))
+        distinct_operands = len(set(operands))
+        total_operators = len(operators)
+        total_operands = len(operands)
+
+        vocabulary = distinct_operators + distinct_operands
+        length = total_operators + total_operands
+        volume = length * math.log2(vocabulary) if vocabulary > 0 else 0.0
+        difficulty = (
+            (distinct_operators / 2) * (total_operands / distinct_operands)
+            if distinct_operands > 0
+            else 0.0
+        )
+        effort = difficulty * volume
+
+        return {
+            "n1": float(distinct_operators),
+            "n2": float(distinct_operands),
+            "N1": float(total_operators),
+            "N2": float(total_operands),
+            "vocabulary": float(vocabulary),
+            "length": float(length),
+            "volume": float(volume),
+            "difficulty": float(difficulty),
+            "effort": float(effort),
+        }
+
+
 def _compute_halstead_metrics_python(tree: ast.AST) -> dict[str, float]:
     """Compute Halstead metrics for Python code using AST traversal."""
-    operators: list[str] = []
-    operands: list[str] = []
-
-    def op_name(node: ast.AST) -> str:
-        return type(node).__name__
-
-    for node in ast.walk(tree):
-        if isinstance(node, (ast.BinOp, ast.BoolOp, ast.UnaryOp, ast.Compare)):
-            operators.append(op_name(node))
-        elif isinstance(node, (ast.Assign, ast.AugAssign, ast.AnnAssign)):
-            operators.append(op_name(node))
-        elif isinstance(node, ast.Call):
-            operators.append(op_name(node))
-        elif isinstance(node, ast.IfExp):
-            operators.append(op_name(node))
-
-        if isinstance(node, ast.Name):
-            operands.append(node.id)
-        elif isinstance(node, ast.Constant):
-            operands.append(repr(node.value))
-
-    distinct_operators = len(set(operators))
-    distinct_operands = len(set(operands))
-    total_operators = len(operators)
-    total_operands = len(operands)
-
-    vocabulary = distinct_operators + distinct_operands
-    length = total_operators + total_operands
-    volume = length * math.log2(vocabulary) if vocabulary > 0 else 0.0
-    difficulty = (
-        (distinct_operators / 2) * (total_operands / distinct_operands)
-        if distinct_operands > 0
-        else 0.0
-    )
-    effort = difficulty * volume
-
-    return {
-        "n1": float(distinct_operators),
-        "n2": float(distinct_operands),
-        "N1": float(total_operators),
-        "N2": float(total_operands),
-        "vocabulary": float(vocabulary),
-        "length": float(length),
-        "volume": float(volume),
-        "difficulty": float(difficulty),
-        "effort": float(effort),
-    }
+    return run_analyses(tree, [_HalsteadMetrics()])[0]
 
 
 def _detect_duplicate_code_blocks(
@@ -308,43 +467,79 @@ def _detect_duplicate_code_blocks(
     return duplicates
 
 
+class _DependencyGraph(FusedAnalysis):
+    """Intra-module call graph; the context is the enclosing functions' callees."""
+
+    context_types = (ast.FunctionDef, ast.AsyncFunctionDef)
+    root_context: tuple = ()
+
+    def __init__(self) -> None:
+        self._callers: list[tuple[str, set[str]]] = []
+        self._callees: dict[int, set[str]] = {}
+
+    def child_context(self, node: ast.AST, field: str, ctx: tuple) -> tuple:
+        return ctx + (self._callees[id(node)],)
+
+    def visit_FunctionDef(self, node: Any, ctx: tuple) -> None:
+        callees: set[str] = set()
+        self._callees[id(node)] = callees
+        self._callers.append((node.name, callees))
+
+    visit_AsyncFunctionDef = visit_FunctionDef
+
+    def visit_Call(self, node: ast.Call, ctx: tuple) -> None:
+        func = node.func
+        if isinstance(func, ast.Name):
+            name = func.id
+        elif isinstance(func, ast.Attribute):
+            name = func.attr
+        else:
+            return
+        for callees in ctx:
+            callees.add(name)
+
+    def finish(self) -> dict[str, list[str]]:
+        graph: dict[str, list[str]] = {}
+        for caller, callees in self._callers:
+            graph[caller] = sorted(callees)
+        return graph
+
+
 def _build_dependency_graph_python(tree: ast.AST) -> dict[str, list[str]]:
     """Build a lightweight intra-module call graph for Python code."""
-    graph: dict[str, list[str]] = {}
-
-    for node in ast.walk(tree):
-        if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
-            caller = node.name
-            callees: set[str] = set()
-            for child in ast.walk(node):
-                if isinstance(child, ast.Call):
-                    func = child.func
-                    if isinstance(func, ast.Name):
-                        callees.add(func.id)
-                    elif isinstance(func, ast.Attribute):
-                        callees.add(func.attr)
-            graph[caller] = sorted(callees)
-    return graph
+    return run_analyses(tree, [_DependencyGraph()])[0]
 
 
-def _detect_naming_issues_python(tree: ast.AST) -> list[str]:
-    """Detect simple naming convention issues (snake_case for functions, PascalCase for classes)."""
-    issues: list[str] = []
-    snake = re.compile(r"^[a-z_][a-z0-9_]*$")
-    pascal = re.compile(r"^[A-Z][A-Za-z0-9]*$")
-
-    for node in ast.walk(tree):
-        if isinstance(
-            node, (ast.FunctionDef, ast.AsyncFunctionDef)
-        ) and not snake.match(node.name):
-            issues.append(
+class _NamingIssues(FusedAnalysis):
+    """snake_case functions, PascalCase classes."""
+
+    _snake = re.compile(r"^[a-z_][a-z0-9_]*$")
+    _pascal = re.compile(r"^[A-Z][A-Za-z0-9]*$")
+
+    def __init__(self) -> None:
+        self.issues: list[str] = []
+
+    def visit_FunctionDef(self, node: Any, ctx: Any) -> None:
+        if not self._snake.match(node.name):
+            self.issues.append(
                 f"Function '{node.name}' should be snake_case at line {node.lineno}."
             )
-        if isinstance(node, ast.ClassDef) and not pascal.match(node.name):
-            issues.append(
+
+    visit_AsyncFunctionDef = visit_FunctionDef
+
+    def visit_ClassDef(self, node: ast.ClassDef, ctx: Any) -> None:
+        if not self._pascal.match(node.name):
+            self.issues.append(
                 f"Class '{node.name}' should be PascalCase at line {node.lineno}."
             )
-    return issues
+
+    def finish(self) -> list[str]:
+        return self.issues
+
+
+def _detect_naming_issues_python(tree: ast.AST) -> list[str]:
+    """Detect simple naming convention issues (snake_case for functions, PascalCase for classes)."""
+    return run_analyses(tree, [_NamingIssues()])[0]
 
 
 def _apply_custom_rules_python(code: str) -> list[dict[str, Any]]:
@@ -372,33 +567,53 @@ def _apply_custom_rules_python(code: str) -> list[dict[str, Any]]:
     return findings
 
 
-def _detect_compliance_issues_python(tree: ast.AST, code: str) -> list[str]:
-    """Detect simple compliance-related patterns (bare except, missing logging)."""
-    issues: list[str] = []
-    for node in ast.walk(tree):
-        if isinstance(node, ast.ExceptHandler) and node.type is None:
-            issues.append(
+class _ComplianceIssues(FusedAnalysis):
+    """Bare excepts, plus a plaintext-password check on the source."""
+
+    def __init__(self, code: str) -> None:
+        self.code = code
+        self.issues: list[str] = []
+
+    def visit_ExceptHandler(self, node: ast.ExceptHandler, ctx: Any) -> None:
+        if node.type is None:
+            self.issues.append(
                 f"Bare except detected at line {node.lineno}. Specify exception types."
             )
-    if "password" in code.lower() and "hashlib" not in code.lower():
-        issues.append(
-            "Potential plaintext password handling detected. Ensure hashing/encryption."
-        )
-    return issues
+
+    def finish(self) -> list[str]:
+        if "password" in self.code.lower() and "hashlib" not in self.code.lower():
+            self.issues.append(
+                "Potential plaintext password handling detected. Ensure hashing/encryption."
+            )
+        return self.issues
+
+
+def _detect_compliance_issues_python(tree: ast.AST, code: str) -> list[str]:
+    """Detect simple compliance-related patterns (bare except, missing logging)."""
+    return run_analyses(tree, [_ComplianceIssues(code)])[0]
+
+
+class _OrganizationPatterns(FusedAnalysis):
+    """Controller/Service/Repository class naming."""
+
+    def __init__(self) -> None:
+        self.patterns: list[str] = []
+
+    def visit_ClassDef(self, node: ast.ClassDef, ctx: Any) -> None:
+        if node.name.endswith("Controller"):
+            self.patterns.append(f"Controller pattern detected: {node.name}")
+        if node.name.endswith("Service"):
+            self.patterns.append(f"Service pattern detected: {node.name}")
+        if node.name.endswith("Repository"):
+            self.patterns.append(f"Repository pattern detected: {node.name}")
+
+    def finish(self) -> list[str]:
+        return self.patterns
 
 
 def _detect_organization_patterns_python(tree: ast.AST) -> list[str]:
     """Detect coarse architectural hints from class naming conventions."""
-    patterns: list[str] = []
-    for node in ast.walk(tree):
-        if isinstance(node, ast.ClassDef):
-            if node.name.endswith("Controller"):
-                patterns.append(f"Controller pattern detected: {node.name}")
-            if node.name.endswith("Service"):
-                patterns.append(f"Service pattern detected: {node.name}")
-            if node.name.endswith("Repository"):
-                patterns.append(f"Repository pattern detected: {node.name}")
-    return patterns
+    return run_analyses(tree, [_OrganizationPatterns()])[0]
 
 
 def _analyze_clike_code(code: str, language: str) -> AnalysisResult:
@@ -520,6 +735,68 @@ def _analysis_result_from_ir_module(ir_module: Any, code: str) -> AnalysisResult
     )
 
 
+_LARGE_FILE_CLASS_WORDS = ("class", "interface", "struct", "enum", "trait", "object")
+_LARGE_FILE_FUNCTION_WORDS = ("function", "method", "constructor")
+
+
+def _analyze_large_file(
+    file_path: str, language: str, info: LargeFileInfo | None = None
+) -> AnalysisResult:
+    """
+    [20261018_PERF] Summarize a large or generated file from its declaration index.
+
+    The file is never read into memory or parsed as a whole, so only the
+    structural fields (functions, classes, line counts) are filled; the
+    warnings say why the metrics are missing.
+    """
+    index = index_large_file(
+        file_path,
+        language=None if language == "auto" else language,
+        info=info,
+    )
+    functions: list[str] = []
+    function_details: list[FunctionInfo] = []
+    classes: list[str] = []
+    class_details: dict[str, ClassInfo] = {}
+    for decl in index.declarations:
+        kind = decl.node_type
+        if any(word in kind for word in _LARGE_FILE_FUNCTION_WORDS):
+            functions.append(decl.name)
+            function_details.append(
+                FunctionInfo(
+                    name=decl.name, lineno=decl.start_line, end_lineno=decl.end_line
+                )
+            )
+            if decl.parent is not None and decl.parent.name in class_details:
+                class_details[decl.parent.name].methods.append(decl.name)
+        elif any(word in kind for word in _LARGE_FILE_CLASS_WORDS):
+            classes.append(decl.name)
+            class_details.setdefault(
+                decl.name,
+                ClassInfo(
+                    name=decl.name, lineno=decl.start_line, end_lineno=decl.end_line
+                ),
+            )
+
+    reason = f"generated ({index.generated})" if index.generated else "oversized"
+    warnings = [
+        f"Large-file mode: {reason} file of {index.size / (1024 * 1024):.1f} MiB "
+        "indexed by declarations only; complexity and code metrics were skipped"
+    ]
+    return AnalysisResult(
+        success=True,
+        functions=functions,
+        classes=classes,
+        imports=[],
+        complexity=0,
+        lines_of_code=index.lines,
+        function_details=function_details,
+        class_details=list(class_details.values()),
+        language_detected=index.language,
+        parser_warnings=warnings + index.warnings,
+    )
+
+
 def _analyze_adapter_backed_code(code: str, language: str) -> AnalysisResult:
     """Analyze languages backed by IParser adapters and unified IR normalizers."""
     language_map = {
@@ -604,8 +881,12 @@ def _analyze_java_code(code: str) -> AnalysisResult:
             JavaParser,
         )
 
-        parser = JavaParser()
-        result = parser.parse(code)
+        # [20261018_PERF] Same artifact as JavaParserAdapter.parse
+        result = PARSED_ARTIFACTS.get(
+            PARSED_ARTIFACTS.key(None, code, "java", "java-treesitter"),
+            lambda: JavaParser().parse(code),
+            size=len(code),
+        )
         return AnalysisResult(
             success=True,
             functions=result["functions"],
@@ -644,20 +925,25 @@ def _analyze_javascript_code(code: str, is_typescript: bool = False) -> Analysis
     [20251220_FEATURE] v3.0.4 - Multi-language analyze_code support.
     [20251220_BUGFIX] v3.0.5 - Consolidated tree-sitter imports.
     """
+    lang_name = "TypeScript" if is_typescript else "JavaScript"
+    language = "typescript" if is_typescript else "javascript"
+    service = get_parser_service()
+    if not service.is_available(language):
+        package = (
+            "tree-sitter-typescript" if is_typescript else "tree-sitter-javascript"
+        )
+        return AnalysisResult(
+            success=False,
+            functions=[],
+            classes=[],
+            imports=[],
+            complexity=0,
+            lines_of_code=0,
+            error=f"{lang_name} support not available. Please install tree-sitter packages: tree-sitter {package}.",
+        )
     try:
-        from tree_sitter import Language, Parser
-
-        if is_typescript:
-            import tree_sitter_typescript as ts_ts
-
-            lang = Language(ts_ts.language_typescript())
-        else:
-            import tree_sitter_javascript as ts_js
-
-            lang = Language(ts_js.language())
-
-        parser = Parser(lang)
-        tree = parser.parse(bytes(code, "utf-8"))
+        # [20261018_PERF] Shared tree from the parsed-artifact store
+        tree = service.parse_tree(code, language)
 
         functions = []
         function_details = []
@@ -792,19 +1078,7 @@ def _analyze_javascript_code(code: str, is_typescript: bool = False) -> Analysis
             function_details=function_details,
             class_details=class_details,
         )
-    except ImportError as e:
-        lang_name = "TypeScript" if is_typescript else "JavaScript"
-        return AnalysisResult(
-            success=False,
-            functions=[],
-            classes=[],
-            imports=[],
-            complexity=0,
-            lines_of_code=0,
-            error=f"{lang_name} support not available. Please install tree-sitter packages: {str(e)}.",
-        )
     except Exception as e:
-        lang_name = "TypeScript" if is_typescript else "JavaScript"
         return AnalysisResult(
             success=False,
             functions=[],
@@ -878,124 +1152,152 @@ def _detect_frameworks_from_code(
     return sorted(frameworks)
 
 
+class _DeadCodeHints(FusedAnalysis):
+    """
+    Unused imports (names loaded nowhere in the file) and statements after
+    return/raise in top-level functions and methods.
+    """
+
+    def __init__(self) -> None:
+        self.used_names: set[str] = set()
+        self.imported_names: list[tuple[str, int]] = []
+        self.module: ast.Module | None = None
+
+    def visit_Module(self, node: ast.Module, ctx: Any) -> None:
+        self.module = node
+
+    def visit_Name(self, node: ast.Name, ctx: Any) -> None:
+        self.used_names.add(node.id)
+
+    def visit_Import(self, node: ast.Import, ctx: Any) -> None:
+        for alias in node.names:
+            name = alias.asname or alias.name.split(".")[0]
+            self.imported_names.append((name, getattr(node, "lineno", 0) or 0))
+
+    def visit_ImportFrom(self, node: ast.ImportFrom, ctx: Any) -> None:
+        for alias in node.names:
+            name = alias.asname or alias.name
+            self.imported_names.append((name, getattr(node, "lineno", 0) or 0))
+
+    def finish(self) -> list[str]:
+        hints: list[str] = []
+        try:
+            for name, lineno in self.imported_names:
+                if name and name not in self.used_names:
+                    hints.append(f"Unused import '{name}' (L{lineno})")
+
+            # Statement lists only: no second walk of the expressions
+            def _scan_block_for_unreachable(stmts: list[ast.stmt], scope: str) -> None:
+                terminated = False
+                for st in stmts:
+                    if terminated:
+                        ln = getattr(st, "lineno", None)
+                        hints.append(
+                            f"Unreachable statement after terminator in {scope} (L{ln})"
+                        )
+                        continue
+                    if isinstance(st, (ast.Return, ast.Raise)):  # simple terminators
+                        terminated = True
+                    # Recurse into nested blocks for basic coverage
+                    if isinstance(st, ast.If):
+                        _scan_block_for_unreachable(st.body or [], f"{scope} (if-body)")
+                        _scan_block_for_unreachable(
+                            st.orelse or [], f"{scope} (if-else)"
+                        )
+                    elif isinstance(st, (ast.For, ast.While, ast.With, ast.Try)):
+                        _scan_block_for_unreachable(
+                            getattr(st, "body", []) or [],
+                            f"{scope} (loop/with/try)",
+                        )
+                        _scan_block_for_unreachable(
+                            getattr(st, "orelse", []) or [], f"{scope} (orelse)"
+                        )
+                        _scan_block_for_unreachable(
+                            getattr(st, "finalbody", []) or [], f"{scope} (finally)"
+                        )
+                        for h in getattr(st, "handlers", []) or []:
+                            _scan_block_for_unreachable(
+                                getattr(h, "body", []) or [], f"{scope} (except)"
+                            )
+
+            for node in self.module.body if self.module is not None else []:
+                if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
+                    _scan_block_for_unreachable(
+                        node.body or [], f"function '{node.name}'"
+                    )
+                elif isinstance(node, ast.ClassDef):
+                    for inner in node.body:
+                        if isinstance(inner, (ast.FunctionDef, ast.AsyncFunctionDef)):
+                            _scan_block_for_unreachable(
+                                inner.body or [],
+                                f"method '{node.name}.{inner.name}'",
+                            )
+
+        except Exception:
+            return hints
+
+        # Deduplicate while keeping stable order
+        seen: set[str] = set()
+        out: list[str] = []
+        for h in hints:
+            if h not in seen:
+                seen.add(h)
+                out.append(h)
+        return out
+
+
 def _detect_dead_code_hints_python(tree: ast.AST, code: str) -> list[str]:
     """Best-effort dead code hints for Python.
 
     This is intentionally conservative: it flags obvious unreachable statements
     and unused imports in the single file.
     """
-    hints: list[str] = []
-    try:
-        used_names: set[str] = set()
-        imported_names: list[tuple[str, int]] = []
-
-        for node in ast.walk(tree):
-            if isinstance(node, ast.Name):
-                used_names.add(node.id)
-            elif isinstance(node, ast.Import):
-                for alias in node.names:
-                    name = alias.asname or alias.name.split(".")[0]
-                    imported_names.append((name, getattr(node, "lineno", 0) or 0))
-            elif isinstance(node, ast.ImportFrom):
-                for alias in node.names:
-                    name = alias.asname or alias.name
-                    imported_names.append((name, getattr(node, "lineno", 0) or 0))
-
-        for name, lineno in imported_names:
-            if name and name not in used_names:
-                hints.append(f"Unused import '{name}' (L{lineno})")
-
-        def _scan_block_for_unreachable(stmts: list[ast.stmt], scope: str) -> None:
-            terminated = False
-            for st in stmts:
-                if terminated:
-                    ln = getattr(st, "lineno", None)
-                    hints.append(
-                        f"Unreachable statement after terminator in {scope} (L{ln})"
-                    )
-                    continue
-                if isinstance(st, (ast.Return, ast.Raise)):  # simple terminators
-                    terminated = True
-                # Recurse into nested blocks for basic coverage
-                if isinstance(st, ast.If):
-                    _scan_block_for_unreachable(st.body or [], f"{scope} (if-body)")
-                    _scan_block_for_unreachable(st.orelse or [], f"{scope} (if-else)")
-                elif isinstance(st, (ast.For, ast.While, ast.With, ast.Try)):
-                    _scan_block_for_unreachable(
-                        getattr(st, "body", []) or [],
-                        f"{scope} (loop/with/try)",
-                    )
-                    _scan_block_for_unreachable(
-                        getattr(st, "orelse", []) or [], f"{scope} (orelse)"
-                    )
-                    _scan_block_for_unreachable(
-                        getattr(st, "finalbody", []) or [], f"{scope} (finally)"
-                    )
-                    for h in getattr(st, "handlers", []) or []:
-                        _scan_block_for_unreachable(
-                            getattr(h, "body", []) or [], f"{scope} (except)"
-                        )
+    return run_analyses(tree, [_DeadCodeHints()])[0]
 
-        for node in tree.body if isinstance(tree, ast.Module) else []:
-            if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
-                _scan_block_for_unreachable(node.body or [], f"function '{node.name}'")
-            elif isinstance(node, ast.ClassDef):
-                for inner in node.body:
-                    if isinstance(inner, (ast.FunctionDef, ast.AsyncFunctionDef)):
-                        _scan_block_for_unreachable(
-                            inner.body or [],
-                            f"method '{node.name}.{inner.name}'",
-                        )
 
-    except Exception:
-        return hints
+def _decorator_name(d: ast.AST) -> str:
+    if isinstance(d, ast.Name):
+        return d.id
+    if isinstance(d, ast.Attribute):
+        # best-effort flatten
+        parts: list[str] = []
+        cur: ast.AST | None = d
+        while isinstance(cur, ast.Attribute):
+            parts.append(cur.attr)
+            cur = cur.value
+        if isinstance(cur, ast.Name):
+            parts.append(cur.id)
+        return ".".join(reversed(parts))
+    if isinstance(d, ast.Call):
+        return _decorator_name(d.func)
+    return d.__class__.__name__
 
-    # Deduplicate while keeping stable order
-    seen: set[str] = set()
-    out: list[str] = []
-    for h in hints:
-        if h not in seen:
-            seen.add(h)
-            out.append(h)
-    return out
 
+class _DecoratorSummary(FusedAnalysis):
+    """Distinct decorator names on functions and classes."""
 
-def _summarize_decorators_python(tree: ast.AST) -> dict[str, Any]:
-    decorators: set[str] = set()
-
-    def _decorator_name(d: ast.AST) -> str:
-        if isinstance(d, ast.Name):
-            return d.id
-        if isinstance(d, ast.Attribute):
-            # best-effort flatten
-            parts: list[str] = []
-            cur: ast.AST | None = d
-            while isinstance(cur, ast.Attribute):
-                parts.append(cur.attr)
-                cur = cur.value
-            if isinstance(cur, ast.Name):
-                parts.append(cur.id)
-            return ".".join(reversed(parts))
-        if isinstance(d, ast.Call):
-            return _decorator_name(d.func)
-        return d.__class__.__name__
-
-    for node in ast.walk(tree):
-        if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef)):
-            for d in getattr(node, "decorator_list", []) or []:
-                decorators.add(_decorator_name(d))
-
-    return {"decorators": sorted(decorators), "decorator_count": len(decorators)}
+    def __init__(self) -> None:
+        self.decorators: set[str] = set()
 
+    def visit_FunctionDef(self, node: Any, ctx: Any) -> None:
+        for d in getattr(node, "decorator_list", []) or []:
+            self.decorators.add(_decorator_name(d))
+
+    visit_AsyncFunctionDef = visit_ClassDef = visit_FunctionDef
+
+    def finish(self) -> dict[str, Any]:
+        return {
+            "decorators": sorted(self.decorators),
+            "decorator_count": len(self.decorators),
+        }
+
+
+def _summarize_decorators_python(tree: ast.AST) -> dict[str, Any]:
+    return run_analyses(tree, [_DecoratorSummary()])[0]
 
-def _summarize_types_python(tree: ast.AST) -> dict[str, Any]:
-    total_funcs = 0
-    funcs_with_any_annotations = 0
-    annotated_params = 0
-    annotated_returns = 0
-    generic_like_uses = 0
 
-    generic_names = {
+_GENERIC_TYPE_NAMES = frozenset(
+    {
         "list",
         "dict",
         "set",
@@ -1009,55 +1311,71 @@ def _summarize_types_python(tree: ast.AST) -> dict[str, Any]:
         "callable",
         "generic",
     }
+)
 
-    def _subscript_head(n: ast.AST) -> str | None:
-        if isinstance(n, ast.Subscript):
-            v = n.value
-            if isinstance(v, ast.Name):
-                return v.id
-            if isinstance(v, ast.Attribute):
-                return v.attr
-        return None
 
-    for node in ast.walk(tree):
-        if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
-            total_funcs += 1
-            has_ann = False
-            for a in list(getattr(node.args, "args", []) or []) + list(
-                getattr(node.args, "kwonlyargs", []) or []
-            ):
-                if getattr(a, "annotation", None) is not None:
-                    annotated_params += 1
-                    has_ann = True
-            if (
-                getattr(node.args, "vararg", None) is not None
-                and getattr(node.args.vararg, "annotation", None) is not None
-            ):
-                annotated_params += 1
-                has_ann = True
-            if (
-                getattr(node.args, "kwarg", None) is not None
-                and getattr(node.args.kwarg, "annotation", None) is not None
-            ):
-                annotated_params += 1
-                has_ann = True
-            if getattr(node, "returns", None) is not None:
-                annotated_returns += 1
+class _TypeSummary(FusedAnalysis):
+    """Annotation coverage of functions and generic-looking subscripts."""
+
+    def __init__(self) -> None:
+        self.total_funcs = 0
+        self.funcs_with_any_annotations = 0
+        self.annotated_params = 0
+        self.annotated_returns = 0
+        self.generic_like_uses = 0
+
+    def visit_FunctionDef(self, node: Any, ctx: Any) -> None:
+        self.total_funcs += 1
+        has_ann = False
+        for a in list(getattr(node.args, "args", []) or []) + list(
+            getattr(node.args, "kwonlyargs", []) or []
+        ):
+            if getattr(a, "annotation", None) is not None:
+                self.annotated_params += 1
                 has_ann = True
-            if has_ann:
-                funcs_with_any_annotations += 1
+        if (
+            getattr(node.args, "vararg", None) is not None
+            and getattr(node.args.vararg, "annotation", None) is not None
+        ):
+            self.annotated_params += 1
+            has_ann = True
+        if (
+            getattr(node.args, "kwarg", None) is not None
+            and getattr(node.args.kwarg, "annotation", None) is not None
+        ):
+            self.annotated_params += 1
+            has_ann = True
+        if getattr(node, "returns", None) is not None:
+            self.annotated_returns += 1
+            has_ann = True
+        if has_ann:
+            self.funcs_with_any_annotations += 1
+
+    visit_AsyncFunctionDef = visit_FunctionDef
+
+    def visit_Subscript(self, node: ast.Subscript, ctx: Any) -> None:
+        v = node.value
+        if isinstance(v, ast.Name):
+            head = v.id
+        elif isinstance(v, ast.Attribute):
+            head = v.attr
+        else:
+            return
+        if head and head.lower() in _GENERIC_TYPE_NAMES:
+            self.generic_like_uses += 1
 
-        head = _subscript_head(node)
-        if head and head.lower() in generic_names:
-            generic_like_uses += 1
+    def finish(self) -> dict[str, Any]:
+        return {
+            "functions_total": self.total_funcs,
+            "functions_with_any_annotations": self.funcs_with_any_annotations,
+            "annotated_params": self.annotated_params,
+            "annotated_returns": self.annotated_returns,
+            "generic_type_uses": self.generic_like_uses,
+        }
 
-    return {
-        "functions_total": total_funcs,
-        "functions_with_any_annotations": funcs_with_any_annotations,
-        "annotated_params": annotated_params,
-        "annotated_returns": annotated_returns,
-        "generic_type_uses": generic_like_uses,
-    }
+
+def _summarize_types_python(tree: ast.AST) -> dict[str, Any]:
+    return run_analyses(tree, [_TypeSummary()])[0]
 
 
 def _compute_api_surface_from_symbols(
@@ -1389,60 +1707,45 @@ def _analyze_code_sync(
                 "changes": sanitization_report.changes,
             }
 
-        functions = []
-        function_details = []
-        classes = []
-        class_details = []
-        imports = []
-        issues = []
-
-        for node in ast.walk(tree):
-            if isinstance(node, ast.FunctionDef):
-                functions.append(node.name)
-                function_details.append(
-                    FunctionInfo(
-                        name=node.name,
-                        lineno=node.lineno,
-                        end_lineno=getattr(node, "end_lineno", None),
-                        is_async=False,
-                    )
-                )
-                # Flag potential issues
-                if len(node.name) < 2:
-                    issues.append(f"Function '{node.name}' has very short name")
-            elif isinstance(node, ast.AsyncFunctionDef):
-                functions.append(f"async {node.name}")
-                function_details.append(
-                    FunctionInfo(
-                        name=node.name,
-                        lineno=node.lineno,
-                        end_lineno=getattr(node, "end_lineno", None),
-                        is_async=True,
-                    )
-                )
-            elif isinstance(node, ast.ClassDef):
-                classes.append(node.name)
-                # Extract method names
-                methods = [
-                    n.name
-                    for n in node.body
-                    if isinstance(n, (ast.FunctionDef, ast.AsyncFunctionDef))
-                ]
-                class_details.append(
-                    ClassInfo(
-                        name=node.name,
-                        lineno=node.lineno,
-                        end_lineno=getattr(node, "end_lineno", None),
-                        methods=methods,
-                    )
-                )
-            elif isinstance(node, ast.Import):
-                for alias in node.names:
-                    imports.append(alias.name)
-            elif isinstance(node, ast.ImportFrom):
-                module = node.module or ""
-                for alias in node.names:
-                    imports.append(f"{module}.{alias.name}")
+        # [20261018_PERF] Every tier-enabled Python analysis runs in one
+        # fused walk of the tree instead of one ast.walk each.
+        def enabled(capability: str) -> bool:
+            return has_capability("analyze_code", capability, tier)
+
+        complexity_enabled = enabled("complexity_metrics")
+        fused: dict[str, FusedAnalysis] = {
+            "symbols": _SymbolCollector(),
+            "cyclomatic": _CyclomaticComplexity(),
+        }
+        if complexity_enabled and enabled("cognitive_complexity"):
+            fused["cognitive"] = _CognitiveComplexity()
+        if complexity_enabled and enabled("code_smells"):
+            fused["smells"] = _CodeSmells()
+        if complexity_enabled and enabled("halstead_metrics"):
+            fused["halstead"] = _HalsteadMetrics()
+        if complexity_enabled and enabled("dependency_graph"):
+            fused["dependencies"] = _DependencyGraph()
+        if enabled("naming_conventions"):
+            fused["naming"] = _NamingIssues()
+        if enabled("compliance_checks"):
+            fused["compliance"] = _ComplianceIssues(code)
+        if enabled("organization_patterns"):
+            fused["organization"] = _OrganizationPatterns()
+        if enabled("dead_code_detection"):
+            fused["dead_code"] = _DeadCodeHints()
+        if enabled("decorator_analysis"):
+            fused["decorators"] = _DecoratorSummary()
+            fused["types"] = _TypeSummary()
+        walked = dict(zip(fused, run_analyses(tree, list(fused.values()))))
+
+        symbols: _SymbolCollector = walked["symbols"]
+        functions = symbols.functions
+        function_details = symbols.function_details
+        classes = symbols.classes
+        class_details = symbols.class_details
+        imports = symbols.imports
+        issues = symbols.issues
+        cyclomatic = walked["cyclomatic"]
 
         # [20251229_FEATURE] v3.3.0 - Compute tier-based advanced metrics
         cognitive_complexity = 0
@@ -1470,56 +1773,48 @@ def _analyze_code_sync(
         # COMMUNITY: Basic cyclomatic complexity
         # PRO: Add cognitive complexity, code smells, halstead metrics
         # ENTERPRISE: Add duplicate detection, dependency graph
-        if has_capability("analyze_code", "complexity_metrics", tier):
+        if complexity_enabled:
             # Basic cyclomatic complexity available at Community
-            cyclomatic = _count_complexity(tree)
             logger.debug(f"Computed cyclomatic complexity: {cyclomatic}")
 
             # PRO tier: Cognitive complexity
-            if has_capability("analyze_code", "cognitive_complexity", tier):
-                cognitive_complexity = _calculate_cognitive_complexity_python(tree)
+            if "cognitive" in walked:
+                cognitive_complexity = walked["cognitive"]
                 logger.debug(f"Computed cognitive complexity: {cognitive_complexity}")
 
             # PRO tier: Code smell detection
-            if has_capability("analyze_code", "code_smells", tier):
-                code_smells = _detect_code_smells_python(tree, code)
+            if "smells" in walked:
+                code_smells = walked["smells"]
                 logger.debug(f"Detected {len(code_smells)} code smells")
 
-            if has_capability("analyze_code", "halstead_metrics", tier):
-                halstead_metrics = _compute_halstead_metrics_python(tree)
+            if "halstead" in walked:
+                halstead_metrics = walked["halstead"]
                 logger.debug("Computed Halstead metrics")
 
-            if has_capability("analyze_code", "duplicate_code_detection", tier):
+            if enabled("duplicate_code_detection"):
                 duplicate_code_blocks = _detect_duplicate_code_blocks(code)
                 logger.debug(
                     f"Detected {len(duplicate_code_blocks)} duplicate code block(s)"
                 )
 
-            if has_capability("analyze_code", "dependency_graph", tier):
-                dependency_graph = _build_dependency_graph_python(tree)
+            if "dependencies" in walked:
+                dependency_graph = walked["dependencies"]
                 logger.debug("Built dependency graph")
 
-        if has_capability("analyze_code", "naming_conventions", tier):
-            naming_issues = _detect_naming_issues_python(tree)
+        naming_issues = walked.get("naming", naming_issues)
 
-        if has_capability("analyze_code", "custom_rules", tier):
+        if enabled("custom_rules"):
             custom_rule_violations = _apply_custom_rules_python(code)
 
-        if has_capability("analyze_code", "compliance_checks", tier):
-            compliance_issues = _detect_compliance_issues_python(tree, code)
+        compliance_issues = walked.get("compliance", compliance_issues)
+        organization_patterns = walked.get("organization", organization_patterns)
 
-        if has_capability("analyze_code", "organization_patterns", tier):
-            organization_patterns = _detect_organization_patterns_python(tree)
-
-        if has_capability("analyze_code", "framework_detection", tier):
+        if enabled("framework_detection"):
             frameworks = _detect_frameworks_from_code(code, "python", imports)
 
-        if has_capability("analyze_code", "dead_code_detection", tier):
-            dead_code_hints = _detect_dead_code_hints_python(tree, code)
-
-        if has_capability("analyze_code", "decorator_analysis", tier):
-            decorator_summary = _summarize_decorators_python(tree)
-            type_summary = _summarize_types_python(tree)
+        dead_code_hints = walked.get("dead_code", dead_code_hints)
+        decorator_summary = walked.get("decorators")
+        type_summary = walked.get("types")
 
         if has_capability("analyze_code", "architecture_patterns", tier):
             # Reuse org pattern detector output as a baseline.
@@ -1570,7 +1865,7 @@ def _analyze_code_sync(
         if has_capability("analyze_code", "complexity_trends", tier):
             complexity_trends = _update_and_get_complexity_trends(
                 file_path=file_path,
-                cyclomatic=_count_complexity(tree),
+                cyclomatic=cyclomatic,
                 cognitive=cognitive_complexity,
             )
 
@@ -1579,7 +1874,7 @@ def _analyze_code_sync(
             functions=functions,
             classes=classes,
             imports=imports,
-            complexity=_count_complexity(tree),
+            complexity=cyclomatic,
             lines_of_code=len(code.splitlines()),
             issues=issues,
             function_details=function_details,
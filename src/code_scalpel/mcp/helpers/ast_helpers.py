@@ -5,24 +5,32 @@ import logging
 from pathlib import Path
 from typing import Dict, Optional, Tuple
 
+from code_scalpel.cache.change_feed import get_change_feed
 from code_scalpel.parsing.unified_parser import parse_python_code, ParsingError
 
 logger = logging.getLogger("code_scalpel.mcp.ast")
 
 # [20251216_PERF] v2.5.0 - Simple in-memory AST cache
 # Key: file_path (str)
-# Value: (mtime, ast_tree)
-_AST_CACHE: Dict[str, Tuple[float, ast.AST]] = {}
+# Value: (mtime, ast_tree, change-feed token or None)
+_AST_CACHE: Dict[str, Tuple[float, ast.AST, Optional[str]]] = {}
 
 
 def get_cached_ast(file_path: Path) -> Optional[ast.Module]:
-    """Retrieve cached AST if fresh, otherwise return None."""
+    """Retrieve cached AST if fresh, otherwise return None.
+
+    [20261018_PERF] When a change feed watches the file, its dirty set
+    answers freshness without a stat.
+    """
     try:
         key = str(file_path.resolve())
         if key not in _AST_CACHE:
             return None
 
-        mtime, tree = _AST_CACHE[key]
+        mtime, tree, token = _AST_CACHE[key]
+        feed = get_change_feed(key) if token else None
+        if feed is not None and feed.unchanged_since(token, key):
+            return tree  # type: ignore
         current_mtime = file_path.stat().st_mtime
         if current_mtime > mtime:
             del _AST_CACHE[key]
@@ -32,11 +40,14 @@ def get_cached_ast(file_path: Path) -> Optional[ast.Module]:
         return None
 
 
-def cache_ast(file_path: Path, tree: ast.AST) -> None:
-    """Cache an AST tree for path."""
+def cache_ast(file_path: Path, tree: ast.AST, token: Optional[str] = None) -> None:
+    """Cache an AST tree for path.
+
+    ``token`` is the change-feed token taken before the file was read.
+    """
     try:
         key = str(file_path.resolve())
-        _AST_CACHE[key] = (file_path.stat().st_mtime, tree)
+        _AST_CACHE[key] = (file_path.stat().st_mtime, tree, token)
     except OSError:
         pass
 
@@ -48,13 +59,15 @@ def parse_file_cached(file_path: Path) -> Optional[ast.Module]:
     if cached is not None:
         return cached
 
+    feed = get_change_feed(file_path.resolve())
+    token = feed.token() if feed is not None else None
     try:
         code = file_path.read_text(encoding="utf-8")
         try:
             tree, _report = parse_python_code(code, filename=str(file_path))
         except ParsingError:
             return None
-        cache_ast(file_path, tree)
+        cache_ast(file_path, tree, token)
         return tree  # type: ignore
     except OSError:
         return None
@@ -925,7 +925,8 @@ def _crawl_project_discovery(
     """
     import re
     from datetime import datetime
-    from fnmatch import fnmatch
+
+    from code_scalpel.analysis.gitignore import GitignoreMatcher
 
     try:
         root = Path(root_path)
@@ -951,40 +952,14 @@ def _crawl_project_discovery(
         if exclude_dirs:
             default_excludes.update(exclude_dirs)
 
-        gitignore_patterns: list[str] = []
-        if respect_gitignore:
-            gitignore_file = root / ".gitignore"
-            if gitignore_file.exists() and gitignore_file.is_file():
-                for raw in gitignore_file.read_text(
-                    encoding="utf-8", errors="ignore"
-                ).splitlines():
-                    line = raw.strip()
-                    if not line or line.startswith("#"):
-                        continue
-                    if line.startswith("!"):
-                        # Negation patterns are intentionally ignored in this minimal implementation.
-                        continue
-                    gitignore_patterns.append(line)
-
-        def _gitignore_match(
-            rel_posix_path: str, pattern: str, *, is_dir: bool
-        ) -> bool:
-            if pattern.endswith("/"):
-                if not is_dir:
-                    return False
-                pattern = pattern[:-1]
-            if "/" in pattern:
-                return fnmatch(rel_posix_path, pattern)
-            return fnmatch(Path(rel_posix_path).name, pattern)
+        # [20261018_PERF] Compiled matcher: nested .gitignore files, negation
+        # and git's excludes, evaluated per entry while walking
+        gitignore = GitignoreMatcher(root) if respect_gitignore else None
 
         def _is_gitignored(rel_path: Path, *, is_dir: bool) -> bool:
-            if not gitignore_patterns:
+            if gitignore is None:
                 return False
-            rel_posix = rel_path.as_posix().lstrip("./")
-            return any(
-                _gitignore_match(rel_posix, pat, is_dir=is_dir)
-                for pat in gitignore_patterns
-            )
+            return gitignore.entry_ignored(rel_path.as_posix(), is_dir)
 
         python_files: list[CrawlFileResult] = []
         entrypoints: list[str] = []
@@ -1159,12 +1134,14 @@ def _crawl_project_sync(
     max_depth: int | None = None,
     respect_gitignore: bool = True,
     ctx: Context | None = None,
+    analysis_mode: str = "full",
 ) -> ProjectCrawlResult:
     """Synchronous implementation of crawl_project."""
     try:
         import json
 
         from code_scalpel.analysis.project_crawler import ProjectCrawler
+        from code_scalpel.cache.change_feed import get_change_feed
 
         # [20251229_FEATURE] Enterprise: Incremental indexing with cache
         cache_file: Path | None = None
@@ -1229,6 +1206,11 @@ def _crawl_project_sync(
             max_depth=max_depth,
             respect_gitignore=respect_gitignore,
             include_extensions=include_extensions,
+            # [20261018_PERF] With a change feed watching the root, warm
+            # crawls reuse cached results for files it vouches for
+            enable_cache=get_change_feed(root_path) is not None,
+            # [20261018_PERF] summary/structure skip per-file parsing
+            mode=analysis_mode,
         )
 
         # [20251229_FEATURE] Enterprise: Optimization for 100k+ files
@@ -1795,6 +1777,7 @@ async def crawl_project(
     pattern: str | None = None,
     pattern_type: str = "regex",
     include_related: list[str] | None = None,
+    analysis_mode: str = "full",
     ctx: Any | None = None,
 ) -> ProjectCrawlResult:
     """
@@ -1845,6 +1828,8 @@ async def crawl_project(
         exclude_dirs: Additional directories to exclude (common ones already excluded)
         complexity_threshold: Complexity score that triggers a warning (default: 10)
         include_report: Include a markdown report in the response (default: True)
+        analysis_mode: "summary", "structure" or "full" per-file detail for
+            deep crawls (default: "full")
 
     Returns:
         ProjectCrawlResult with files, summary stats, complexity_hotspots, and markdown_report
@@ -1896,6 +1881,7 @@ async def crawl_project(
             max_depth,
             respect_gitignore,
             ctx,
+            analysis_mode,
         )
 
     # [20260106_FEATURE] v1.0 pre-release - Add output transparency metadata
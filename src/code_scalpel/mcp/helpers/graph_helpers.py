@@ -7,6 +7,7 @@ import re
 from pathlib import Path
 from typing import Any, TYPE_CHECKING, Set, cast
 
+from code_scalpel.analysis.source_walker import walk_source_files
 from code_scalpel.licensing.features import get_tool_capabilities
 
 # [20260213_BUGFIX] Use protocol._get_current_tier which honors CODE_SCALPEL_TIER env var
@@ -73,6 +74,19 @@ _PROJECT_MAP_JS_TS_SUFFIXES: tuple[str, ...] = (
 
 _PROJECT_MAP_JAVA_SUFFIXES: tuple[str, ...] = (".java",)
 
+# File types counted in get_project_map's language breakdown
+_PROJECT_MAP_COUNTED_TYPES: tuple[tuple[str, str], ...] = (
+    (".js", "javascript"),
+    (".ts", "typescript"),
+    (".java", "java"),
+    (".json", "json"),
+    (".yaml", "yaml"),
+    (".yml", "yaml"),
+    (".md", "markdown"),
+    (".html", "html"),
+    (".css", "css"),
+)
+
 _PROJECT_MAP_JS_TS_COMPLEXITY_PATTERN = re.compile(
     r"\b(if|for|while|switch|catch|case|function|class)\b|=>|&&|\|\|"
 )
@@ -2172,20 +2186,6 @@ def _get_project_map_sync(
                     complexity += len(node.values) - 1
             return complexity
 
-        # [20260307_FEATURE] Initial local JS/TS parity slice for get_project_map.
-        # Keep Python as the primary path, but include local JS/TS source files.
-        source_files = [
-            f
-            for f in root_path.rglob("*")
-            if f.is_file()
-            and f.suffix.lower()
-            in (
-                {".py"}
-                | set(_PROJECT_MAP_JS_TS_SUFFIXES)
-                | set(_PROJECT_MAP_JAVA_SUFFIXES)
-            )
-        ]
-
         # [20251229_BUGFIX] Filter exclusions BEFORE applying file limit
         # Previously: files were sorted/limited first, then filtered, causing
         # .venv files to dominate the limited set and then be filtered out,
@@ -2206,20 +2206,32 @@ def _get_project_map_sync(
             ".mypy_cache",
         }
 
-        # Filter out excluded directories FIRST
         # Check both exact matches and startswith for patterns like .venv-*
-        def should_exclude(file_path: Path) -> bool:
-            for part in file_path.parts:
-                # Exact match
-                if part in exclude_patterns:
-                    return True
-                # Startswith match for patterns like .venv-mcp-smoke
-                for pattern in exclude_patterns:
-                    if part.startswith(pattern):
-                        return True
-            return False
+        def should_exclude(rel_path: str) -> bool:
+            return any(
+                part.startswith(pattern)
+                for part in rel_path.split("/")
+                for pattern in exclude_patterns
+            )
 
-        source_files = [f for f in source_files if not should_exclude(f)]
+        # [20260307_FEATURE] Initial local JS/TS parity slice for get_project_map.
+        # Keep Python as the primary path, but include local JS/TS source files.
+        # [20261018_PERF] One pruned scandir walk (excluded directories are
+        # never listed) serves the analyzed sources and the file-type counts.
+        source_suffixes = (
+            {".py"} | set(_PROJECT_MAP_JS_TS_SUFFIXES) | set(_PROJECT_MAP_JAVA_SUFFIXES)
+        )
+        project_walk = walk_source_files(
+            root_path,
+            extensions=source_suffixes | {ext for ext, _ in _PROJECT_MAP_COUNTED_TYPES},
+            exclude_dirs=exclude_patterns,
+            with_size=False,
+        )
+        source_files = [
+            Path(f.path)
+            for f in project_walk.all_files()
+            if f.extension.lower() in source_suffixes and not should_exclude(f.rel_path)
+        ]
 
         # [20251226_FEATURE] Tier-aware file cap - AFTER filtering
         source_files = sorted(source_files)
@@ -2373,24 +2385,11 @@ def _get_project_map_sync(
                 languages[detected_language] = languages.get(detected_language, 0) + 1
 
         # Also count other common file types
-        for ext, lang in [
-            (".js", "javascript"),
-            (".ts", "typescript"),
-            (".java", "java"),
-            (".json", "json"),
-            (".yaml", "yaml"),
-            (".yml", "yaml"),
-            (".md", "markdown"),
-            (".html", "html"),
-            (".css", "css"),
-        ]:
-            len(list(root_path.rglob(f"*{ext}")))
-            # Exclude common ignored dirs
-            actual_count = sum(
-                1
-                for f in root_path.rglob(f"*{ext}")
-                if not any(p in exclude_patterns for p in f.parts)
-            )
+        extension_counts: dict[str, int] = {}
+        for f in project_walk.all_files():
+            extension_counts[f.extension] = extension_counts.get(f.extension, 0) + 1
+        for ext, lang in _PROJECT_MAP_COUNTED_TYPES:
+            actual_count = extension_counts.get(ext, 0)
             analyzed_count = languages.get(lang, 0)
             remainder = max(actual_count - analyzed_count, 0)
             if remainder > 0:
@@ -7,6 +7,10 @@ This module tracks how well our suggestions (self-correction hints) work:
 - suggestion_type: Categories of suggestions (symbol_typo, import_missing, etc)
 
 Metrics can be stored in-memory or persisted to file/database.
+
+[20261018_PERF] ``get_parse_cache_statistics()`` reports the shared
+parsed-artifact store (entries, estimated bytes vs. budget, hits, misses
+and evictions, overall and per artifact kind).
 """
 
 from __future__ import annotations
@@ -377,6 +381,13 @@ def get_metrics_collector() -> MetricsCollector:
     return _metrics_collector
 
 
+def get_parse_cache_statistics() -> dict[str, Any]:
+    """Get hit/miss and memory statistics of the shared parsed-artifact store."""
+    from code_scalpel.parsing.artifact_store import get_artifact_store
+
+    return get_artifact_store().get_stats()
+
+
 def set_metrics_persistence(path: Path) -> None:
     """Configure persistence path for metrics."""
     global _metrics_collector
@@ -389,5 +400,6 @@ __all__ = [
     "SuggestionMetric",
     "MetricsCollector",
     "get_metrics_collector",
+    "get_parse_cache_statistics",
     "set_metrics_persistence",
 ]
@@ -36,7 +36,6 @@ if TYPE_CHECKING:
 
 from pydantic import BaseModel, Field
 
-
 # [20251216_FEATURE] v2.5.0 - Unified sink detection MCP tool
 from code_scalpel.security.analyzers.unified_sink_detector import (
     UnifiedSinkDetector,
@@ -201,7 +200,6 @@ def _get_current_tier() -> str:
     return get_effective_tier()
 
 
-
 # [20251230_FEATURE] Support "invisible" onboarding: MCP startup can generate
 # the `.code-scalpel/` directory so users do not need to run `code-scalpel init`.
 #
@@ -4736,6 +4734,17 @@ def run_server(
     # Debug: confirm auto-init result
     _debug_print(f"DEBUG: auto_init result={init_result}")
 
+    # [20261018_PERF] Optional change feed (SCALPEL_CHANGE_FEED=1|inotify|poll):
+    # caches consult its dirty set instead of re-stat'ing the project per call
+    from code_scalpel.cache.change_feed import start_change_feed_from_env
+
+    change_feed = start_change_feed_from_env(get_project_root())
+    if change_feed is not None:
+        print(
+            f"Change feed: {change_feed.backend} on {change_feed.root}",
+            file=sys.stderr,
+        )
+
     # [20251215_BUGFIX] Print to stderr for stdio transport
     # [20260210_FEATURE] Enhanced boot display with license information
     output = sys.stderr if transport == "stdio" else sys.stdout
@@ -10,11 +10,15 @@ from typing import Any
 from importlib import import_module
 from pathlib import Path
 
-from code_scalpel.mcp.helpers.analyze_helpers import _analyze_code_sync
+from code_scalpel.mcp.helpers.analyze_helpers import (
+    _analyze_code_sync,
+    _analyze_large_file,
+)
 from code_scalpel.mcp.contract import ToolResponseEnvelope, ToolError, make_envelope
 from code_scalpel import __version__ as _pkg_version
 from code_scalpel.mcp.oracle_middleware import with_oracle_resilience, PathStrategy
 from code_scalpel.mcp.path_resolver import resolve_path
+from code_scalpel.parsing.large_files import classify_file
 from code_scalpel.mcp.protocol import _get_current_tier
 from code_scalpel.mcp.v1_1_kernel_adapter import get_adapter
 
@@ -662,6 +666,28 @@ async def analyze_code(
                     f"File size {file_size_mb:.2f} MB exceeds limit of {limit_mb} MB for {tier} tier"
                 )
 
+            # [20261018_PERF] Oversized and generated files are indexed by
+            # declarations in bounded memory instead of being read and parsed
+            large = classify_file(
+                file_path,
+                language=None if normalized_language == "auto" else normalized_language,
+            )
+            if large.large:
+                result = await asyncio.to_thread(
+                    _analyze_large_file, file_path, normalized_language, large
+                )
+                if static_tools:
+                    result.tool_findings = await asyncio.to_thread(
+                        _run_static_tools, file_path, static_tools, tier
+                    )
+                return make_envelope(
+                    data=result,
+                    tool_id="analyze_code",
+                    tool_version=_pkg_version,
+                    tier=tier,
+                    duration_ms=int((time.perf_counter() - started) * 1000),
+                )
+
             # Read the file
             with open(file_path, "r", encoding="utf-8") as f:
                 code = f.read()
@@ -33,6 +33,7 @@ async def crawl_project(
     pattern: str | None = None,
     pattern_type: str = "regex",
     include_related: list[str] | None = None,
+    analysis_mode: str = "full",
     ctx: Context | None = None,
 ) -> ToolResponseEnvelope:
     """Crawl a project directory and analyze Python files.
@@ -55,6 +56,9 @@ async def crawl_project(
         pattern: Optional pattern to filter files
         pattern_type: Type of pattern matching ("regex" or "glob", default: "regex")
         include_related: Optional list of related file types to include
+        analysis_mode: Per-file detail for deep crawls - "summary" (file and
+            line counts only), "structure" (declarations without parsing) or
+            "full" (default)
 
     **Returns:**
         ToolResponseEnvelope with crawl results:
@@ -90,6 +94,7 @@ async def crawl_project(
             pattern=pattern,
             pattern_type=pattern_type,
             include_related=include_related,
+            analysis_mode=analysis_mode,
             ctx=ctx,
         )
         duration_ms = int((time.perf_counter() - started) * 1000)
@@ -5,9 +5,29 @@ All AST parsing flows through this module, ensuring consistent behavior
 controlled by response_config.json.
 """
 
+from .artifact_store import (
+    PARSED_ARTIFACTS,
+    ArtifactKey,
+    ArtifactLease,
+    ParsedArtifactStore,
+    get_artifact_store,
+    normalize_ir,
+    parse_python_ast,
+)
+from .large_files import (
+    LargeFileIndex,
+    LargeFileInfo,
+    MemoryCeiling,
+    classify_file,
+    index_large_file,
+)
 from .unified_parser import (
     parse_python_code,
     parse_javascript_code,
+    parse_many,
+    get_parser_service,
+    ParsedFile,
+    ParserService,
     ParsingError,
     SanitizationReport,
 )
@@ -15,6 +35,22 @@ from .unified_parser import (
 __all__ = [
     "parse_python_code",
     "parse_javascript_code",
+    "parse_many",
+    "get_parser_service",
+    "ParsedFile",
+    "ParserService",
     "ParsingError",
     "SanitizationReport",
+    "PARSED_ARTIFACTS",
+    "ArtifactKey",
+    "ArtifactLease",
+    "ParsedArtifactStore",
+    "get_artifact_store",
+    "normalize_ir",
+    "parse_python_ast",
+    "LargeFileIndex",
+    "LargeFileInfo",
+    "MemoryCeiling",
+    "classify_file",
+    "index_large_file",
 ]
@@ -0,0 +1,319 @@
+"""
+Shared store of parsed artifacts (Python ASTs, tree-sitter trees, IR modules).
+
+[20261018_PERF] ``analyze_code``, ``security_scan`` and ``extract_code`` on
+the same file used to parse it once each, through different parsers and
+adapters. Every parse entry point now asks this store first:
+
+- ``parse_python_code`` / ``parse_python_ast`` (Python ``ast``),
+- ``ParserService.parse_tree`` (raw tree-sitter trees),
+- ``normalize_ir`` (IR modules from the adapters and PolyglotExtractor),
+- the Java and JavaScript adapters' native parse results.
+
+Artifacts are addressed by ArtifactKey(path, content hash, language, kind).
+A parse depends on the text alone, so the path only scopes ``invalidate``:
+the same text seen as a file by one tool and inline by another shares one
+entry.
+
+Lifetime is reference counted. ``lease()`` pins an artifact until the lease
+is released; the store evicts least recently used *unpinned* artifacts
+whenever the estimated size of everything it holds exceeds the global
+budget (``SCALPEL_PARSE_CACHE_MB``, 256 MiB by default). Pinned artifacts
+are never evicted, so the budget can be exceeded while leases are
+outstanding. Hit/miss counters are reported by ``get_stats()`` and through
+``code_scalpel.mcp.metrics.get_parse_cache_statistics()``.
+
+Artifacts are shared objects: callers must treat them as read-only.
+
+Example:
+    >>> with PARSED_ARTIFACTS.lease(key, lambda: ast.parse(code)) as tree:
+    ...     analyze(tree)
+"""
+
+from __future__ import annotations
+
+import ast
+import hashlib
+import os
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Dict, NamedTuple, Optional, Set, Tuple
+
+DEFAULT_BUDGET_BYTES = 256 * 1024 * 1024
+
+# Estimated resident bytes per source character, by artifact kind (measured
+# with tracemalloc on large files; tree-sitter trees live in C memory and
+# are far more compact than Python object graphs).
+_COST_FACTORS = {"ast": 34, "tree-sitter": 8, "ir": 24}
+_DEFAULT_COST_FACTOR = 32
+
+
+class ArtifactKey(NamedTuple):
+    """Address of a parsed artifact."""
+
+    path: str
+    content_hash: str
+    language: str
+    kind: str
+
+    @property
+    def identity(self) -> Tuple[str, str, str]:
+        """The path-independent part that identifies the artifact."""
+        return (self.content_hash, self.language, self.kind)
+
+
+class _Artifact:
+    __slots__ = ("value", "cost", "refs", "paths")
+
+    def __init__(self, value: Any, cost: int, path: str):
+        self.value = value
+        self.cost = cost
+        self.refs = 0
+        self.paths: Set[str] = {path}
+
+
+def content_hash(source: str | bytes) -> str:
+    """Digest identifying a source text in the store."""
+    if isinstance(source, str):
+        source = source.encode("utf-8", errors="surrogatepass")
+    return hashlib.blake2b(source, digest_size=16).hexdigest()
+
+
+def _kind_family(kind: str) -> str:
+    return kind.split(":", 1)[0]
+
+
+def _budget_from_env() -> int:
+    value = os.environ.get("SCALPEL_PARSE_CACHE_MB")
+    if value:
+        try:
+            return max(0, int(float(value) * 1024 * 1024))
+        except ValueError:
+            pass
+    return DEFAULT_BUDGET_BYTES
+
+
+class ArtifactLease:
+    """
+    A pinned reference to a stored artifact.
+
+    Use as a context manager, or call ``release()`` exactly once.
+    """
+
+    __slots__ = ("_store", "key", "value", "_released")
+
+    def __init__(self, store: ParsedArtifactStore, key: ArtifactKey, value: Any):
+        self._store = store
+        self.key = key
+        self.value = value
+        self._released = False
+
+    def release(self) -> None:
+        if not self._released:
+            self._released = True
+            self._store._release(self.key)
+
+    def __enter__(self) -> Any:
+        return self.value
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.release()
+
+
+class ParsedArtifactStore:
+    """
+    Process-wide, reference-counted, memory-budgeted store of parse results.
+
+    Thread-safe. Builders run outside the lock; when two threads build the
+    same artifact at once, the first one stored wins and both get it.
+    """
+
+    def __init__(self, max_bytes: Optional[int] = None):
+        self.max_bytes = _budget_from_env() if max_bytes is None else max_bytes
+        self._entries: OrderedDict[Tuple[str, str, str], _Artifact] = OrderedDict()
+        self._by_path: Dict[str, Set[Tuple[str, str, str]]] = {}
+        self._lock = threading.Lock()
+        self._bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._kind_counts: Dict[str, list[int]] = {}
+
+    @staticmethod
+    def key(
+        path: Optional[str], source: str | bytes, language: str, kind: str
+    ) -> ArtifactKey:
+        """Build the key of ``source`` parsed as ``language`` by ``kind``."""
+        return ArtifactKey(path or "<string>", content_hash(source), language, kind)
+
+    def lease(
+        self,
+        key: ArtifactKey,
+        build: Callable[[], Any],
+        *,
+        size: int = 0,
+    ) -> ArtifactLease:
+        """
+        Return a pinned lease on the artifact ``key``, building it on a miss.
+
+        Args:
+            key: Artifact address.
+            build: Produces the artifact; exceptions propagate and nothing
+                is stored.
+            size: Source length used to estimate the artifact's memory.
+        """
+        identity = key.identity
+        counts = self._kind_counts
+        with self._lock:
+            entry = self._entries.get(identity)
+            if entry is not None:
+                self._entries.move_to_end(identity)
+                entry.refs += 1
+                self._remember_path(key.path, identity, entry)
+                self.hits += 1
+                counts.setdefault(key.kind, [0, 0])[0] += 1
+                return ArtifactLease(self, key, entry.value)
+            self.misses += 1
+            counts.setdefault(key.kind, [0, 0])[1] += 1
+
+        value = build()
+        cost = size * _COST_FACTORS.get(_kind_family(key.kind), _DEFAULT_COST_FACTOR)
+        with self._lock:
+            entry = self._entries.get(identity)
+            if entry is None:
+                entry = _Artifact(value, cost, key.path)
+                self._entries[identity] = entry
+                self._by_path.setdefault(key.path, set()).add(identity)
+                self._bytes += cost
+            else:
+                self._remember_path(key.path, identity, entry)
+            entry.refs += 1
+            self._evict_locked()
+            return ArtifactLease(self, key, entry.value)
+
+    def get(
+        self,
+        key: ArtifactKey,
+        build: Callable[[], Any],
+        *,
+        size: int = 0,
+    ) -> Any:
+        """Return the artifact ``key`` without pinning it."""
+        lease = self.lease(key, build, size=size)
+        lease.release()
+        return lease.value
+
+    def invalidate(self, path: str) -> int:
+        """Drop the unpinned artifacts recorded for ``path``; return how many."""
+        dropped = 0
+        with self._lock:
+            for identity in self._by_path.pop(path, ()):
+                entry = self._entries.get(identity)
+                if entry is None:
+                    continue
+                entry.paths.discard(path)
+                if entry.refs == 0 and not entry.paths:
+                    self._drop_locked(identity, entry)
+                    dropped += 1
+        return dropped
+
+    def clear(self) -> None:
+        """Drop every unpinned artifact and reset the counters."""
+        with self._lock:
+            for identity, entry in list(self._entries.items()):
+                if entry.refs == 0:
+                    self._drop_locked(identity, entry)
+            self.hits = 0
+            self.misses = 0
+            self.evictions = 0
+            self._kind_counts.clear()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Return sizes, budget and hit/miss counters (also per kind)."""
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "pinned": sum(1 for e in self._entries.values() if e.refs),
+                "bytes": self._bytes,
+                "budget_bytes": self.max_bytes,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "by_kind": {
+                    kind: {"hits": hits, "misses": misses}
+                    for kind, (hits, misses) in sorted(self._kind_counts.items())
+                },
+            }
+
+    # ------------------------------------------------------------------
+    # Internals (called with the lock held unless noted)
+    # ------------------------------------------------------------------
+
+    def _release(self, key: ArtifactKey) -> None:
+        """Unpin one lease (takes the lock)."""
+        with self._lock:
+            entry = self._entries.get(key.identity)
+            if entry is not None and entry.refs > 0:
+                entry.refs -= 1
+                self._evict_locked()
+
+    def _remember_path(
+        self, path: str, identity: Tuple[str, str, str], entry: _Artifact
+    ) -> None:
+        if path not in entry.paths:
+            entry.paths.add(path)
+            self._by_path.setdefault(path, set()).add(identity)
+
+    def _drop_locked(self, identity: Tuple[str, str, str], entry: _Artifact) -> None:
+        del self._entries[identity]
+        self._bytes -= entry.cost
+        for path in entry.paths:
+            identities = self._by_path.get(path)
+            if identities is not None:
+                identities.discard(identity)
+                if not identities:
+                    del self._by_path[path]
+
+    def _evict_locked(self) -> None:
+        if self._bytes <= self.max_bytes:
+            return
+        for identity, entry in list(self._entries.items()):
+            if self._bytes <= self.max_bytes:
+                break
+            if entry.refs == 0:
+                self._drop_locked(identity, entry)
+                self.evictions += 1
+
+
+PARSED_ARTIFACTS = ParsedArtifactStore()
+
+
+def get_artifact_store() -> ParsedArtifactStore:
+    """Return the process-wide parsed-artifact store."""
+    return PARSED_ARTIFACTS
+
+
+def parse_python_ast(source: str, filename: Optional[str] = None) -> ast.Module:
+    """``ast.parse`` through the store (SyntaxError propagates, uncached)."""
+    key = PARSED_ARTIFACTS.key(filename, source, "python", "ast")
+    return PARSED_ARTIFACTS.get(
+        key,
+        lambda: ast.parse(source, filename=filename or "<string>"),
+        size=len(source),
+    )
+
+
+def normalize_ir(normalizer: Any, source: str, path: Optional[str] = None) -> Any:
+    """
+    ``normalizer.normalize(source)`` through the store.
+
+    The kind records the normalizer class, so the same text normalized by
+    an adapter and by PolyglotExtractor with the same normalizer is built
+    once.
+    """
+    key = PARSED_ARTIFACTS.key(
+        path, source, normalizer.language, f"ir:{type(normalizer).__name__}"
+    )
+    return PARSED_ARTIFACTS.get(
+        key, lambda: normalizer.normalize(source), size=len(source)
+    )
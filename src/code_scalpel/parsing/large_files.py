@@ -0,0 +1,573 @@
+"""
+Large-file mode: bounded-memory declaration indexing of oversized sources.
+
+[20261018_PERF] Parsing reads the whole file into a string and builds a
+full AST or tree-sitter tree, so a 30 MB generated protobuf module or
+minified bundle costs gigabytes in the MCP server (a Python AST takes about
+34 bytes per source byte). Large-file mode avoids that:
+
+- ``classify_file`` decides up front, from ``stat`` and a 64 KiB prefix,
+  whether a file is oversized (``SCALPEL_LARGE_FILE_MB``, 4 MiB by
+  default) or generated/minified (then 1 MiB is enough);
+- ``index_large_file`` memory-maps the file and parses it in chunks that
+  end at top-level declaration boundaries. tree-sitter reads each chunk
+  straight from the mapping through a read callback; Python chunks go
+  through ``ast``. Only the declaration index is kept; every tree is
+  dropped before the next chunk is parsed;
+- a MemoryCeiling (``SCALPEL_REQUEST_MEMORY_MB``, 256 MiB by default per
+  request) bounds the estimated memory of a chunk's tree plus the index.
+  Regions that cannot be parsed within it (a minified bundle is one
+  enormous line) are skipped, and the index stops growing when the budget
+  is spent. Either way the result carries warnings instead of the server
+  running out of memory.
+
+Example:
+    >>> info = classify_file("api_pb2.py")
+    >>> if info.large:
+    ...     index = index_large_file("api_pb2.py")
+    ...     index.lookup("Request")
+"""
+
+from __future__ import annotations
+
+import ast
+import mmap
+import os
+import re
+from dataclasses import dataclass, field
+from typing import Any, Callable, List, Optional, Tuple
+
+from code_scalpel.ir.normalizers.lazy import Declaration, declared_name
+
+from .artifact_store import _COST_FACTORS
+
+_MIB = 1024 * 1024
+DEFAULT_LARGE_FILE_BYTES = 4 * _MIB
+# Generated and minified files switch to large-file mode earlier
+DEFAULT_GENERATED_FILE_BYTES = 1 * _MIB
+DEFAULT_MEMORY_CEILING_BYTES = 256 * _MIB
+DEFAULT_CHUNK_BYTES = 1 * _MIB
+
+_PREFIX_BYTES = 64 * 1024
+_HEADER_BYTES = 2048
+# Estimated size of one Declaration record
+_DECLARATION_COST = 400
+# Retries that grow a chunk to the next boundary when it does not parse
+_MAX_CHUNK_RETRIES = 4
+
+_LANGUAGE_BY_EXTENSION = {
+    ".py": "python",
+    ".pyi": "python",
+    ".js": "javascript",
+    ".jsx": "javascript",
+    ".mjs": "javascript",
+    ".cjs": "javascript",
+    ".ts": "typescript",
+    ".mts": "typescript",
+    ".cts": "typescript",
+    ".tsx": "tsx",
+    ".java": "java",
+    ".go": "go",
+    ".c": "c",
+    ".h": "c",
+    ".cc": "cpp",
+    ".cpp": "cpp",
+    ".cxx": "cpp",
+    ".hpp": "cpp",
+    ".hh": "cpp",
+    ".cs": "csharp",
+    ".kt": "kotlin",
+    ".kts": "kotlin",
+    ".rb": "ruby",
+    ".rs": "rust",
+    ".php": "php",
+    ".swift": "swift",
+}
+
+_GENERATED_SUFFIXES = (
+    "_pb2.py",
+    "_pb2.pyi",
+    "_pb2_grpc.py",
+    ".pb.go",
+    ".pb.cc",
+    ".pb.h",
+    ".min.js",
+    ".min.mjs",
+    ".bundle.js",
+    ".designer.cs",
+    ".g.cs",
+)
+_GENERATED_MARKERS = (
+    b"@generated",
+    b"code generated",
+    b"do not edit",
+    b"autogenerated",
+    b"auto-generated",
+    b"generated by the protocol buffer compiler",
+)
+# Longest line / mean line length of the prefix that marks minified code
+_MINIFIED_LONGEST_LINE = 5000
+_MINIFIED_MEAN_LINE = 300
+
+_PY_DEF = re.compile(rb"^(?:async[ \t]+def|def|class)[ \t]+([A-Za-z_]\w*)", re.M)
+
+
+def _env_bytes(name: str, default: int) -> int:
+    value = os.environ.get(name)
+    if value:
+        try:
+            return max(0, int(float(value) * _MIB))
+        except ValueError:
+            pass
+    return default
+
+
+def language_for_path(path: str) -> Optional[str]:
+    """Language of ``path`` by extension (None if unknown)."""
+    return _LANGUAGE_BY_EXTENSION.get(os.path.splitext(path)[1].lower())
+
+
+@dataclass
+class LargeFileInfo:
+    """
+    Up-front classification of a source file.
+
+    Attributes:
+        size: File size in bytes.
+        generated: Why the file looks generated ("name", "marker",
+            "minified"), or None.
+        large: Whether the file should be handled in large-file mode.
+    """
+
+    path: str
+    size: int
+    language: Optional[str]
+    generated: Optional[str] = None
+    large: bool = False
+
+
+def _looks_minified(prefix: bytes) -> bool:
+    lines = prefix.split(b"\n")
+    if len(lines) == 1:
+        return len(prefix) > _MINIFIED_LONGEST_LINE
+    complete = lines[:-1]  # the last one may be cut by the prefix
+    longest = max(len(line) for line in complete)
+    mean = sum(len(line) for line in complete) / len(complete)
+    return longest > _MINIFIED_LONGEST_LINE or mean > _MINIFIED_MEAN_LINE
+
+
+def classify_file(
+    path: str | os.PathLike[str],
+    *,
+    language: Optional[str] = None,
+    threshold: Optional[int] = None,
+) -> LargeFileInfo:
+    """
+    Decide whether ``path`` needs large-file mode, without reading it all.
+
+    The name is always checked for generated-code suffixes; the prefix is
+    only read when the file is big enough for the answer to matter.
+
+    Raises:
+        OSError: The file cannot be stat'ed or read.
+    """
+    path_str = os.fspath(path)
+    size = os.stat(path_str).st_size
+    info = LargeFileInfo(
+        path=path_str,
+        size=size,
+        language=language or language_for_path(path_str),
+    )
+    if path_str.lower().endswith(_GENERATED_SUFFIXES):
+        info.generated = "name"
+
+    generated_threshold = DEFAULT_GENERATED_FILE_BYTES
+    large_threshold = (
+        threshold
+        if threshold is not None
+        else _env_bytes("SCALPEL_LARGE_FILE_MB", DEFAULT_LARGE_FILE_BYTES)
+    )
+    if size >= min(generated_threshold, large_threshold) and info.generated is None:
+        with open(path_str, "rb") as f:
+            prefix = f.read(_PREFIX_BYTES)
+        header = prefix[:_HEADER_BYTES].lower()
+        if any(marker in header for marker in _GENERATED_MARKERS):
+            info.generated = "marker"
+        elif _looks_minified(prefix):
+            info.generated = "minified"
+
+    info.large = size >= large_threshold or (
+        info.generated is not None and size >= generated_threshold
+    )
+    return info
+
+
+class MemoryCeiling:
+    """
+    Per-request budget of estimated parse memory.
+
+    Estimates use the parsed-artifact store's bytes-per-source-byte factors;
+    nothing is measured, so the check costs nothing.
+    """
+
+    def __init__(self, limit_bytes: Optional[int] = None):
+        self.limit_bytes = (
+            _env_bytes("SCALPEL_REQUEST_MEMORY_MB", DEFAULT_MEMORY_CEILING_BYTES)
+            if limit_bytes is None
+            else limit_bytes
+        )
+        self.used = 0
+        self.peak = 0
+
+    @property
+    def remaining(self) -> int:
+        return max(0, self.limit_bytes - self.used)
+
+    def reserve(self, nbytes: int) -> bool:
+        """Account ``nbytes``; False (and nothing reserved) if they do not fit."""
+        if nbytes > self.remaining:
+            return False
+        self.used += nbytes
+        self.peak = max(self.peak, self.used)
+        return True
+
+    def release(self, nbytes: int) -> None:
+        self.used = max(0, self.used - nbytes)
+
+
+@dataclass
+class LargeFileIndex:
+    """
+    Declaration index of a file parsed in large-file mode.
+
+    Attributes:
+        declarations: Top-level declarations and their class-level members,
+            in source order (Declaration.node is always None).
+        chunks: Number of chunks parsed.
+        truncated: The memory ceiling stopped indexing before the end.
+        warnings: What was skipped or approximated, for the caller to
+            surface.
+    """
+
+    path: str
+    language: Optional[str]
+    size: int
+    lines: int = 0
+    declarations: List[Declaration] = field(default_factory=list)
+    generated: Optional[str] = None
+    chunks: int = 0
+    truncated: bool = False
+    warnings: List[str] = field(default_factory=list)
+
+    def lookup(self, qualified_name: str) -> List[Declaration]:
+        """Declarations named ``qualified_name`` (``Class.member`` for members)."""
+        return [d for d in self.declarations if d.qualified_name == qualified_name]
+
+
+class _ChunkBytes:
+    """Chunk-relative byte slicing over the mapping (for ``declared_name``)."""
+
+    __slots__ = ("_mm", "_start")
+
+    def __init__(self, mm: mmap.mmap, start: int):
+        self._mm = mm
+        self._start = start
+
+    def __getitem__(self, item: slice) -> bytes:
+        return self._mm[self._start + item.start : self._start + item.stop]
+
+
+def _count_lines(mm: mmap.mmap, size: int) -> int:
+    lines = 0
+    for offset in range(0, size, DEFAULT_CHUNK_BYTES):
+        lines += mm[offset : offset + DEFAULT_CHUNK_BYTES].count(b"\n")
+    if size and mm[size - 1 : size] != b"\n":
+        lines += 1
+    return lines
+
+
+def _is_boundary(mm: mmap.mmap, line_start: int, size: int) -> bool:
+    """Whether a top-level declaration can start at ``line_start``."""
+    if line_start >= size:
+        return True
+    first = mm[line_start : line_start + 1]
+    if first in (b" ", b"\t", b"\r", b"\n", b"}", b")", b"]", b".", b","):
+        return False
+    # The previous line must be blank or close a statement
+    prev_end = line_start - 1
+    prev_start = mm.rfind(b"\n", 0, prev_end) + 1
+    previous = mm[prev_start:prev_end].strip()
+    return not previous or previous.endswith((b"}", b";"))
+
+
+def _next_boundary(mm: mmap.mmap, offset: int, size: int, limit: int) -> Optional[int]:
+    """
+    First boundary at or after ``offset`` and before ``limit``.
+
+    The end of the file counts as a boundary when ``limit`` reaches it;
+    otherwise None is returned when no boundary lies before ``limit``.
+    """
+    if offset >= size:
+        return size
+    pos = mm.find(b"\n", offset, min(size, limit))
+    while pos >= 0:
+        if _is_boundary(mm, pos + 1, size):
+            return pos + 1
+        pos = mm.find(b"\n", pos + 1, min(size, limit))
+    return size if limit >= size else None
+
+
+def _python_chunk(
+    data: bytes, base_byte: int, base_line: int
+) -> Tuple[List[Declaration], bool]:
+    try:
+        tree = ast.parse(data.decode("utf-8", errors="replace"))
+    except (SyntaxError, ValueError):
+        return [], False
+    line_starts = [0]
+    pos = data.find(b"\n")
+    while pos >= 0:
+        line_starts.append(pos + 1)
+        pos = data.find(b"\n", pos + 1)
+
+    def offset(line: int, col: int) -> int:
+        return base_byte + line_starts[line - 1] + col
+
+    def make(node: Any, parent: Optional[Declaration]) -> Declaration:
+        is_class = isinstance(node, ast.ClassDef)
+        return Declaration(
+            name=node.name,
+            qualified_name=f"{parent.name}.{node.name}" if parent else node.name,
+            node_type="class_definition" if is_class else "function_definition",
+            start_byte=offset(node.lineno, node.col_offset),
+            end_byte=offset(node.end_lineno, node.end_col_offset),
+            start_line=node.lineno + base_line,
+            end_line=node.end_lineno + base_line,
+            parent=parent,
+        )
+
+    found: List[Declaration] = []
+    definitions = (ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef)
+    for node in tree.body:
+        if not isinstance(node, definitions):
+            continue
+        top = make(node, None)
+        found.append(top)
+        if isinstance(node, ast.ClassDef):
+            found.extend(
+                make(member, top)
+                for member in node.body
+                if isinstance(member, definitions)
+            )
+    return found, True
+
+
+def _python_scan(data: bytes, base_byte: int, base_line: int) -> List[Declaration]:
+    """Column-0 ``def``/``class`` lines of a chunk ``ast`` could not parse."""
+    found = []
+    for match in _PY_DEF.finditer(data):
+        line = data.count(b"\n", 0, match.start()) + 1 + base_line
+        name = match.group(1).decode("utf-8", errors="replace")
+        found.append(
+            Declaration(
+                name=name,
+                qualified_name=name,
+                node_type=(
+                    "class_definition"
+                    if match.group(0).startswith(b"class")
+                    else "function_definition"
+                ),
+                start_byte=base_byte + match.start(),
+                end_byte=base_byte + match.end(),
+                start_line=line,
+                end_line=line,
+            )
+        )
+    return found
+
+
+def _tree_sitter_chunk(
+    parser: Any, mm: mmap.mmap, start: int, end: int, base_line: int
+) -> Tuple[List[Declaration], bool]:
+    def read(byte: int, point: Any) -> bytes:
+        offset = start + byte
+        return mm[offset : min(offset + 65536, end)] if offset < end else b""
+
+    tree = parser.parse(read)
+    root = tree.root_node
+    data = _ChunkBytes(mm, start)
+
+    def make(node: Any, parent: Optional[Declaration]) -> Optional[Declaration]:
+        name = declared_name(node, data)  # type: ignore[arg-type]
+        if not name:
+            return None
+        return Declaration(
+            name=name,
+            qualified_name=f"{parent.name}.{name}" if parent else name,
+            node_type=node.type,
+            start_byte=start + node.start_byte,
+            end_byte=start + node.end_byte,
+            start_line=node.start_point[0] + 1 + base_line,
+            end_line=node.end_point[0] + 1 + base_line,
+            parent=parent,
+        )
+
+    found: List[Declaration] = []
+    for node in root.named_children:
+        top = make(node, None)
+        if top is None:
+            continue
+        found.append(top)
+        inner = node.child_by_field_name("declaration") or node
+        if "function" in inner.type or "method" in inner.type:
+            continue
+        body = inner.child_by_field_name("body")
+        if body is not None:
+            for member in body.named_children:
+                decl = make(member, top)
+                if decl is not None:
+                    found.append(decl)
+    return found, not root.has_error
+
+
+_ChunkParser = Callable[[int, int, int, mmap.mmap], Tuple[List[Declaration], bool]]
+
+
+def _truncate(
+    index: LargeFileIndex, path: str, base_line: int, ceiling: MemoryCeiling
+) -> None:
+    index.truncated = True
+    index.warnings.append(
+        f"Declaration index of {path} truncated at line {base_line + 1}: "
+        f"memory ceiling ({ceiling.limit_bytes // _MIB} MiB) reached"
+    )
+
+
+def index_large_file(
+    path: str | os.PathLike[str],
+    *,
+    language: Optional[str] = None,
+    ceiling: Optional[MemoryCeiling] = None,
+    chunk_bytes: int = DEFAULT_CHUNK_BYTES,
+    info: Optional[LargeFileInfo] = None,
+) -> LargeFileIndex:
+    """
+    Build the declaration index of ``path`` chunk by chunk within ``ceiling``.
+
+    Args:
+        path: Source file.
+        language: Override the language taken from the extension.
+        ceiling: Memory budget of the request (a fresh default one if None).
+        chunk_bytes: Target chunk size; chunks end at the next top-level
+            boundary and never exceed what the ceiling allows.
+        info: A classification already made for ``path``.
+
+    Returns:
+        LargeFileIndex; problems are reported in ``warnings``, not raised
+        (except OSError when the file cannot be read).
+    """
+    path_str = os.fspath(path)
+    info = info or classify_file(path_str, language=language)
+    language = language or info.language
+    ceiling = ceiling or MemoryCeiling()
+    index = LargeFileIndex(
+        path=path_str, language=language, size=info.size, generated=info.generated
+    )
+    if info.size == 0:
+        return index
+
+    parse_chunk: _ChunkParser
+    if language == "python":
+        factor = _COST_FACTORS["ast"]
+
+        def parse_python(start, end, base_line, mm):
+            return _python_chunk(mm[start:end], start, base_line)
+
+        parse_chunk = parse_python
+
+    else:
+        factor = _COST_FACTORS["tree-sitter"]
+        try:
+            from .unified_parser import ParsingError, get_parser_service
+
+            parser = get_parser_service().parser(language or "")
+        except (ParsingError, ImportError) as e:
+            index.warnings.append(f"No declaration index for {path_str}: {e}")
+            with (
+                open(path_str, "rb") as f,
+                mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm,
+            ):
+                index.lines = _count_lines(mm, info.size)
+            return index
+
+        def parse_tree_sitter(start, end, base_line, mm):
+            return _tree_sitter_chunk(parser, mm, start, end, base_line)
+
+        parse_chunk = parse_tree_sitter
+
+    with (
+        open(path_str, "rb") as f,
+        mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm,
+    ):
+        size = info.size
+        index.lines = _count_lines(mm, size)
+        start = base_line = 0
+        while start < size:
+            # The index itself draws on the budget, so chunks shrink as it grows
+            max_chunk = ceiling.remaining // factor
+            target = max(1, min(chunk_bytes, max_chunk))
+            limit = start + max_chunk
+            end = _next_boundary(mm, start + target, size, limit)
+            if end is None:
+                # Nothing between the target and the limit: stop at the first
+                # boundary before the target instead
+                end = _next_boundary(mm, start + 1, size, start + target)
+            if end is None:
+                # The construct starting here does not fit; find where it ends
+                region_end = _next_boundary(mm, limit, size, size) or size
+                if region_end - start <= ceiling.limit_bytes // factor:
+                    # It would fit in a fresh budget: this one is spent
+                    _truncate(index, path_str, base_line, ceiling)
+                    break
+                index.warnings.append(
+                    f"Skipped bytes {start}-{region_end} of {path_str}: a "
+                    f"declaration larger than the memory ceiling "
+                    f"({ceiling.limit_bytes // _MIB} MiB)"
+                )
+                base_line += mm[start:region_end].count(b"\n")
+                start = region_end
+                continue
+
+            # A chunk that does not parse on its own (a boundary guess inside
+            # a multi-line construct) is grown to the next boundary
+            ceiling.reserve((end - start) * factor)
+            decls, ok = parse_chunk(start, end, base_line, mm)
+            retries = 0
+            while not ok and end < size and retries < _MAX_CHUNK_RETRIES:
+                grown = _next_boundary(mm, end + 1, size, limit)
+                if grown is None:
+                    break
+                ceiling.release((end - start) * factor)
+                ceiling.reserve((grown - start) * factor)
+                end = grown
+                decls, ok = parse_chunk(start, end, base_line, mm)
+                retries += 1
+            ceiling.release((end - start) * factor)
+            chunk_lines = mm[start:end].count(b"\n")
+            if not ok:
+                if language == "python":
+                    decls = _python_scan(mm[start:end], start, base_line)
+                index.warnings.append(
+                    f"Lines {base_line + 1}-{base_line + chunk_lines} of "
+                    f"{path_str} did not parse cleanly; declarations there "
+                    f"are approximate"
+                )
+
+            index.chunks += 1
+            if not ceiling.reserve(len(decls) * _DECLARATION_COST):
+                _truncate(index, path_str, base_line, ceiling)
+                break
+            index.declarations.extend(decls)
+            base_line += chunk_lines
+            start = end
+    return index
@@ -3,19 +3,37 @@ Unified parsing with deterministic error handling.
 
 All parsing behavior controlled by .code-scalpel/response_config.json.
 This ensures deterministic results: same input + same config = same output.
+
+[20261018_PERF] Parsing goes through a process-wide ParserService. It loads
+the configuration once and reloads it only when the config file's mtime or
+size changes, keeps one tree-sitter parser per language per thread, and
+offers ``parse_many(paths)`` for project-wide batches. The per-file cost is
+then the parse itself.
+
+[20261018_PERF] Python ASTs and tree-sitter trees come from the shared
+parsed-artifact store (``artifact_store.py``), so tools parsing the same
+text reuse one tree.
 """
 
 from __future__ import annotations
 
 import ast
+import importlib
 import json
+import os
+import threading
 import warnings
+from collections.abc import Iterable, Sequence
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any
 
 from code_scalpel.utilities.source_sanitizer import sanitize_python_source
 
+from .artifact_store import PARSED_ARTIFACTS, parse_python_ast
+from .large_files import classify_file
+
 
 @dataclass
 class SanitizationReport:
@@ -52,17 +70,29 @@ class ParsingError(ValueError):
         self.suggestion = suggestion
 
 
-def _load_parsing_config() -> ParsingConfig:
+_CONFIG_RELATIVE_PATH = Path(".code-scalpel/response_config.json")
+# Package root fallback
+_PACKAGE_CONFIG_PATH = (
+    Path(__file__).parent.parent.parent.parent
+    / ".code-scalpel"
+    / "response_config.json"
+)
+
+
+def _config_path() -> Path | None:
+    """Return the response_config.json in effect (workspace first), if any."""
+    for config_path in (_CONFIG_RELATIVE_PATH, _PACKAGE_CONFIG_PATH):
+        if config_path.exists():
+            return config_path
+    return None
+
+
+def _load_parsing_config(config_path: Path | None = None) -> ParsingConfig:
     """Load parsing configuration from response_config.json."""
     try:
-        # Look for config in workspace root
-        config_path = Path(".code-scalpel/response_config.json")
-        if not config_path.exists():
-            # Fallback to package root
-            package_root = Path(__file__).parent.parent.parent.parent
-            config_path = package_root / ".code-scalpel" / "response_config.json"
-
-        if not config_path.exists():
+        # Look for config in workspace root, then package root
+        config_path = config_path or _config_path()
+        if config_path is None:
             return ParsingConfig()  # Use defaults
 
         with open(config_path) as f:
@@ -82,6 +112,272 @@ def _load_parsing_config() -> ParsingConfig:
         return ParsingConfig()
 
 
+# Languages parse_many detects from file extensions
+_EXTENSION_LANGUAGES = {
+    ".py": "python",
+    ".pyi": "python",
+    ".js": "javascript",
+    ".jsx": "javascript",
+    ".mjs": "javascript",
+    ".cjs": "javascript",
+    ".ts": "typescript",
+    ".mts": "typescript",
+    ".cts": "typescript",
+    ".tsx": "tsx",
+}
+
+# Language -> (grammar module, function returning the language pointer)
+_TREE_SITTER_GRAMMARS = {
+    "javascript": ("tree_sitter_javascript", "language"),
+    "typescript": ("tree_sitter_typescript", "language_typescript"),
+    "tsx": ("tree_sitter_typescript", "language_tsx"),
+    "java": ("tree_sitter_java", "language"),
+    "go": ("tree_sitter_go", "language"),
+    "c": ("tree_sitter_c", "language"),
+    "cpp": ("tree_sitter_cpp", "language"),
+    "csharp": ("tree_sitter_c_sharp", "language"),
+    "kotlin": ("tree_sitter_kotlin", "language"),
+    "ruby": ("tree_sitter_ruby", "language"),
+    "rust": ("tree_sitter_rust", "language"),
+    "php": ("tree_sitter_php", "language_php"),
+    "swift": ("tree_sitter_swift", "language"),
+}
+
+
+@dataclass
+class ParsedFile:
+    """Result of parsing one file in a :meth:`ParserService.parse_many` batch."""
+
+    path: str
+    language: str | None
+    tree: Any = None
+    report: SanitizationReport | None = None
+    error: ParsingError | None = None
+
+    @property
+    def success(self) -> bool:
+        return self.error is None
+
+
+class ParserService:
+    """
+    Process-wide parsing front end.
+
+    - ``config()`` returns the cached ParsingConfig and re-reads
+      response_config.json only when the file in effect (or its mtime/size)
+      changes.
+    - ``parser(language)`` returns a tree-sitter parser owned by the calling
+      thread, created once per language per thread; Language objects are
+      shared.
+    - ``parse_many(paths)`` parses a batch of files against one config
+      snapshot, optionally on a thread pool.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._config: ParsingConfig | None = None
+        self._config_stamp: tuple[str, int, int] | None = None
+        self._languages: dict[str, Any] = {}
+        self._local = threading.local()
+
+    # ------------------------------------------------------------------
+    # Configuration
+    # ------------------------------------------------------------------
+
+    def config(self) -> ParsingConfig:
+        """Return the parsing config, reloading it if the file changed."""
+        config_path: Path | None = None
+        stamp = None
+        for candidate in (_CONFIG_RELATIVE_PATH, _PACKAGE_CONFIG_PATH):
+            try:
+                stat = os.stat(candidate)
+            except OSError:
+                continue
+            config_path = candidate
+            stamp = (os.path.abspath(candidate), stat.st_mtime_ns, stat.st_size)
+            break
+        config = self._config
+        if config is not None and stamp == self._config_stamp:
+            return config
+        with self._lock:
+            if self._config is None or stamp != self._config_stamp:
+                self._config = _load_parsing_config(config_path)
+                self._config_stamp = stamp
+            return self._config
+
+    def invalidate(self) -> None:
+        """Drop the cached config so the next call re-reads it."""
+        with self._lock:
+            self._config = None
+            self._config_stamp = None
+
+    # ------------------------------------------------------------------
+    # Parsers
+    # ------------------------------------------------------------------
+
+    def _language(self, language: str) -> Any:
+        lang = self._languages.get(language)
+        if lang is not None:
+            return lang
+        grammar = _TREE_SITTER_GRAMMARS.get(language)
+        if grammar is None:
+            raise ParsingError(f"No tree-sitter parser for language: {language}")
+        try:
+            from tree_sitter import Language
+
+            module_name, function = grammar
+            module = importlib.import_module(module_name)
+            lang = Language(getattr(module, function)())
+        except ImportError as e:
+            raise ParsingError(
+                f"Tree-sitter not available: {e}",
+                suggestion=(
+                    "Install tree-sitter: pip install tree-sitter "
+                    f"{grammar[0].replace('_', '-')}"
+                ),
+            ) from e
+        with self._lock:
+            return self._languages.setdefault(language, lang)
+
+    def is_available(self, language: str) -> bool:
+        """Whether tree-sitter and the grammar for ``language`` are installed."""
+        try:
+            self._language(language)
+        except ParsingError:
+            return False
+        return True
+
+    def parser(self, language: str) -> Any:
+        """Return the calling thread's tree-sitter parser for ``language``."""
+        parsers = getattr(self._local, "parsers", None)
+        if parsers is None:
+            parsers = self._local.parsers = {}
+        parser = parsers.get(language)
+        if parser is None:
+            from tree_sitter import Parser
+
+            parser = parsers[language] = Parser(self._language(language))
+        return parser
+
+    def parse_tree(self, code: str, language: str, path: str | None = None) -> Any:
+        """
+        Return the tree-sitter tree of ``code``, shared through the store.
+
+        The tree is not validated; ``_parse_tree_sitter`` applies the
+        configured error policy on top.
+        """
+        key = PARSED_ARTIFACTS.key(path, code, language, "tree-sitter")
+        return PARSED_ARTIFACTS.get(
+            key,
+            lambda: self.parser(language).parse(bytes(code, "utf-8")),
+            size=len(code),
+        )
+
+    # ------------------------------------------------------------------
+    # Batch parsing
+    # ------------------------------------------------------------------
+
+    def parse_file(
+        self,
+        path: str | os.PathLike[str],
+        *,
+        language: str | None = None,
+        config: ParsingConfig | None = None,
+    ) -> ParsedFile:
+        """
+        Parse one file; errors are returned in the result, not raised.
+
+        Files that ``classify_file`` puts in large-file mode are not parsed:
+        those of ``SCALPEL_LARGE_FILE_MB`` or more, and generated or minified
+        files from 1 MiB. Their result carries a ParsingError pointing at
+        ``index_large_file``.
+        """
+        path_str = os.fspath(path)
+        language = language or _EXTENSION_LANGUAGES.get(
+            os.path.splitext(path_str)[1].lower()
+        )
+        result = ParsedFile(path=path_str, language=language)
+        if language is None:
+            result.error = ParsingError(f"Unsupported file type: {path_str}")
+            return result
+        config = config or self.config()
+        try:
+            info = classify_file(path_str, language=language)
+            if info.large:
+                kind = f"generated ({info.generated}) " if info.generated else ""
+                result.error = ParsingError(
+                    f"{path_str} is a large {kind}file "
+                    f"({info.size / (1024 * 1024):.1f} MiB); not parsed in full",
+                    suggestion="Use index_large_file() for its declaration index",
+                )
+                return result
+            with open(path_str, encoding="utf-8") as f:
+                code = f.read()
+            if language == "python":
+                result.tree, result.report = parse_python_code(
+                    code, filename=path_str, config=config
+                )
+            else:
+                result.tree, result.report = _parse_tree_sitter(
+                    self, code, language, config, path_str
+                )
+        except ParsingError as e:
+            result.error = e
+        except (OSError, UnicodeDecodeError) as e:
+            result.error = ParsingError(f"Cannot read {path_str}: {e}")
+        return result
+
+    def parse_many(
+        self,
+        paths: Iterable[str | os.PathLike[str]],
+        *,
+        language: str | None = None,
+        max_workers: int | None = None,
+    ) -> list[ParsedFile]:
+        """
+        Parse a batch of files against a single config snapshot.
+
+        Args:
+            paths: Files to parse; the language is taken from the extension
+                unless ``language`` is given.
+            language: Force one language for every file.
+            max_workers: Parse on a thread pool of this size (each worker
+                thread keeps its own parsers). Sequential when None or 1.
+
+        Returns:
+            One ParsedFile per path, in input order.
+        """
+        config = self.config()
+        paths = list(paths)
+        if not max_workers or max_workers <= 1 or len(paths) <= 1:
+            return [self.parse_file(p, language=language, config=config) for p in paths]
+        with ThreadPoolExecutor(max_workers=max_workers) as pool:
+            return list(
+                pool.map(
+                    lambda p: self.parse_file(p, language=language, config=config),
+                    paths,
+                )
+            )
+
+
+_PARSER_SERVICE = ParserService()
+
+
+def get_parser_service() -> ParserService:
+    """Return the process-wide parser service."""
+    return _PARSER_SERVICE
+
+
+def parse_many(
+    paths: Sequence[str | os.PathLike[str]],
+    *,
+    language: str | None = None,
+    max_workers: int | None = None,
+) -> list[ParsedFile]:
+    """Parse a batch of files with the process-wide parser service."""
+    return _PARSER_SERVICE.parse_many(paths, language=language, max_workers=max_workers)
+
+
 def parse_python_code(
     code: str,
     *,
@@ -125,7 +421,7 @@ def parse_python_code(
 
     [20260119_FEATURE] Added filename parameter for better error context in MCP tools.
     """
-    config = config or _load_parsing_config()
+    config = config or _PARSER_SERVICE.config()
     report = SanitizationReport(was_sanitized=False)
 
     def _format_location(lineno: int | None) -> str | None:
@@ -138,7 +434,7 @@ def parse_python_code(
 
     # Try direct parse first
     try:
-        tree = ast.parse(code, filename=filename or "<string>")
+        tree = parse_python_ast(code, filename)
         return tree, report
 
     except SyntaxError as e:
@@ -208,7 +504,7 @@ def parse_python_code(
 
         # Parse sanitized code
         try:
-            tree = ast.parse(sanitized, filename=filename or "<string>")
+            tree = parse_python_ast(sanitized, filename)
             return tree, report
         except SyntaxError as e2:
             raise ParsingError(
@@ -234,28 +530,22 @@ def parse_javascript_code(
     Raises:
         ParsingError: When tree-sitter detects ERROR nodes (in strict mode)
     """
-    config = config or _load_parsing_config()
-    report = SanitizationReport(was_sanitized=False)
-
-    try:
-        from tree_sitter import Language, Parser
-
-        if is_typescript:
-            import tree_sitter_typescript as ts_ts
-
-            lang = Language(ts_ts.language_typescript())
-        else:
-            import tree_sitter_javascript as ts_js
+    language = "typescript" if is_typescript else "javascript"
+    return _parse_tree_sitter(
+        _PARSER_SERVICE, code, language, config or _PARSER_SERVICE.config()
+    )
 
-            lang = Language(ts_js.language())
-    except ImportError as e:
-        raise ParsingError(
-            f"Tree-sitter not available: {e}",
-            suggestion="Install tree-sitter: pip install tree-sitter tree-sitter-javascript",
-        ) from e
 
-    parser = Parser(lang)
-    tree = parser.parse(bytes(code, "utf-8"))
+def _parse_tree_sitter(
+    service: ParserService,
+    code: str,
+    language: str,
+    config: ParsingConfig,
+    path: str | None = None,
+) -> tuple[Any, SanitizationReport]:
+    """Parse with the calling thread's cached parser and validate ERROR nodes."""
+    report = SanitizationReport(was_sanitized=False)
+    tree = service.parse_tree(code, language, path)
 
     # Check for ERROR nodes (tree-sitter never raises exceptions)
     if config.mode == "strict" and tree.root_node.has_error:
@@ -290,4 +580,4 @@ def _find_first_error_node(node: Any) -> Any | None:
 # Backward compatibility aliases
 def get_parsing_config() -> ParsingConfig:
     """Get current parsing configuration."""
-    return _load_parsing_config()
+    return _PARSER_SERVICE.config()
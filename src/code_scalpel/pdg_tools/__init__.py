@@ -13,15 +13,30 @@ from .analyzer import (
     PDGAnalyzer,
     SecurityVulnerability,
 )
-from .builder import NodeType, PDGBuilder, Scope, build_pdg
+from .builder import NodeType, PDGBuilder, Scope, build_compact_pdg, build_pdg
+from .compact import CompactPDG
+from .sdg import (
+    FunctionSummary,
+    InterproceduralSlice,
+    SummaryCache,
+    SystemDependenceGraph,
+)
+from .slice_cache import SliceCache, get_slice_cache
 from .slicer import ProgramSlicer, SliceInfo, SliceType, SlicingCriteria
 
 __all__ = [
     # Builder
     "PDGBuilder",
     "build_pdg",
+    "build_compact_pdg",
     "NodeType",
     "Scope",
+    # Compact backend
+    "CompactPDG",
+    "SystemDependenceGraph",
+    "InterproceduralSlice",
+    "FunctionSummary",
+    "SummaryCache",
     # Analyzer
     "PDGAnalyzer",
     "DependencyType",
@@ -32,4 +47,6 @@ __all__ = [
     "SlicingCriteria",
     "SliceType",
     "SliceInfo",
+    "SliceCache",
+    "get_slice_cache",
 ]
@@ -2,10 +2,12 @@ import ast
 from collections import defaultdict
 from dataclasses import dataclass
 from enum import Enum
-from typing import Optional
+from typing import Optional, Union
 
 import networkx as nx
 
+from .compact import CompactPDG, PDGRecorder
+
 
 class NodeType(Enum):
     """Types of nodes in the PDG."""
@@ -38,11 +40,43 @@ class Scope:
             self.variables = {}
 
 
+class _PDGDiGraph(nx.DiGraph):
+    """DiGraph that remembers the most recently inserted node."""
+
+    last_node: Optional[str] = None
+
+    def add_node(self, node_for_adding, **attr):
+        if node_for_adding not in self:
+            self.last_node = node_for_adding
+        super().add_node(node_for_adding, **attr)
+
+    def add_edge(self, u_of_edge, v_of_edge, **attr):
+        new = [n for n in (u_of_edge, v_of_edge) if n not in self]
+        super().add_edge(u_of_edge, v_of_edge, **attr)
+        if new:
+            self.last_node = new[-1]
+
+
 class PDGBuilder(ast.NodeVisitor):
     """Enhanced Program Dependence Graph Builder."""
 
-    def __init__(self, track_constants: bool = True, interprocedural: bool = True):
-        self.graph = nx.DiGraph()
+    def __init__(
+        self,
+        track_constants: bool = True,
+        interprocedural: bool = True,
+        sdg_mode: bool = False,
+    ):
+        """
+        Args:
+            track_constants: Whether to track constant values
+            interprocedural: Whether to perform interprocedural analysis
+            sdg_mode: Record the extra structure SystemDependenceGraph needs
+                for summary edges: parameters registered as definitions,
+                return nodes, and call-argument variables routed through
+                their call node. Off by default so existing PDG consumers
+                see the same graph shape.
+        """
+        self.graph: Union[_PDGDiGraph, PDGRecorder] = _PDGDiGraph()
         self.scopes: list[Scope] = []
         self.control_deps: list[str] = []
         self.loop_deps: list[str] = []
@@ -50,14 +84,36 @@ class PDGBuilder(ast.NodeVisitor):
         self.call_graph: nx.DiGraph = nx.DiGraph()
         self.track_constants = track_constants
         self.interprocedural = interprocedural
+        self.sdg_mode = sdg_mode
         self.current_function: Optional[str] = None
         self.node_counter = defaultdict(int)
 
     def build(self, code: str) -> tuple[nx.DiGraph, nx.DiGraph]:
         """Build PDG and call graph from code."""
+        if not isinstance(self.graph, _PDGDiGraph):
+            self.graph = _PDGDiGraph()
+        graph = self.graph
         tree = ast.parse(code)
         self.visit(tree)
-        return self.graph, self.call_graph
+        return graph, self.call_graph
+
+    def build_compact(self, code: Union[str, ast.AST]) -> tuple[CompactPDG, nx.DiGraph]:
+        """
+        Build an array-backed PDG and call graph from code.
+
+        [20261018_PERF] Records nodes and edges into a PDGRecorder instead of
+        a networkx graph and freezes it into a CompactPDG, avoiding networkx
+        overhead for large functions. Use CompactPDG.to_networkx() when a
+        DiGraph is required.
+
+        Args:
+            code: Source code, or an already-parsed AST node (e.g. a single
+                FunctionDef) to build from without re-parsing.
+        """
+        self.graph = PDGRecorder()
+        tree = ast.parse(code) if isinstance(code, str) else code
+        self.visit(tree)
+        return self.graph.freeze(), self.call_graph
 
     def visit_Module(self, node: ast.Module):
         """Handle module-level code by creating a module scope."""
@@ -98,6 +154,7 @@ class PDGBuilder(ast.NodeVisitor):
             args=[arg.arg for arg in node.args.args],
             returns=ast.unparse(node.returns) if node.returns else None,
             lineno=node.lineno,
+            end_lineno=getattr(node, "end_lineno", None),
         )
 
         # Add to call graph
@@ -119,13 +176,18 @@ class PDGBuilder(ast.NodeVisitor):
                 arg_id, type="parameter", name=arg.arg, lineno=arg.lineno
             )
             self.graph.add_edge(node_id, arg_id, type="parameter_dependency")
-            if scope and scope.variables:
+            # variables starts as an empty (falsy) dict, so the truthiness
+            # check never registers parameters; SDG summaries need them.
+            if self.sdg_mode:
+                if scope.variables is not None:
+                    scope.variables[arg.arg] = arg_id
+            elif scope and scope.variables:
                 scope.variables[arg.arg] = arg_id
 
         # Process function body
         for stmt in node.body:
             self.visit(stmt)
-            stmt_id = list(self.graph.nodes)[-1]
+            stmt_id = self._last_node_id()
             self.graph.add_edge(node_id, stmt_id, type="control_dependency")
 
         # Exit function scope
@@ -155,13 +217,13 @@ class PDGBuilder(ast.NodeVisitor):
         # Process if body
         for stmt in node.body:
             self.visit(stmt)
-            stmt_id = list(self.graph.nodes)[-1]
+            stmt_id = self._last_node_id()
             self.graph.add_edge(node_id, stmt_id, type="control_dependency")
 
         # Process else/elif body
         for stmt in node.orelse:
             self.visit(stmt)
-            stmt_id = list(self.graph.nodes)[-1]
+            stmt_id = self._last_node_id()
             self.graph.add_edge(node_id, stmt_id, type="control_dependency")
 
         # Exit control context
@@ -188,7 +250,7 @@ class PDGBuilder(ast.NodeVisitor):
         # Process class body
         for stmt in node.body:
             self.visit(stmt)
-            stmt_id = list(self.graph.nodes)[-1]
+            stmt_id = self._last_node_id()
             self.graph.add_edge(node_id, stmt_id, type="control_dependency")
 
         # Exit class scope
@@ -222,7 +284,7 @@ class PDGBuilder(ast.NodeVisitor):
         # Process loop body
         for stmt in node.body:
             self.visit(stmt)
-            stmt_id = list(self.graph.nodes)[-1]
+            stmt_id = self._last_node_id()
             self.graph.add_edge(node_id, stmt_id, type="control_dependency")
             self.graph.add_edge(node_id, stmt_id, type="loop_dependency")
 
@@ -230,7 +292,7 @@ class PDGBuilder(ast.NodeVisitor):
         if node.orelse:
             for stmt in node.orelse:
                 self.visit(stmt)
-                stmt_id = list(self.graph.nodes)[-1]
+                stmt_id = self._last_node_id()
                 self.graph.add_edge(node_id, stmt_id, type="control_dependency")
 
         # Exit loop context
@@ -261,7 +323,7 @@ class PDGBuilder(ast.NodeVisitor):
         # Process loop body
         for stmt in node.body:
             self.visit(stmt)
-            stmt_id = list(self.graph.nodes)[-1]
+            stmt_id = self._last_node_id()
             self.graph.add_edge(node_id, stmt_id, type="control_dependency")
             self.graph.add_edge(node_id, stmt_id, type="loop_dependency")
 
@@ -283,7 +345,7 @@ class PDGBuilder(ast.NodeVisitor):
         # Process try body
         for stmt in node.body:
             self.visit(stmt)
-            stmt_id = list(self.graph.nodes)[-1]
+            stmt_id = self._last_node_id()
             self.graph.add_edge(try_id, stmt_id, type="control_dependency")
 
         # Process except handlers
@@ -300,7 +362,7 @@ class PDGBuilder(ast.NodeVisitor):
             # Process except body
             for stmt in handler.body:
                 self.visit(stmt)
-                stmt_id = list(self.graph.nodes)[-1]
+                stmt_id = self._last_node_id()
                 self.graph.add_edge(handler_id, stmt_id, type="control_dependency")
 
         # Exit try context
@@ -336,8 +398,9 @@ class PDGBuilder(ast.NodeVisitor):
             for ctrl_id in self.control_deps:
                 self.graph.add_edge(ctrl_id, node_id, type="control_dependency")
 
-        # Add data dependencies for variables used in RHS
-        for var in self._extract_variables(node.value):
+        # Add data dependencies for variables used in RHS (in SDG mode call
+        # arguments reach the assignment through their call node)
+        for var in self._rhs_variables(node.value):
             if def_node := self._find_definition(var):
                 self.graph.add_edge(def_node, node_id, type="data_dependency")
 
@@ -393,6 +456,40 @@ class PDGBuilder(ast.NodeVisitor):
 
         return node_id
 
+    def visit_Return(self, node: ast.Return):
+        """Handle return statements (SDG mode only)."""
+        if not self.sdg_mode:
+            return self.generic_visit(node)
+
+        # Calls are visited first so the return node is the statement's last node
+        call_ids = []
+        if node.value is not None:
+            for child in ast.walk(node.value):
+                if isinstance(child, ast.Call):
+                    call_ids.append(self.visit_Call(child))
+
+        node_id = self._get_node_id("return")
+        self.graph.add_node(
+            node_id,
+            type=NodeType.RETURN.value,
+            value=ast.unparse(node.value) if node.value is not None else None,
+            lineno=node.lineno,
+        )
+
+        # Add control dependency if inside a control structure
+        for ctrl_id in self.control_deps:
+            self.graph.add_edge(ctrl_id, node_id, type="control_dependency")
+
+        # Add data dependencies for returned variables and call results
+        if node.value is not None:
+            for var in self._extract_direct_variables(node.value):
+                if def_node := self._find_definition(var):
+                    self.graph.add_edge(def_node, node_id, type="data_dependency")
+        for call_id in call_ids:
+            self.graph.add_edge(call_id, node_id, type="data_dependency")
+
+        return node_id
+
     def visit_Call(self, node: ast.Call):
         """Handle function calls."""
         node_id = self._get_node_id("call")
@@ -473,11 +570,45 @@ class PDGBuilder(ast.NodeVisitor):
                 scope.variables = {}
             scope.variables[var_name] = node_id
 
+    def _last_node_id(self) -> str:
+        """Return the most recently added node id in O(1)."""
+        # [20261018_PERF] list(self.graph.nodes)[-1] copied every node per statement
+        last = self.graph.last_node
+        if last is None:
+            raise IndexError("no PDG node has been added yet")
+        return last
+
     def _get_node_id(self, prefix: str) -> str:
         """Generate a unique node ID."""
         self.node_counter[prefix] += 1
         return f"{prefix}_{self.node_counter[prefix]}"
 
+    def _rhs_variables(self, node: ast.AST) -> set[str]:
+        """Variables a statement's value depends on for the current mode."""
+        if self.sdg_mode:
+            return self._extract_direct_variables(node)
+        return self._extract_variables(node)
+
+    def _extract_direct_variables(self, node: ast.AST) -> set[str]:
+        """
+        Extract variables used directly by an expression.
+
+        Variables that only appear inside call arguments are skipped: they are
+        linked to the call node (with their argument position), which in turn
+        feeds the statement, so interprocedural summaries can filter them.
+        """
+        variables = set()
+        stack = [node]
+        while stack:
+            child = stack.pop()
+            if isinstance(child, ast.Call):
+                stack.append(child.func)
+                continue
+            if isinstance(child, ast.Name) and isinstance(child.ctx, ast.Load):
+                variables.add(child.id)
+            stack.extend(ast.iter_child_nodes(child))
+        return variables
+
     def _extract_variables(self, node: ast.AST) -> set[str]:
         """Extract all variables used in an AST node."""
         variables = set()
@@ -503,3 +634,21 @@ def build_pdg(
     """
     builder = PDGBuilder(track_constants, interprocedural)
     return builder.build(code)
+
+
+def build_compact_pdg(
+    code: str, track_constants: bool = True, interprocedural: bool = True
+) -> tuple[CompactPDG, nx.DiGraph]:
+    """
+    Build an array-backed Program Dependence Graph from Python code.
+
+    Args:
+        code: The Python source code
+        track_constants: Whether to track constant values
+        interprocedural: Whether to perform interprocedural analysis
+
+    Returns:
+        Tuple containing the CompactPDG and call graph
+    """
+    builder = PDGBuilder(track_constants, interprocedural)
+    return builder.build_compact(code)
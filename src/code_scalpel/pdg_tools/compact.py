@@ -0,0 +1,369 @@
+"""
+Compact, array-backed Program Dependence Graph.
+
+[20261018_PERF] networkx stores every node and edge as nested dicts, which
+dominates memory and slicing latency for functions with thousands of
+statements. CompactPDG keeps the same information as integer node ids,
+compressed sparse row (CSR) adjacency arrays split by dependence kind, and a
+side table for per-node statement metadata. Slices run as worklists over a
+visited bitmap and only materialise a networkx graph on demand.
+
+Example:
+    >>> from code_scalpel.pdg_tools import PDGBuilder
+    >>> pdg, _ = PDGBuilder().build_compact("x = 1\\ny = x + 1")
+    >>> pdg.backward_slice({"assign_2"})
+    {'assign_1', 'assign_2'}
+"""
+
+from __future__ import annotations
+
+import sys
+from array import array
+from collections.abc import Iterable
+from typing import Any, Optional
+
+import networkx as nx
+
+DATA_DEPENDENCY = "data_dependency"
+CONTROL_DEPENDENCY = "control_dependency"
+
+_NO_LINE = -1
+_EMPTY: dict[str, Any] = {}
+
+
+class _CSR:
+    """Compressed sparse row adjacency: targets of row i are targets[offsets[i]:offsets[i+1]]."""
+
+    __slots__ = ("offsets", "targets")
+
+    def __init__(self, size: int, pairs: list[tuple[int, int]]):
+        counts = [0] * (size + 1)
+        for src, _ in pairs:
+            counts[src + 1] += 1
+        for i in range(size):
+            counts[i + 1] += counts[i]
+        self.offsets = array("l", counts)
+        fill = counts[:-1]
+        targets = [0] * len(pairs)
+        for src, dst in pairs:
+            targets[fill[src]] = dst
+            fill[src] += 1
+        self.targets = array("l", targets)
+
+    def row(self, i: int) -> array:
+        return self.targets[self.offsets[i] : self.offsets[i + 1]]
+
+    def __len__(self) -> int:
+        return len(self.targets)
+
+
+class CompactPDG:
+    """
+    Program Dependence Graph stored as integer ids and CSR arrays.
+
+    Data and control dependences each get a forward (dependents) and a
+    reverse (dependencies) CSR. All other edge kinds produced by PDGBuilder
+    (loop, parameter, exception, decorator dependences) are kept in a single
+    forward CSR with a parallel type list so networkx export is lossless.
+
+    Attributes:
+        node_ids: Original string node id for each integer id.
+        node_types: Interned ``type`` attribute per node (None if absent).
+        linenos: Line number per node (-1 if absent).
+        metadata: Remaining node attributes per node (side table).
+    """
+
+    def __init__(
+        self,
+        nodes: Iterable[tuple[str, dict[str, Any]]],
+        edges: Iterable[tuple[str, str, dict[str, Any]]],
+    ):
+        self.node_ids: list[str] = []
+        self.node_types: list[Optional[str]] = []
+        self.linenos = array("l")
+        self.metadata: list[dict[str, Any]] = []
+        self._index: dict[str, int] = {}
+
+        for node, attrs in nodes:
+            self._add_node(node, attrs)
+
+        data: list[tuple[int, int]] = []
+        control: list[tuple[int, int]] = []
+        other: list[tuple[int, int, Optional[str]]] = []
+        self._edge_attrs: dict[tuple[int, int], dict[str, Any]] = {}
+        for src, dst, attrs in edges:
+            u = self._index.get(src)
+            if u is None:
+                u = self._add_node(src, _EMPTY)
+            v = self._index.get(dst)
+            if v is None:
+                v = self._add_node(dst, _EMPTY)
+            kind = attrs.get("type")
+            if kind == DATA_DEPENDENCY:
+                data.append((u, v))
+            elif kind == CONTROL_DEPENDENCY:
+                control.append((u, v))
+            else:
+                other.append((u, v, kind))
+            extra = {k: val for k, val in attrs.items() if k != "type"}
+            if extra:
+                self._edge_attrs[(u, v)] = extra
+
+        size = len(self.node_ids)
+        self.data_out = _CSR(size, data)
+        self.data_in = _CSR(size, [(v, u) for u, v in data])
+        self.control_out = _CSR(size, control)
+        self.control_in = _CSR(size, [(v, u) for u, v in control])
+        other.sort(key=lambda edge: edge[0])
+        self.other_out = _CSR(size, [(u, v) for u, v, _ in other])
+        self.other_types: list[Optional[str]] = [kind for _, _, kind in other]
+
+    def _add_node(self, node: str, attrs: dict[str, Any]) -> int:
+        idx = len(self.node_ids)
+        self._index[node] = idx
+        self.node_ids.append(node)
+        kind = attrs.get("type")
+        self.node_types.append(sys.intern(kind) if isinstance(kind, str) else None)
+        lineno = attrs.get("lineno")
+        self.linenos.append(lineno if isinstance(lineno, int) else _NO_LINE)
+        rest = {
+            k: v
+            for k, v in attrs.items()
+            if not (k == "type" and isinstance(v, str))
+            and not (k == "lineno" and isinstance(v, int))
+        }
+        self.metadata.append(rest if rest else _EMPTY)
+        return idx
+
+    # ------------------------------------------------------------------
+    # Construction / export
+    # ------------------------------------------------------------------
+
+    @classmethod
+    def from_networkx(cls, graph: nx.DiGraph) -> CompactPDG:
+        """Build a CompactPDG from a PDGBuilder-style networkx DiGraph."""
+        return cls(graph.nodes(data=True), graph.edges(data=True))
+
+    def to_networkx(self) -> nx.DiGraph:
+        """Export the full graph as a networkx DiGraph (compatibility path)."""
+        return self.induced_subgraph(range(len(self.node_ids)), by_index=True)
+
+    def induced_subgraph(
+        self, nodes: Iterable[Any], by_index: bool = False
+    ) -> nx.DiGraph:
+        """
+        Materialise the subgraph induced by ``nodes`` as a networkx DiGraph.
+
+        Cost is proportional to the selected nodes and their edges only.
+
+        Args:
+            nodes: String node ids (or integer ids when ``by_index``).
+            by_index: Interpret ``nodes`` as integer ids.
+        """
+        selected = list(nodes) if by_index else self.indices(nodes)
+        mark = bytearray(len(self.node_ids))
+        for i in selected:
+            mark[i] = 1
+
+        graph = nx.DiGraph()
+        for i in selected:
+            graph.add_node(self.node_ids[i], **self.node_attributes(i))
+        for i in selected:
+            for csr, kind in (
+                (self.data_out, DATA_DEPENDENCY),
+                (self.control_out, CONTROL_DEPENDENCY),
+            ):
+                for j in csr.row(i):
+                    if mark[j]:
+                        self._add_export_edge(graph, i, j, kind)
+            start, end = self.other_out.offsets[i], self.other_out.offsets[i + 1]
+            for pos in range(start, end):
+                j = self.other_out.targets[pos]
+                if mark[j]:
+                    self._add_export_edge(graph, i, j, self.other_types[pos])
+        return graph
+
+    def _add_export_edge(
+        self, graph: nx.DiGraph, u: int, v: int, kind: Optional[str]
+    ) -> None:
+        attrs = dict(self._edge_attrs.get((u, v), _EMPTY))
+        if kind is not None:
+            attrs["type"] = kind
+        graph.add_edge(self.node_ids[u], self.node_ids[v], **attrs)
+
+    # ------------------------------------------------------------------
+    # Queries
+    # ------------------------------------------------------------------
+
+    def __len__(self) -> int:
+        return len(self.node_ids)
+
+    def __contains__(self, node: object) -> bool:
+        return node in self._index
+
+    def index_of(self, node: str) -> Optional[int]:
+        """Return the integer id of ``node`` (None if unknown)."""
+        return self._index.get(node)
+
+    def indices(self, nodes: Iterable[str]) -> list[int]:
+        """Map string node ids to integer ids, skipping unknown nodes."""
+        index = self._index
+        return [index[n] for n in nodes if n in index]
+
+    def node_attributes(self, i: int) -> dict[str, Any]:
+        """Return the full attribute dict for integer node ``i``."""
+        attrs = dict(self.metadata[i])
+        if self.node_types[i] is not None:
+            attrs["type"] = self.node_types[i]
+        if self.linenos[i] != _NO_LINE:
+            attrs["lineno"] = self.linenos[i]
+        return attrs
+
+    def edge_attributes(self, u: int, v: int) -> dict[str, Any]:
+        """Return extra (non-``type``) attributes of edge ``u -> v``."""
+        return self._edge_attrs.get((u, v), _EMPTY)
+
+    def data_dependencies(self, node: str) -> set[str]:
+        """Nodes that ``node`` data-depends on."""
+        return self._neighbours(node, self.data_in)
+
+    def control_dependencies(self, node: str) -> set[str]:
+        """Nodes that ``node`` control-depends on."""
+        return self._neighbours(node, self.control_in)
+
+    def data_dependents(self, node: str) -> set[str]:
+        """Nodes that data-depend on ``node``."""
+        return self._neighbours(node, self.data_out)
+
+    def control_dependents(self, node: str) -> set[str]:
+        """Nodes that control-depend on ``node``."""
+        return self._neighbours(node, self.control_out)
+
+    def _neighbours(self, node: str, csr: _CSR) -> set[str]:
+        i = self._index.get(node)
+        if i is None:
+            return set()
+        ids = self.node_ids
+        return {ids[j] for j in csr.row(i)}
+
+    # ------------------------------------------------------------------
+    # Slicing
+    # ------------------------------------------------------------------
+
+    def closure(
+        self,
+        seeds: Iterable[int],
+        *,
+        forward: bool = False,
+        include_data: bool = True,
+        include_control: bool = True,
+    ) -> list[int]:
+        """
+        Transitive closure from ``seeds`` over the selected dependence kinds.
+
+        Runs a worklist over a visited bitmap, touching each node and edge
+        at most once.
+
+        Returns:
+            Integer ids reached (including the seeds), in discovery order.
+        """
+        graphs: list[_CSR] = []
+        if include_data:
+            graphs.append(self.data_out if forward else self.data_in)
+        if include_control:
+            graphs.append(self.control_out if forward else self.control_in)
+
+        visited = bytearray(len(self.node_ids))
+        reached: list[int] = []
+        for s in seeds:
+            if not visited[s]:
+                visited[s] = 1
+                reached.append(s)
+
+        pos = 0
+        while pos < len(reached):
+            i = reached[pos]
+            pos += 1
+            for csr in graphs:
+                offsets, targets = csr.offsets, csr.targets
+                for k in range(offsets[i], offsets[i + 1]):
+                    j = targets[k]
+                    if not visited[j]:
+                        visited[j] = 1
+                        reached.append(j)
+        return reached
+
+    def backward_slice(
+        self,
+        nodes: Iterable[str],
+        include_data: bool = True,
+        include_control: bool = True,
+    ) -> set[str]:
+        """Return the string ids of the backward slice from ``nodes``."""
+        reached = self.closure(
+            self.indices(nodes),
+            include_data=include_data,
+            include_control=include_control,
+        )
+        ids = self.node_ids
+        return {ids[i] for i in reached}
+
+    def forward_slice(
+        self,
+        nodes: Iterable[str],
+        include_data: bool = True,
+        include_control: bool = True,
+    ) -> set[str]:
+        """Return the string ids of the forward slice from ``nodes``."""
+        reached = self.closure(
+            self.indices(nodes),
+            forward=True,
+            include_data=include_data,
+            include_control=include_control,
+        )
+        ids = self.node_ids
+        return {ids[i] for i in reached}
+
+
+class PDGRecorder:
+    """
+    Minimal DiGraph stand-in used by PDGBuilder.build_compact.
+
+    Supports the ``add_node``/``add_edge``/``nodes`` surface the builder uses
+    (with networkx's attribute-merging semantics) and freezes into a
+    CompactPDG without ever creating networkx objects.
+    """
+
+    def __init__(self) -> None:
+        self.nodes: dict[str, dict[str, Any]] = {}
+        self.edges: dict[tuple[str, str], dict[str, Any]] = {}
+
+    def add_node(self, node: str, **attrs: Any) -> None:
+        existing = self.nodes.get(node)
+        if existing is None:
+            self.nodes[node] = attrs
+        else:
+            existing.update(attrs)
+
+    def add_edge(self, u: str, v: str, **attrs: Any) -> None:
+        if u not in self.nodes:
+            self.nodes[u] = {}
+        if v not in self.nodes:
+            self.nodes[v] = {}
+        existing = self.edges.get((u, v))
+        if existing is None:
+            self.edges[(u, v)] = attrs
+        else:
+            existing.update(attrs)
+
+    @property
+    def last_node(self) -> Optional[str]:
+        """The most recently inserted node, or None when empty."""
+        return next(reversed(self.nodes), None)
+
+    def freeze(self) -> CompactPDG:
+        """Convert the recorded graph into a CompactPDG."""
+        return CompactPDG(
+            self.nodes.items(),
+            ((u, v, attrs) for (u, v), attrs in self.edges.items()),
+        )
@@ -0,0 +1,554 @@
+"""
+System Dependence Graph (SDG) and interprocedural slicing.
+
+[20261018_FEATURE] ProgramSlicer only slices within one PDG. This module links
+per-function CompactPDGs through call and parameter edges and computes
+Horwitz-Reps-Binkley summary edges (which parameters of a function can reach
+its return value) once per function. Summaries are cached by a content hash of
+the function and of the summaries it depends on, so they survive across SDG
+instances and only change when the function or one of its callees changes.
+
+Slicing is the classic two-phase HRB algorithm:
+
+1. Ascend: walk backward from the criterion, stepping over call sites via
+   summary edges and climbing from formal parameters to the actual arguments
+   at every caller.
+2. Descend: from every call site reached in phase 1, walk backward from the
+   callee's return statements into callees, without climbing to callers.
+
+Only PDGs of functions the slice actually reaches are traversed, so the cost
+is proportional to the slice rather than the program.
+
+Limitations:
+    Call resolution is name based (qualified ``module.name`` first, then a
+    unique simple name). Unresolved calls are treated conservatively: every
+    argument flows to the result. Module-level statements, globals and
+    side effects through mutable arguments are not modelled.
+
+Example:
+    >>> sdg = SystemDependenceGraph()
+    >>> sdg.add_module(source, module="app")
+    >>> result = sdg.backward_slice("app.main", sdg.nodes_at_line("app.main", 12))
+    >>> result.functions
+    {'app.main', 'app.helper'}
+"""
+
+from __future__ import annotations
+
+import ast
+import hashlib
+import threading
+from collections import OrderedDict
+from collections.abc import Iterable
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Optional, Union
+
+from .builder import NodeType, PDGBuilder
+from .compact import CompactPDG
+
+_PARAMETER_DEPENDENCY = "parameter_dependency"
+
+
+@dataclass(frozen=True)
+class FunctionSummary:
+    """
+    Summary edges for one function.
+
+    Attributes:
+        key: Cache key (content hash of the function and its callee summaries).
+        params: Formal parameter names in positional order.
+        flows_to_return: Indices of parameters that can affect the return value.
+    """
+
+    key: str
+    params: tuple[str, ...]
+    flows_to_return: frozenset[int]
+
+
+class SummaryCache:
+    """
+    Process-wide LRU cache of FunctionSummary objects keyed by content hash.
+
+    Shared by every SystemDependenceGraph unless one is given explicitly, so
+    rebuilding the SDG after an edit only recomputes summaries for the edited
+    functions and their transitive callers.
+    """
+
+    def __init__(self, max_entries: int = 8192):
+        self.max_entries = max_entries
+        self._entries: OrderedDict[str, FunctionSummary] = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: str) -> Optional[FunctionSummary]:
+        with self._lock:
+            summary = self._entries.get(key)
+            if summary is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return summary
+
+    def put(self, summary: FunctionSummary) -> None:
+        with self._lock:
+            self._entries[summary.key] = summary
+            self._entries.move_to_end(summary.key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+_DEFAULT_SUMMARY_CACHE = SummaryCache()
+
+
+def get_summary_cache() -> SummaryCache:
+    """Return the process-wide summary cache."""
+    return _DEFAULT_SUMMARY_CACHE
+
+
+@dataclass
+class CallSite:
+    """A call node inside a function PDG and the function it resolves to."""
+
+    caller: str
+    node: int
+    callee_name: str
+    callee: Optional[str] = None
+    arg_offset: int = 0  # 1 when calling a method through an attribute
+
+
+@dataclass
+class FunctionPDG:
+    """Per-function PDG plus the interface nodes the SDG links through."""
+
+    qualname: str
+    module: str
+    content_hash: str
+    pdg: CompactPDG
+    params: list[int]
+    param_names: list[str]
+    returns: list[int]
+    is_method: bool = False
+    call_sites: list[CallSite] = field(default_factory=list)
+
+
+@dataclass
+class InterproceduralSlice:
+    """
+    Result of an interprocedural slice.
+
+    Attributes:
+        nodes: Function qualname -> local PDG node ids in the slice.
+        lines: Function qualname -> source line numbers in the slice.
+    """
+
+    nodes: dict[str, set[str]] = field(default_factory=dict)
+    lines: dict[str, set[int]] = field(default_factory=dict)
+
+    @property
+    def functions(self) -> set[str]:
+        return set(self.nodes)
+
+    @property
+    def size(self) -> int:
+        return sum(len(ids) for ids in self.nodes.values())
+
+
+class SystemDependenceGraph:
+    """Per-function PDGs linked by call/parameter edges with cached summaries."""
+
+    def __init__(self, summary_cache: Optional[SummaryCache] = None):
+        self.summary_cache = (
+            summary_cache if summary_cache is not None else _DEFAULT_SUMMARY_CACHE
+        )
+        self.functions: dict[str, FunctionPDG] = {}
+        self._by_simple_name: dict[str, list[str]] = {}
+        self._callers: dict[str, list[CallSite]] = {}
+        self._summaries: dict[str, FunctionSummary] = {}
+        self._linked = True
+
+    # ------------------------------------------------------------------
+    # Construction
+    # ------------------------------------------------------------------
+
+    def add_module(self, source: str, module: str = "<module>") -> list[str]:
+        """
+        Add every top-level function and class method in ``source``.
+
+        Args:
+            source: Python source code of the module.
+            module: Module name used to qualify function names.
+
+        Returns:
+            Qualified names of the functions added.
+        """
+        tree = ast.parse(source)
+        added = []
+        for node in tree.body:
+            if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
+                added.append(self._add_function(node, module, f"{module}.{node.name}"))
+            elif isinstance(node, ast.ClassDef):
+                for item in node.body:
+                    if isinstance(item, (ast.FunctionDef, ast.AsyncFunctionDef)):
+                        qualname = f"{module}.{node.name}.{item.name}"
+                        added.append(
+                            self._add_function(item, module, qualname, is_method=True)
+                        )
+        self._linked = False
+        return added
+
+    def add_file(
+        self, path: Union[str, Path], root: Union[str, Path, None] = None
+    ) -> list[str]:
+        """Add a Python file, naming its module relative to ``root``."""
+        path = Path(path)
+        if root is not None:
+            module = ".".join(path.relative_to(root).with_suffix("").parts)
+        else:
+            module = path.stem
+        return self.add_module(path.read_text(encoding="utf-8"), module)
+
+    @classmethod
+    def from_sources(
+        cls, sources: dict[str, str], summary_cache: Optional[SummaryCache] = None
+    ) -> SystemDependenceGraph:
+        """Build an SDG from a ``{module_name: source}`` mapping."""
+        sdg = cls(summary_cache)
+        for module, source in sources.items():
+            sdg.add_module(source, module)
+        return sdg
+
+    def _add_function(
+        self,
+        node: Union[ast.FunctionDef, ast.AsyncFunctionDef],
+        module: str,
+        qualname: str,
+        is_method: bool = False,
+    ) -> str:
+        content_hash = hashlib.sha256(ast.unparse(node).encode("utf-8")).hexdigest()
+        if isinstance(node, ast.AsyncFunctionDef):
+            # PDGBuilder only has a FunctionDef handler; the bodies are identical
+            converted = ast.FunctionDef(**{f: getattr(node, f) for f in node._fields})
+            node = ast.copy_location(converted, node)
+        pdg, _ = PDGBuilder(sdg_mode=True).build_compact(node)
+
+        root = 0  # The function node is always the first node recorded
+        params = [
+            pdg.other_out.targets[pos]
+            for pos in range(
+                pdg.other_out.offsets[root], pdg.other_out.offsets[root + 1]
+            )
+            if pdg.other_types[pos] == _PARAMETER_DEPENDENCY
+        ]
+        returns = [
+            i for i, kind in enumerate(pdg.node_types) if kind == NodeType.RETURN.value
+        ]
+        func = FunctionPDG(
+            qualname=qualname,
+            module=module,
+            content_hash=content_hash,
+            pdg=pdg,
+            params=params,
+            param_names=[pdg.metadata[i].get("name", "") for i in params],
+            returns=returns,
+            is_method=is_method,
+        )
+        for i, kind in enumerate(pdg.node_types):
+            if kind == NodeType.CALL.value:
+                func.call_sites.append(
+                    CallSite(qualname, i, str(pdg.metadata[i].get("function", "")))
+                )
+        self.functions[qualname] = func
+        simple = qualname.rsplit(".", 1)[-1]
+        self._by_simple_name.setdefault(simple, []).append(qualname)
+        return qualname
+
+    # ------------------------------------------------------------------
+    # Linking and summaries
+    # ------------------------------------------------------------------
+
+    def _resolve(self, site: CallSite) -> Optional[str]:
+        caller = self.functions[site.caller]
+        name = site.callee_name
+        for candidate in (f"{caller.module}.{name}", name):
+            if candidate in self.functions:
+                return candidate
+        if "." in name and name.split(".", 1)[0] in ("self", "cls"):
+            owner = site.caller.rsplit(".", 1)[0]
+            candidate = f"{owner}.{name.rsplit('.', 1)[-1]}"
+            if candidate in self.functions:
+                return candidate
+        matches = self._by_simple_name.get(name.rsplit(".", 1)[-1], [])
+        return matches[0] if len(matches) == 1 else None
+
+    def link(self) -> None:
+        """Resolve call sites and compute (or fetch cached) summaries."""
+        if self._linked:
+            return
+        self._callers = {name: [] for name in self.functions}
+        for func in self.functions.values():
+            for site in func.call_sites:
+                site.callee = self._resolve(site)
+                if site.callee is None:
+                    continue
+                callee = self.functions[site.callee]
+                site.arg_offset = (
+                    1 if callee.is_method and "." in site.callee_name else 0
+                )
+                self._callers[site.callee].append(site)
+        self._compute_summaries()
+        self._linked = True
+
+    def summary(self, qualname: str) -> FunctionSummary:
+        """Return the summary for ``qualname`` (linking first if needed)."""
+        self.link()
+        return self._summaries[qualname]
+
+    def _compute_summaries(self) -> None:
+        """Compute summaries bottom-up over call-graph SCCs (Tarjan)."""
+        self._summaries = {}
+        for component in self._callee_first_sccs():
+            members = set(component)
+            outside = sorted(
+                {
+                    site.callee
+                    for name in component
+                    for site in self.functions[name].call_sites
+                    if site.callee is not None and site.callee not in members
+                }
+            )
+            digest = hashlib.sha256()
+            for name in sorted(component):
+                digest.update(name.encode())
+                digest.update(self.functions[name].content_hash.encode())
+            for name in outside:
+                digest.update(self._summaries[name].key.encode())
+            group_key = digest.hexdigest()
+
+            cached = {
+                name: self.summary_cache.get(f"{group_key}:{name}")
+                for name in component
+            }
+            if all(cached.values()):
+                self._summaries.update(cached)  # type: ignore[arg-type]
+                continue
+
+            # Optimistic start, then iterate to a fixpoint for recursion
+            for name in component:
+                self._summaries[name] = FunctionSummary(
+                    f"{group_key}:{name}",
+                    tuple(self.functions[name].param_names),
+                    frozenset(),
+                )
+            changed = True
+            while changed:
+                changed = False
+                for name in component:
+                    flows = self._params_reaching_return(self.functions[name])
+                    if flows != self._summaries[name].flows_to_return:
+                        self._summaries[name] = FunctionSummary(
+                            f"{group_key}:{name}",
+                            tuple(self.functions[name].param_names),
+                            flows,
+                        )
+                        changed = True
+            for name in component:
+                self.summary_cache.put(self._summaries[name])
+
+    def _callee_first_sccs(self) -> list[list[str]]:
+        """Strongly connected components of the call graph, callees first."""
+        index: dict[str, int] = {}
+        low: dict[str, int] = {}
+        on_stack: set[str] = set()
+        stack: list[str] = []
+        result: list[list[str]] = []
+        counter = 0
+
+        for start in self.functions:
+            if start in index:
+                continue
+            work = [(start, iter(self._callees(start)))]
+            index[start] = low[start] = counter
+            counter += 1
+            stack.append(start)
+            on_stack.add(start)
+            while work:
+                name, callees = work[-1]
+                for callee in callees:
+                    if callee not in index:
+                        index[callee] = low[callee] = counter
+                        counter += 1
+                        stack.append(callee)
+                        on_stack.add(callee)
+                        work.append((callee, iter(self._callees(callee))))
+                        break
+                    if callee in on_stack:
+                        low[name] = min(low[name], index[callee])
+                else:
+                    work.pop()
+                    if work:
+                        parent = work[-1][0]
+                        low[parent] = min(low[parent], low[name])
+                    if low[name] == index[name]:
+                        component = []
+                        while True:
+                            member = stack.pop()
+                            on_stack.discard(member)
+                            component.append(member)
+                            if member == name:
+                                break
+                        result.append(component)
+        return result
+
+    def _callees(self, qualname: str) -> list[str]:
+        return [
+            site.callee
+            for site in self.functions[qualname].call_sites
+            if site.callee is not None
+        ]
+
+    def _params_reaching_return(self, func: FunctionPDG) -> frozenset[int]:
+        reached = self._intra_backward(func, func.returns)
+        return frozenset(i for i, param in enumerate(func.params) if param in reached)
+
+    # ------------------------------------------------------------------
+    # Slicing
+    # ------------------------------------------------------------------
+
+    def _intra_backward(self, func: FunctionPDG, seeds: Iterable[int]) -> set[int]:
+        """
+        Backward closure within one PDG, crossing call sites via summaries.
+
+        At a resolved call node only arguments whose parameter reaches the
+        callee's return are followed; all other predecessors are kept.
+        """
+        pdg = func.pdg
+        sites = {site.node: site for site in func.call_sites if site.callee}
+        visited = set(seeds)
+        work = list(visited)
+        while work:
+            i = work.pop()
+            site = sites.get(i)
+            flows = None
+            arg_offset = 0
+            if site is not None and site.callee in self._summaries:
+                arg_offset = site.arg_offset
+                flows = self._summaries[site.callee].flows_to_return
+                names = self.functions[site.callee].param_names
+            for csr in (pdg.data_in, pdg.control_in):
+                for j in csr.row(i):
+                    if j in visited:
+                        continue
+                    if flows is not None and csr is pdg.data_in:
+                        attrs = pdg.edge_attributes(j, i)
+                        if "arg_index" in attrs:
+                            if attrs["arg_index"] + arg_offset not in flows:
+                                continue
+                        elif "keyword" in attrs:
+                            keyword = attrs["keyword"]
+                            if keyword in names and names.index(keyword) not in flows:
+                                continue
+                    visited.add(j)
+                    work.append(j)
+        return visited
+
+    def nodes_at_line(self, qualname: str, lineno: int) -> list[str]:
+        """Return local node ids of ``qualname`` recorded at ``lineno``."""
+        pdg = self.functions[qualname].pdg
+        return [pdg.node_ids[i] for i, line in enumerate(pdg.linenos) if line == lineno]
+
+    def backward_slice(
+        self, qualname: str, nodes: Iterable[str]
+    ) -> InterproceduralSlice:
+        """
+        Two-phase (Horwitz-Reps-Binkley) interprocedural backward slice.
+
+        Args:
+            qualname: Function containing the slicing criterion.
+            nodes: Local PDG node ids of the criterion within that function.
+
+        Returns:
+            InterproceduralSlice grouping reached nodes by function.
+        """
+        self.link()
+        reached: dict[str, set[int]] = {}
+
+        def expand(name: str, seeds: Iterable[int], frontier: list) -> None:
+            known = reached.setdefault(name, set())
+            fresh = [s for s in seeds if s not in known]
+            if not fresh:
+                return
+            new = self._intra_backward(self.functions[name], fresh) - known
+            known.update(new)
+            frontier.append((name, new))
+
+        # Phase 1: ascend to callers through parameters, step over calls
+        phase_one: list[tuple[str, set[int]]] = []
+        call_sites: dict[str, set[int]] = {}
+        func = self.functions[qualname]
+        expand(qualname, func.pdg.indices(nodes), phase_one)
+        pending = list(phase_one)
+        while pending:
+            name, new = pending.pop()
+            func = self.functions[name]
+            for position, param in enumerate(func.params):
+                if param not in new:
+                    continue
+                for site in self._callers.get(name, []):
+                    call_sites.setdefault(site.caller, set()).add(site.node)
+                    before = len(phase_one)
+                    expand(site.caller, self._actual_in(site, position), phase_one)
+                    pending.extend(phase_one[before:])
+
+        # Phase 2: descend into callees from call sites reached in phase 1
+        pending = list(phase_one)
+        while pending:
+            name, new = pending.pop()
+            for site in self.functions[name].call_sites:
+                if site.callee is not None and site.node in new:
+                    callee = self.functions[site.callee]
+                    before = len(phase_one)
+                    expand(site.callee, callee.returns, phase_one)
+                    pending.extend(phase_one[before:])
+
+        result = InterproceduralSlice()
+        for name in reached.keys() | call_sites.keys():
+            ids = reached.get(name, set()) | call_sites.get(name, set())
+            pdg = self.functions[name].pdg
+            result.nodes[name] = {pdg.node_ids[i] for i in ids}
+            result.lines[name] = {pdg.linenos[i] for i in ids if pdg.linenos[i] != -1}
+        return result
+
+    def _actual_in(self, site: CallSite, position: int) -> list[int]:
+        """
+        Caller nodes feeding parameter ``position`` at ``site``.
+
+        The call node itself is not expanded (that would pull in every
+        argument via its summary); only its control dependences are.
+        """
+        pdg = self.functions[site.caller].pdg
+        names = self.functions[site.callee].param_names if site.callee else []
+        keyword = names[position] if position < len(names) else None
+        seeds = list(pdg.control_in.row(site.node))
+        for j in pdg.data_in.row(site.node):
+            attrs = pdg.edge_attributes(j, site.node)
+            if "arg_index" in attrs:
+                if attrs["arg_index"] + site.arg_offset == position:
+                    seeds.append(j)
+            elif "keyword" in attrs:
+                if attrs["keyword"] == keyword:
+                    seeds.append(j)
+            else:
+                seeds.append(j)
+        return seeds
@@ -0,0 +1,377 @@
+"""
+Content-addressed slice cache shared across PDG builds.
+
+[20261018_PERF] ProgramSlicer.cache lives and dies with one PDG object, so
+every PDGBuilder run starts cold. SliceCache outlives individual PDGs:
+
+- A PDG is partitioned into regions, one per function (plus the module
+  level), and every region gets a fingerprint of its nodes, their line
+  offsets from the function start and their dependence edges.
+- Slice criteria are stored as (region fingerprint, position in region)
+  pairs, so the key survives node-id and line shifts caused by edits
+  elsewhere in the file.
+- Each entry records, per region the slice touched, which positions are in
+  the slice. A lookup only succeeds when every touched region still has the
+  same fingerprint, so an edit invalidates exactly the slices that pass
+  through the edited function.
+- Entries are evicted least-recently-used under a byte budget, and the cache
+  can be saved to and loaded from disk as plain JSON (never pickle, so a
+  tampered cache file cannot execute code).
+
+Example:
+    >>> cache = SliceCache(max_bytes=16 * 1024 * 1024)
+    >>> ProgramSlicer(pdg, slice_cache=cache).compute_slice("assign_3")
+    >>> # After an edit to another function, the rebuilt PDG hits the cache
+    >>> ProgramSlicer(rebuilt_pdg, slice_cache=cache).compute_slice("assign_4")
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import sys
+import threading
+from array import array
+from collections import OrderedDict
+from collections.abc import Iterable
+from pathlib import Path
+from typing import Any, Optional, Union
+
+from .compact import CompactPDG
+
+MODULE_REGION = "<module>"
+
+# (region fingerprint, position of the node inside the region)
+Position = tuple[str, int]
+
+_ENTRY_OVERHEAD = 256
+
+_FILE_FORMAT = "code-scalpel-slice-cache"
+_FILE_VERSION = 1
+
+
+class PDGRegions:
+    """
+    Partition of a CompactPDG into per-function regions with fingerprints.
+
+    A node belongs to the innermost function whose ``lineno``..``end_lineno``
+    span contains its line; nodes outside every function (or without a line)
+    belong to the module region.
+
+    Attributes:
+        labels: Label per region (function name, ``#n`` suffixed when
+            repeated; ``<module>`` for the module region).
+        fingerprints: Content fingerprint per region.
+        members: Integer node ids of each region, in PDG order.
+        owner: Region index per node.
+        offset: Position of each node inside its region.
+    """
+
+    def __init__(self, pdg: CompactPDG):
+        self.pdg = pdg
+        size = len(pdg)
+        spans: list[tuple[int, int, int]] = []
+        for i in range(size):
+            if pdg.node_types[i] != "function" or pdg.linenos[i] == -1:
+                continue
+            end = pdg.metadata[i].get("end_lineno")
+            if isinstance(end, int):
+                spans.append((pdg.linenos[i], end, i))
+
+        # Paint line owners outer-to-inner so nested functions win.
+        spans.sort(key=lambda span: (span[0], -span[1]))
+        self.labels: list[str] = [MODULE_REGION]
+        self.base_lines: list[int] = [0]
+        line_owner: dict[int, int] = {}
+        seen: dict[str, int] = {}
+        for start, end, i in spans:
+            name = str(pdg.metadata[i].get("name", "function"))
+            count = seen.get(name, 0)
+            seen[name] = count + 1
+            self.labels.append(name if count == 0 else f"{name}#{count}")
+            self.base_lines.append(start)
+            region = len(self.labels) - 1
+            for line in range(start, end + 1):
+                line_owner[line] = region
+
+        self.members: list[list[int]] = [[] for _ in self.labels]
+        self.owner = array("l", [0] * size)
+        self.offset = array("l", [0] * size)
+        for i in range(size):
+            lineno = pdg.linenos[i]
+            region = line_owner.get(lineno, 0) if lineno != -1 else 0
+            self.owner[i] = region
+            self.offset[i] = len(self.members[region])
+            self.members[region].append(i)
+
+        self.fingerprints = [
+            self._fingerprint(region) for region in range(len(self.labels))
+        ]
+        self._by_fingerprint: dict[str, int] = {}
+        self._ambiguous: set[str] = set()
+        for region, fp in enumerate(self.fingerprints):
+            if fp in self._by_fingerprint:
+                self._ambiguous.add(fp)
+            self._by_fingerprint[fp] = region
+
+    def _fingerprint(self, region: int) -> str:
+        pdg = self.pdg
+        base = self.base_lines[region]
+        digest = hashlib.blake2b(digest_size=16)
+        digest.update(self.labels[region].encode())
+        for i in self.members[region]:
+            lineno = pdg.linenos[i]
+            meta = pdg.metadata[i]
+            end = meta.get("end_lineno")
+            if isinstance(end, int):
+                meta = {**meta, "end_lineno": end - base}
+            record: list[Any] = [
+                pdg.node_types[i],
+                lineno - base if lineno != -1 else None,
+                meta,
+            ]
+            for tag, csr in (
+                ("di", pdg.data_in),
+                ("do", pdg.data_out),
+                ("ci", pdg.control_in),
+                ("co", pdg.control_out),
+            ):
+                for j in csr.row(i):
+                    record.append((tag, self.labels[self.owner[j]], self.offset[j]))
+            digest.update(repr(record).encode())
+        return digest.hexdigest()
+
+    def position(self, i: int) -> Optional[Position]:
+        """Return the stable position of integer node ``i`` (None if ambiguous)."""
+        fp = self.fingerprints[self.owner[i]]
+        if fp in self._ambiguous:
+            return None
+        return fp, self.offset[i]
+
+    def region_of(self, fingerprint: str) -> Optional[int]:
+        """Return the region with ``fingerprint`` (None if absent or ambiguous)."""
+        if fingerprint in self._ambiguous:
+            return None
+        return self._by_fingerprint.get(fingerprint)
+
+
+class SliceCache:
+    """
+    Thread-safe LRU cache of slice results bounded by a byte budget.
+
+    Attributes:
+        max_bytes: Approximate memory budget for stored slices.
+        size_bytes: Approximate memory used by stored slices.
+        hits: Lookups answered from the cache.
+        misses: Lookups that found no valid entry.
+        evictions: Entries dropped to stay within ``max_bytes``.
+    """
+
+    def __init__(self, max_bytes: int = 64 * 1024 * 1024):
+        self.max_bytes = max_bytes
+        self._entries: OrderedDict[tuple, tuple[dict[str, array], int]] = OrderedDict()
+        self._by_region: dict[str, set[tuple]] = {}
+        self._lock = threading.Lock()
+        self.size_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    @staticmethod
+    def make_key(
+        slice_kind: str,
+        node_seeds: Iterable[Position],
+        variable_seeds: Iterable[Position],
+        *options: Any,
+    ) -> tuple:
+        """Build a cache key from stable seed positions and slice options."""
+        return (slice_kind, frozenset(node_seeds), frozenset(variable_seeds), options)
+
+    def lookup(self, key: tuple, regions: PDGRegions) -> Optional[list[int]]:
+        """
+        Return the cached slice for ``key`` as integer node ids of ``regions``.
+
+        Returns None when there is no entry or a region the slice touched has
+        changed (or is missing) in the current PDG.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            result: list[int] = []
+            for fp, offsets in entry[0].items():
+                region = regions.region_of(fp)
+                if region is None:
+                    self.misses += 1
+                    return None
+                members = regions.members[region]
+                result.extend(members[k] for k in offsets)
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return result
+
+    def store(self, key: tuple, regions: PDGRegions, nodes: Iterable[int]) -> bool:
+        """
+        Store a slice given as integer node ids of ``regions``.
+
+        Returns False (and stores nothing) when a node lies in a region whose
+        fingerprint is not unique in the PDG, or the slice exceeds the budget.
+        """
+        grouped: dict[str, list[int]] = {}
+        for i in nodes:
+            position = regions.position(i)
+            if position is None:
+                return False
+            grouped.setdefault(position[0], []).append(position[1])
+        result = {fp: array("l", sorted(offsets)) for fp, offsets in grouped.items()}
+        with self._lock:
+            return self._insert(key, result)
+
+    def invalidate(self, fingerprint: str) -> int:
+        """Drop every entry whose slice touched the region ``fingerprint``."""
+        with self._lock:
+            keys = list(self._by_region.get(fingerprint, ()))
+            for key in keys:
+                self._discard(key)
+            return len(keys)
+
+    def _insert(self, key: tuple, result: dict[str, array]) -> bool:
+        size = _ENTRY_OVERHEAD + sum(
+            sys.getsizeof(offsets) + len(fp) for fp, offsets in result.items()
+        )
+        if size > self.max_bytes:
+            return False
+        self._discard(key)
+        self._entries[key] = (result, size)
+        self.size_bytes += size
+        for fp in result:
+            self._by_region.setdefault(fp, set()).add(key)
+        while self.size_bytes > self.max_bytes:
+            self._discard(next(iter(self._entries)))
+            self.evictions += 1
+        return True
+
+    def _discard(self, key: tuple) -> None:
+        entry = self._entries.pop(key, None)
+        if entry is None:
+            return
+        result, size = entry
+        self.size_bytes -= size
+        for fp in result:
+            keys = self._by_region.get(fp)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del self._by_region[fp]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._by_region.clear()
+            self.size_bytes = 0
+            self.hits = 0
+            self.misses = 0
+            self.evictions = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get_stats(self) -> dict[str, int]:
+        """Return hit/miss/eviction counters and current size."""
+        return {
+            "entries": len(self._entries),
+            "size_bytes": self.size_bytes,
+            "max_bytes": self.max_bytes,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+        }
+
+    def save(self, path: Union[str, Path]) -> None:
+        """Persist all entries (in LRU order) to ``path`` as JSON."""
+        with self._lock:
+            entries = [
+                {
+                    "key": _encode_key(key),
+                    "slice": {fp: offsets.tolist() for fp, offsets in result.items()},
+                }
+                for key, (result, _) in self._entries.items()
+            ]
+        target = Path(path)
+        target.parent.mkdir(parents=True, exist_ok=True)
+        payload = {"format": _FILE_FORMAT, "version": _FILE_VERSION, "entries": entries}
+        target.write_text(json.dumps(payload), encoding="utf-8")
+
+    @classmethod
+    def load(
+        cls, path: Union[str, Path], max_bytes: int = 64 * 1024 * 1024
+    ) -> SliceCache:
+        """
+        Load a cache saved with :meth:`save` (empty if ``path`` is missing).
+
+        Raises:
+            ValueError: If the file is not a slice cache of a supported
+                version or an entry is malformed.
+        """
+        cache = cls(max_bytes=max_bytes)
+        target = Path(path)
+        if not target.exists():
+            return cache
+        payload = json.loads(target.read_text(encoding="utf-8"))
+        if (
+            not isinstance(payload, dict)
+            or payload.get("format") != _FILE_FORMAT
+            or payload.get("version") != _FILE_VERSION
+            or not isinstance(payload.get("entries"), list)
+        ):
+            raise ValueError(f"{target} is not a supported slice cache file")
+        with cache._lock:
+            for entry in payload["entries"]:
+                try:
+                    key = _decode_key(entry["key"])
+                    result = {
+                        str(fp): array("l", (int(k) for k in offsets))
+                        for fp, offsets in entry["slice"].items()
+                    }
+                except (KeyError, TypeError, ValueError, AttributeError) as exc:
+                    raise ValueError(
+                        f"malformed slice cache entry in {target}"
+                    ) from exc
+                cache._insert(key, result)
+        return cache
+
+
+def _encode_key(key: tuple) -> list[Any]:
+    kind, node_seeds, variable_seeds, options = key
+    return [
+        kind,
+        sorted([fp, offset] for fp, offset in node_seeds),
+        sorted([fp, offset] for fp, offset in variable_seeds),
+        list(options),
+    ]
+
+
+def _decode_key(raw: list[Any]) -> tuple:
+    kind, node_seeds, variable_seeds, options = raw
+    return SliceCache.make_key(
+        str(kind),
+        ((str(fp), int(offset)) for fp, offset in node_seeds),
+        ((str(fp), int(offset)) for fp, offset in variable_seeds),
+        *(_as_tuple(option) for option in options),
+    )
+
+
+def _as_tuple(value: Any) -> Any:
+    """Undo JSON's tuple-to-list conversion for key options."""
+    if isinstance(value, list):
+        return tuple(_as_tuple(item) for item in value)
+    return value
+
+
+_DEFAULT_SLICE_CACHE = SliceCache()
+
+
+def get_slice_cache() -> SliceCache:
+    """Return the process-wide slice cache."""
+    return _DEFAULT_SLICE_CACHE
@@ -5,6 +5,9 @@ from typing import Optional, Union
 
 import networkx as nx
 
+from .compact import CompactPDG
+from .slice_cache import PDGRegions, SliceCache, get_slice_cache
+
 
 class SliceType(Enum):
     """Types of program slices."""
@@ -45,18 +48,41 @@ class SliceInfo:
 class ProgramSlicer:
     """Advanced program slicer with multiple slicing strategies."""
 
-    def __init__(self, pdg: nx.DiGraph):
+    def __init__(
+        self,
+        pdg: Union[nx.DiGraph, CompactPDG],
+        slice_cache: Optional[SliceCache] = None,
+    ):
+        # [20261018_PERF] Worklists run over the array-backed CompactPDG; a
+        # networkx input is converted once and kept for exact subgraph export.
         self.pdg = pdg
+        self.compact = (
+            pdg if isinstance(pdg, CompactPDG) else CompactPDG.from_networkx(pdg)
+        )
         self.cache = {}
+        # [20261018_PERF] Shared across slicers so rebuilt PDGs reuse slices of
+        # functions whose content did not change.
+        self.slice_cache = slice_cache if slice_cache is not None else get_slice_cache()
+        self._regions: Optional[PDGRegions] = None
         self._initialize_indices()
 
+    @property
+    def regions(self) -> PDGRegions:
+        """Per-function regions and fingerprints of the PDG (built lazily)."""
+        if self._regions is None:
+            self._regions = PDGRegions(self.compact)
+        return self._regions
+
     def _initialize_indices(self):
         """Initialize indices for faster slicing."""
         self.var_def_sites = defaultdict(set)
         self.var_use_sites = defaultdict(set)
         self.line_to_nodes = defaultdict(set)
 
-        for node, data in self.pdg.nodes(data=True):
+        compact = self.compact
+        for i, node in enumerate(compact.node_ids):
+            data = compact.metadata[i]
+            lineno = compact.linenos[i]
             # Index variable definitions
             if "defines" in data:
                 for var in data["defines"]:
@@ -68,7 +94,9 @@ class ProgramSlicer:
                     self.var_use_sites[var].add(node)
 
             # Index line numbers
-            if "lineno" in data:
+            if lineno != -1:
+                self.line_to_nodes[lineno].add(node)
+            elif "lineno" in data:
                 self.line_to_nodes[data["lineno"]].add(node)
 
     def compute_slice(
@@ -98,6 +126,15 @@ class ProgramSlicer:
         if cache_key in self.cache:
             return self.cache[cache_key].copy()
 
+        shared_key = self._make_shared_cache_key(criteria, slice_type)
+        if shared_key is not None:
+            cached = self.slice_cache.lookup(shared_key, self.regions)
+            if cached is not None:
+                ids = self.compact.node_ids
+                sliced_pdg = self._induce_subgraph({ids[i] for i in cached})
+                self.cache[cache_key] = sliced_pdg
+                return sliced_pdg.copy()
+
         if slice_type == SliceType.BACKWARD:
             sliced_pdg = self._compute_backward_slice(criteria)
         elif slice_type == SliceType.FORWARD:
@@ -111,6 +148,10 @@ class ProgramSlicer:
             sliced_pdg = self._compute_backward_slice(criteria)
 
         self.cache[cache_key] = sliced_pdg
+        if shared_key is not None:
+            self.slice_cache.store(
+                shared_key, self.regions, self.compact.indices(sliced_pdg.nodes)
+            )
         return sliced_pdg.copy()
 
     def get_slice_info(self, sliced_pdg: nx.DiGraph) -> SliceInfo:
@@ -208,52 +249,28 @@ class ProgramSlicer:
 
     def _compute_backward_slice(self, criteria: SlicingCriteria) -> nx.DiGraph:
         """Compute a backward slice."""
-        sliced_nodes = set()
-        worklist = set()
-
-        # Initialize worklist
-        worklist.update(criteria.nodes)
+        seeds = set(criteria.nodes)
         for var in criteria.variables:
-            worklist.update(self.var_def_sites[var])
-
-        while worklist:
-            node = worklist.pop()
-            if node in sliced_nodes:
-                continue
-
-            sliced_nodes.add(node)
-
-            # Add dependencies based on criteria
-            if criteria.include_data:
-                worklist.update(self._get_data_dependencies(node))
-            if criteria.include_control:
-                worklist.update(self._get_control_dependencies(node))
+            seeds.update(self.var_def_sites[var])
 
+        sliced_nodes = self.compact.backward_slice(
+            seeds,
+            include_data=criteria.include_data,
+            include_control=criteria.include_control,
+        )
         return self._induce_subgraph(sliced_nodes)
 
     def _compute_forward_slice(self, criteria: SlicingCriteria) -> nx.DiGraph:
         """Compute a forward slice."""
-        sliced_nodes = set()
-        worklist = set()
-
-        # Initialize worklist
-        worklist.update(criteria.nodes)
+        seeds = set(criteria.nodes)
         for var in criteria.variables:
-            worklist.update(self.var_use_sites[var])
-
-        while worklist:
-            node = worklist.pop()
-            if node in sliced_nodes:
-                continue
-
-            sliced_nodes.add(node)
-
-            # Add dependents based on criteria
-            if criteria.include_data:
-                worklist.update(self._get_data_dependents(node))
-            if criteria.include_control:
-                worklist.update(self._get_control_dependents(node))
+            seeds.update(self.var_use_sites[var])
 
+        sliced_nodes = self.compact.forward_slice(
+            seeds,
+            include_data=criteria.include_data,
+            include_control=criteria.include_control,
+        )
         return self._induce_subgraph(sliced_nodes)
 
     def _compute_thin_slice(self, criteria: SlicingCriteria) -> nx.DiGraph:
@@ -302,43 +319,23 @@ class ProgramSlicer:
 
     def _get_data_dependencies(self, node: str) -> set[str]:
         """Get all nodes that the given node data-depends on."""
-        deps = set()
-        for pred, _, data in self.pdg.in_edges(node, data=True):
-            if data.get("type") == "data_dependency":
-                deps.add(pred)
-        return deps
+        return self.compact.data_dependencies(node)
 
     def _get_control_dependencies(self, node: str) -> set[str]:
         """Get all nodes that the given node control-depends on."""
-        deps = set()
-        for pred, _, data in self.pdg.in_edges(node, data=True):
-            if data.get("type") == "control_dependency":
-                deps.add(pred)
-        return deps
+        return self.compact.control_dependencies(node)
 
     def _get_data_dependents(self, node: str) -> set[str]:
         """Get all nodes that data-depend on the given node."""
-        deps = set()
-        for _, succ, data in self.pdg.out_edges(node, data=True):
-            if data.get("type") == "data_dependency":
-                deps.add(succ)
-        return deps
+        return self.compact.data_dependents(node)
 
     def _get_control_dependents(self, node: str) -> set[str]:
         """Get all nodes that control-depend on the given node."""
-        deps = set()
-        for _, succ, data in self.pdg.out_edges(node, data=True):
-            if data.get("type") == "control_dependency":
-                deps.add(succ)
-        return deps
+        return self.compact.control_dependents(node)
 
     def _get_direct_data_dependencies(self, node: str) -> set[str]:
         """Get only direct data dependencies (no transitive closure)."""
-        return {
-            pred
-            for pred, _, data in self.pdg.in_edges(node, data=True)
-            if data.get("type") == "data_dependency"
-        }
+        return self.compact.data_dependencies(node)
 
     def _calculate_slice_complexity(self, sliced_pdg: nx.DiGraph) -> int:
         """Calculate complexity of a slice."""
@@ -352,6 +349,8 @@ class ProgramSlicer:
 
     def _induce_subgraph(self, nodes: set[str]) -> nx.DiGraph:
         """Create a subgraph from the given nodes, preserving edge attributes."""
+        if isinstance(self.pdg, CompactPDG):
+            return self.pdg.induced_subgraph(nodes)
         subgraph = self.pdg.subgraph(nodes)
         return nx.DiGraph(subgraph)
 
@@ -368,10 +367,52 @@ class ProgramSlicer:
             slice_type,
         )
 
+    def _make_shared_cache_key(
+        self, criteria: SlicingCriteria, slice_type: SliceType
+    ) -> Optional[tuple]:
+        """
+        Create a content-addressed key for the shared slice cache.
+
+        Seeds are expressed as stable (function fingerprint, position) pairs.
+        Variable criteria are resolved to their definition/use sites first,
+        so a new definition in another function changes the key. Returns
+        None when a seed lies in a function whose fingerprint is ambiguous.
+        """
+        if slice_type == SliceType.FORWARD:
+            variable_sites = [self.var_use_sites[var] for var in criteria.variables]
+        elif slice_type == SliceType.THIN:
+            variable_sites = [
+                self.var_def_sites[var] | self.var_use_sites[var]
+                for var in criteria.variables
+            ]
+        elif slice_type in (SliceType.UNION, SliceType.INTERSECTION):
+            variable_sites = []
+        else:
+            variable_sites = [self.var_def_sites[var] for var in criteria.variables]
+
+        regions = self.regions
+        seeds = []
+        for nodes in (criteria.nodes, set().union(*variable_sites)):
+            positions = []
+            for i in self.compact.indices(nodes):
+                position = regions.position(i)
+                if position is None:
+                    return None
+                positions.append(position)
+            seeds.append(positions)
+        return SliceCache.make_key(
+            slice_type.value,
+            seeds[0],
+            seeds[1],
+            criteria.line_range,
+            criteria.include_control,
+            criteria.include_data,
+        )
+
 
 # Utility functions
 def compute_slice(
-    pdg: nx.DiGraph,
+    pdg: Union[nx.DiGraph, CompactPDG],
     node: str,
     backward: bool = True,
     criteria: Optional[SlicingCriteria] = None,
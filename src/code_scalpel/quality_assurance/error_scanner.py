@@ -46,7 +46,7 @@ import time
 from dataclasses import dataclass, field
 from enum import Enum
 from pathlib import Path
-from subprocess import TimeoutExpired
+from typing import Any
 
 logger = logging.getLogger(__name__)
 
@@ -309,42 +309,19 @@ class ErrorScanner:
         except ImportError:
             logger.debug("mypy not available, skipping type checking")
 
-        # Try flake8 for linting
-        try:
-            for file_path in files:
-                errors = self._parse_flake8_errors(str(file_path))
-                if errors:
-                    batch_errors[str(file_path)].extend(errors)
-
-        except Exception as e:
-            logger.debug(f"flake8 check failed: {e}")
-
-        # Try ruff for fast linting
-        try:
-            for file_path in files:
-                errors = self._parse_ruff_errors(str(file_path))
-                if errors:
+        # [20261018_PERF] One linter process per chunk of files (not per
+        # file), with diagnostics cached by content hash across scans.
+        linters = ["flake8", "ruff"] + (["pylint"] if self.use_pylint else [])
+        for tool in linters:
+            try:
+                for file_key, errors in self._lint_errors(tool, files).items():
                     # Merge with existing errors, avoiding duplicates
                     for error in errors:
-                        if error not in batch_errors[str(file_path)]:
-                            batch_errors[str(file_path)].append(error)
-
-        except Exception as e:
-            logger.debug(f"ruff check failed: {e}")
-
-        # Try pylint for comprehensive analysis
-        if self.use_pylint:
-            try:
-                for file_path in files:
-                    errors = self._parse_pylint_errors(str(file_path))
-                    if errors:
-                        # Merge with existing errors, avoiding duplicates
-                        for error in errors:
-                            if error not in batch_errors[str(file_path)]:
-                                batch_errors[str(file_path)].append(error)
+                        if error not in batch_errors[file_key]:
+                            batch_errors[file_key].append(error)
 
             except Exception as e:
-                logger.debug(f"pylint check failed: {e}")
+                logger.debug(f"{tool} check failed: {e}")
 
         # Final fallback: syntax checking for any unchecked files
         for file_path in files:
@@ -420,216 +397,74 @@ class ErrorScanner:
 
         return errors
 
-    def _parse_flake8_errors(self, file_path: str) -> list[CodeError]:
+    def _lint_errors(self, tool: str, files: list[Path]) -> dict[str, list[CodeError]]:
         """
-        Parse flake8 errors for a file.
+        Run flake8, ruff or pylint over files through the lint orchestrator.
 
         Args:
-            file_path: Path to the file to check
+            tool: "flake8", "ruff" or "pylint"
+            files: Files to check
 
         Returns:
-            List of CodeError objects
+            Dict mapping each file path to its CodeError objects
         """
-        errors = []
-
-        try:
-            import subprocess
+        from code_scalpel.code_parsers.lint_orchestrator import lint_files
 
-            result = subprocess.run(
-                ["flake8", file_path, "--max-line-length=120"],
-                capture_output=True,
-                text=True,
+        config: Any = None
+        if tool == "flake8":
+            from code_scalpel.code_parsers.python_parsers.python_parsers_flake8 import (
+                Flake8Config,
             )
 
-            if result.stdout:
-                for line in result.stdout.strip().split("\n"):
-                    if not line.strip():
-                        continue
-
-                    # Parse: file.py:line:column: code message
-                    parts = line.split(":", 3)
-                    if len(parts) < 4:
-                        continue
-
-                    try:
-                        line_num = int(parts[1].strip())
-                        col_num = int(parts[2].strip())
-                    except ValueError:
-                        continue
-
-                    message_part = parts[3].strip()
-
-                    # Extract error code (e.g., F401, E302)
-                    code_match = message_part.split(" ", 1)
-                    error_code = code_match[0] if code_match else "unknown"
-                    message = code_match[1] if len(code_match) > 1 else message_part
-
-                    # Map flake8 codes to severity
-                    if error_code.startswith("E") or error_code.startswith("F"):
-                        severity = ErrorSeverity.ERROR
-                    elif error_code.startswith("W"):
-                        severity = ErrorSeverity.WARNING
-                    else:
-                        severity = ErrorSeverity.INFO
-
-                    errors.append(
-                        CodeError(
-                            file_path=file_path,
-                            line_number=line_num,
-                            column=col_num,
-                            message=message,
-                            error_type=f"flake8_{error_code}",
-                            severity=severity,
-                        )
-                    )
-
-        except (ImportError, FileNotFoundError):
-            logger.debug("flake8 command not available")
-        except Exception as e:
-            logger.debug(f"Error parsing flake8 output: {e}")
-
-        return errors
-
-    def _parse_ruff_errors(self, file_path: str) -> list[CodeError]:
-        """
-        Parse ruff linting errors for a file.
-
-        Args:
-            file_path: Path to the file to check
-
-        Returns:
-            List of CodeError objects
-        """
-        errors = []
-
-        try:
-            import subprocess
-
-            result = subprocess.run(
-                ["ruff", "check", file_path, "--output-format=text"],
-                capture_output=True,
-                text=True,
+            config = Flake8Config(max_line_length=120)
+        elif tool == "pylint":
+            from code_scalpel.code_parsers.python_parsers.python_parsers_pylint import (
+                PylintConfig,
             )
 
-            if result.stdout:
-                for line in result.stdout.strip().split("\n"):
-                    if not line.strip() or line.startswith("All checks passed"):
-                        continue
-
-                    # Parse: file.py:line:column: code message
-                    parts = line.split(":", 3)
-                    if len(parts) < 4:
-                        continue
-
-                    try:
-                        line_num = int(parts[1].strip())
-                        col_num = int(parts[2].strip())
-                    except ValueError:
-                        continue
-
-                    message_part = parts[3].strip()
-
-                    # Extract error code (e.g., F401, E302)
-                    code_match = message_part.split(" ", 1)
-                    error_code = code_match[0] if code_match else "unknown"
-                    message = code_match[1] if len(code_match) > 1 else message_part
-
-                    # Map ruff codes to severity
-                    if error_code.startswith("E") or error_code.startswith("F"):
-                        severity = ErrorSeverity.ERROR
-                    elif error_code.startswith("W"):
-                        severity = ErrorSeverity.WARNING
-                    else:
-                        severity = ErrorSeverity.INFO
-
-                    errors.append(
-                        CodeError(
-                            file_path=file_path,
-                            line_number=line_num,
-                            column=col_num,
-                            message=message,
-                            error_type=f"ruff_{error_code}",
-                            severity=severity,
-                        )
-                    )
-
-        except (ImportError, FileNotFoundError):
-            logger.debug("ruff command not available")
-        except Exception as e:
-            logger.debug(f"Error parsing ruff output: {e}")
-
-        return errors
-
-    def _parse_pylint_errors(self, file_path: str) -> list[CodeError]:
-        """
-        Parse pylint errors for a file.
-
-        Args:
-            file_path: Path to the file to check
-
-        Returns:
-            List of CodeError objects
-        """
-        errors = []
-
-        try:
-            import json
-            import subprocess
-
-            result = subprocess.run(
-                [
-                    "pylint",
-                    file_path,
-                    "--output-format=json",
-                    "--disable=all",
-                    "--enable=E,W,C0101,C0103,W0611,W0612",
-                ],
-                capture_output=True,
-                text=True,
-                timeout=30,
+            config = PylintConfig(
+                disable=["all"], enable=["E", "W", "C0101", "C0103", "W0611", "W0612"]
             )
 
-            if result.stdout:
-                try:
-                    messages = json.loads(result.stdout)
-                    for msg in messages:
-                        error_code = msg.get("symbol", "unknown")
-                        line_num = msg.get("line", 0)
-                        col_num = msg.get("column", 0)
-                        message = msg.get("message", "")
-
-                        # Map pylint codes to severity
-                        if error_code.startswith("E") or error_code in [
-                            "unused-import",
-                            "undefined-variable",
-                        ]:
-                            severity = ErrorSeverity.ERROR
-                        elif error_code.startswith("W"):
-                            severity = ErrorSeverity.WARNING
-                        else:
-                            severity = ErrorSeverity.INFO
-
-                        errors.append(
-                            CodeError(
-                                file_path=file_path,
-                                line_number=line_num,
-                                column=col_num,
-                                message=message,
-                                error_type=f"pylint_{error_code}",
-                                severity=severity,
-                            )
-                        )
-                except json.JSONDecodeError:
-                    logger.debug("Failed to parse pylint JSON output")
-
-        except (ImportError, FileNotFoundError):
-            logger.debug("pylint command not available")
-        except TimeoutExpired:
-            logger.debug("pylint check timed out")
-        except Exception as e:
-            logger.debug(f"Error parsing pylint output: {e}")
-
-        return errors
+        run = lint_files(tool, [str(f) for f in files], config=config)
+        if self.verbose:
+            for error in run.errors:
+                logger.debug(f"{tool}: {error}")
+
+        results: dict[str, list[CodeError]] = {}
+        for file_path, diagnostics in run.diagnostics.items():
+            errors = []
+            for diagnostic in diagnostics:
+                # pylint is keyed by symbol, flake8 and ruff by code (E302)
+                if tool == "pylint":
+                    error_code = diagnostic.symbol or "unknown"
+                    is_error = error_code.startswith("E") or error_code in [
+                        "unused-import",
+                        "undefined-variable",
+                    ]
+                else:
+                    error_code = diagnostic.code or "unknown"
+                    is_error = error_code.startswith(("E", "F"))
+
+                if is_error:
+                    severity = ErrorSeverity.ERROR
+                elif error_code.startswith("W"):
+                    severity = ErrorSeverity.WARNING
+                else:
+                    severity = ErrorSeverity.INFO
+
+                errors.append(
+                    CodeError(
+                        file_path=file_path,
+                        line_number=diagnostic.line,
+                        column=diagnostic.column,
+                        message=diagnostic.message,
+                        error_type=f"{tool}_{error_code}",
+                        severity=severity,
+                    )
+                )
+            results[file_path] = errors
+        return results
 
     def _check_file_syntax(self, file_path: Path) -> list[CodeError]:
         """
@@ -59,6 +59,7 @@ class SecurityAnalysisResultDict(TypedDict):
 # [20260102_REFACTOR] Keep imports below to allow class/type definitions before heavy modules.
 # ruff: noqa: E402
 # [20251225_REFACTOR] Updated import path after security module reorganization
+from code_scalpel.parsing.artifact_store import parse_python_ast
 from ..secrets.secret_scanner import SecretScanner
 from .taint_tracker import detect_ssr_vulnerabilities  # [20251216_FEATURE] v2.2.0
 from .taint_tracker import (
@@ -381,7 +382,7 @@ class SecurityAnalyzer:
             return SecurityAnalysisResult()
 
         try:
-            tree = ast.parse(code)
+            tree = parse_python_ast(code)
         except SyntaxError:
             return SecurityAnalysisResult()
 
@@ -33,6 +33,7 @@ class CoverageReportDict(TypedDict, total=False):
 
 # [20260102_REFACTOR] Keep imports below to allow type declarations before heavy modules.
 # ruff: noqa: E402
+from code_scalpel.parsing.artifact_store import parse_python_ast
 from .taint_tracker import SecuritySink, TaintInfo, TaintLevel
 
 
@@ -2067,7 +2068,7 @@ class UnifiedSinkDetector:
     ) -> List[DetectedSink]:
         """Detect sinks in Python code using AST and Taint Tracking."""
         try:
-            tree = ast.parse(code)
+            tree = parse_python_ast(code)
         except SyntaxError:
             return []
 
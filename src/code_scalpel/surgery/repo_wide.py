@@ -191,36 +191,39 @@ class RepoWideRename:
         Returns:
             List of file paths to process
         """
+        from code_scalpel.analysis.source_walker import walk_source_files
+
         candidates = []
         files_found = 0
 
-        for root, dirs, files in os.walk(self.project_root):
-            # Skip excluded directories (modify in-place to prune walk)
-            dirs[:] = [
-                d for d in dirs if d not in self.SKIP_DIRS and not d.startswith(".")
-            ]
-
-            for filename in files:
-                file_path = Path(root) / filename
-
-                # Apply extension filter if provided
-                if file_extensions and file_path.suffix not in file_extensions:
-                    continue
+        # [20261018_PERF] One pruned scandir walk; skipped directories are
+        # never listed
+        walk = walk_source_files(
+            self.project_root,
+            extensions=file_extensions or None,
+            exclude_dirs=self.SKIP_DIRS,
+            skip_hidden_dirs=True,
+            include_unknown=True,
+            with_size=False,
+            max_workers=self.max_workers,
+        )
+        for file_info in walk.all_files():
+            file_path = Path(file_info.path)
 
-                # Check if should skip
-                should_skip, reason = self.should_skip_file(file_path)
-                if should_skip:
-                    continue
+            # Check if should skip
+            should_skip, reason = self.should_skip_file(file_path)
+            if should_skip:
+                continue
 
-                # If no extension filter, check if text file
-                if not file_extensions and not self.is_text_file(file_path):
-                    continue
+            # If no extension filter, check if text file
+            if not file_extensions and not self.is_text_file(file_path):
+                continue
 
-                candidates.append(file_path)
-                files_found += 1
+            candidates.append(file_path)
+            files_found += 1
 
-                if progress_callback and files_found % 100 == 0:
-                    progress_callback(files_found)
+            if progress_callback and files_found % 100 == 0:
+                progress_callback(files_found)
 
         return candidates
 
@@ -0,0 +1,271 @@
+"""
+[20261018_TEST] Metrics engine: shared parse, value cache, process pool.
+
+Collectors share one parse per file, values are cached per collector version
+and content hash so re-runs only measure changed files, and a process pool
+produces the same report as the sequential path.
+"""
+
+import os
+from pathlib import Path
+
+import pytest
+
+from code_scalpel.analysis import custom_metrics
+from code_scalpel.analysis.custom_metrics import (
+    LinesOfCodeCollector,
+    MetricCollector,
+    MetricsCollector,
+    MetricValue,
+)
+
+OLD = 1_600_000_000
+
+SOURCES = {
+    "app/main.py": (
+        "import os, sys\nfrom json import loads\n\n"
+        "class App:\n    def run(self, x):\n"
+        "        if x and os:\n            return [i for i in x if i]\n"
+        "        # TODO: handle empty input\n"
+    ),
+    "app/util.py": "def helper():\n    return 1\n",
+    "app/broken.py": "def broken(:\n",
+    "web/index.js": "import x from 'lib';\nfunction main() {}\nclass Widget {}\n",
+    "node_modules/dep/index.js": "function ignored() {}\n",
+}
+
+
+class SizeCollector(MetricCollector):
+    version = "1"
+
+    @property
+    def name(self):
+        return "size"
+
+    def collect(self, file_path, content):
+        return MetricValue(name=self.name, value=len(content))
+
+
+def _make_project(root: Path) -> None:
+    for rel, content in SOURCES.items():
+        path = root / rel
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(content)
+        os.utime(path, (OLD, OLD))
+
+
+def _values(report):
+    return {
+        path: [(m.name, m.value, m.details) for m in metrics]
+        for path, metrics in report.file_metrics.items()
+    }
+
+
+@pytest.fixture
+def parsed(monkeypatch):
+    calls = []
+    real_parse = custom_metrics.ast.parse
+
+    def counting_parse(source, *args, **kwargs):
+        calls.append(source)
+        return real_parse(source, *args, **kwargs)
+
+    monkeypatch.setattr(custom_metrics.ast, "parse", counting_parse)
+    return calls
+
+
+def test_collectors_share_one_parse_per_file(tmp_path, parsed):
+    _make_project(tmp_path)
+    report = MetricsCollector().collect(tmp_path)
+
+    assert len(parsed) == 3  # one per .py file, not one per collector
+    assert sorted(report.file_metrics) == [
+        "app/broken.py",
+        "app/main.py",
+        "app/util.py",
+        "web/index.js",
+    ]
+    main = {m.name: m.value for m in report.file_metrics["app/main.py"]}
+    assert main == {
+        "lines_of_code": 6,
+        "cyclomatic_complexity": 5,
+        "function_count": 1,
+        "class_count": 1,
+        "import_count": 3,
+        "todo_count": 1,
+    }
+    # invalid syntax: no complexity, zero counts
+    broken = {m.name: m.value for m in report.file_metrics["app/broken.py"]}
+    assert "cyclomatic_complexity" not in broken and broken["function_count"] == 0
+
+    # collect() on a collector still parses on its own
+    path = tmp_path / "app/util.py"
+    assert LinesOfCodeCollector().collect(path, path.read_text()).value == 2
+
+
+def test_line_endings_are_normalized_before_measuring(tmp_path):
+    (tmp_path / "crlf.py").write_bytes(b"a = 1\r\nb = 2\r\n\r\nc = 3\rd = 4\r\n")
+    collector = MetricsCollector()
+    collector.register_collector(SizeCollector())
+    values = {
+        m.name: m.value for m in collector.collect(tmp_path).file_metrics["crlf.py"]
+    }
+
+    text = (tmp_path / "crlf.py").read_text()
+    assert values["size"] == len(text) == 25
+    assert values["lines_of_code"] == 4
+
+
+def test_summaries_are_aggregated_incrementally(tmp_path):
+    _make_project(tmp_path)
+    collector = MetricsCollector()
+    report = collector.collect(tmp_path)
+    assert report.summaries == collector._calculate_summaries(report.metrics)
+    loc = report.summaries["lines_of_code"]
+    assert (loc.total, loc.count, loc.min_value, loc.max_value) == (12, 4, 1, 6)
+
+
+def test_rerun_only_measures_changed_files(tmp_path, parsed):
+    _make_project(tmp_path)
+    first = MetricsCollector(enable_cache=True).collect(tmp_path)
+    assert first.metadata["files_measured"] == 4
+
+    (tmp_path / "app/util.py").write_text("def helper():\n    if x:\n        pass\n")
+    os.utime(tmp_path / "app/main.py", (OLD + 5, OLD + 5))  # touched only
+    parsed.clear()
+    collector = MetricsCollector(enable_cache=True)
+    second = collector.collect(tmp_path)
+
+    assert (collector._cache_hits, collector._cache_misses) == (2, 2)
+    assert len(parsed) == 1  # main.py was hashed, found unchanged, not parsed
+    assert _values(second) == _values(MetricsCollector().collect(tmp_path))
+
+    third = MetricsCollector(enable_cache=True)
+    third.collect(tmp_path)
+    assert (third._cache_hits, third._cache_misses) == (4, 0)
+
+
+def test_cache_keys_follow_collector_versions(tmp_path, parsed):
+    _make_project(tmp_path)
+    collector = MetricsCollector(enable_cache=True)
+    collector.register_collector(SizeCollector())
+    collector.register_metric("cached_len", lambda p, c: len(c), version="1")
+    collector.collect(tmp_path)
+
+    again = MetricsCollector(enable_cache=True)
+    again.register_collector(SizeCollector())
+    again.register_metric("cached_len", lambda p, c: len(c), version="1")
+    again.collect(tmp_path)
+    assert again._cache_misses == 0
+
+    bumped = SizeCollector()
+    bumped.version = "2"
+    parsed.clear()
+    upgraded = MetricsCollector(enable_cache=True)
+    upgraded.register_collector(bumped)
+    upgraded.register_metric("cached_len", lambda p, c: len(c), version="1")
+    report = upgraded.collect(tmp_path)
+    assert upgraded._cache_misses == 4  # only "size" was re-measured
+    assert parsed == []
+    assert {m.name for m in report.file_metrics["app/util.py"]} >= {
+        "size",
+        "cached_len",
+        "cyclomatic_complexity",
+    }
+
+    unversioned = MetricsCollector(enable_cache=True)
+    unversioned.register_metric("live", lambda p, c: 1)
+    unversioned.collect(tmp_path)
+    unversioned.collect(tmp_path)
+    assert unversioned._cache_misses == 4  # never cached
+
+
+def test_process_pool_matches_sequential(tmp_path, monkeypatch):
+    _make_project(tmp_path)
+    for i in range(8):
+        (tmp_path / f"app/mod{i}.py").write_text(f"def f{i}(x):\n    return x\n")
+    expected = _values(MetricsCollector().collect(tmp_path))
+
+    pools = []
+
+    class RecordingPool(custom_metrics.ProcessPoolExecutor):
+        def __init__(self, *args, **kwargs):
+            pools.append(kwargs["max_workers"])
+            super().__init__(*args, **kwargs)
+
+    monkeypatch.setattr(custom_metrics, "ProcessPoolExecutor", RecordingPool)
+    monkeypatch.setattr(custom_metrics, "_MIN_FILES_PER_WORKER", 2)
+    monkeypatch.setattr(custom_metrics.os, "cpu_count", lambda: 2)
+    pooled = MetricsCollector(parallelism="processes", enable_cache=True)
+    pooled.register_collector(SizeCollector())
+    report = pooled.collect(tmp_path)
+    assert _values(report) == {
+        path: metrics + [("size", len((tmp_path / path).read_text()), {})]
+        for path, metrics in expected.items()
+    }
+    assert pools == [2]
+
+    # Unpicklable metric functions fall back to measuring in-process
+    local = MetricsCollector(parallelism="processes")
+    local.register_metric("nonzero", lambda p, c: 1)
+    assert all(
+        metrics[-1].name == "nonzero"
+        for metrics in local.collect(tmp_path).file_metrics.values()
+    )
+    assert pools == [2]
+
+
+class UnversionedCollector(SizeCollector):
+    version = None
+
+
+class SetDetailsCollector(SizeCollector):
+    @property
+    def name(self):
+        return "set_details"
+
+    def collect(self, file_path, content):
+        return MetricValue(name=self.name, value=1, details={"seen": {1}})
+
+
+class UnloadableCollector(SizeCollector):
+    def __init__(self):
+        self.state = "pickled"  # empty state would skip __setstate__
+
+    def __setstate__(self, state):
+        raise RuntimeError("only loads in the parent")
+
+
+def test_only_versioned_collectors_are_cached(tmp_path):
+    _make_project(tmp_path)
+    for _ in range(2):
+        collector = MetricsCollector(enable_cache=True)
+        collector.register_collector(UnversionedCollector())
+        collector.collect(tmp_path)
+    assert collector._cache_misses == 4
+
+
+def test_unserializable_details_skip_only_their_values(tmp_path):
+    _make_project(tmp_path)
+    for _ in range(2):
+        collector = MetricsCollector(enable_cache=True)
+        collector.register_collector(SetDetailsCollector())
+        report = collector.collect(tmp_path)
+    assert collector._cache_misses == 4  # only set_details is re-measured
+    cache = tmp_path / ".code-scalpel" / "cache" / "metrics_cache_v1.json"
+    assert "c:lines_of_code@1" in cache.read_text()
+    assert "c:set_details@1" not in cache.read_text()
+    assert report.file_metrics["app/util.py"][-1].details == {"seen": {1}}
+
+
+def test_broken_process_pool_falls_back_to_in_process(tmp_path, monkeypatch):
+    _make_project(tmp_path)
+    for i in range(8):
+        (tmp_path / f"app/mod{i}.py").write_text(f"def f{i}(x):\n    return x\n")
+    monkeypatch.setattr(custom_metrics, "_MIN_FILES_PER_WORKER", 2)
+    monkeypatch.setattr(custom_metrics.os, "cpu_count", lambda: 2)
+    pooled = MetricsCollector(parallelism="processes")
+    pooled.register_collector(UnloadableCollector())
+    report = pooled.collect(tmp_path)
+    assert len(report.file_metrics) == 12
+    assert all(m[-1].name == "size" for m in report.file_metrics.values())
@@ -0,0 +1,137 @@
+"""
+[20261018_TEST] Single-pass framework and generated-code detection.
+
+One walk feeds every detector, Python files are parsed only when a byte-level
+marker makes them candidates, and each candidate is parsed once even when
+several detectors read it.
+"""
+
+import ast
+
+import pytest
+
+from code_scalpel.analysis import framework_detector
+from code_scalpel.analysis.framework_detector import detect_frameworks
+from code_scalpel.analysis.generated_code import detect_generated_files
+
+FILES = {
+    "manage.py": "import django\n",
+    "shop/urls.py": (
+        "from django.urls import path\n"
+        "from . import views\n"
+        "urlpatterns = [path('items/', views.item_view)]\n"
+    ),
+    "shop/views.py": (
+        "def item_view(request):\n    pass\n\nclass ItemDetail(DetailView):\n    pass\n"
+    ),
+    "api/flask_app.py": (
+        "from flask import Flask\napp = Flask(__name__)\n\n"
+        "@app.route('/hello')\ndef hello():\n    pass\n"
+    ),
+    "api/fast.py": (
+        "from fastapi import APIRouter\nrouter = APIRouter()\n\n"
+        "@router.get('/items')\ndef items():\n    pass\n"
+    ),
+    # imports both frameworks: one parse feeds both detectors
+    "api/both.py": (
+        "import flask\nimport fastapi\n\n"
+        "@bp.route('/a')\ndef a():\n    pass\n\n"
+        "@api.post('/b')\ndef b():\n    pass\n"
+    ),
+    "lib/util.py": "def helper():\n    return 1\n",
+    "lib/broken.py": "from flask import (\n",
+    "proto/user.pb.py": "x = 1\n",
+    "shop/migrations/0001_initial.py": "x = 1\n",
+    "schema.graphql": "type Query { a: Int }\n",
+    "dist/bundle.js": "x\n",
+    # artifact copies are reported as generated and still searched for routes
+    "build/lib/api/flask_app.py": "from flask import Flask\n@app.route('/x')\ndef x(): pass\n",
+}
+
+
+@pytest.fixture
+def project(tmp_path):
+    for rel, content in FILES.items():
+        path = tmp_path / rel
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(content)
+    return tmp_path
+
+
+@pytest.fixture
+def parsed(monkeypatch):
+    calls = []
+    real_parse = ast.parse
+
+    def counting_parse(source, *args, **kwargs):
+        calls.append(source)
+        return real_parse(source, *args, **kwargs)
+
+    monkeypatch.setattr(framework_detector.ast, "parse", counting_parse)
+    return calls
+
+
+def test_single_pass_detects_all_frameworks(project, parsed):
+    result = detect_frameworks(project)
+
+    assert result.detected_frameworks == {"django", "flask", "fastapi"}
+    assert [(r.framework, r.route_pattern, r.file_path) for r in result.routes] == [
+        ("django", "items/", "shop/urls.py"),
+        ("django", "view:item_view", "shop/views.py"),
+        ("django", "cbv:ItemDetail", "shop/views.py"),
+        ("flask", "/a", "api/both.py"),
+        ("flask", "/hello", "api/flask_app.py"),
+        ("flask", "/x", "build/lib/api/flask_app.py"),
+        ("fastapi", "/b", "api/both.py"),
+        ("fastapi", "/items", "api/fast.py"),
+    ]
+    # urls, views, three framework files, the build/ copy and the broken
+    # flask import; manage.py, util.py and other generated files are not parsed
+    assert len(parsed) == 7
+
+
+def test_generated_files_from_the_same_walk(project):
+    result = detect_frameworks(project)
+    assert sorted((g["type"], g["path"]) for g in result.generated_files) == [
+        ("build_artifact", "build/lib/api/flask_app.py"),
+        ("build_artifact", "dist/bundle.js"),
+        ("django_migration", "shop/migrations/0001_initial.py"),
+        ("graphql_schema", "schema.graphql"),
+        ("protobuf", "proto/user.pb.py"),
+    ]
+
+
+def test_dependency_directories_are_not_reported(project):
+    for rel in ("venv/lib/app/migrations/0001_initial.py", "node_modules/x/m.pb.py"):
+        path = project / rel
+        path.parent.mkdir(parents=True)
+        path.write_text("from flask import Flask\n@app.route('/dep')\ndef f(): pass\n")
+    result = detect_frameworks(project)
+    paths = [g["path"] for g in result.generated_files]
+    assert not [p for p in paths if p.startswith(("venv", "node_modules"))]
+    assert "/dep" not in result.flask_routes
+
+
+def test_generated_code_detector_patterns_and_headers(tmp_path):
+    files = {
+        "api_pb2_grpc.py": "x = 1\n",
+        "models_generated.py": "x = 1\n",
+        "client.py": "#!/usr/bin/env python\n# Generated by protoc\nx = 1\n",
+        "plain.py": "# hand written\nx = 1\n",
+        "late.py": "\n" * 10 + "# Generated by tool\n",
+        "gen.go": "// Code generated by stringer; DO NOT EDIT.\n",
+    }
+    for name, content in files.items():
+        (tmp_path / name).write_text(content)
+
+    result = detect_generated_files(tmp_path)
+    found = {g.path: (g.gen_type, g.reason) for g in result.generated_files}
+    assert found == {
+        "api_pb2_grpc.py": ("protobuf_grpc", r"Matched pattern: .*_pb2_grpc\.py$"),
+        "models_generated.py": ("generated", r"Matched pattern: .*_generated\.py$"),
+        "client.py": ("header_generated", "Header matched: # Generated by"),
+        "gen.go": (
+            "header_go_generated",
+            "Header matched: // Code generated .* DO NOT EDIT",
+        ),
+    }
@@ -0,0 +1,220 @@
+"""
+[20261018_TEST] Compiled gitignore matcher conformance.
+
+Fixture trees are checked path by path against ``git check-ignore`` so the
+matcher's precedence, negation, anchoring and ``**`` handling follow git.
+"""
+
+import os
+import shutil
+import subprocess
+
+import pytest
+
+from code_scalpel.analysis.gitignore import (
+    GitignoreMatcher,
+    GitignoreParser,
+    translate_pattern,
+)
+from code_scalpel.analysis.source_walker import walk_source_files
+
+pytestmark = pytest.mark.skipif(shutil.which("git") is None, reason="git required")
+
+ROOT_IGNORE = """\
+# build output
+*.log
+!keep.log
+/build/
+dist
+docs/**/*.tmp
+**/cache/
+generated/**
+!generated/keep/
+!generated/keep/**
+vendor/*/
+\\#literal
+\\!bang
+trailing\\
+lib/[a-c]*.py
+lib/[!a-c]x.py
+lib/[[:digit:]]*.py
+a/**/z
+*.ba?
+foo**bar
+"""
+
+NESTED_IGNORE = """\
+*.py
+!main.py
+/local/
+!*.log
+"""
+
+FILES = [
+    "app.log",
+    "keep.log",
+    "build/out.js",
+    "src/build/file.py",
+    "dist",
+    "src/dist/x.js",
+    "docs/a/b/c.tmp",
+    "docs/c.tmp",
+    "src/cache/x",
+    "cache",
+    "generated/a.py",
+    "generated/keep/b.py",
+    "generated/keep/deep/c.py",
+    "vendor/pkg/x.js",
+    "vendor/x.js",
+    "#literal",
+    "!bang",
+    "trailing ",
+    "lib/a1.py",
+    "lib/d1.py",
+    "lib/dx.py",
+    "lib/ax.py",
+    "lib/7x.py",
+    "a/z",
+    "a/b/c/z",
+    "x.bak",
+    "x.bakk",
+    "foobar",
+    "fooxbar",
+    "foo/bar",
+    "pkg/util.py",
+    "pkg/main.py",
+    "pkg/local/x.txt",
+    "pkg/sub/local/x.txt",
+    "pkg/debug.log",
+    "pkg/sub/deep.py",
+    "info_excluded.txt",
+    "sub/info_excluded.txt",
+    "global.bak2",
+    "plain.txt",
+]
+
+
+def _git(repo, *args, stdin=None):
+    env = {
+        **os.environ,
+        "HOME": str(repo.parent / "home"),
+        "XDG_CONFIG_HOME": str(repo.parent / "xdg"),
+        "GIT_CONFIG_NOSYSTEM": "1",
+    }
+    return subprocess.run(
+        ["git", *args],
+        cwd=repo,
+        input=stdin,
+        capture_output=True,
+        text=True,
+        env=env,
+    )
+
+
+@pytest.fixture
+def repo(tmp_path, monkeypatch):
+    repo = tmp_path / "repo"
+    repo.mkdir()
+    (tmp_path / "home").mkdir()
+    xdg_git = tmp_path / "xdg" / "git"
+    xdg_git.mkdir(parents=True)
+    (xdg_git / "ignore").write_text("global.bak2\n")
+    monkeypatch.setenv("HOME", str(tmp_path / "home"))
+    monkeypatch.setenv("XDG_CONFIG_HOME", str(tmp_path / "xdg"))
+    assert _git(repo, "init", "-q").returncode == 0
+
+    (repo / ".gitignore").write_text(ROOT_IGNORE)
+    (repo / "pkg").mkdir()
+    (repo / "pkg" / ".gitignore").write_text(NESTED_IGNORE)
+    (repo / ".git" / "info").mkdir(exist_ok=True)
+    (repo / ".git" / "info" / "exclude").write_text("info_excluded.txt\n")
+    for rel in FILES:
+        path = repo / rel
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text("x\n")
+    (repo / "cache").unlink()
+    (repo / "cache").mkdir()
+    return repo
+
+
+def _all_paths(repo):
+    paths = []
+    for dirpath, dirnames, filenames in os.walk(repo):
+        dirnames[:] = [d for d in dirnames if d != ".git"]
+        rel_dir = os.path.relpath(dirpath, repo).replace(os.sep, "/")
+        prefix = "" if rel_dir == "." else f"{rel_dir}/"
+        paths.extend((prefix + d, True) for d in dirnames)
+        paths.extend((prefix + f, False) for f in filenames)
+    return sorted(paths)
+
+
+def _git_ignored(repo, paths):
+    result = _git(
+        repo,
+        "check-ignore",
+        "--no-index",
+        "--stdin",
+        "-z",
+        stdin="\0".join(paths) + "\0",
+    )
+    assert result.returncode in (0, 1), result.stderr
+    return {p for p in result.stdout.split("\0") if p}
+
+
+def test_matches_git_check_ignore(repo):
+    paths = _all_paths(repo)
+    expected = _git_ignored(repo, [p for p, _ in paths])
+    matcher = GitignoreMatcher(repo)
+    actual = {p for p, is_dir in paths if matcher.is_ignored(p, is_dir=is_dir)}
+    assert sorted(actual - expected) == []
+    assert sorted(expected - actual) == []
+    # the fixture exercises both outcomes of every source
+    assert {"keep.log", "pkg/main.py", "plain.txt"}.isdisjoint(actual)
+    assert {"app.log", "pkg/util.py", "info_excluded.txt", "global.bak2"} <= actual
+
+
+def test_matcher_below_repository_top(repo):
+    paths = [p for p, _ in _all_paths(repo) if p.startswith("pkg/")]
+    expected = _git_ignored(repo, paths)
+    matcher = GitignoreMatcher(repo / "pkg")
+    actual = {
+        p
+        for p in paths
+        if matcher.is_ignored(p[len("pkg/") :], is_dir=(repo / p).is_dir())
+    }
+    assert actual == expected
+
+
+def test_walk_prunes_with_matcher(repo):
+    files = walk_source_files(
+        repo, exclude_dirs={".git"}, respect_gitignore=True, include_unknown=True
+    )
+    found = {f.rel_path for f in files.all_files()}
+    expected_ignored = _git_ignored(repo, sorted(found | set(FILES)))
+    assert found == (
+        set(FILES) | {".gitignore", "pkg/.gitignore"}
+    ) - expected_ignored - {"cache"}
+
+
+def test_matcher_picks_up_edited_gitignore(repo):
+    assert not GitignoreMatcher(repo).is_ignored("plain.txt")
+    (repo / ".gitignore").write_text(ROOT_IGNORE + "plain.txt\n")
+    assert GitignoreMatcher(repo).is_ignored("plain.txt")
+
+
+def test_parser_supports_negation_and_anchoring():
+    parser = GitignoreParser(["*.log", "!keep.log", "/top.txt", "out/"])
+    assert parser.is_ignored("a/b.log")
+    assert not parser.is_ignored("a/keep.log")
+    assert parser.is_ignored("top.txt")
+    assert not parser.is_ignored("a/top.txt")
+    assert parser.is_ignored("out", is_dir=True)
+    assert not parser.is_ignored("out")
+    assert parser.is_ignored("out/x.py")
+
+
+def test_translate_pattern():
+    assert translate_pattern("*.py") == r"[^/]*\.py"
+    assert translate_pattern("a/**/b") == "a/(?:.*/)?b"
+    assert translate_pattern("a/**") == "a/.*"
+    assert translate_pattern("x**y") == "x[^/]*y"
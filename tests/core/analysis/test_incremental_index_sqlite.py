@@ -0,0 +1,136 @@
+"""
+[20261018_TEST] IncrementalIndex SQLite backend.
+
+Connections persist per thread in WAL mode, ``batch()`` writes many rows in
+one transaction, and staleness is decided from stored stat data so only
+files whose stat changed are re-hashed.
+"""
+
+import os
+import sqlite3
+import threading
+
+import pytest
+
+from code_scalpel.analysis.incremental_index import IncrementalIndex
+
+OLD = 1_600_000_000
+
+
+def _make_files(root, count):
+    for i in range(count):
+        path = root / f"mod{i}.py"
+        path.write_text(f"x = {i}\n")
+        os.utime(path, (OLD, OLD))  # well outside the racy window
+
+
+@pytest.fixture
+def index(tmp_path):
+    (tmp_path / "cache").mkdir()
+    index = IncrementalIndex(tmp_path, cache_dir=tmp_path / "cache")
+    yield index
+    index.close()
+
+
+@pytest.fixture
+def hashed(monkeypatch):
+    calls = []
+    real_hash = IncrementalIndex.compute_file_hash
+
+    def counting_hash(self, file_path):
+        calls.append(os.fspath(file_path))
+        return real_hash(self, file_path)
+
+    monkeypatch.setattr(IncrementalIndex, "compute_file_hash", counting_hash)
+    return calls
+
+
+def test_connection_is_per_thread_and_wal(index):
+    conn = index._connect()
+    assert index._connect() is conn
+    assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+    other = []
+    thread = threading.Thread(target=lambda: other.append(index._connect()))
+    thread.start()
+    thread.join()
+    assert other[0] is not conn
+
+
+def test_batch_writes_in_one_transaction(tmp_path, index):
+    _make_files(tmp_path, 50)
+    with index.batch():
+        for i in range(50):
+            index.store_analysis(f"mod{i}.py", 1, [], [], [], [])
+        # readers on this thread see pending rows, other connections do not
+        assert len(index.get_all_cached_paths()) == 50
+        outside = sqlite3.connect(index.db_path)
+        assert outside.execute("SELECT COUNT(*) FROM file_analysis").fetchone()[0] == 0
+    assert outside.execute("SELECT COUNT(*) FROM file_analysis").fetchone()[0] == 50
+    outside.close()
+
+
+def test_batch_rolls_back_on_error(tmp_path, index):
+    _make_files(tmp_path, 3)
+    with pytest.raises(RuntimeError):
+        with index.batch():
+            for i in range(3):
+                index.store_analysis(f"mod{i}.py", 1, [], [], [], [])
+            raise RuntimeError("crawl failed")
+    assert index.get_all_cached_paths() == []
+
+
+def test_stale_files_only_rehash_changed_stat(tmp_path, index, hashed):
+    _make_files(tmp_path, 20)
+    with index.batch():
+        for i in range(20):
+            index.store_analysis(f"mod{i}.py", 1, [], [], [], [])
+    hashed.clear()
+    assert index.get_stale_files() == []
+    assert hashed == []
+
+    # touched only: hashed once, found clean, stat data refreshed
+    os.utime(tmp_path / "mod3.py", (OLD + 10, OLD + 10))
+    # edited and deleted: stale
+    (tmp_path / "mod5.py").write_text("x = 'changed'\n")
+    os.utime(tmp_path / "mod5.py", (OLD, OLD))
+    (tmp_path / "mod7.py").unlink()
+    assert index.get_stale_files() == ["mod5.py", "mod7.py"]
+    assert sorted(hashed) == ["mod3.py", "mod5.py"]
+
+    hashed.clear()
+    assert index.get_stale_files() == ["mod5.py", "mod7.py"]
+    assert hashed == ["mod5.py"]
+    assert not index.needs_reanalysis("mod3.py")
+    assert index.needs_reanalysis("mod5.py")
+
+
+def test_recently_modified_files_are_hashed(tmp_path, index, hashed):
+    (tmp_path / "fresh.py").write_text("x = 1\n")
+    index.store_analysis("fresh.py", 1, [], [], [], [])
+    hashed.clear()
+    # an mtime inside the racy window cannot vouch for the content
+    assert not index.needs_reanalysis("fresh.py")
+    assert hashed == ["fresh.py"]
+
+
+def test_schema_v1_database_is_migrated(tmp_path):
+    db = tmp_path / ".scalpel_index.db"
+    conn = sqlite3.connect(db)
+    conn.executescript("""
+        CREATE TABLE schema_version (version INTEGER PRIMARY KEY);
+        INSERT INTO schema_version VALUES (1);
+        CREATE TABLE file_analysis (
+            path TEXT PRIMARY KEY, content_hash TEXT NOT NULL,
+            analysis_timestamp REAL NOT NULL, lines_of_code INTEGER DEFAULT 0,
+            functions_json TEXT, classes_json TEXT, imports_json TEXT,
+            complexity_warnings_json TEXT, error TEXT
+        );
+    """)
+    conn.close()
+    _make_files(tmp_path, 1)
+
+    with IncrementalIndex(tmp_path) as index:
+        conn = index._connect()
+        assert conn.execute("SELECT version FROM schema_version").fetchone()[0] == 2
+        index.store_analysis("mod0.py", 1, [], [], [], [])
+        assert index.get_stale_files() == []
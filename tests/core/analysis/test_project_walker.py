@@ -524,6 +524,15 @@ class TestLanguageDetection:
             lang = walker._get_language(ext)
             assert lang != "unknown"
 
+    def test_extensions_outside_supported_set_stay_unknown(self, tmp_path):
+        """Extra languages of the shared walker are not reported here."""
+        for name in ("app.kt", "index.php", "main.swift", "lib.c", "util.cjs"):
+            (tmp_path / name).write_text("x\n")
+        walker = ProjectWalker(str(tmp_path))
+
+        assert walker._get_language(".kt") == "unknown"
+        assert {f.language for f in walker.get_files()} == {"unknown"}
+
 
 class TestExtensionsAndLanguages:
     """Tests for language extension constants."""
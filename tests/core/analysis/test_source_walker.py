@@ -0,0 +1,102 @@
+"""
+[20261018_TEST] Shared scandir source walker.
+
+One walk returns per-language file lists, prunes excluded and ignored
+directories before listing them, and gives the same answer sequentially
+and on the parallel work queue.
+"""
+
+import os
+
+from code_scalpel.analysis import source_walker
+from code_scalpel.analysis.source_walker import walk_source_files
+
+
+def _make_tree(root, packages=40):
+    for i in range(packages):
+        pkg = root / f"pkg{i:02d}" / "sub"
+        pkg.mkdir(parents=True)
+        (pkg / "mod.py").write_text("x = 1\n")
+        (pkg / "view.ts").write_text("export const x = 1;\n")
+        (pkg / "notes.txt").write_text("notes\n")
+    nm = root / "node_modules" / "lib"
+    nm.mkdir(parents=True)
+    (nm / "index.js").write_text("module.exports = 1;\n")
+    (root / ".hidden").mkdir()
+    (root / ".hidden" / "secret.py").write_text("x = 1\n")
+    (root / "main.go").write_text("package main\n")
+
+
+def test_one_walk_returns_files_per_language(tmp_path):
+    _make_tree(tmp_path)
+    files = walk_source_files(tmp_path, max_workers=1)
+
+    assert set(files.by_language) == {"python", "typescript", "go"}
+    python = files.get("python")
+    assert len(python) == 41  # .hidden is not skipped by default
+    assert [f.rel_path for f in python] == sorted(f.rel_path for f in python)
+    assert python[0].size == 6 and python[0].language == "python"
+    assert files.get("javascript") == []  # node_modules pruned
+    assert files.directories_pruned == 1
+    assert len(files.get("python", "go")) == 42
+
+    hidden = walk_source_files(tmp_path, skip_hidden_dirs=True, max_workers=1)
+    assert len(hidden.get("python")) == 40
+
+    with_unknown = walk_source_files(tmp_path, include_unknown=True, max_workers=1)
+    assert len(with_unknown.get("unknown")) == 40
+
+
+def test_ignored_directories_are_never_listed(tmp_path, monkeypatch):
+    _make_tree(tmp_path)
+    (tmp_path / ".gitignore").write_text("pkg0*/\n*.ts\n")
+    listed = []
+    real_scandir = os.scandir
+
+    def recording_scandir(path):
+        listed.append(os.path.relpath(path, tmp_path))
+        return real_scandir(path)
+
+    monkeypatch.setattr(source_walker.os, "scandir", recording_scandir)
+    files = walk_source_files(tmp_path, respect_gitignore=True, max_workers=1)
+
+    assert not [p for p in listed if p.startswith(("node_modules", "pkg0"))]
+    assert files.get("typescript") == []
+    assert len(files.get("python")) == 31
+
+
+def test_parallel_walk_matches_sequential(tmp_path):
+    _make_tree(tmp_path, packages=80)
+    sequential = walk_source_files(tmp_path, max_workers=1)
+    parallel = walk_source_files(tmp_path, max_workers=4)
+    assert parallel.by_language == sequential.by_language
+    assert parallel.directories_scanned == sequential.directories_scanned
+
+
+def test_max_files_keeps_the_first_files_by_path(tmp_path):
+    _make_tree(tmp_path, packages=80)
+    everything = [f.rel_path for f in walk_source_files(tmp_path).all_files()]
+    for workers in (1, 4):
+        capped = walk_source_files(tmp_path, max_files=7, max_workers=workers)
+        assert capped.truncated
+        assert [f.rel_path for f in capped.all_files()] == everything[:7]
+
+
+def test_limits_and_filters(tmp_path):
+    _make_tree(tmp_path)
+    shallow = walk_source_files(tmp_path, max_depth=0, max_workers=1)
+    assert [f.rel_path for f in shallow.all_files()] == ["main.go"]
+    one_level = walk_source_files(tmp_path, max_depth=1, max_workers=1)
+    assert [f.rel_path for f in one_level.all_files()] == [
+        ".hidden/secret.py",
+        "main.go",
+    ]
+
+    capped = walk_source_files(tmp_path, max_files=5, max_workers=1)
+    assert capped.total_files == 5 and capped.truncated
+
+    only = walk_source_files(
+        tmp_path, extensions={".TXT"}, exclude_dirs=(), with_size=False
+    )
+    assert len(only.get("unknown")) == 40
+    assert all(f.size == 0 for f in only.all_files())
@@ -0,0 +1,108 @@
+"""
+[20261018_TEST] Fused AST traversal.
+
+Several analyses share one breadth-first walk (same order as ast.walk),
+keep their state apart, and receive per-field context; analyze_code runs
+its Python analyses in a single walk.
+"""
+
+import ast
+
+from code_scalpel.ast_tools import fused_visitor
+from code_scalpel.ast_tools.fused_visitor import FusedAnalysis, run_analyses
+from code_scalpel.mcp.helpers import analyze_helpers
+
+SOURCE = """
+import os
+from typing import List
+
+
+class Service:
+    def run(self, items: List[int], flag=a or b) -> int:
+        total = 0
+        for item in items:
+            if item and flag:
+                total += helper(item)
+        return total
+
+
+def helper(x):
+    def inner():
+        return os.getcwd()
+    return inner() if x else None
+"""
+
+
+class _Order(FusedAnalysis):
+    def __init__(self):
+        self.seen = []
+
+    def visit_FunctionDef(self, node, ctx):
+        self.seen.append(node.name)
+
+    visit_ClassDef = visit_FunctionDef
+
+    def finish(self):
+        return self.seen
+
+
+class _Depth(FusedAnalysis):
+    context_types = (ast.FunctionDef,)
+    root_context = ()
+
+    def __init__(self):
+        self.calls = []
+
+    def child_context(self, node, field, ctx):
+        return ctx + ((node.name, field),)
+
+    def visit_Call(self, node, ctx):
+        self.calls.append(ctx)
+
+    def finish(self):
+        return self.calls
+
+
+def test_walk_order_matches_ast_walk():
+    tree = ast.parse(SOURCE)
+    expected = [
+        n.name for n in ast.walk(tree) if isinstance(n, (ast.FunctionDef, ast.ClassDef))
+    ]
+    first, second = run_analyses(tree, [_Order(), _Order()])
+    assert first == expected
+    assert first is not second  # state is per analysis instance
+
+
+def test_context_is_derived_per_field():
+    calls = run_analyses(ast.parse(SOURCE), [_Depth()])[0]
+    assert (("run", "body"),) in calls
+    assert (("helper", "body"), ("inner", "body")) in calls
+
+
+def test_ported_analyses_keep_legacy_semantics():
+    tree = ast.parse(SOURCE)
+    assert analyze_helpers._build_dependency_graph_python(tree) == {
+        "helper": ["getcwd", "inner"],
+        "run": ["helper"],
+        "inner": ["getcwd"],
+    }
+    assert analyze_helpers._count_complexity(tree) == 5
+    assert analyze_helpers._calculate_cognitive_complexity_python(tree) == 8
+    assert analyze_helpers._detect_dead_code_hints_python(tree, SOURCE) == []
+
+
+def test_analyze_code_walks_python_tree_once(monkeypatch):
+    walks = []
+    real_walk = fused_visitor.FusedWalker.walk
+
+    def counting_walk(self, tree):
+        walks.append(len(self.analyses))
+        return real_walk(self, tree)
+
+    monkeypatch.setattr(fused_visitor.FusedWalker, "walk", counting_walk)
+    monkeypatch.setattr(analyze_helpers, "_get_cache", lambda: None)
+    result = analyze_helpers._analyze_code_sync(SOURCE, "python")
+    assert result.success
+    assert result.functions == ["helper", "run", "inner"]
+    assert len(walks) == 1
+    assert walks[0] >= 2
@@ -0,0 +1,252 @@
+"""
+[20261018_TEST] Content-addressed analysis store.
+
+Entries are shared by content, analyzer version and config; packs round-trip
+between stores with integrity checks; prune and verify maintain the store;
+IncrementalIndexer uses the store to start warm in a fresh checkout.
+"""
+
+import io
+import os
+import sys
+import tarfile
+import time
+
+import pytest
+
+from code_scalpel.analysis.incremental_indexer import IncrementalIndexer
+from code_scalpel.cache.analysis_store import AnalysisStore, DirectoryRemote
+
+RESULT = {"functions": [{"name": "main", "lineno": 1}], "imports": ["os"]}
+
+
+@pytest.fixture(autouse=True)
+def _no_git_index(monkeypatch):
+    monkeypatch.setenv("SCALPEL_GIT_INDEX", "0")
+    monkeypatch.delenv("SCALPEL_ANALYSIS_STORE", raising=False)
+
+
+def test_keys_cover_version_content_and_config(tmp_path):
+    store = AnalysisStore(tmp_path / "s", analyzer_version="1.0", config={"a": 1})
+    store.put("abc", RESULT)
+    assert store.get("abc") == RESULT
+    assert store.get("abd") is None
+    assert AnalysisStore(tmp_path / "s", "1.0", {"a": 1}).get("abc") == RESULT
+    assert AnalysisStore(tmp_path / "s", "1.1", {"a": 1}).get("abc") is None
+    assert AnalysisStore(tmp_path / "s", "1.0", {"a": 2}).get("abc") is None
+
+
+def test_pack_round_trip(tmp_path):
+    source = AnalysisStore(tmp_path / "ci", "1.0")
+    for i in range(20):
+        source.put(f"hash{i}", {"i": i})
+    assert source.export_pack(tmp_path / "store.pack") == 20
+
+    target = AnalysisStore(tmp_path / "runner", "1.0")
+    target.put("hash0", {"i": 0})
+    result = target.import_pack(tmp_path / "store.pack")
+    assert (result.imported, result.skipped, result.rejected) == (19, 1, [])
+    assert all(target.get(f"hash{i}") == {"i": i} for i in range(20))
+
+
+def test_import_rejects_bad_members(tmp_path):
+    source = AnalysisStore(tmp_path / "a", "1.0")
+    key = source.put("good", RESULT)
+    bad_key = source.put("bad", RESULT)
+    source.export_pack(tmp_path / "p.pack")
+
+    # Re-pack with a tampered object and a path traversal attempt
+    with (
+        tarfile.open(tmp_path / "p.pack") as src,
+        tarfile.open(tmp_path / "evil.pack", "w") as dst,
+    ):
+        for member in src:
+            data = src.extractfile(member).read()
+            if member.name.endswith(bad_key[2:]):
+                data = data[:-1] + bytes([data[-1] ^ 1])
+            member.size = len(data)
+            dst.addfile(member, io.BytesIO(data))
+        evil = tarfile.TarInfo("../escape")
+        evil.size = 1
+        dst.addfile(evil, io.BytesIO(b"x"))
+
+    target = AnalysisStore(tmp_path / "b", "1.0")
+    result = target.import_pack(tmp_path / "evil.pack")
+    assert result.imported == 1
+    assert sorted(result.rejected) == sorted(
+        ["../escape", f"objects/{bad_key[:2]}/{bad_key[2:]}"]
+    )
+    assert list(target.keys()) == [key]
+    assert not (tmp_path / "escape").exists()
+
+
+def test_import_rejects_oversized_objects(tmp_path):
+    source = AnalysisStore(tmp_path / "a", "1.0")
+    small = source.put("small", {"i": 1})
+    big = source.put("big", {"payload": "x" * 50_000})  # compresses well
+    stored = source.objects / big[:2] / big[2:]
+    source.export_pack(tmp_path / "p.pack")
+
+    target = AnalysisStore(tmp_path / "b", "1.0")
+    result = target.import_pack(tmp_path / "p.pack", max_object_bytes=10_000)
+    assert stored.stat().st_size < 10_000  # rejected for its decompressed size
+    assert result.imported == 1
+    assert result.rejected == [f"objects/{big[:2]}/{big[2:]}"]
+    assert list(target.keys()) == [small]
+
+    result = target.import_pack(tmp_path / "p.pack", max_object_bytes=100)
+    assert result.skipped == 1 and len(result.rejected) == 1
+
+
+@pytest.mark.parametrize(
+    "manifest", [b"[1, 2]", b'{"objects": [1, 2]}', b'"text"', b"not json"]
+)
+def test_malformed_manifest_is_ignored(tmp_path, manifest):
+    source = AnalysisStore(tmp_path / "a", "1.0")
+    key = source.put("good", RESULT)
+    raw = (source.objects / key[:2] / key[2:]).read_bytes()
+    with tarfile.open(tmp_path / "p.pack", "w") as tar:
+        for name, data in (
+            ("manifest.json", manifest),
+            (f"objects/{key[:2]}/{key[2:]}", raw),
+        ):
+            info = tarfile.TarInfo(name)
+            info.size = len(data)
+            tar.addfile(info, io.BytesIO(data))
+
+    result = AnalysisStore(tmp_path / "b", "1.0").import_pack(tmp_path / "p.pack")
+    assert (result.imported, result.rejected) == (1, [])
+
+
+def test_unreadable_pack_raises_value_error(tmp_path):
+    source = AnalysisStore(tmp_path / "a", "1.0")
+    for i in range(20):
+        source.put(f"h{i}", {"payload": os.urandom(64).hex()})
+    source.export_pack(tmp_path / "p.pack")
+    data = (tmp_path / "p.pack").read_bytes()
+    with tarfile.open(tmp_path / "p.pack") as tar:
+        member = tar.getmembers()[10]
+    # Cut inside a member's data: a cut on a block boundary is a valid, shorter tar.
+    (tmp_path / "cut.pack").write_bytes(data[: member.offset_data + 10])
+    (tmp_path / "junk.pack").write_bytes(b"not a tar file at all")
+
+    target = AnalysisStore(tmp_path / "b", "1.0")
+    for name in ("cut.pack", "junk.pack"):
+        with pytest.raises(ValueError, match="Unreadable pack"):
+            target.import_pack(tmp_path / name)
+
+
+def test_verify_and_prune(tmp_path):
+    store = AnalysisStore(tmp_path / "s", "1.0")
+    keys = [store.put(f"h{i}", {"payload": "x" * 100, "i": i}) for i in range(6)]
+    corrupt = store.objects / keys[0][:2] / keys[0][2:]
+    corrupt.write_bytes(corrupt.read_bytes()[:-3])
+
+    result = store.verify()
+    assert (result.checked, result.corrupt) == (6, [keys[0]])
+    assert store.verify(remove_corrupt=True).removed == 1
+    assert store.verify().corrupt == []
+
+    # h1 and h2 were last used long ago; reading h2 refreshes it
+    old = time.time() - 30 * 86400
+    for i in (1, 2):
+        os.utime(store.objects / keys[i][:2] / keys[i][2:], (old, old))
+    assert store.get("h2") is not None
+    assert store.prune(max_age_seconds=7 * 86400) == 1
+    assert store.get("h1") is None and store.get("h2") is not None
+
+    size = (store.objects / keys[3][:2] / keys[3][2:]).stat().st_size
+    assert store.prune(max_bytes=2 * size) == 2
+    assert len(list(store.keys())) == 2
+
+
+def test_directory_remote_push_pull(tmp_path):
+    remote = DirectoryRemote(tmp_path / "artifacts")
+    first = AnalysisStore(tmp_path / "one", "1.0")
+    first.put("h", RESULT)
+    assert first.push(remote, "analysis.pack") == 1
+
+    second = AnalysisStore(tmp_path / "two", "1.0")
+    assert second.pull(remote, "missing.pack") is None
+    assert second.pull(remote, "analysis.pack").imported == 1
+    assert second.get("h") == RESULT
+    with pytest.raises(ValueError):
+        remote.put("../x", tmp_path / "one")
+
+
+def test_indexer_starts_warm_in_another_checkout(tmp_path):
+    shared = tmp_path / "shared-store"
+    for checkout in ("ci-a", "ci-b"):
+        (tmp_path / checkout).mkdir()
+        (tmp_path / checkout / "app.py").write_text("def main():\n    pass\n")
+
+    a = IncrementalIndexer(tmp_path / "ci-a", analysis_store=shared)
+    a.cache_analysis(tmp_path / "ci-a" / "app.py", RESULT)
+    a.analysis_store.export_pack(tmp_path / "store.pack")
+
+    # A different runner: different path, empty SQLite cache, restored pack
+    restored = tmp_path / "restored"
+    AnalysisStore(restored).import_pack(tmp_path / "store.pack")
+    b = IncrementalIndexer(tmp_path / "ci-b", analysis_store=restored)
+    assert b.get_cached_analysis(tmp_path / "ci-b" / "app.py") == RESULT
+    assert b.analysis_store.hits == 1
+
+    (tmp_path / "ci-b" / "app.py").write_text("def main():\n    return 1\n")
+    assert b.get_cached_analysis(tmp_path / "ci-b" / "app.py") is None
+
+    other_config = IncrementalIndexer(
+        tmp_path / "ci-b", analysis_store=restored, analysis_config={"deep": True}
+    )
+    (tmp_path / "ci-b" / "app.py").write_text("def main():\n    pass\n")
+    assert other_config.get_cached_analysis(tmp_path / "ci-b" / "app.py") is None
+
+
+def test_cli_export_import(tmp_path, monkeypatch, capsys):
+    from code_scalpel.cli import main
+
+    AnalysisStore(tmp_path / "s").put("h", RESULT)
+    pack = tmp_path / "out.pack"
+    monkeypatch.setattr(
+        sys,
+        "argv",
+        [
+            "codescalpel",
+            "analysis-store",
+            "--store",
+            str(tmp_path / "s"),
+            "export",
+            str(pack),
+        ],
+    )
+    assert main() == 0
+    monkeypatch.setattr(
+        sys,
+        "argv",
+        [
+            "codescalpel",
+            "analysis-store",
+            "--store",
+            str(tmp_path / "t"),
+            "import",
+            str(pack),
+        ],
+    )
+    assert main() == 0
+    assert "Imported 1 objects" in capsys.readouterr().out
+    assert AnalysisStore(tmp_path / "t").get("h") == RESULT
+
+    (tmp_path / "junk.pack").write_bytes(b"\x1f\x8b truncated")
+    monkeypatch.setattr(
+        sys,
+        "argv",
+        [
+            "codescalpel",
+            "analysis-store",
+            "--store",
+            str(tmp_path / "t"),
+            "import",
+            str(tmp_path / "junk.pack"),
+        ],
+    )
+    assert main() == 1
+    assert "Unreadable pack" in capsys.readouterr().err
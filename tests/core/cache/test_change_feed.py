@@ -0,0 +1,199 @@
+"""
+[20261018_TEST] Filesystem change feed.
+
+Edits, new directories and unwatched paths are reflected in the dirty set
+with increasing generations (inotify and polling backends), and warm crawls
+consult the feed instead of re-walking and re-stat'ing the tree.
+"""
+
+import os
+import sys
+import time
+from pathlib import Path
+
+import pytest
+
+from code_scalpel.analysis.incremental_index import IncrementalIndex
+from code_scalpel.analysis.project_crawler import ProjectCrawler
+from code_scalpel.analysis.project_walker import ProjectWalker
+from code_scalpel.cache.change_feed import (
+    ChangeFeed,
+    get_change_feed,
+    start_change_feed,
+    stop_change_feeds,
+)
+
+BACKENDS = ["poll"] + (["inotify"] if sys.platform.startswith("linux") else [])
+
+
+def _settle(feed):
+    # Polling feeds report changes after their next scan
+    if feed.backend == "poll":
+        time.sleep(feed.poll_interval * 4)
+
+
+@pytest.fixture(autouse=True)
+def _no_feeds():
+    yield
+    stop_change_feeds()
+
+
+@pytest.mark.parametrize("backend", BACKENDS)
+def test_feed_tracks_edits_and_new_directories(tmp_path, backend):
+    src = tmp_path / "src"
+    src.mkdir()
+    (tmp_path / "node_modules").mkdir()
+    module = src / "app.py"
+    module.write_text("x = 1\n")
+
+    with ChangeFeed(tmp_path, backend=backend, poll_interval=0.05) as feed:
+        assert feed.backend == backend
+        token = feed.token()
+        assert feed.unchanged_since(token, module)
+        assert feed.changes_since(token).files == frozenset()
+
+        module.write_text("x = 2\n")
+        _settle(feed)
+        assert not feed.unchanged_since(token, module)
+        later = feed.token()
+        assert int(later.split(":")[1]) > int(token.split(":")[1])
+        assert feed.unchanged_since(later, module)
+
+        (src / "pkg" / "deep").mkdir(parents=True)
+        (src / "pkg" / "deep" / "new.py").write_text("y = 1\n")
+        _settle(feed)
+        changes = feed.changes_since(later)
+        assert changes.affects(str(src / "pkg" / "deep" / "new.py"))
+        assert str(src / "pkg") in changes.directories
+
+        # Unwatched directories and foreign tokens are never vouched for
+        assert not feed.unchanged_since(later, tmp_path / "node_modules" / "x.js")
+        assert not feed.unchanged_since("other:0", module)
+    assert not feed.unchanged_since(later, module)  # stopped
+
+
+def test_registry_finds_feed_for_nested_paths(tmp_path):
+    feed = start_change_feed(tmp_path, backend="poll", poll_interval=0.05)
+    assert start_change_feed(tmp_path) is feed
+    assert get_change_feed(tmp_path / "a" / "b.py") is feed
+    assert get_change_feed(tmp_path.parent / "elsewhere") is None
+    stop_change_feeds()
+    assert get_change_feed(tmp_path / "a" / "b.py") is None
+
+
+def _make_project(root: Path, files: int = 5) -> None:
+    for i in range(files):
+        (root / f"mod{i}.py").write_text(f"def f{i}(x):\n    return x + {i}\n")
+
+
+@pytest.mark.parametrize("backend", BACKENDS)
+def test_warm_crawl_consults_feed(tmp_path, monkeypatch, backend):
+    _make_project(tmp_path)
+    feed = start_change_feed(tmp_path, backend=backend, poll_interval=0.05)
+
+    first = ProjectCrawler(tmp_path, enable_cache=True).crawl()
+    assert first.total_files == 5
+
+    stats = []
+    walks = []
+    real_stat = Path.stat
+    real_get_files = ProjectWalker.get_files
+
+    def counting_stat(self, *args, **kwargs):
+        if self.suffix == ".py":
+            stats.append(self.name)
+        return real_stat(self, *args, **kwargs)
+
+    (tmp_path / "mod3.py").write_text("def g(x):\n    return x\n")
+    _settle(feed)
+    monkeypatch.setattr(Path, "stat", counting_stat)
+    monkeypatch.setattr(
+        ProjectWalker, "get_files", lambda self: walks.append(1) or real_get_files(self)
+    )
+    crawler = ProjectCrawler(tmp_path, enable_cache=True)
+    warm = crawler.crawl()
+
+    assert crawler._cache_hits == 4 and crawler._cache_misses == 1
+    assert walks == []  # the previous listing still holds
+    # only the edited file is stat'ed (when it is re-analyzed and stored)
+    assert set(stats) == {"mod3.py"}
+    names = {f.name for r in warm.files_analyzed for f in r.functions}
+    assert names == {"f0", "f1", "f2", "f4", "g"}
+
+    # a new source file forces a fresh walk
+    (tmp_path / "mod9.py").write_text("def h():\n    pass\n")
+    _settle(feed)
+    assert ProjectCrawler(tmp_path, enable_cache=True).crawl().total_files == 6
+    assert walks == [1]
+
+
+def test_warm_crawl_checks_paths_the_feed_does_not_watch(tmp_path):
+    project = tmp_path / "project"
+    vendored = project / "venv" / "lib"
+    vendored.mkdir(parents=True)
+    (vendored / "dep.py").write_text("def old():\n    pass\n")
+    outside = tmp_path / "outside.py"
+    outside.write_text("def before():\n    pass\n")
+    (project / "linked.py").symlink_to(outside)
+    feed = start_change_feed(project, backend="poll", poll_interval=0.05)
+
+    def crawl():
+        crawler = ProjectCrawler(
+            project, enable_cache=True, exclude_dirs=frozenset({".code-scalpel"})
+        )
+        result = crawler.crawl()
+        return {f.name for r in result.files_analyzed for f in r.functions}
+
+    assert crawl() == {"old", "before"}
+    (vendored / "dep.py").write_text("def new_name():\n    pass\n")
+    (vendored / "extra.py").write_text("def added():\n    pass\n")
+    outside.write_text("def after_edit():\n    pass\n")
+    _settle(feed)
+    assert crawl() == {"new_name", "added", "after_edit"}
+
+
+def test_listing_follows_git_excludes_outside_the_feed(tmp_path, monkeypatch):
+    monkeypatch.setenv("HOME", str(tmp_path / "home"))
+    monkeypatch.setenv("XDG_CONFIG_HOME", str(tmp_path / "xdg"))
+    project = tmp_path / "project"
+    (project / ".git" / "info").mkdir(parents=True)
+    _make_project(project)
+    feed = start_change_feed(project, backend="poll", poll_interval=0.05)
+
+    def crawl():
+        crawler = ProjectCrawler(project, enable_cache=True, respect_gitignore=True)
+        return crawler.crawl().total_files
+
+    assert crawl() == 5
+    (project / ".git" / "info" / "exclude").write_text("mod1.py\n")
+    _settle(feed)
+    assert crawl() == 4
+    (tmp_path / "xdg" / "git").mkdir(parents=True)
+    (tmp_path / "xdg" / "git" / "ignore").write_text("mod2.py\n")
+    _settle(feed)
+    assert crawl() == 3
+
+
+def test_incremental_index_skips_rehash_for_unchanged(tmp_path, monkeypatch):
+    _make_project(tmp_path, files=3)
+    (tmp_path / ".code-scalpel").mkdir()
+    index = IncrementalIndex(tmp_path, cache_dir=tmp_path / ".code-scalpel")
+    start_change_feed(tmp_path, backend="poll", poll_interval=0.05)
+    for i in range(3):
+        index.store_analysis(f"mod{i}.py", 2, [], [], [], [])
+
+    hashed = []
+    real_hash = IncrementalIndex.compute_file_hash
+
+    def counting_hash(self, file_path):
+        hashed.append(os.fspath(file_path))
+        return real_hash(self, file_path)
+
+    monkeypatch.setattr(IncrementalIndex, "compute_file_hash", counting_hash)
+    assert index.get_stale_files() == []
+    assert hashed == []
+
+    (tmp_path / "mod1.py").write_text("changed = True\n")
+    time.sleep(0.2)
+    assert index.get_stale_files() == ["mod1.py"]
+    assert hashed == ["mod1.py"]
@@ -0,0 +1,128 @@
+"""
+[20261018_TEST] Git-index change detection.
+
+Blob ids read from ``.git/index`` match ``git hash-object``; clean files are
+answered without hashing, while edited, untracked and racily-clean files are
+hashed the way git hashes them.
+"""
+
+import os
+import shutil
+import subprocess
+
+import pytest
+
+from code_scalpel.analysis.incremental_index import IncrementalIndex
+from code_scalpel.cache import git_index
+from code_scalpel.cache.git_index import (
+    git_detector_for,
+    hash_blob,
+    parse_git_index,
+    reset_git_detectors,
+)
+
+pytestmark = pytest.mark.skipif(shutil.which("git") is None, reason="git required")
+
+
+def _git(repo, *args):
+    result = subprocess.run(
+        ["git", *args], cwd=repo, capture_output=True, text=True, check=True
+    )
+    return result.stdout.strip()
+
+
+@pytest.fixture
+def repo(tmp_path, monkeypatch):
+    monkeypatch.setenv("HOME", str(tmp_path / "home"))
+    monkeypatch.setenv("XDG_CONFIG_HOME", str(tmp_path / "xdg"))
+    monkeypatch.setenv("GIT_CONFIG_NOSYSTEM", "1")
+    monkeypatch.delenv("SCALPEL_GIT_INDEX", raising=False)
+    repo = tmp_path / "repo"
+    (repo / "pkg" / "deep").mkdir(parents=True)
+    (repo / "app.py").write_text("def main():\n    return 1\n")
+    (repo / "pkg" / "util.py").write_text("X = 1\n")
+    (repo / "pkg" / "deep" / "empty.py").write_text("")
+    _git(repo, "init", "-q")
+    _git(repo, "add", ".")
+    _age_files(repo)
+    reset_git_detectors()
+    yield repo
+    reset_git_detectors()
+
+
+def _age_files(repo):
+    # Back-date the work tree so no entry is racily clean, then refresh the
+    # stat data recorded in the index.
+    for dirpath, dirnames, filenames in os.walk(repo):
+        dirnames[:] = [d for d in dirnames if d != ".git"]
+        for name in filenames:
+            os.utime(os.path.join(dirpath, name), (1_600_000_000, 1_600_000_000))
+    _git(repo, "update-index", "--really-refresh")
+
+
+def test_clean_files_come_from_the_index(repo):
+    detector = git_detector_for(repo / "app.py")
+    assert detector is not None
+    for rel in ("app.py", "pkg/util.py", "pkg/deep/empty.py"):
+        assert detector.blob_id(repo / rel) == _git(repo, "hash-object", rel)
+    assert detector.files_hashed == 0
+    assert detector.dirty_paths() == []
+
+
+def test_dirty_and_untracked_files_are_hashed(repo):
+    detector = git_detector_for(repo)
+    (repo / "app.py").write_text("def main():\n    return 2\n")
+    (repo / "new.py").write_text("Y = 2\n")
+    assert detector.dirty_paths() == ["app.py"]
+    for rel in ("app.py", "new.py"):
+        assert detector.blob_id(repo / rel) == _git(repo, "hash-object", rel)
+    assert detector.files_hashed == 2
+    assert hash_blob(repo / "new.py") == _git(repo, "hash-object", "new.py")
+
+
+def test_racily_clean_entries_are_not_trusted(repo):
+    detector = git_detector_for(repo)
+    index = repo / ".git" / "index"
+    st = index.stat()
+    # An entry stamped no earlier than the index itself may hide a same-tick edit
+    os.utime(repo / "app.py", ns=(st.st_mtime_ns, st.st_mtime_ns))
+    _git(repo, "update-index", "--really-refresh")
+    os.utime(index, ns=(st.st_mtime_ns, st.st_mtime_ns))
+    assert detector.index_oid(repo / "app.py") is None
+    assert detector.blob_id(repo / "app.py") == _git(repo, "hash-object", "app.py")
+
+
+def test_index_versions_agree(repo):
+    v2 = parse_git_index((repo / ".git" / "index").read_bytes())
+    _git(repo, "update-index", "--index-version", "4")
+    v4 = parse_git_index((repo / ".git" / "index").read_bytes())
+    assert (v2.version, v4.version) == (2, 4)
+    assert {p: e.oid for p, e in v4.entries.items()} == {
+        p: e.oid for p, e in v2.entries.items()
+    }
+    assert set(v4.entries) == {"app.py", "pkg/util.py", "pkg/deep/empty.py"}
+
+
+def test_incremental_index_uses_blob_ids(repo):
+    (repo / ".code-scalpel").mkdir()
+    index = IncrementalIndex(repo, cache_dir=repo / ".code-scalpel")
+    index.store_analysis("app.py", 2, ["main"], [], [], [])
+    assert index.get_cached_analysis("app.py").content_hash == _git(
+        repo, "hash-object", "app.py"
+    )
+    assert not index.needs_reanalysis("app.py")
+    assert git_detector_for(repo).files_hashed == 0
+
+
+def test_disabled_by_environment(repo, monkeypatch):
+    monkeypatch.setenv("SCALPEL_GIT_INDEX", "0")
+    assert git_detector_for(repo / "app.py") is None
+
+
+def test_detectors_are_shared_per_work_tree(repo, monkeypatch):
+    monkeypatch.setattr(git_index, "_DIRECTORY_TOPS_MAX", 2)
+    detector = git_detector_for(repo / "app.py")
+    for rel in ("pkg/util.py", "pkg/deep/empty.py", "app.py"):
+        assert git_detector_for(repo / rel) is detector
+    assert len(git_index._DIRECTORY_TOPS) == 2
+    assert list(git_index._DETECTORS) == [str(repo)]
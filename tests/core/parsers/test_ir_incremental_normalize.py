@@ -0,0 +1,106 @@
+"""
+[20261018_TEST] Incremental tree-sitter reparsing in the IR normalizers.
+
+Incremental normalization must produce exactly the IR of a full parse while
+reusing the IR of top-level declarations the edit did not touch.
+"""
+
+import pytest
+
+from code_scalpel.ir.normalizers import GoNormalizer, JavaScriptNormalizer
+from code_scalpel.ir.normalizers.incremental import INCREMENTAL_TREES
+
+GO_SOURCE = """package main
+
+func add(a int, b int) int {
+	return a + b
+}
+
+func scale(x int) int {
+	return x * 2
+}
+
+func main() {
+	add(1, 2)
+}
+"""
+
+JS_SOURCE = """function add(a, b) {
+  return a + b;
+}
+
+function scale(x) {
+  return x * 2;
+}
+
+const y = scale(add(1, 2));
+"""
+
+
+@pytest.fixture
+def spy_sessions(monkeypatch):
+    sessions = []
+    original = INCREMENTAL_TREES.parse
+
+    def parse(*args, **kwargs):
+        session = original(*args, **kwargs)
+        sessions.append(session)
+        return session
+
+    monkeypatch.setattr(INCREMENTAL_TREES, "parse", parse)
+    return sessions
+
+
+def _full(normalizer_cls, source, filename):
+    INCREMENTAL_TREES.forget(normalizer_cls().language, filename)
+    module = normalizer_cls().normalize(source, filename)
+    INCREMENTAL_TREES.forget(normalizer_cls().language, filename)
+    return module
+
+
+@pytest.mark.parametrize(
+    "normalizer_cls, source, old, new",
+    [
+        (GoNormalizer, GO_SOURCE, "return a + b", "return a - b"),
+        (GoNormalizer, GO_SOURCE, "return a + b\n", "sum := a + b\n\treturn sum\n"),
+        (JavaScriptNormalizer, JS_SOURCE, "return a + b;", "return a - b;"),
+        (
+            JavaScriptNormalizer,
+            JS_SOURCE,
+            "return a + b;\n",
+            "const s = a + b;\n  return s;\n",
+        ),
+    ],
+)
+def test_incremental_matches_full_parse(spy_sessions, normalizer_cls, source, old, new):
+    filename = f"/virtual/{normalizer_cls.__name__}.src"
+    INCREMENTAL_TREES.forget(normalizer_cls().language, filename)
+    normalizer = normalizer_cls()
+    normalizer.normalize(source, filename)
+
+    edited = source.replace(old, new)
+    incremental = normalizer.normalize(edited, filename)
+    session = spy_sessions[-1]
+
+    assert incremental == _full(normalizer_cls, edited, filename)
+    # Only the edited function is re-normalized
+    assert session.normalized == 1
+    assert session.reused >= 2
+
+
+def test_line_shift_does_not_mutate_previous_ir():
+    filename = "/virtual/shift.go"
+    INCREMENTAL_TREES.forget("go", filename)
+    normalizer = GoNormalizer()
+    before = normalizer.normalize(GO_SOURCE, filename)
+    main_line = before.body[-1].loc.line
+
+    after = normalizer.normalize(GO_SOURCE.replace("\n", "\n\n", 1), filename)
+    assert after.body[-1].loc.line == main_line + 1
+    assert before.body[-1].loc.line == main_line
+
+
+def test_anonymous_sources_keep_no_state():
+    count = len(INCREMENTAL_TREES)
+    GoNormalizer().normalize(GO_SOURCE)
+    assert len(INCREMENTAL_TREES) == count
@@ -0,0 +1,137 @@
+"""
+[20261018_TEST] On-demand, per-declaration IR normalization.
+
+Extraction normalizes only the requested declaration, found through a
+byte-range index of the raw tree, and must return exactly what extraction
+from the fully normalized module returns.
+"""
+
+import pytest
+
+from code_scalpel.code_parsers.extractor import Language, PolyglotExtractor
+from code_scalpel.ir.normalizers import JavaNormalizer, JavaScriptNormalizer
+from code_scalpel.ir.normalizers.lazy import LAZY_MODULES, LazyModule
+
+JS_SOURCE = """import { x } from "./x";
+
+export function add(a, b) {
+  return a + b;
+}
+
+class Calculator {
+  constructor() { this.total = 0; }
+  add(n) { this.total += n; return this; }
+}
+
+function scale(v) {
+  return v * 2;
+}
+"""
+
+JAVA_SOURCE = """package demo;
+
+public class Calculator {
+    private int total;
+
+    public int add(int a, int b) {
+        return a + b;
+    }
+}
+
+class Helper {
+    int twice(int x) { return x * 2; }
+}
+"""
+
+
+@pytest.fixture(autouse=True)
+def _fresh_lazy_store():
+    LAZY_MODULES.clear()
+    yield
+    LAZY_MODULES.clear()
+
+
+def _full_result(code, language, target_type, target_name):
+    extractor = PolyglotExtractor(code, language=language)
+    extractor._parse()
+    return extractor._extract_from_ir(target_type, target_name)
+
+
+@pytest.mark.parametrize(
+    "code, language, target_type, target_name",
+    [
+        (JS_SOURCE, Language.JAVASCRIPT, "function", "add"),
+        (JS_SOURCE, Language.JAVASCRIPT, "function", "scale"),
+        (JS_SOURCE, Language.JAVASCRIPT, "class", "Calculator"),
+        (JS_SOURCE, Language.JAVASCRIPT, "method", "Calculator.add"),
+        (JAVA_SOURCE, Language.JAVA, "class", "Helper"),
+        (JAVA_SOURCE, Language.JAVA, "method", "Calculator.add"),
+    ],
+)
+def test_lazy_extraction_matches_full_normalization(
+    code, language, target_type, target_name
+):
+    extractor = PolyglotExtractor(code, language=language)
+    result = extractor.extract(target_type, target_name)
+    assert result.success
+    assert not extractor._parsed  # the module was never fully normalized
+    assert result == _full_result(code, language, target_type, target_name)
+
+
+def test_missing_symbol_falls_back_to_full_normalization():
+    extractor = PolyglotExtractor(JS_SOURCE, language=Language.JAVASCRIPT)
+    result = extractor.extract("function", "missing")
+    assert not result.success
+    assert extractor._parsed
+    assert result == _full_result(JS_SOURCE, Language.JAVASCRIPT, "function", "missing")
+
+
+def test_only_requested_declaration_is_normalized():
+    module = LazyModule(JavaScriptNormalizer(), JS_SOURCE)
+    assert len(module.index) == 4
+    (decl,) = module.index.lookup("scale")
+    assert (decl.start_line, decl.end_line) == (12, 14)
+    (ir,) = module.normalize(decl)
+    assert ir.name == "scale"
+    assert module.normalized == 1
+
+    (method,) = module.index.lookup("Calculator.add")
+    assert module.index.top_level(method).name == "Calculator"
+    assert module.index.enclosing(method.start_byte).name == "Calculator"
+    assert module.index.enclosing(0).node_type == "import_statement"
+
+
+def test_symbols_cached_per_content_hash():
+    PolyglotExtractor(JAVA_SOURCE, language=Language.JAVA).extract("class", "Helper")
+    PolyglotExtractor(JAVA_SOURCE, language=Language.JAVA).extract("class", "Helper")
+    assert LAZY_MODULES.get_stats() == {
+        "modules": 1,
+        "symbols": 1,
+        "hits": 1,
+        "misses": 1,
+    }
+
+    edited = JAVA_SOURCE.replace("x * 2", "x * 3")
+    result = PolyglotExtractor(edited, language=Language.JAVA).extract(
+        "method", "Helper.twice"
+    )
+    assert "x * 3" in result.code
+    assert LAZY_MODULES.get_stats()["modules"] == 2
+
+
+def test_parse_tree_primes_normalize_node():
+    normalizer = JavaNormalizer()
+    tree = normalizer.parse_tree(JAVA_SOURCE)
+    classes = [
+        n for n in tree.root_node.named_children if n.type == "class_declaration"
+    ]
+    assert normalizer.normalize_node(classes[1]).name == "Helper"
+
+
+def test_on_demand_normalization_is_a_capability():
+    from code_scalpel.ir.normalizers import OnDemandNormalizer, PythonNormalizer
+
+    assert issubclass(JavaNormalizer, OnDemandNormalizer)
+    assert issubclass(JavaScriptNormalizer, OnDemandNormalizer)
+    assert not issubclass(PythonNormalizer, OnDemandNormalizer)
+    assert not hasattr(PythonNormalizer, "parse_tree")
@@ -0,0 +1,111 @@
+"""
+[20261018_TEST] Compact IR node representation.
+
+IR nodes are slotted, allocate metadata lazily and intern identifiers, while
+keeping the dataclass API (construction, equality, metadata writes, copies).
+"""
+
+import copy
+import pickle
+import sys
+from dataclasses import replace
+
+from code_scalpel.ir.nodes import (
+    IRAttribute,
+    IRFunctionDef,
+    IRModule,
+    IRName,
+    SourceLocation,
+)
+from code_scalpel.ir.normalizers import JavaScriptNormalizer
+from code_scalpel.ir.normalizers.incremental import shift_lines
+
+
+def test_nodes_have_no_instance_dict():
+    node = IRName(id="x")
+    assert not hasattr(node, "__dict__")
+    assert not hasattr(SourceLocation(line=1, column=0), "__dict__")
+
+
+def test_metadata_is_lazy_but_writable():
+    node = IRName(id="x")
+    assert node._metadata == {}
+    node._metadata["kind"] = "local"
+    node._metadata.setdefault("scope", "module")
+    assert node._metadata == {"kind": "local", "scope": "module"}
+    assert node.with_metadata("hot", True)._metadata["hot"] is True
+
+
+def test_metadata_view_keeps_writes_through_held_reference():
+    node = IRName(id="x")
+    metadata = node._metadata
+    metadata["a"] = 1
+    metadata["b"] = 2
+    assert node._metadata == {"a": 1, "b": 2}
+    assert metadata["a"] == 1
+
+
+def test_metadata_constructor_argument_and_assignment():
+    node = IRFunctionDef(name="f", _metadata={"kind": "method"})
+    assert node._metadata == {"kind": "method"}
+    shared = {}
+    node._metadata = shared
+    shared["late"] = 1
+    assert node._metadata == {"late": 1}
+
+
+def test_untouched_metadata_views_do_not_leak_between_nodes():
+    first = IRName(id="x")
+    second = IRName(id="y")
+    second._metadata = first._metadata
+    second._metadata["k"] = 1
+    assert second._metadata == {"k": 1}
+    assert first._metadata == {}
+
+
+def test_equality_ignores_metadata_allocation():
+    a = IRName(id="x")
+    b = IRName(id="x", _metadata={})
+    assert a == b
+    b._metadata["k"] = 1
+    assert a != b
+
+
+def test_identifiers_and_filenames_are_interned():
+    name = "".join(["my_", "variable"])
+    path = "".join(["/src/", "main.ts"])
+    assert IRName(id=name).id is sys.intern("my_variable")
+    assert IRAttribute(attr=name).attr is sys.intern("my_variable")
+    assert SourceLocation(1, 0, filename=path).filename is sys.intern("/src/main.ts")
+
+
+def test_copy_pickle_and_replace_round_trip():
+    node = IRModule(
+        loc=SourceLocation(1, 0, end_line=3, filename="a.py"),
+        body=[IRName(id="x"), IRName(id="y", _metadata={"k": 1})],
+    )
+    for clone in (
+        copy.copy(node),
+        copy.deepcopy(node),
+        pickle.loads(pickle.dumps(node)),
+        replace(node),
+    ):
+        assert clone == node
+        assert clone.body[1]._metadata == {"k": 1}
+
+
+def test_shift_lines_keeps_metadata_lazy():
+    node = IRName(loc=SourceLocation(2, 0, end_line=2), id="x")
+    shifted = shift_lines(node, 3)
+    assert shifted.loc.line == 5
+    assert shifted == IRName(loc=SourceLocation(5, 0, end_line=5), id="x")
+    shifted._metadata["k"] = 1
+    assert node._metadata == {}
+
+
+def test_normalized_ir_shares_identifier_strings():
+    module = JavaScriptNormalizer().normalize(
+        "function f(value) { return value + value; }"
+    )
+    ret = module.body[0].body[0]
+    assert ret.value.left.id is ret.value.right.id
@@ -0,0 +1,104 @@
+"""
+[20261018_TEST] Bounded-prefix language detector with verdict cache.
+"""
+
+import os
+
+from code_scalpel.analysis.project_crawler import ProjectCrawler
+from code_scalpel.code_parsers.language_detection import (
+    Language,
+    LanguageDetector,
+    _detect_from_content,
+)
+
+PYTHON_SOURCE = """
+import os
+
+def main():
+    value = compute()
+    print(value)
+
+if __name__ == "__main__":
+    main()
+"""
+
+
+def test_content_verdicts_match_full_scan():
+    detector = LanguageDetector()
+    samples = [
+        PYTHON_SOURCE,
+        "package main\n\nfunc main() {\n\tprintln(1)\n}\n",
+        "public class Hello {\n  public static void main(String[] a) {}\n}\n",
+        "const x = require('x');\nmodule.exports = () => x;\n",
+        "interface User { name: string; age: number }\n",
+        "<?php\n$x = 1;\n",
+        "hello world",
+    ]
+    for code in samples:
+        assert detector.detect_code(code) == _detect_from_content(code)
+
+
+def test_only_prefix_is_examined():
+    detector = LanguageDetector(prefix_bytes=len(PYTHON_SOURCE))
+    code = PYTHON_SOURCE + "\n" + "public class Late {}\n" * 200
+    assert detector.detect_code(code) == Language.PYTHON
+
+
+def test_shebang_and_modeline(tmp_path):
+    script = tmp_path / "deploy"
+    script.write_text("#!/usr/bin/env bash\necho hi\n")
+    tool = tmp_path / "tool"
+    tool.write_text("x = 1\n# vim: set ft=ruby:\n")
+    emacs = tmp_path / "config.tmpl"
+    emacs.write_text("# -*- mode: python; coding: utf-8 -*-\n")
+    detector = LanguageDetector()
+    assert detector.detect_file(script) == Language.SHELL
+    assert detector.detect_file(tool) == Language.RUBY
+    assert detector.detect_file(emacs) == Language.PYTHON
+
+
+def test_ambiguous_and_template_extensions(tmp_path):
+    c_header = tmp_path / "a.h"
+    c_header.write_text("#include <stdio.h>\nint add(int a, int b);\n")
+    cpp_header = tmp_path / "b.h"
+    cpp_header.write_text("namespace util {\nclass Box {};\n}\n")
+    template = tmp_path / "settings.py.j2"
+    template.write_text("{{ value }}")
+    detector = LanguageDetector()
+    assert detector.detect_file(c_header) == Language.C
+    assert detector.detect_file(cpp_header) == Language.CPP
+    assert detector.detect_file(template) == Language.PYTHON
+
+
+def test_verdicts_cached_until_file_changes(tmp_path):
+    path = tmp_path / "script"
+    path.write_text(PYTHON_SOURCE)
+    detector = LanguageDetector()
+    assert detector.detect_file(path) == Language.PYTHON
+    assert detector.detect_file(path) == Language.PYTHON
+    assert detector.get_stats() == {"entries": 1, "hits": 1, "misses": 1}
+
+    path.write_text("package main\nfunc main() {}\n")
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+    assert detector.detect_file(path) == Language.GO
+    assert detector.get_stats()["misses"] == 2
+
+
+def test_batch_detection_and_crawler(tmp_path):
+    (tmp_path / "main.py").write_text(PYTHON_SOURCE)
+    (tmp_path / "runner").write_text("#!/usr/bin/env python3\nprint(1)\n")
+    (tmp_path / "missing").unlink(missing_ok=True)
+    paths = [str(tmp_path / "main.py"), str(tmp_path / "runner"), "missing"]
+    result = LanguageDetector().detect_many(paths, max_workers=2)
+    assert result == {
+        paths[0]: Language.PYTHON,
+        paths[1]: Language.PYTHON,
+        "missing": Language.UNKNOWN,
+    }
+
+    crawler = ProjectCrawler(tmp_path, include_extensions=(".py", ""))
+    languages = {
+        os.path.basename(f.path): f.language for f in crawler.crawl().files_analyzed
+    }
+    assert languages == {"main.py": "python", "runner": "python"}
@@ -0,0 +1,139 @@
+"""
+[20261018_TEST] Large-file mode.
+
+Oversized and generated files are detected up front, indexed chunk by chunk
+at top-level boundaries, and a per-request memory ceiling degrades the
+result with warnings instead of failing.
+"""
+
+import pytest
+
+from code_scalpel.mcp.helpers.analyze_helpers import _analyze_large_file
+from code_scalpel.parsing import (
+    MemoryCeiling,
+    classify_file,
+    get_parser_service,
+    index_large_file,
+)
+
+
+def _python_module(path, count):
+    with open(path, "w") as f:
+        for i in range(count):
+            f.write(
+                f"class Model{i}:\n"
+                f"    def method(self):\n"
+                f"        return [\n1,\n2]\n\n\n"
+                f"def func_{i}(a):\n"
+                f"    return a\n\n\n"
+            )
+    return path
+
+
+def _javascript_module(path, count):
+    with open(path, "w") as f:
+        for i in range(count):
+            f.write(
+                f"function fn{i}(a) {{\n  return a + 1;\n}}\n\n"
+                f"class Widget{i} {{\n  render() {{ return 1; }}\n}}\n\n"
+            )
+    return path
+
+
+def test_classify_detects_size_and_generated_markers(tmp_path):
+    small = tmp_path / "small.py"
+    small.write_text("x = 1\n")
+    assert not classify_file(small).large
+    assert classify_file(small, threshold=4).large
+
+    proto = tmp_path / "api_pb2.py"
+    proto.write_text("x = 1\n")
+    info = classify_file(proto)
+    assert (info.generated, info.large) == ("name", False)
+
+    marked = tmp_path / "schema.py"
+    marked.write_text("# Code generated by tool. DO NOT EDIT.\n" + "x = 1\n" * 200_000)
+    info = classify_file(marked)
+    assert info.generated == "marker"
+    assert info.large  # over the generated-file threshold
+
+    bundle = tmp_path / "bundle.js"
+    bundle.write_text("var a=1;" * 200_000)
+    assert classify_file(bundle).generated == "minified"
+
+
+def test_python_index_spans_chunks(tmp_path):
+    path = _python_module(tmp_path / "big.py", 3000)
+    index = index_large_file(path, chunk_bytes=4096)
+    assert index.chunks > 10
+    assert not index.warnings and not index.truncated
+    assert len(index.declarations) == 9000
+    assert index.lines == 3000 * 11
+
+    (func,) = index.lookup("func_2999")
+    assert (func.start_line, func.end_line) == (2999 * 11 + 8, 2999 * 11 + 9)
+    (method,) = index.lookup("Model1500.method")
+    assert method.parent.name == "Model1500"
+    assert path.read_bytes()[func.start_byte : func.end_byte].startswith(
+        b"def func_2999"
+    )
+
+
+def test_tree_sitter_index_reads_through_callback(tmp_path):
+    pytest.importorskip("tree_sitter_javascript")
+    path = _javascript_module(tmp_path / "big.js", 2000)
+    index = index_large_file(path, chunk_bytes=2048)
+    assert index.chunks > 10 and not index.warnings
+    assert len(index.declarations) == 6000
+    (cls,) = index.lookup("Widget1999")
+    assert cls.start_line == 1999 * 8 + 5
+    assert index.lookup("Widget7.render")
+    assert get_parser_service().parser("javascript") is not None
+
+
+def test_memory_ceiling_degrades_instead_of_failing(tmp_path):
+    path = _python_module(tmp_path / "big.py", 3000)
+    index = index_large_file(path, chunk_bytes=4096, ceiling=MemoryCeiling(1024 * 1024))
+    assert index.truncated
+    assert 0 < len(index.declarations) < 9000
+    assert "truncated" in index.warnings[-1]
+
+    minified = tmp_path / "app.min.js"
+    minified.write_text("var a=1;" * 100_000)
+    index = index_large_file(minified, ceiling=MemoryCeiling(64 * 1024))
+    assert index.declarations == []
+    assert index.lines == 1
+    assert "Skipped bytes" in index.warnings[0]
+
+
+def test_parse_file_refuses_large_file_and_analyze_uses_index(tmp_path, monkeypatch):
+    path = _python_module(tmp_path / "big.py", 200)
+    monkeypatch.setenv("SCALPEL_LARGE_FILE_MB", "0.01")
+    parsed = get_parser_service().parse_file(path)
+    assert parsed.tree is None
+    assert "index_large_file" in parsed.error.suggestion
+
+    result = _analyze_large_file(str(path), "auto")
+    assert result.success
+    assert result.lines_of_code == 2200
+    assert result.classes[:2] == ["Model0", "Model1"]
+    assert result.class_details[0].methods == ["method"]
+    assert "func_199" in result.functions
+    assert "Large-file mode" in result.parser_warnings[0]
+
+
+def test_oversized_declaration_is_skipped_and_indexing_resumes(tmp_path):
+    path = tmp_path / "huge.py"
+    with open(path, "w") as f:
+        f.write("def before():\n    return 0\n\n\n")
+        f.write("def huge():\n" + "    x = 1\n" * 50_000 + "\n\n")
+        for i in range(20):
+            f.write(f"def after_{i}():\n    return {i}\n\n\n")
+    index = index_large_file(path, chunk_bytes=4096, ceiling=MemoryCeiling(1024 * 1024))
+    names = [d.name for d in index.declarations]
+    assert "huge" not in names
+    assert names == ["before"] + [f"after_{i}" for i in range(20)]
+    (after,) = index.lookup("after_0")
+    assert after.start_line == 4 + 1 + 50_000 + 2 + 1
+    assert not index.truncated
+    assert any("Skipped bytes" in w for w in index.warnings)
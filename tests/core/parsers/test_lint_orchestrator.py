@@ -0,0 +1,116 @@
+"""
+[20261018_TEST] Batched linter orchestration.
+
+Files are linted with one process per argv-sized chunk, availability probes
+run once per process, and diagnostics are cached by file content.
+"""
+
+import pytest
+
+from code_scalpel.code_parsers import lint_orchestrator
+from code_scalpel.code_parsers.lint_orchestrator import (
+    LintOrchestrator,
+    argv_chunks,
+    probe_tool,
+)
+from code_scalpel.code_parsers.python_parsers.python_parsers_ruff import RuffParser
+
+requires_ruff = pytest.mark.skipif(
+    not RuffParser().is_available(), reason="ruff not installed"
+)
+
+
+def _write_project(root, count):
+    paths = []
+    for i in range(count):
+        path = root / f"mod_{i}.py"
+        path.write_text("import os\n" if i % 2 else "x = 1\n")
+        paths.append(str(path))
+    return paths
+
+
+def test_argv_chunks_respect_limit():
+    files = [f"/src/pkg/module_{i:03d}.py" for i in range(200)]
+    chunks = list(argv_chunks(["ruff", "check"], files, limit=2000))
+    assert [f for chunk in chunks for f in chunk] == files
+    assert len(chunks) > 1
+    for chunk in chunks:
+        assert sum(len(a) + 9 for a in ["ruff", "check", *chunk]) <= 2000
+
+    # A single oversized argument still gets a chunk of its own
+    assert list(argv_chunks([], ["x" * 5000], limit=100)) == [["x" * 5000]]
+
+
+def test_probe_runs_once_per_executable(monkeypatch):
+    calls = []
+
+    def fake_run(argv, **kwargs):
+        calls.append(argv)
+        raise FileNotFoundError(argv[0])
+
+    lint_orchestrator.clear_probe_cache()
+    monkeypatch.setattr(lint_orchestrator.subprocess, "run", fake_run)
+    try:
+        assert probe_tool("no-such-linter") is None
+        assert probe_tool("no-such-linter") is None
+        assert calls == [["no-such-linter", "--version"]]
+    finally:
+        lint_orchestrator.clear_probe_cache()
+
+
+@requires_ruff
+def test_files_batched_into_one_invocation_and_cached(tmp_path):
+    paths = _write_project(tmp_path, 6)
+    orchestrator = LintOrchestrator()
+
+    run = orchestrator.run("ruff", paths)
+    assert run.invocations == 1
+    assert set(run.diagnostics) == set(paths)
+    assert ["F401"] == [v.code for v in run.diagnostics[paths[1]] if v.code == "F401"]
+    assert not [v for v in run.diagnostics[paths[0]] if v.code == "F401"]
+
+    again = orchestrator.run("ruff", paths)
+    assert (again.invocations, again.cached) == (0, 6)
+    assert again.diagnostics == run.diagnostics
+
+    # Only the edited file is linted again
+    (tmp_path / "mod_0.py").write_text("import sys\n")
+    edited = orchestrator.run("ruff", paths)
+    assert (edited.invocations, edited.cached) == (1, 5)
+    assert [v.code for v in edited.diagnostics[paths[0]] if v.code == "F401"] == [
+        "F401"
+    ]
+
+
+@requires_ruff
+def test_small_argv_limit_splits_invocations(tmp_path):
+    paths = _write_project(tmp_path, 8)
+    fixed = sum(len(arg) + 9 for arg in RuffParser().analyze_command())
+    orchestrator = LintOrchestrator(argv_limit=fixed + (len(paths[0]) + 9) * 3)
+    run = orchestrator.run("ruff", paths, max_workers=2)
+    assert run.invocations > 1
+    assert sum(1 for p in paths if run.diagnostics[p]) >= 4
+
+
+@requires_ruff
+def test_editing_tool_config_invalidates_cached_diagnostics(tmp_path):
+    paths = _write_project(tmp_path, 2)
+    orchestrator = LintOrchestrator()
+    run = orchestrator.run("ruff", paths)
+    assert [v.code for v in run.diagnostics[paths[1]] if v.code == "F401"]
+
+    (tmp_path / "ruff.toml").write_text('[lint]\nignore = ["F401"]\n')
+    edited = orchestrator.run("ruff", paths)
+    assert (edited.invocations, edited.cached) == (1, 0)
+    assert not [v for v in edited.diagnostics[paths[1]] if v.code == "F401"]
+
+
+def test_missing_tool_results_are_not_cached(tmp_path, monkeypatch):
+    paths = _write_project(tmp_path, 2)
+    orchestrator = LintOrchestrator()
+    monkeypatch.setattr(
+        orchestrator.parser("ruff"), "ruff_path", "no-such-ruff-executable"
+    )
+    run = orchestrator.run("ruff", paths)
+    assert any("not found" in e for e in run.errors)
+    assert orchestrator.get_stats()["entries"] == 0
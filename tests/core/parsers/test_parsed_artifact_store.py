@@ -0,0 +1,95 @@
+"""
+[20261018_TEST] Shared parsed-artifact store.
+
+Parsers, adapters and analyzers share one parse per (content, language,
+kind); pinned artifacts survive budget pressure and statistics reach the
+MCP metrics module.
+"""
+
+import ast
+
+import pytest
+
+from code_scalpel.code_parsers.adapters import GoParserAdapter
+from code_scalpel.code_parsers.extractor import Language, PolyglotExtractor
+from code_scalpel.mcp.metrics import get_parse_cache_statistics
+from code_scalpel.parsing import (
+    PARSED_ARTIFACTS,
+    ParsedArtifactStore,
+    parse_python_code,
+)
+from code_scalpel.security.analyzers import SecurityAnalyzer
+
+PYTHON_SOURCE = "import os\n\ndef run(cmd):\n    os.system(cmd)\n"
+
+GO_SOURCE = """package main
+
+func add(a int, b int) int {
+    return a + b
+}
+"""
+
+
+@pytest.fixture(autouse=True)
+def _fresh_store():
+    PARSED_ARTIFACTS.clear()
+    yield
+    PARSED_ARTIFACTS.clear()
+
+
+def test_tools_share_one_python_parse():
+    analyzer = SecurityAnalyzer()
+    tree, _ = parse_python_code(PYTHON_SOURCE, filename="app.py")
+    before = get_parse_cache_statistics()["by_kind"]["ast"]
+    analyzer.analyze(PYTHON_SOURCE)
+    again, _ = parse_python_code(PYTHON_SOURCE)
+    assert again is tree
+    after = get_parse_cache_statistics()["by_kind"]["ast"]
+    assert after["misses"] == before["misses"]
+    assert after["hits"] >= before["hits"] + 2
+
+
+def test_adapter_and_extractor_share_ir():
+    if GoParserAdapter is None:
+        pytest.skip("tree-sitter-go not installed")
+    module = GoParserAdapter().parse(GO_SOURCE).ast
+    extractor = PolyglotExtractor(GO_SOURCE, language=Language.GO)
+    extractor._parse()
+    assert extractor._ir_module is module
+    assert PARSED_ARTIFACTS.get_stats()["hits"] == 1
+
+
+def test_failed_parses_are_not_stored():
+    with pytest.raises(SyntaxError):
+        PARSED_ARTIFACTS.get(
+            PARSED_ARTIFACTS.key(None, "def (", "python", "ast"),
+            lambda: ast.parse("def ("),
+        )
+    assert PARSED_ARTIFACTS.get_stats()["entries"] == 0
+
+
+def test_budget_evicts_only_unpinned_artifacts():
+    store = ParsedArtifactStore(max_bytes=150)  # three 2-char sources do not fit
+    pinned = store.lease(store.key("a.py", "a", "python", "x"), object, size=2)
+    store.get(store.key("b.py", "b", "python", "x"), object, size=2)
+    store.get(store.key("c.py", "c", "python", "x"), object, size=2)
+    stats = store.get_stats()
+    assert (stats["entries"], stats["pinned"], stats["evictions"]) == (2, 1, 1)
+
+    # The pinned artifact outlives budget pressure until its lease is released
+    store.get(store.key("d.py", "d", "python", "x"), object, size=4)
+    assert store.get_stats()["entries"] == 1
+    pinned.release()
+    store.get(store.key("e.py", "e", "python", "x"), object, size=4)
+    assert store.get_stats()["entries"] == 1
+    assert store.get_stats()["pinned"] == 0
+
+
+def test_invalidate_by_path_and_sharing_across_paths():
+    store = ParsedArtifactStore()
+    first = store.get(store.key("a.py", "x = 1", "python", "ast"), object)
+    second = store.get(store.key("b.py", "x = 1", "python", "ast"), object)
+    assert first is second
+    assert store.invalidate("a.py") == 0  # still recorded under b.py
+    assert store.invalidate("b.py") == 1
+    assert store.get_stats()["entries"] == 0
@@ -0,0 +1,139 @@
+"""Tests for ControlFlowGraph dominance analysis.
+
+[20261018_TEST] Cooper-Harvey-Kennedy dominators, post-dominators and frontiers.
+"""
+
+from code_scalpel.code_parsers.python_parsers.python_parsers_ast import (
+    PythonASTParser,
+)
+
+
+def _build_cfg(code: str):
+    parser = PythonASTParser()
+    module = parser.parse_string(code)
+    return parser.build_cfg(module.functions[0])
+
+
+def _brute_force_dominates(cfg, a: int, b: int) -> bool:
+    """A dominates B iff B is unreachable from entry once A is removed."""
+    if a == b:
+        return True
+    seen: set[int] = set()
+    stack = [cfg.entry_block]
+    while stack:
+        block = stack.pop()
+        if block.id in seen or block.id == a:
+            continue
+        seen.add(block.id)
+        stack.extend(block.successors)
+    return b not in seen
+
+
+BRANCHY = """
+def f(x):
+    y = 0
+    while x > 0:
+        if x % 2:
+            y += 1
+        else:
+            y -= 1
+            continue
+        x -= 1
+    try:
+        z = 1 / y
+    except ZeroDivisionError:
+        return None
+    return y
+"""
+
+
+def test_dominators_match_brute_force():
+    cfg = _build_cfg(BRANCHY)
+    dominators = cfg.get_dominators()
+    for a in dominators:
+        for b in dominators:
+            expected = _brute_force_dominates(cfg, a, b)
+            assert (a in dominators[b]) == expected
+            assert cfg.dominates(a, b) == expected
+
+
+def test_immediate_dominators_form_tree_rooted_at_entry():
+    cfg = _build_cfg(BRANCHY)
+    idom = cfg.get_immediate_dominators()
+    tree = cfg.get_dominator_tree()
+
+    assert idom[cfg.entry_block.id] is None
+    for block_id, parent in idom.items():
+        if parent is not None:
+            assert block_id in tree[parent]
+            assert parent in cfg.get_dominators()[block_id]
+
+
+def test_entry_and_exit_roles():
+    cfg = _build_cfg(BRANCHY)
+    entry, exit_ = cfg.entry_block.id, cfg.exit_block.id
+
+    for block_id, doms in cfg.get_dominators().items():
+        if cfg.dominates(entry, block_id):
+            assert entry in doms
+    for block_id, pdoms in cfg.get_post_dominators().items():
+        if block_id != exit_ and cfg.post_dominates(exit_, block_id):
+            assert exit_ in pdoms
+    assert cfg.get_immediate_post_dominators()[exit_] is None
+
+
+def test_back_edges_detect_loop():
+    cfg = _build_cfg(BRANCHY)
+    back_edges = cfg.get_back_edges()
+    assert back_edges
+    for src, dst in back_edges:
+        assert cfg.dominates(dst, src)
+
+
+def test_dominance_frontier_of_branch_arms_is_join():
+    cfg = _build_cfg("""
+def g(x):
+    if x:
+        a = 1
+    else:
+        a = 2
+    return a
+""")
+    frontiers = cfg.get_dominance_frontiers()
+    joins = [b for b in cfg.blocks if len(b.predecessors) >= 2]
+    assert any(
+        join.id in frontiers[pred.id] for join in joins for pred in join.predecessors
+    )
+
+
+def test_control_dependences_point_at_branch():
+    cfg = _build_cfg("""
+def h(x):
+    if x:
+        y = 1
+    return 0
+""")
+    deps = cfg.get_control_dependences()
+    branch = next(b for b in cfg.blocks if len(b.successors) == 2)
+    then_block = next(s for s in branch.successors if s.statements)
+    assert branch.id in deps[then_block.id]
+    assert deps[cfg.exit_block.id] == set()
+
+
+def test_results_are_cached_and_invalidated_on_edit():
+    cfg = _build_cfg(BRANCHY)
+    info = cfg.get_dominator_info()
+    assert cfg.get_dominator_info() is info
+
+    cfg.blocks[0].successors.append(cfg.exit_block)
+    cfg.exit_block.predecessors.append(cfg.blocks[0])
+    assert cfg.get_dominator_info() is not info
+
+
+def test_large_straight_line_function_is_fast():
+    body = "".join(f"    if x > {i}:\n        x = x - 1\n" for i in range(2000))
+    cfg = _build_cfg("def big(x):\n" + body + "    return x\n")
+
+    idom = cfg.get_immediate_dominators()
+    assert len(idom) == len(cfg.blocks)
+    assert cfg.get_back_edges() == []
@@ -0,0 +1,91 @@
+"""Tests for ControlFlowGraph path counting and enumeration.
+
+[20261018_TEST] DAG path counting, bounded lazy enumeration and basis paths.
+"""
+
+from code_scalpel.code_parsers.python_parsers.python_parsers_ast import (
+    PythonASTParser,
+)
+
+
+def _build_cfg(code: str):
+    parser = PythonASTParser()
+    module = parser.parse_string(code)
+    return parser.build_cfg(module.functions[0])
+
+
+def _sequential_ifs(count: int) -> str:
+    body = "".join(f"    if x > {i}:\n        x = x - 1\n" for i in range(count))
+    return "def f(x):\n" + body + "    return x\n"
+
+
+def test_count_matches_enumeration_for_acyclic_code():
+    cfg = _build_cfg(_sequential_ifs(4))
+    assert cfg.count_paths() == 16
+    assert len(list(cfg.get_all_paths(max_paths=None))) == 16
+
+
+def test_count_is_exponential_without_enumerating():
+    cfg = _build_cfg(_sequential_ifs(200))
+    assert cfg.count_paths() == 2**200
+
+
+def test_get_all_paths_respects_limit_and_is_lazy():
+    cfg = _build_cfg(_sequential_ifs(200))
+    paths = list(cfg.get_all_paths(max_paths=5))
+
+    assert len(paths) == 5
+    for path in paths:
+        assert path[0] is cfg.entry_block
+        assert path[-1] is cfg.exit_block
+    assert list(cfg.get_all_paths(max_paths=0)) == []
+
+
+def test_loops_are_collapsed_for_counting():
+    cfg = _build_cfg("""
+def loop(x):
+    while x > 0:
+        if x % 2:
+            x -= 1
+        else:
+            x -= 2
+    return x
+""")
+    # Skip the loop, or take it once through either arm
+    assert cfg.count_paths() == 3
+
+
+def test_basis_paths_cover_every_edge_within_cyclomatic_bound():
+    cfg = _build_cfg("""
+def g(x, y):
+    for i in range(x):
+        if i == y:
+            break
+        elif i > y:
+            continue
+        y += 1
+    return y
+""")
+    basis = cfg.get_basis_paths()
+    assert 0 < len(basis) <= cfg.get_cyclomatic_complexity()
+
+    covered = set()
+    for path in basis:
+        assert path[0] is cfg.entry_block and path[-1] is cfg.exit_block
+        for a, b in zip(path, path[1:]):
+            assert b in a.successors
+            covered.add((a.id, b.id))
+    for block in cfg.blocks:
+        for succ in block.successors:
+            assert (block.id, succ.id) in covered
+
+
+def test_unreachable_exit_yields_nothing():
+    cfg = _build_cfg("def f(x):\n    return x\n")
+    entry, exit_ = cfg.entry_block, cfg.exit_block
+    entry.successors.clear()
+    exit_.predecessors.clear()
+
+    assert cfg.count_paths() == 0
+    assert list(cfg.get_all_paths()) == []
+    assert cfg.get_basis_paths() == []
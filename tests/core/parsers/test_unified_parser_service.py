@@ -0,0 +1,104 @@
+"""
+[20261018_TEST] Process-wide parser service in parsing/unified_parser.py.
+
+The parsing config is cached until response_config.json changes, tree-sitter
+parsers are reused per thread, and parse_many parses batches of files.
+"""
+
+import json
+import os
+import threading
+
+import pytest
+
+from code_scalpel.parsing import (
+    ParserService,
+    parse_javascript_code,
+    parse_many,
+)
+from code_scalpel.parsing import unified_parser
+
+
+def _write_config(path, mode):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps({"parsing": {"mode": mode}}))
+
+
+@pytest.fixture
+def workspace(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    return tmp_path
+
+
+def test_config_is_cached_until_file_changes(workspace, monkeypatch):
+    config_file = workspace / ".code-scalpel" / "response_config.json"
+    _write_config(config_file, "permissive")
+    service = ParserService()
+
+    loads = []
+    real_load = unified_parser._load_parsing_config
+    monkeypatch.setattr(
+        unified_parser,
+        "_load_parsing_config",
+        lambda path=None: loads.append(path) or real_load(path),
+    )
+
+    assert service.config().mode == "permissive"
+    assert service.config() is service.config()
+    assert len(loads) == 1
+
+    _write_config(config_file, "strict-ish")
+    stat = config_file.stat()
+    os.utime(config_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+    assert service.config().mode == "strict-ish"
+    assert len(loads) == 2
+
+    config_file.unlink()
+    service.config()
+    assert len(loads) == 3
+
+
+def test_parser_is_reused_per_thread():
+    pytest.importorskip("tree_sitter_javascript")
+    service = ParserService()
+    first = service.parser("javascript")
+    assert service.parser("javascript") is first
+
+    other = []
+    thread = threading.Thread(target=lambda: other.append(service.parser("javascript")))
+    thread.start()
+    thread.join()
+    assert other[0] is not first
+
+
+def test_parse_many_detects_languages_and_reports_errors(workspace):
+    pytest.importorskip("tree_sitter_javascript")
+    pytest.importorskip("tree_sitter_typescript")
+    (workspace / "a.py").write_text("def f():\n    return 1\n")
+    (workspace / "b.js").write_text("function g() { return 2; }\n")
+    (workspace / "c.ts").write_text("const x: number = 1;\n")
+    (workspace / "broken.py").write_text("def broken(:\n")
+    (workspace / "notes.txt").write_text("hello")
+    paths = ["a.py", "b.js", "c.ts", "broken.py", "notes.txt", "missing.py"]
+
+    for results in (parse_many(paths), parse_many(paths, max_workers=3)):
+        assert [r.path for r in results] == paths
+        assert [r.language for r in results] == [
+            "python",
+            "javascript",
+            "typescript",
+            "python",
+            None,
+            "python",
+        ]
+        assert [r.success for r in results] == [True, True, True, False, False, False]
+        assert results[1].tree.root_node.type == "program"
+        assert "Invalid Python syntax" in str(results[3].error)
+
+
+def test_parse_javascript_code_uses_cached_parser():
+    pytest.importorskip("tree_sitter_javascript")
+    tree, report = parse_javascript_code("let a = 1;")
+    assert tree.root_node.type == "program"
+    assert not report.was_sanitized
+    assert unified_parser.get_parser_service().parser("javascript") is not None
@@ -0,0 +1,116 @@
+"""
+Tests for the array-backed CompactPDG.
+
+[20261018_TEST] CSR storage, networkx round-trip and bitmap worklist slicing.
+"""
+
+import networkx as nx
+
+from code_scalpel.pdg_tools import CompactPDG, PDGBuilder, build_compact_pdg
+from code_scalpel.pdg_tools.slicer import ProgramSlicer, SliceType, SlicingCriteria
+
+SAMPLE = """
+def process(a, b):
+    total = a
+    for item in range(b):
+        if item > a:
+            total = total + item
+        else:
+            total = total - 1
+    result = total * 2
+    return result
+"""
+
+
+def _edge_map(graph: nx.DiGraph) -> dict:
+    return {(u, v): d for u, v, d in graph.edges(data=True)}
+
+
+class TestCompactConstruction:
+    def test_build_compact_matches_networkx_build(self):
+        graph, _ = PDGBuilder().build(SAMPLE)
+        compact, call_graph = PDGBuilder().build_compact(SAMPLE)
+
+        exported = compact.to_networkx()
+        assert dict(exported.nodes(data=True)) == dict(graph.nodes(data=True))
+        assert _edge_map(exported) == _edge_map(graph)
+        assert isinstance(call_graph, nx.DiGraph)
+
+    def test_from_networkx_round_trip_keeps_custom_attributes(self):
+        graph = nx.DiGraph()
+        graph.add_node("a", type="assign", lineno=1, defines=["x"])
+        graph.add_node("b", lineno="weird", extra=True)
+        graph.add_edge("a", "b", type="data_dependency", arg_index=0)
+        graph.add_edge("b", "a", weight=3)
+
+        exported = CompactPDG.from_networkx(graph).to_networkx()
+
+        assert dict(exported.nodes(data=True)) == dict(graph.nodes(data=True))
+        assert _edge_map(exported) == _edge_map(graph)
+
+    def test_edges_are_split_by_kind(self):
+        compact, _ = build_compact_pdg(SAMPLE)
+
+        assert len(compact.data_out) == len(compact.data_in)
+        assert len(compact.control_out) == len(compact.control_in)
+        assert len(compact.data_out) > 0 and len(compact.control_out) > 0
+
+    def test_unknown_nodes_are_ignored(self):
+        compact, _ = build_compact_pdg(SAMPLE)
+        assert "missing" not in compact
+        assert compact.index_of("missing") is None
+        assert compact.backward_slice({"missing"}) == set()
+        assert compact.data_dependencies("missing") == set()
+
+
+class TestCompactSlicing:
+    def test_slices_match_networkx_slicer(self):
+        graph, _ = PDGBuilder().build(SAMPLE)
+        compact, _ = PDGBuilder().build_compact(SAMPLE)
+        nx_slicer = ProgramSlicer(graph)
+        compact_slicer = ProgramSlicer(compact)
+
+        for node in graph.nodes:
+            for slice_type in (SliceType.BACKWARD, SliceType.FORWARD):
+                expected = nx_slicer.compute_slice(node, slice_type)
+                actual = compact_slicer.compute_slice(node, slice_type)
+                assert set(actual.nodes) == set(expected.nodes)
+                assert _edge_map(actual) == _edge_map(expected)
+
+    def test_backward_slice_follows_data_chain(self):
+        compact, _ = build_compact_pdg("x = 1\ny = x + 1\nz = y * 2\nw = 5\n")
+        assert compact.backward_slice({"assign_3"}) == {
+            "assign_1",
+            "assign_2",
+            "assign_3",
+        }
+        assert compact.forward_slice({"assign_1"}) == {
+            "assign_1",
+            "assign_2",
+            "assign_3",
+        }
+
+    def test_slice_kind_filters(self):
+        graph = nx.DiGraph()
+        graph.add_edge("a", "b", type="data_dependency")
+        graph.add_edge("c", "b", type="control_dependency")
+        compact = CompactPDG.from_networkx(graph)
+
+        assert compact.backward_slice({"b"}, include_control=False) == {"a", "b"}
+        assert compact.backward_slice({"b"}, include_data=False) == {"b", "c"}
+
+    def test_slicer_variable_criteria_on_compact(self):
+        graph = nx.DiGraph()
+        graph.add_node("d", defines=["x"], lineno=1)
+        graph.add_node("u", uses=["x"], lineno=2)
+        graph.add_edge("d", "u", type="data_dependency")
+        slicer = ProgramSlicer(CompactPDG.from_networkx(graph))
+
+        criteria = SlicingCriteria(nodes=set(), variables={"x"})
+        assert set(slicer.compute_slice(criteria, SliceType.FORWARD).nodes) == {"u"}
+        assert slicer.line_to_nodes[2] == {"u"}
+
+    def test_deep_chain_does_not_recurse(self):
+        lines = ["v0 = 0"] + [f"v{i} = v{i - 1} + 1" for i in range(1, 5000)]
+        compact, _ = build_compact_pdg("\n".join(lines))
+        assert len(compact.backward_slice({"assign_5000"})) == 5000
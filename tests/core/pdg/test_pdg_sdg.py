@@ -0,0 +1,129 @@
+"""
+Tests for the system dependence graph and HRB summary edges.
+
+[20261018_TEST] Summary precision, two-phase interprocedural slicing and
+content-hash summary reuse.
+"""
+
+from code_scalpel.pdg_tools import SummaryCache, SystemDependenceGraph
+
+LIB = """
+def scale(value, factor, unused):
+    tmp = unused * 2
+    return value * factor
+
+def passthrough(a):
+    return scale(a, 3, 99)
+
+def fact(n):
+    if n <= 1:
+        return 1
+    return n * fact(n - 1)
+"""
+
+APP = """
+from lib import scale
+
+def main(x, y):
+    z = y + 1
+    r = scale(x, 2, z)
+    q = z * 5
+    return r
+
+class Svc:
+    def run(self, n):
+        return self.helper(n)
+
+    def helper(self, k):
+        return k + 1
+"""
+
+
+def _sdg(cache=None):
+    sdg = SystemDependenceGraph.from_sources(
+        {"lib": LIB, "app": APP}, cache if cache is not None else SummaryCache()
+    )
+    sdg.link()
+    return sdg
+
+
+class TestSummaries:
+    def test_unused_parameter_is_filtered(self):
+        assert _sdg().summary("lib.scale").flows_to_return == frozenset({0, 1})
+
+    def test_summary_filters_call_arguments_transitively(self):
+        sdg = _sdg()
+        assert sdg.summary("lib.passthrough").flows_to_return == frozenset({0})
+        assert sdg.summary("app.main").flows_to_return == frozenset({0})
+
+    def test_method_call_through_self(self):
+        sdg = _sdg()
+        assert sdg.summary("app.Svc.helper").flows_to_return == frozenset({1})
+        assert 1 in sdg.summary("app.Svc.run").flows_to_return
+
+    def test_recursive_function_reaches_fixpoint(self):
+        assert _sdg().summary("lib.fact").flows_to_return == frozenset({0})
+
+
+class TestInterproceduralSlice:
+    def test_backward_slice_descends_into_callee(self):
+        sdg = _sdg()
+        result = sdg.backward_slice("app.main", sdg.nodes_at_line("app.main", 8))
+        assert {"app.main", "lib.scale"} <= result.functions
+        # z (line 5) only feeds the unused parameter and must be excluded
+        assert 5 not in result.lines["app.main"]
+        assert 6 in result.lines["app.main"]
+        # the unused-parameter computation in the callee is not in the slice
+        assert 3 not in result.lines["lib.scale"]
+
+    def test_backward_slice_ascends_to_callers(self):
+        sdg = _sdg()
+        result = sdg.backward_slice("lib.scale", sdg.nodes_at_line("lib.scale", 4))
+        assert {"lib.passthrough", "app.main"} <= result.functions
+        assert 5 not in result.lines["app.main"]
+
+
+class TestSummaryCache:
+    def test_unchanged_functions_reuse_summaries(self):
+        cache = SummaryCache()
+        _sdg(cache)
+        assert cache.hits == 0
+        misses = cache.misses
+        _sdg(cache)
+        assert cache.hits == misses
+
+    def test_editing_callee_invalidates_dependent_summary(self):
+        cache = SummaryCache()
+        _sdg(cache)
+        edited = LIB.replace("return value * factor", "return unused")
+        sdg = SystemDependenceGraph.from_sources({"lib": edited, "app": APP}, cache)
+        sdg.link()
+        assert sdg.summary("lib.scale").flows_to_return == frozenset({2})
+        assert sdg.summary("app.main").flows_to_return == frozenset({1})
+
+
+class TestBuilderSdgMode:
+    SOURCE = "def f(a):\n    b = g(a)\n    return b\n"
+
+    def test_default_builder_keeps_pdg_shape(self):
+        from code_scalpel.pdg_tools import build_pdg
+
+        pdg, _ = build_pdg(self.SOURCE)
+        types = {data.get("type") for _, data in pdg.nodes(data=True)}
+        assert "return" not in types
+        # parameters are not registered as definitions outside SDG mode
+        assign = next(n for n, d in pdg.nodes(data=True) if d.get("type") == "assign")
+        assert not any(
+            pdg.nodes[p].get("type") == "parameter" for p in pdg.predecessors(assign)
+        )
+
+    def test_sdg_mode_records_returns_and_parameters(self):
+        from code_scalpel.pdg_tools import PDGBuilder
+
+        pdg, _ = PDGBuilder(sdg_mode=True).build(self.SOURCE)
+        returns = [n for n, d in pdg.nodes(data=True) if d.get("type") == "return"]
+        assert len(returns) == 1
+        call = next(n for n, d in pdg.nodes(data=True) if d.get("type") == "call")
+        assert any(
+            pdg.nodes[p].get("type") == "parameter" for p in pdg.predecessors(call)
+        )
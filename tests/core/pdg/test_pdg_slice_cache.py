@@ -0,0 +1,144 @@
+"""
+Tests for the content-addressed slice cache shared across PDG builds.
+
+[20261018_TEST] Reuse after unrelated edits, invalidation of edited
+functions, byte budget and persistence.
+"""
+
+import pytest
+
+from code_scalpel.pdg_tools import PDGBuilder, ProgramSlicer, SliceCache
+from code_scalpel.pdg_tools.slice_cache import PDGRegions
+from code_scalpel.pdg_tools.slicer import SliceType, SlicingCriteria
+
+SOURCE = """
+def first(a):
+    b = a + 1
+    return b
+
+def second(x, y):
+    total = x
+    for i in range(y):
+        total = total + i
+    result = total * 2
+    return result
+"""
+
+EDIT_FIRST = SOURCE.replace(
+    "    b = a + 1\n", "    extra = a * 3\n    b = a + extra\n    c = b\n"
+)
+EDIT_SECOND = SOURCE.replace("result = total * 2", "result = x * 2")
+
+
+def _build(source):
+    pdg, _ = PDGBuilder().build_compact(source)
+    return pdg
+
+
+def _node_at(pdg, lineno, kind="assign"):
+    return next(
+        pdg.node_ids[i]
+        for i in range(len(pdg))
+        if pdg.linenos[i] == lineno and pdg.node_types[i] == kind
+    )
+
+
+def _slice(pdg, node, cache, slice_type=SliceType.BACKWARD):
+    return set(ProgramSlicer(pdg, slice_cache=cache).compute_slice(node, slice_type))
+
+
+def _uncached(pdg, node, slice_type=SliceType.BACKWARD):
+    return _slice(pdg, node, SliceCache(), slice_type)
+
+
+class TestSliceCacheReuse:
+    def test_rebuilt_pdg_hits_cache(self):
+        cache = SliceCache()
+        pdg = _build(SOURCE)
+        node = _node_at(pdg, 10)
+        first = _slice(pdg, node, cache)
+        second = _slice(_build(SOURCE), node, cache)
+        assert cache.hits == 1
+        assert first == second
+
+    def test_edit_in_other_function_keeps_entry(self):
+        cache = SliceCache()
+        pdg = _build(SOURCE)
+        _slice(pdg, _node_at(pdg, 10), cache)
+
+        edited = _build(EDIT_FIRST)
+        # Lines and node ids of `second` shifted; the slice must follow them.
+        node = _node_at(edited, 12)
+        result = _slice(edited, node, cache)
+        assert cache.hits == 1
+        assert result == _uncached(edited, node)
+
+    def test_edit_in_sliced_function_misses(self):
+        cache = SliceCache()
+        pdg = _build(SOURCE)
+        _slice(pdg, _node_at(pdg, 10), cache)
+
+        edited = _build(EDIT_SECOND)
+        node = _node_at(edited, 10)
+        result = _slice(edited, node, cache)
+        assert cache.hits == 0
+        assert result == _uncached(edited, node)
+
+    def test_variable_criteria_and_forward_slices(self):
+        cache = SliceCache()
+        pdg = _build(SOURCE)
+        criteria = SlicingCriteria(nodes=set(), variables={"total"})
+        for slice_type in (SliceType.BACKWARD, SliceType.FORWARD, SliceType.THIN):
+            ProgramSlicer(pdg, slice_cache=cache).compute_slice(criteria, slice_type)
+        rebuilt = _build(EDIT_FIRST)
+        for slice_type in (SliceType.BACKWARD, SliceType.FORWARD, SliceType.THIN):
+            cached = ProgramSlicer(rebuilt, slice_cache=cache).compute_slice(
+                criteria, slice_type
+            )
+            fresh = ProgramSlicer(rebuilt, slice_cache=SliceCache()).compute_slice(
+                criteria, slice_type
+            )
+            assert set(cached) == set(fresh)
+        assert cache.hits == 3
+
+
+class TestSliceCacheBookkeeping:
+    def test_byte_budget_evicts_least_recently_used(self):
+        pdg = _build(SOURCE)
+        probe = SliceCache()
+        _slice(pdg, _node_at(pdg, 10), probe)
+        cache = SliceCache(max_bytes=probe.size_bytes * 2)
+        for lineno in (3, 7, 10):
+            _slice(pdg, _node_at(pdg, lineno), cache)
+        assert cache.evictions >= 1
+        assert cache.size_bytes <= cache.max_bytes
+
+    def test_invalidate_by_region_fingerprint(self):
+        cache = SliceCache()
+        pdg = _build(SOURCE)
+        _slice(pdg, _node_at(pdg, 3), cache)
+        _slice(pdg, _node_at(pdg, 10), cache)
+        regions = PDGRegions(pdg)
+        second = regions.fingerprints[regions.labels.index("second")]
+        assert cache.invalidate(second) == 1
+        assert len(cache) == 1
+
+    def test_save_and_load_round_trip(self, tmp_path):
+        cache = SliceCache()
+        pdg = _build(SOURCE)
+        node = _node_at(pdg, 10)
+        expected = _slice(pdg, node, cache)
+        path = tmp_path / "slices.json"
+        cache.save(path)
+
+        loaded = SliceCache.load(path)
+        assert len(loaded) == 1
+        assert _slice(_build(SOURCE), node, loaded) == expected
+        assert loaded.hits == 1
+        assert len(SliceCache.load(tmp_path / "missing.json")) == 0
+
+    def test_load_rejects_foreign_files(self, tmp_path):
+        path = tmp_path / "slices.json"
+        path.write_text('{"entries": []}')
+        with pytest.raises(ValueError):
+            SliceCache.load(path)
@@ -110,3 +110,95 @@ def test_debug_node_truncates_long_text():
 
     output = visitor.debug_node(long)
     assert "..." in output
+
+
+# [20261018_TEST] kind_id dispatch, cursor-based generic traversal and opt-in
+# parent tracking on real tree-sitter trees.
+class _GoIdentifierVisitor(TreeSitterVisitor):
+    language = "go-identifiers"
+
+    def __init__(self, source: str):
+        super().__init__()
+        self.ctx.source = source
+        self.chains = []
+
+    def _get_node_type(self, node):
+        return node.type
+
+    def _get_children(self, node):
+        return node.children
+
+    def _get_named_children(self, node):
+        return [c for c in node.children if c.is_named]
+
+    def _get_text(self, node):
+        return self.ctx.source[node.start_byte : node.end_byte]
+
+    def _get_location(self, node):
+        return SourceLocation(line=node.start_point[0] + 1, column=node.start_point[1])
+
+    def _get_child_by_field(self, node, field_name):
+        return node.child_by_field_name(field_name)
+
+    def _get_children_by_field(self, node, field_name):
+        return node.children_by_field_name(field_name)
+
+    def visit_identifier(self, node):
+        self.chains.append(list(self.ctx.parent_chain))
+        return self.get_text(node)
+
+
+def _parse_go(source: str):
+    tree_sitter = pytest.importorskip("tree_sitter")
+    tree_sitter_go = pytest.importorskip("tree_sitter_go")
+    parser = tree_sitter.Parser(tree_sitter.Language(tree_sitter_go.language()))
+    return parser.parse(source.encode()).root_node
+
+
+GO_SOURCE = "package main\nfunc f(a int) int { b := a + g(a) // note\n return b }\n"
+
+
+def test_kind_id_dispatch_matches_string_dispatch():
+    root = _parse_go(GO_SOURCE)
+    fast = _GoIdentifierVisitor(GO_SOURCE)
+    slow = _GoIdentifierVisitor(GO_SOURCE)
+    slow.register_handler("identifier", slow.visit_identifier)
+
+    assert fast.visit(root) == ["f", "a", "b", "a", "g", "a", "b"]
+    assert slow.visit(root) == fast.visit(root)
+    # Repeated visits reuse the compiled tables
+    assert _GoIdentifierVisitor(GO_SOURCE).visit(root) == fast.visit(root)
+
+
+def test_generic_traversal_does_not_recurse_per_level():
+    depth = 5000
+    source = "package main\nvar x = " + "(" * depth + "y" + ")" * depth + "\n"
+    visitor = _GoIdentifierVisitor(source)
+
+    assert visitor.visit(_parse_go(source)) == ["x", "y"]
+
+
+def test_parent_chain_is_opt_in():
+    root = _parse_go(GO_SOURCE)
+    visitor = _GoIdentifierVisitor(GO_SOURCE)
+    visitor.visit(root)
+    assert all(chain == [] for chain in visitor.chains)
+
+    debug = _GoIdentifierVisitor(GO_SOURCE)
+    debug.track_parents = True
+    debug.visit(root)
+    first = debug.chains[0]
+    assert first[0].type == "source_file"
+    assert first[-1].type == "identifier"
+    assert debug.ctx.parent_chain == []
+
+
+def test_noise_bitset_matches_noise_types():
+    root = _parse_go(GO_SOURCE)
+    visitor = _GoIdentifierVisitor(GO_SOURCE)
+    nodes = [root]
+    for node in nodes:
+        nodes.extend(node.children)
+    for node in nodes:
+        expected = node.type in TreeSitterVisitor.NOISE_TYPES
+        assert visitor.is_noise(node) is expected
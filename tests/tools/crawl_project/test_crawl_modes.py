@@ -0,0 +1,185 @@
+"""
+[20261018_TEST] Tiered crawl modes.
+
+Summary crawls count lines without parsing, structure crawls find the same
+declarations as the AST analysis without building a tree, and cached results
+are only reused by crawls asking for the same or less detail.
+"""
+
+import ast
+from pathlib import Path
+
+import pytest
+
+from code_scalpel.analysis import crawl_modes
+from code_scalpel.analysis.crawl_modes import count_lines, scan_python_declarations
+from code_scalpel.analysis.project_crawler import (
+    CodeAnalyzerVisitor,
+    ProjectCrawler,
+    crawl_project,
+)
+
+SAMPLE = """\
+import os, sys as system
+from collections import OrderedDict
+from . import sibling
+from .pkg.mod import thing
+
+
+class Base(object):
+    def method(self):
+        def helper():
+            return 1
+        return helper()
+
+    async def run(self):
+        pass
+
+
+class Child(Base, mixins.Mixin, metaclass=Meta):
+    class Inner:
+        def deep(self):
+            import json
+            return json
+
+    def after_inner(self):
+        pass
+
+
+def top(a,
+        b):
+    def nested():
+        pass
+    return nested
+
+
+async def coroutine():
+    pass
+"""
+
+
+def _declarations(functions, classes):
+    return (
+        [(f.name, f.lineno, f.is_method, f.class_name) for f in functions],
+        [
+            (
+                c.name,
+                c.lineno,
+                c.bases,
+                [(m.name, m.lineno, m.class_name) for m in c.methods],
+            )
+            for c in classes
+        ],
+    )
+
+
+def _make_project(root: Path) -> None:
+    (root / "pkg").mkdir()
+    (root / "pkg" / "sample.py").write_text(SAMPLE)
+    (root / "app.js").write_text("import x from 'lib';\nif (a) { b(); }\n")
+    (root / "tail.py").write_text("x = 1\ny = 2")  # no trailing newline
+
+
+class TestLineCounting:
+    @pytest.mark.parametrize(
+        "content",
+        [
+            b"",
+            b"a",
+            b"a\n",
+            b"a\nb",
+            b"a\r\nb\r\n",
+            b"\n\n\n",
+            b"x = 1\n" * 100_000,
+            b"a\rb\r",  # classic Mac line endings
+            b"a\x0cb\n\x0c\n",  # form feed between sections
+            b"a\x1cb\x1dc\x1ed\x0b",
+            "a\u2028b\u2029c\x85d".encode(),
+            b"a\r\xff\nb\n\xfe",  # invalid UTF-8 is dropped by full mode
+            b"x = 1\r\n\x0c\r" * 100_000,
+        ],
+    )
+    def test_matches_splitlines(self, tmp_path, content):
+        path = tmp_path / "f.py"
+        path.write_bytes(content)
+        expected = len(content.decode("utf-8", "ignore").splitlines())
+        assert count_lines(path) == expected
+
+    def test_breaks_split_across_chunks(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(crawl_modes, "_MMAP_MIN_BYTES", 0)
+        monkeypatch.setattr(crawl_modes, "_COUNT_CHUNK_BYTES", 4)
+        content = "a\r\nb\u2028\r\nc\x85\r\r\n".encode() * 7
+        path = tmp_path / "f.py"
+        path.write_bytes(content)
+        assert count_lines(path) == len(content.decode().splitlines())
+
+
+class TestStructureScan:
+    def test_matches_ast_declarations(self):
+        visitor = CodeAnalyzerVisitor()
+        visitor.visit(ast.parse(SAMPLE))
+        functions, classes, imports = scan_python_declarations(SAMPLE)
+        assert _declarations(functions, classes) == _declarations(
+            visitor.functions, visitor.classes
+        )
+        assert imports == visitor.imports
+
+
+class TestCrawlModes:
+    def test_unknown_mode_rejected(self, tmp_path):
+        with pytest.raises(ValueError, match="crawl mode"):
+            ProjectCrawler(tmp_path, mode="deep")
+
+    def test_summary_counts_without_parsing(self, tmp_path, monkeypatch):
+        _make_project(tmp_path)
+        full = ProjectCrawler(tmp_path).crawl()
+
+        def no_parse(*args, **kwargs):
+            raise AssertionError("summary mode must not parse")
+
+        monkeypatch.setattr(ast, "parse", no_parse)
+        summary = ProjectCrawler(tmp_path, mode="summary").crawl()
+        assert summary.total_files == full.total_files == 3
+        assert summary.total_lines_of_code == full.total_lines_of_code
+        assert summary.total_functions == 0
+        assert {r.language for r in summary.files_analyzed} == {
+            "python",
+            "javascript",
+        }
+
+    def test_structure_matches_full_declarations(self, tmp_path, monkeypatch):
+        _make_project(tmp_path)
+        full = ProjectCrawler(tmp_path).crawl()
+        monkeypatch.setattr(
+            ast, "parse", lambda *a, **k: (_ for _ in ()).throw(AssertionError())
+        )
+        structure = ProjectCrawler(tmp_path, mode="structure").crawl()
+
+        def by_path(result):
+            return {
+                Path(r.path).name: (_declarations(r.functions, r.classes), r.imports)
+                for r in result.files_analyzed
+            }
+
+        assert by_path(structure) == by_path(full)
+        assert structure.total_lines_of_code == full.total_lines_of_code
+
+    def test_cache_reuses_only_equal_or_richer_results(self, tmp_path):
+        _make_project(tmp_path)
+        summary = ProjectCrawler(tmp_path, mode="summary", enable_cache=True)
+        summary.crawl()
+        assert summary._cache_misses == 3
+
+        full = ProjectCrawler(tmp_path, mode="full", enable_cache=True)
+        assert full.crawl().total_functions > 0
+        assert full._cache_misses == 3  # summary entries cannot serve it
+
+        again = ProjectCrawler(tmp_path, mode="summary", enable_cache=True)
+        again.crawl()
+        assert (again._cache_hits, again._cache_misses) == (3, 0)
+
+    def test_crawl_project_function_accepts_mode(self, tmp_path):
+        _make_project(tmp_path)
+        result = crawl_project(str(tmp_path), mode="summary")
+        assert result["summary"]["total_files"] == 3
+        assert result["summary"]["total_functions"] == 0
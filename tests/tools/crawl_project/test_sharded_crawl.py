@@ -0,0 +1,123 @@
+"""
+[20261018_TEST] Monorepo-sharded crawling.
+
+Each detected package is crawled with its own cache partition, files outside
+packages form a root shard, nested packages are pruned from their parents,
+scoped crawls skip other packages, and a change in one package leaves the
+other partitions untouched.
+"""
+
+import json
+import os
+
+import pytest
+
+from code_scalpel.analysis import sharded_crawler
+from code_scalpel.analysis.project_crawler import ProjectCrawler
+from code_scalpel.analysis.sharded_crawler import ShardedCrawler, crawl_monorepo
+
+
+def _write(path, content):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(content)
+
+
+@pytest.fixture
+def yarn_repo(tmp_path):
+    _write(tmp_path / "package.json", json.dumps({"workspaces": ["packages/*"]}))
+    for name in ("web", "api"):
+        pkg = tmp_path / "packages" / name
+        _write(pkg / "package.json", json.dumps({"name": f"@acme/{name}"}))
+        _write(pkg / "src" / "index.ts", "export function main() { return 1; }\n")
+        _write(pkg / "src" / "util.py", f"def {name}_helper():\n    return 1\n")
+    _write(tmp_path / "tools" / "release.py", "def release():\n    pass\n")
+    return tmp_path
+
+
+def _paths(result):
+    return sorted(r.path for r in result.files_analyzed + result.files_with_errors)
+
+
+def test_merged_result_matches_flat_crawl(yarn_repo):
+    result = ShardedCrawler(yarn_repo).crawl()
+    flat = ProjectCrawler(yarn_repo).crawl()
+
+    assert result.workspace_type == "yarn_workspaces"
+    assert [p.name for p in result.packages] == [".", "@acme/api", "@acme/web"]
+    assert _paths(result.merged) == _paths(flat)
+    assert result.merged.total_functions == flat.total_functions
+
+    packages = {p["name"]: p for p in result.summary["packages"]}
+    assert packages["."]["total_files"] == 1  # tools/release.py only
+    assert packages["@acme/web"]["total_files"] == 2
+    assert packages["@acme/web"]["path"] == "packages/web"
+    assert result.summary["total_files"] == 5
+
+
+def test_scoped_crawl_skips_other_packages(yarn_repo, monkeypatch):
+    crawled = []
+    real_crawl = sharded_crawler._crawl_shard
+
+    def recording_crawl(root_path, options):
+        crawled.append(os.path.relpath(root_path, yarn_repo))
+        return real_crawl(root_path, options)
+
+    monkeypatch.setattr(sharded_crawler, "_crawl_shard", recording_crawl)
+    result = crawl_monorepo(yarn_repo, packages=["@acme/web", "packages/web"])
+    assert crawled == [os.path.join("packages", "web")]
+    assert all("web" in path for path in _paths(result.merged))
+
+    with pytest.raises(ValueError, match="Unknown package"):
+        ShardedCrawler(yarn_repo).crawl(packages=["nope"])
+
+
+def test_change_in_one_package_keeps_other_partitions(yarn_repo):
+    ShardedCrawler(yarn_repo, enable_cache=True).crawl()
+    partitions = yarn_repo / ".code-scalpel" / "cache" / "packages"
+    caches = {p.parent.name: p for p in partitions.glob("*/crawl_cache_v1.json")}
+    assert len(caches) == 3
+    before = {name: path.stat().st_mtime_ns for name, path in caches.items()}
+
+    util = yarn_repo / "packages" / "web" / "src" / "util.py"
+    util.write_text("def web_helper():\n    return 2\n\ndef more():\n    pass\n")
+    os.utime(util, (1_700_000_000, 1_700_000_000))
+
+    result = ShardedCrawler(yarn_repo, enable_cache=True).crawl()
+    stats = {p.name: (p.cache_hits, p.cache_misses) for p in result.packages}
+    assert stats == {".": (1, 0), "@acme/api": (2, 0), "@acme/web": (1, 1)}
+    changed = [
+        name for name, path in caches.items() if path.stat().st_mtime_ns != before[name]
+    ]
+    assert len(changed) == 1 and changed[0].startswith("packages_web-")
+
+
+def test_nested_packages_are_pruned_from_parents(tmp_path):
+    _write(tmp_path / "WORKSPACE", "")
+    _write(tmp_path / "svc" / "BUILD", "")
+    _write(tmp_path / "svc" / "app.py", "def app():\n    pass\n")
+    _write(tmp_path / "svc" / "sub" / "BUILD", "")
+    _write(tmp_path / "svc" / "sub" / "inner.py", "def inner():\n    pass\n")
+    _write(tmp_path / "top.py", "x = 1\n")
+
+    crawler = ShardedCrawler(tmp_path)
+    assert {s.path: s.exclude_paths for s in crawler.shards()} == {
+        ".": ["svc", "svc/sub"],
+        "svc": ["sub"],
+        "svc/sub": [],
+    }
+    result = crawler.crawl()
+    files = {
+        p.path: sorted(os.path.basename(r.path) for r in p.result.files_analyzed)
+        for p in result.packages
+    }
+    assert files == {".": ["top.py"], "svc": ["app.py"], "svc/sub": ["inner.py"]}
+
+
+@pytest.mark.parametrize("parallelism", ["threads", "processes"])
+def test_parallel_shards_match_sequential(yarn_repo, parallelism):
+    sequential = ShardedCrawler(yarn_repo).crawl()
+    parallel = ShardedCrawler(yarn_repo, parallelism=parallelism, max_workers=2).crawl()
+    assert _paths(parallel.merged) == _paths(sequential.merged)
+    assert [p.summary["total_functions"] for p in parallel.packages] == [
+        p.summary["total_functions"] for p in sequential.packages
+    ]